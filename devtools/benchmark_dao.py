@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+#       devtools.benchmark_dao.py is part of The RTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+#    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#    "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#    LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+#    PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER
+#    OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#    EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#    PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#    PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#    LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#    NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#    SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Utility script for RTK developers to time the RTK Program database operations
+in the Data Access Object (DAO) module.  The timings depend on the machine so
+they are printed rather than checked by the unit tests.
+
+Usage: python devtools/benchmark_dao.py
+"""
+
+import sys
+import os
+import time
+from os.path import dirname
+
+sys.path.insert(0, dirname(dirname(os.path.abspath(__file__))) + "/rtk", )
+
+from dao.DAO import DAO                         # pylint: disable=E0401
+from dao.RTKHardware import RTKHardware         # pylint: disable=E0401
+from dao.RTKMatrix import RTKMatrix             # pylint: disable=E0401
+# The hardware and matrix foreign keys refer to the revision table.
+from dao.RTKRevision import RTKRevision         # pylint: disable=E0401, W0611
+
+
+def benchmark_create_indexes(database='/tmp/_rtk_index_db.rtk'):
+    """
+    Function to time the hardware and matrix queries on a 100,000 row RTK
+    Program database before and after db_create_indexes() is called.
+
+    :keyword str database: the path to the scratch SQLite database.
+    :return: None
+    :rtype: None
+    """
+
+    _dao = DAO()
+    _dao.db_connect('sqlite:///' + database)
+
+    for _table in [RTKHardware.__table__, RTKMatrix.__table__]:
+        _table.create(bind=_dao.engine, checkfirst=True)
+        for _index in _table.indexes:
+            _index.drop(bind=_dao.engine)
+
+    # 100 revisions of 1,000 hardware items and 100,000 matrix cells spread
+    # over 100 revisions and five matrix types.
+    _dao.engine.execute(
+        RTKHardware.__table__.insert(),
+        [{'fld_revision_id': _id // 1000, 'fld_hardware_id': _id + 1}
+         for _id in range(100000)])
+    _dao.engine.execute(
+        RTKMatrix.__table__.insert(),
+        [{'fld_revision_id': _id // 1000, 'fld_matrix_id': _id % 5,
+          'fld_matrix_type': 'type{0:d}'.format(_id % 5),
+          'fld_row_item_id': (_id % 1000) // 25,
+          'fld_column_item_id': _id % 25, 'fld_value': 1}
+         for _id in range(100000)])
+
+    _queries = [
+        "SELECT * FROM rtk_hardware WHERE fld_revision_id=42",
+        "SELECT fld_matrix_id, fld_row_item_id, fld_column_item_id, "
+        "fld_value FROM rtk_matrix WHERE fld_revision_id=42 AND "
+        "fld_matrix_type='type3'"
+    ]
+
+    def _plan(query):
+        return ' '.join([
+            str(_row[-1]) for _row in _dao.engine.execute(
+                'EXPLAIN QUERY PLAN ' + query)
+        ])
+
+    def _time(query):
+        _start = time.time()
+        for __ in range(20):
+            _dao.engine.execute(query).fetchall()
+        return time.time() - _start
+
+    _before = [(_plan(_query), _time(_query)) for _query in _queries]
+    _dao.db_create_indexes()
+    _after = [(_plan(_query), _time(_query)) for _query in _queries]
+
+    for _query, (_plan_before, _time_before), (_plan_after, _time_after) \
+            in zip(_queries, _before, _after):
+        print "{0:s}\n  before: {1:s} ({2:.4f}s)\n  after:  {3:s} " \
+              "({4:.4f}s)".format(_query, _plan_before, _time_before,
+                                  _plan_after, _time_after)
+
+    _dao.db_close()
+    os.remove(database)
+
+
+def benchmark_create_program(database='/tmp/_rtk_program_db.rtk'):
+    """
+    Function to time the creation of a new RTK Program database.
+
+    :keyword str database: the path to the scratch SQLite database.
+    :return: None
+    :rtype: None
+    """
+
+    _times = []
+    for __ in range(5):
+        _dao = DAO()
+        _dao.db_connect('sqlite:///' + database)
+        _start = time.time()
+        _dao.db_create_program('sqlite:///' + database, _dao.db_session())
+        _times.append(time.time() - _start)
+        _dao.db_close()
+        os.remove(database)
+
+    print "db_create_program: best {0:.4f}s, mean {1:.4f}s".format(
+        min(_times), sum(_times) / len(_times))
+
+
+if __name__ == '__main__':
+    benchmark_create_program()
+    benchmark_create_indexes()
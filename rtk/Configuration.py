@@ -142,6 +142,32 @@ class Configuration(object):
                               +----------+-------------------------------+
                               | password | User password (MySQL only)    |
                               +----------+-------------------------------+
+    :cvar dict RTK_DB_PROFILE: Dictionary of the default RTK Program database
+                               engine profile.  Each Configuration copies the
+                               defaults and then reads its own profile from
+                               the Backend section of the configuration file.
+                               The information contained is:
+
+                               +--------------+----------------------------+
+                               |     Key      | Information                |
+                               +==============+============================+
+                               |  pool_size   | Connections kept open      |
+                               +--------------+----------------------------+
+                               | max_overflow | Extra connections allowed  |
+                               +--------------+----------------------------+
+                               | pool_timeout | Seconds to wait for a      |
+                               |              | connection                 |
+                               +--------------+----------------------------+
+                               | journal_mode | PRAGMA (SQLite only)       |
+                               +--------------+----------------------------+
+                               | synchronous  | PRAGMA (SQLite only)       |
+                               +--------------+----------------------------+
+                               |  cache_size  | PRAGMA (SQLite only)       |
+                               +--------------+----------------------------+
+                               |  mmap_size   | PRAGMA (SQLite only)       |
+                               +--------------+----------------------------+
+                               |  temp_store  | PRAGMA (SQLite only)       |
+                               +--------------+----------------------------+
     :cvar dict RTK_TABPOS: Dictionary containing the location of tabs in the
                            three main gtk.Notebook() widgets.  Can be one of:
 
@@ -326,6 +352,10 @@ class Configuration(object):
     RTK_COLORS = {}
     RTK_COM_INFO = {}  # RTK Common database info.
     RTK_PROG_INFO = {}  # RTK Program database info.
+    RTK_DB_PROFILE = {'pool_size': 5, 'max_overflow': 10, 'pool_timeout': 30,
+                      'journal_mode': 'WAL', 'synchronous': 'NORMAL',
+                      'cache_size': -65536, 'mmap_size': 268435456,
+                      'temp_store': 'MEMORY'}
     RTK_TABPOS = {'listbook': 'top', 'modulebook': 'bottom',
                   'workbook': 'bottom'}
 
@@ -418,6 +448,10 @@ class Configuration(object):
                             'softwarebg', 'incidentbg', 'validationbg',
                             'testbg', 'survivalbg', 'stakeholderbg',
                             'stakeholderfg']
+        self._lst_db_profile = ['pool_size', 'max_overflow', 'pool_timeout',
+                                'journal_mode', 'synchronous', 'cache_size',
+                                'mmap_size', 'temp_store']
+        self.RTK_DB_PROFILE = dict(Configuration.RTK_DB_PROFILE)
         self._lst_format_files = ['revision', 'function', 'requirement',
                                   'hardware', 'software', 'incident',
                                   'validation', 'testing', 'part', 'sia',
@@ -622,6 +656,8 @@ class Configuration(object):
         _config.set('Backend', 'database', '')
         _config.set('Backend', 'user', '')
         _config.set('Backend', 'password', '')
+        for _key in self._lst_db_profile:
+            _config.set('Backend', _key, self.RTK_DB_PROFILE[_key])
 
         _config.add_section('Directories')
         _config.set('Directories', 'datadir', self.RTK_DATA_DIR)
@@ -717,6 +753,8 @@ class Configuration(object):
             _config.set('Backend', 'database', self.RTK_PROG_INFO['database'])
             _config.set('Backend', 'user', self.RTK_PROG_INFO['user'])
             _config.set('Backend', 'password', self.RTK_PROG_INFO['password'])
+            for _key in self._lst_db_profile:
+                _config.set('Backend', _key, self.RTK_DB_PROFILE[_key])
 
             _config.add_section('Directories')
             _config.set('Directories', 'datadir', self.RTK_DATA_DIR)
@@ -798,6 +836,12 @@ class Configuration(object):
             self.RTK_PROG_INFO['user'] = _config.get('Backend', 'user')
             self.RTK_PROG_INFO['password'] = _config.get('Backend', 'password')
 
+            # Configuration files from older versions of RTK don't have the
+            # engine profile so keep the defaults for any missing options.
+            for _key in self._lst_db_profile:
+                if _config.has_option('Backend', _key):
+                    self.RTK_DB_PROFILE[_key] = _config.get('Backend', _key)
+
             self.RTK_HR_MULTIPLIER = _config.get('General', 'frmultiplier')
             self.RTK_DEC_PLACES = _config.get('General', 'decimal')
             self.RTK_MTIME = _config.get('General', 'calcreltime')
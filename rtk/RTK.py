@@ -8,11 +8,21 @@
 """This is the main program for the RTK application."""
 
 import gettext
+import cPickle
 import logging
 import os
 import sys
 from datetime import date
 
+# Import Utilities before the other modules so the --profile-startup report
+# includes all of them.
+import Utilities  # pylint: disable=E0401
+
+_IMPORT_PROFILER = None
+if '--profile-startup' in sys.argv:
+    _IMPORT_PROFILER = Utilities.ImportProfiler()
+    _IMPORT_PROFILER.start()
+
 from sqlalchemy.orm import scoped_session  # pylint: disable=E0401
 from pubsub import pub  # pylint: disable=E0401
 
@@ -31,38 +41,11 @@ except ImportError:
 # Import other RTK modules.
 # pylint: disable=E0401
 from Configuration import Configuration
-import Utilities
-from dao.DAO import DAO
+from dao.DAO import DAO, get_table
 from dao.RTKProgramInfo import RTKProgramInfo
-from dao.RTKApplication import RTKApplication
-from dao.RTKCategory import RTKCategory
-from dao.RTKCriticality import RTKCriticality
-from dao.RTKDistribution import RTKDistribution
-from dao.RTKEnviron import RTKEnviron
-from dao.RTKFailureMode import RTKFailureMode
-from dao.RTKGroup import RTKGroup
-from dao.RTKHazards import RTKHazards
-from dao.RTKLevel import RTKLevel
-from dao.RTKManufacturer import RTKManufacturer
-from dao.RTKMethod import RTKMethod
-from dao.RTKModel import RTKModel
-from dao.RTKPhase import RTKPhase
-from dao.RTKRPN import RTKRPN
 from dao.RTKSiteInfo import RTKSiteInfo
-from dao.RTKStakeholders import RTKStakeholders
-from dao.RTKStatus import RTKStatus
-from dao.RTKSubCategory import RTKSubCategory
-from dao.RTKType import RTKType
-from dao.RTKUnit import RTKUnit
-from dao.RTKUser import RTKUser
+# The data controllers are imported when an RTK Program database is opened.
 # from datamodels.matrix.Matrix import Matrix
-from revision import dtcRevision
-from usage import dtcUsageProfile
-from failure_definition import dtcFailureDefinition
-from function import dtcFunction
-from analyses.fmea import dtcFMEA
-from requirement import dtcRequirement
-from stakeholder import dtcStakeholder
 # from hardware.BoM import BoM as HardwareBoM
 # from analyses.allocation.Allocation import Allocation
 # from analyses.hazard.Hazard import Hazard
@@ -90,6 +73,51 @@ __copyright__ = 'Copyright 2007 - 2016 Andrew "weibullguy" Rowland'
 # Add localization support.
 _ = gettext.gettext
 
+# The global lookups loaded from the RTK Common database.  Each entry is the
+# table, the attribute holding the type of each record, and the Configuration
+# dictionary each type of record is loaded into.  Every record of a table
+# without a type attribute is loaded into one dictionary.
+RTK_GLOBALS = (
+    ('RTKCategory', 'cat_type', {'incident': 'RTK_INCIDENT_CATEGORY',
+                                 'risk': 'RTK_SEVERITY'}),
+    ('RTKEnviron', 'environ_type', {'active': 'RTK_ACTIVE_ENVIRONMENTS',
+                                    'dormant': 'RTK_DORMANT_ENVIRONMENTS',
+                                    'development':
+                                    'RTK_SW_DEV_ENVIRONMENTS'}),
+    ('RTKGroup', 'group_type', {'affinity': 'RTK_AFFINITY_GROUPS',
+                                'workgroup': 'RTK_WORKGROUPS'}),
+    ('RTKLevel', 'level_type', {'probability': 'RTK_FAILURE_PROBABILITY',
+                                'software': 'RTK_SW_LEVELS'}),
+    ('RTKMethod', 'method_type', {'detection': 'RTK_DETECTION_METHODS',
+                                  'test': 'RTK_SW_TEST_METHODS'}),
+    ('RTKModel', 'model_type', {'allocation': 'RTK_ALLOCATION_MODELS',
+                                'rprediction': 'RTK_HR_MODEL'}),
+    ('RTKPhase', 'phase_type', {'lifecycle': 'RTK_LIFECYCLE',
+                                'development': 'RTK_SW_DEV_PHASES'}),
+    ('RTKRPN', 'rpn_type', {'detection': 'RTK_RPN_DETECTION',
+                            'occurrence': 'RTK_RPN_OCCURRENCE',
+                            'severity': 'RTK_RPN_SEVERITY'}),
+    ('RTKStatus', 'status_type', {'action': 'RTK_ACTION_STATUS',
+                                  'incident': 'RTK_INCIDENT_STATUS'}),
+    ('RTKType', 'type_type', {'cost': 'RTK_COST_TYPE',
+                              'mtbf': 'RTK_HR_TYPE',
+                              'incident': 'RTK_INCIDENT_TYPE',
+                              'mttr': 'RTK_MTTR_TYPE',
+                              'requirement': 'RTK_REQUIREMENT_TYPE',
+                              'validation': 'RTK_VALIDATION_TYPE'}),
+    ('RTKUnit', 'unit_type', {'measurement': 'RTK_MEASUREMENT_UNITS'}),
+    ('RTKApplication', None, {None: 'RTK_SW_APPLICATION'}),
+    ('RTKCriticality', None, {None: 'RTK_CRITICALITY'}),
+    ('RTKDistribution', None, {None: 'RTK_S_DIST'}),
+    ('RTKHazards', None, {None: 'RTK_HAZARDS'}),
+    ('RTKManufacturer', None, {None: 'RTK_MANUFACTURERS'}),
+    ('RTKStakeholders', None, {None: 'RTK_STAKEHOLDERS'}),
+    ('RTKUser', None, {None: 'RTK_USERS'}))
+
+# Increment whenever RTK_GLOBALS or the components tree changes so the global
+# lookups cached by an older version of RTK are not used.
+RTK_GLOBALS_VERSION = 1
+
 
 def main():
     """Launch the RTK application."""
@@ -103,6 +131,10 @@ def main():
     # sleep(3)
     RTK(test=False)
 
+    if _IMPORT_PROFILER is not None:
+        _IMPORT_PROFILER.stop()
+        sys.stderr.write(_IMPORT_PROFILER.report())
+
     # splScreen.window.destroy()
 
     gtk.main()
@@ -200,12 +232,13 @@ class Model(object):
         self.site_session = scoped_session(site_session)
         self.program_session = None
 
-    def create_program(self, database):
+    def create_program(self, database, profile=None):
         """
         Create a new RTK Program database.
 
         :param str database: the RFC1738 URL path to the database to connect
                              with.
+        :keyword dict profile: the engine profile to connect with.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
@@ -213,7 +246,7 @@ class Model(object):
         _msg = 'RTK SUCCESS: Creating RTK Program database {0:s}.'.\
             format(database)
 
-        self.program_dao.db_connect(database)
+        self.program_dao.db_connect(database, profile)
 
         _session = scoped_session(self.program_dao.RTK_SESSION)
         _session.configure(
@@ -240,12 +273,13 @@ class Model(object):
         """
         return self.program_session.query(RTKProgramInfo).all()
 
-    def open_program(self, database):
+    def open_program(self, database, profile=None):
         """
         Open an RTK Program database for analyses.
 
         :param str database: the RFC1738 URL path to the database to connect
                              with.
+        :keyword dict profile: the engine profile to connect with.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
@@ -253,13 +287,13 @@ class Model(object):
         _msg = 'RTK SUCCESS: Opening RTK Program database {0:s}.'.\
             format(database)
 
-        if not self.program_dao.db_connect(database):
-            program_session = self.program_dao.RTK_SESSION
-            program_session.configure(
-                bind=self.program_dao.engine,
-                autoflush=False,
-                expire_on_commit=False)
-            self.program_session = scoped_session(program_session)
+        if not self.program_dao.db_connect(database, profile):
+            self.program_session = self.program_dao.sessions
+
+            # Add any indexes missing from RTK Program databases created by
+            # older versions of RTK.  A missing index only makes the queries
+            # slower so it doesn't keep the database from opening.
+            self.program_dao.db_create_indexes()
 
         else:
             _error_code = 1001
@@ -293,11 +327,16 @@ class Model(object):
         """
         pass
 
-    # pylint: disable=too-many-branches
     def load_globals(self, configuration):
         """
         Load the RTK Program global constants.
 
+        The global lookups and the components tree are read from the RTK
+        Common database with one query per table.  When the RTK Common
+        database is an SQLite file they are also saved to a cache file in the
+        configuration directory.  The cache is used instead of the database
+        until the database file changes.
+
         :param configuration: the currently active RTK Program Configuration()
                               object.
         :type configuration: :class:`rtk.Configuration.Configuration()`
@@ -306,20 +345,113 @@ class Model(object):
         """
         _return = False
 
+        _cache = configuration.RTK_CONF_DIR + '/RTK_globals.cache'
+        _key = self._get_globals_key(configuration)
+
+        _snapshot = None
+        if _key is not None:
+            try:
+                with open(_cache, 'rb') as _file:
+                    _snapshot = cPickle.load(_file)
+            except (IOError, EOFError, AttributeError, ImportError,
+                    IndexError, ValueError, cPickle.UnpicklingError):
+                _snapshot = None
+
+        if _snapshot is None or _snapshot[0] != _key:
+            _snapshot = (_key, ) + self._read_globals()
+
+            # Write to a temporary file first so a partly written cache file
+            # is never read.
+            if _key is not None:
+                try:
+                    with open(_cache + '.tmp', 'wb') as _file:
+                        cPickle.dump(_snapshot, _file,
+                                     cPickle.HIGHEST_PROTOCOL)
+                    os.rename(_cache + '.tmp', _cache)
+                except (IOError, OSError):
+                    pass
+
+        (__, _globals, self.tree) = _snapshot
+
+        for _name, _values in _globals.items():
+            getattr(configuration, _name).update(_values)
+
+        configuration.RTK_CONTROL_TYPES = [_(u"Prevention"), _(u"Detection")]
+
+        return _return
+
+    @staticmethod
+    def _get_globals_key(configuration):
+        """
+        Get the key of the cached global lookups.
+
+        :param configuration: the currently active RTK Program Configuration()
+                              object.
+        :type configuration: :class:`rtk.Configuration.Configuration()`
+        :return: the RTK_GLOBALS_VERSION and the path, modification time, and
+                 size of the RTK Common database file or None if the RTK Common
+                 database is not an SQLite file.
+        :rtype: tuple
+        """
+        _key = None
+
+        if configuration.RTK_COM_BACKEND == 'sqlite':
+            _database = configuration.RTK_COM_INFO['database']
+            try:
+                _stat = os.stat(_database)
+                _key = (RTK_GLOBALS_VERSION, os.path.abspath(_database),
+                        _stat.st_mtime, _stat.st_size)
+            except OSError:
+                _key = None
+
+        return _key
+
+    def _read_globals(self):
+        """
+        Read the global lookups and the components tree from the RTK Common
+        database.
+
+        :return: (_globals, _tree); the dictionary of global lookups with the
+                 Configuration attribute name as the key and the category,
+                 subcategory, failure mode tree.
+        :rtype: (dict, :class:`treelib.Tree`)
+        """
+        _globals = {}
+        _categories = []
+
+        for (_table, _type, _dictionaries) in RTK_GLOBALS:
+            for _name in _dictionaries.values():
+                _globals[_name] = {}
+
+            for _record in self.site_session.query(get_table(_table)).all():
+                _attributes = _record.get_attributes()
+
+                _record_type = None
+                if _type is not None:
+                    _record_type = getattr(_record, _type)
+
+                _name = _dictionaries.get(_record_type)
+                if _name is not None:
+                    _globals[_name][_attributes[0]] = _attributes[1:]
+
+                # The hardware categories are the top level of the components
+                # tree.
+                if _table == 'RTKCategory' and _record_type == 'hardware':
+                    _categories.append(_attributes)
+
         # ------------------------------------------------------------------- #
         # Build the component category, component subcategory, failure modes  #
         # tree.                                                               #
         # ------------------------------------------------------------------- #
-        self.tree.create_node('Components', -1)
-        for _record in self.site_session.query(RTKCategory).\
-                filter(RTKCategory.cat_type == 'hardware').all():
-            self.tree.create_node(
-                _record.name,
-                _record.category_id,
-                parent=-1,
-                data=_record.get_attributes()[1:])
-
-        for _record in self.site_session.query(RTKSubCategory).all():
+        _tree = Tree()
+        _tree.create_node('Components', -1)
+        for _attributes in _categories:
+            _tree.create_node(
+                _attributes[1], _attributes[0], parent=-1,
+                data=_attributes[1:])
+
+        for _record in self.site_session.query(
+                get_table('RTKSubCategory')).all():
             # We need to create a unique identifer for each subcategory because
             # we can't have two nodes in the tree with the same ID, but we can
             # have a category and subcategory with the same ID in the database.
@@ -327,13 +459,14 @@ class Model(object):
             # the tree.
             _identifier = str(_record.category_id) + str(
                 _record.subcategory_id)
-            self.tree.create_node(
+            _tree.create_node(
                 _record.description,
                 _identifier,
                 parent=_record.category_id,
                 data=_record.get_attributes()[2:])
 
-        for _record in self.site_session.query(RTKFailureMode).all():
+        for _record in self.site_session.query(
+                get_table('RTKFailureMode')).all():
             # We need to create a unique identifer for each mode because
             # we can't have two nodes in the tree with the same ID, but we can
             # have a category, subcategory, and/or mode with the same ID in the
@@ -343,215 +476,13 @@ class Model(object):
             _identifier = str(_record.category_id) + \
                 str(_record.subcategory_id) + str(_record.mode_id)
             _parent = str(_record.category_id) + str(_record.subcategory_id)
-            self.tree.create_node(
+            _tree.create_node(
                 _record.description,
                 _identifier,
                 parent=_parent,
                 data=_record.get_attributes()[3:])
 
-        for _record in self.site_session.query(RTKStakeholders).all():
-            configuration.RTK_STAKEHOLDERS[_record.stakeholders_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from RTKCategory.                                 #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKCategory).\
-                filter(RTKCategory.category_id == 'action').all():
-            configuration.RTK_ACTION_CATEGORY[_record.category_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKCategory).\
-                filter(RTKCategory.cat_type == 'incident').all():
-            configuration.RTK_INCIDENT_CATEGORY[_record.category_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKCategory).\
-                filter(RTKCategory.cat_type == 'risk').all():
-            configuration.RTK_SEVERITY[_record.category_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from RTKEnviron.                                  #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKEnviron).\
-                filter(RTKEnviron.environ_type == 'active').all():
-            configuration.RTK_ACTIVE_ENVIRONMENTS[_record.environ_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKEnviron).\
-                filter(RTKEnviron.environ_type == 'dormant').all():
-            configuration.RTK_DORMANT_ENVIRONMENTS[_record.environ_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKEnviron).\
-                filter(RTKEnviron.environ_type == 'development').all():
-            configuration.RTK_SW_DEV_ENVIRONMENTS[_record.environ_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from RTKGroup.                                    #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKGroup).\
-                filter(RTKGroup.group_type == 'affinity').all():
-            configuration.RTK_AFFINITY_GROUPS[_record.group_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKGroup).\
-                filter(RTKGroup.group_type == 'workgroup').all():
-            configuration.RTK_WORKGROUPS[_record.group_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from RTKLevel.                                    #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKLevel).\
-                filter(RTKLevel.level_type == 'probability').all():
-            configuration.RTK_FAILURE_PROBABILITY[_record.level_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKLevel).\
-                filter(RTKLevel.level_type == 'software').all():
-            configuration.RTK_SW_LEVELS[_record.level_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load the dictionaries from RTKMethod.                               #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKMethod).\
-                filter(RTKMethod.method_type == 'detection').all():
-            configuration.RTK_DETECTION_METHODS[_record.method_id] = \
-                _record.get_attributes[1:]
-
-        for _record in self.site_session.query(RTKMethod).\
-                filter(RTKMethod.method_type == 'test').all():
-            configuration.RTK_SW_TEST_METHODS[_record.method_id] = \
-                _record.get_attributes[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from RTKModel.                                    #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKModel).\
-                filter(RTKModel.model_type == 'allocation').all():
-            configuration.RTK_ALLOCATION_MODELS[_record.model_id] = \
-                _record.get_attributes()[1:]
-        for _record in self.site_session.query(RTKModel).\
-                filter(RTKModel.model_type == 'rprediction').all():
-            configuration.RTK_HR_MODEL[_record.model_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load the dictionaries from RTKPhase.                                #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKPhase).\
-                filter(RTKPhase.phase_type == 'lifecycle').all():
-            configuration.RTK_LIFECYCLE[_record.phase_id] = \
-                _record.get_atrributes()[1:]
-
-        for _record in self.site_session.query(RTKPhase).\
-                filter(RTKPhase.phase_type == 'development').all():
-            configuration.RTK_SW_DEV_PHASES[_record.phase_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from RTKRPN.                                      #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKRPN).\
-                filter(RTKRPN.rpn_type == 'detection').all():
-            configuration.RTK_RPN_DETECTION[_record.rpn_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKRPN).\
-                filter(RTKRPN.rpn_type == 'occurrence').all():
-            configuration.RTK_RPN_OCCURRENCE[_record.rpn_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKRPN). \
-                filter(RTKRPN.rpn_type == 'severity').all():
-            configuration.RTK_RPN_SEVERITY[_record.rpn_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from RTKStatus.                                   #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKStatus).\
-                filter(RTKStatus.status_type == 'action').all():
-            configuration.RTK_ACTION_STATUS[_record.status_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKStatus).\
-                filter(RTKStatus.status_type == 'incident').all():
-            configuration.RTK_INCIDENT_STATUS[_record.status_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from RTKType.                                     #
-        # ------------------------------------------------------------------- #
-        configuration.RTK_CONTROL_TYPES = [_(u"Prevention"), _(u"Detection")]
-
-        for _record in self.site_session.query(RTKType). \
-                filter(RTKType.type_type == 'cost').all():
-            configuration.RTK_COST_TYPE[_record.type_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKType).\
-                filter(RTKType.type_type == 'mtbf').all():
-            configuration.RTK_HR_TYPE[_record.type_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKType).\
-                filter(RTKType.type_type == 'incident').all():
-            configuration.RTK_INCIDENT_TYPE[_record.type_id] = \
-                _record.get_attributes[1:]
-
-        for _record in self.site_session.query(RTKType).\
-                filter(RTKType.type_type == 'mttr').all():
-            configuration.RTK_MTTR_TYPE[_record.type_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKType).\
-                filter(RTKType.type_type == 'requirement').all():
-            configuration.RTK_REQUIREMENT_TYPE[_record.type_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKType).\
-                filter(RTKType.type_type == 'validation').all():
-            configuration.RTK_VALIDATION_TYPE[_record.type_id] = \
-                _record.get_attributes()[1:]
-
-        # ------------------------------------------------------------------- #
-        # Load dictionaries from tables not requiring a filter.               #
-        # ------------------------------------------------------------------- #
-        for _record in self.site_session.query(RTKApplication).all():
-            configuration.RTK_SW_APPLICATION[_record.application_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKCriticality).all():
-            configuration.RTK_CRITICALITY[_record.criticality_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKDistribution).all():
-            configuration.RTK_S_DIST[_record.distribution_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKHazards).all():
-            configuration.RTK_HAZARDS[_record.hazard_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKManufacturer).all():
-            configuration.RTK_MANUFACTURERS[_record.manufacturer_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKUnit).\
-                filter(RTKUnit.unit_type == 'measurement').all():
-            configuration.RTK_MEASUREMENT_UNITS[_record.unit_id] = \
-                _record.get_attributes()[1:]
-
-        for _record in self.site_session.query(RTKUser).all():
-            configuration.RTK_USERS[_record.user_id] = \
-                _record.get_attributes()[1:]
-
-        return _return
+        return _globals, _tree
 
     def validate_license(self, license_key):
         """
@@ -741,7 +672,8 @@ class RTK(object):
             _database = self.RTK_CONFIGURATION.RTK_BACKEND + ':///' + \
                 self.RTK_CONFIGURATION.RTK_PROG_INFO['database']
 
-        _error_code, _msg = self.rtk_model.create_program(_database)
+        _error_code, _msg = self.rtk_model.create_program(
+            _database, self.RTK_CONFIGURATION.RTK_DB_PROFILE)
         if _error_code == 0:
             self.request_open_program()
             self.RTK_CONFIGURATION.RTK_USER_LOG.info(_msg)
@@ -779,9 +711,21 @@ class RTK(object):
                 self.RTK_CONFIGURATION.RTK_PROG_INFO['database']
 
         # If the database was successfully opened, create an instance of each
-        # of the slave data controllers.
-        _error_code, _msg = self.rtk_model.open_program(_database)
+        # of the slave data controllers.  The data controllers and the RTK
+        # Program database tables they use aren't imported until now to keep
+        # the start up time down.
+        _error_code, _msg = self.rtk_model.open_program(
+            _database, self.RTK_CONFIGURATION.RTK_DB_PROFILE)
         if _error_code == 0:
+            # pylint: disable=E0401
+            from revision import dtcRevision
+            from usage import dtcUsageProfile
+            from failure_definition import dtcFailureDefinition
+            from function import dtcFunction
+            from analyses.fmea import dtcFMEA
+            from requirement import dtcRequirement
+            from stakeholder import dtcStakeholder
+
             pub.sendMessage('requestOpen')
             self.dic_controllers['revision'] = dtcRevision(
                 self.rtk_model.program_dao, self.RTK_CONFIGURATION, test=False)
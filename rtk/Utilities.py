@@ -11,6 +11,9 @@ this module in other modules that need to interact with the RTK application.
 
 import os
 import os.path
+import sys
+import time
+import __builtin__
 
 # Add localization support.
 import gettext
@@ -55,6 +58,128 @@ class NoMatrixError(Exception):
     pass
 
 
+class ImportProfiler(object):
+    """
+    Records the time taken to import each module while it is running.  The
+    self time of a module excludes the time taken to import the modules it
+    imports; the cumulative time includes it.
+    """
+
+    def __init__(self):
+        """
+        Method to initialize an ImportProfiler instance.
+        """
+
+        # Initialize private dictionary instance attributes.
+
+        # Initialize private list instance attributes.
+        self._lst_stack = []
+
+        # Initialize private scalar instance attributes.
+        self._import = None
+        self._start = None
+        self._stop = None
+
+        # Initialize public dictionary instance attributes.
+        self.dic_times = {}
+
+    def start(self):
+        """
+        Method to start recording import times.
+
+        :return: None
+        :rtype: None
+        """
+
+        self._import = __builtin__.__import__
+        self._start = time.time()
+        __builtin__.__import__ = self._profiled_import
+
+        return None
+
+    def stop(self):
+        """
+        Method to stop recording import times.
+
+        :return: None
+        :rtype: None
+        """
+
+        if self._import is not None:
+            __builtin__.__import__ = self._import
+            self._import = None
+            self._stop = time.time()
+
+        return None
+
+    def _profiled_import(self, name, _globals=None, _locals=None,
+                         fromlist=None, level=-1):
+        """
+        Method to import a module and record how long it took the first time
+        it is imported.  The arguments are those of __import__().
+        """
+
+        # Python 2 tries a relative import from the importing package before
+        # an absolute import unless the level is zero.
+        _relative = None
+        if level != 0 and _globals and '__name__' in _globals:
+            _package = _globals['__name__']
+            if '__path__' not in _globals:
+                _package = _package.rpartition('.')[0]
+            for __ in range(max(level, 1) - 1):
+                _package = _package.rpartition('.')[0]
+            if _package:
+                _relative = (_package + '.' + name).rstrip('.')
+
+        if(sys.modules.get(_relative) is not None or
+           (level < 1 and sys.modules.get(name) is not None)):
+            return self._import(name, _globals, _locals, fromlist, level)
+
+        self._lst_stack.append(0.0)
+        _start = time.time()
+        try:
+            return self._import(name, _globals, _locals, fromlist, level)
+        finally:
+            _cumulative = time.time() - _start
+            _children = self._lst_stack.pop()
+            if self._lst_stack:
+                self._lst_stack[-1] += _cumulative
+            if sys.modules.get(_relative) is not None:
+                name = _relative
+            if name not in self.dic_times:
+                self.dic_times[name] = (_cumulative - _children, _cumulative)
+
+    def report(self, n_modules=25):
+        """
+        Method to create a report of the slowest imports.
+
+        :keyword int n_modules: the number of modules to include in the
+                                report.
+        :return: _report; the report with one module per line, slowest
+                 first.
+        :rtype: str
+        """
+
+        _stop = self._stop
+        if _stop is None:
+            _stop = time.time()
+
+        _lines = ['{0:>10s} {1:>10s}  {2:s}'.format('self [s]', 'cumul [s]',
+                                                    'module')]
+        for _name, _times in sorted(self.dic_times.items(),
+                                    key=lambda x: x[1][0],
+                                    reverse=True)[:n_modules]:
+            _lines.append('{0:10.4f} {1:10.4f}  {2:s}'.format(_times[0],
+                                                             _times[1],
+                                                             _name))
+        _lines.append('{0:d} modules imported; {1:.3f} s since start.'.format(
+            len(self.dic_times), _stop - self._start))
+
+        _report = '\n'.join(_lines) + '\n'
+
+        return _report
+
+
 def create_logger(log_name, log_level, log_file, to_tty=False):
     """
     This function creates a logger instance.
@@ -83,6 +83,7 @@ class ModeDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _mode.mode_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -153,21 +154,7 @@ class ModeDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = 'RTK SUCCESS: Saving all Modes in the FMEA.'
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.mode_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.analyses.fmea.Model.ModeDataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.analyses.fmea.Model.ModeDataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
@@ -235,6 +222,7 @@ class MechanismDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _mechanism.mechanism_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -304,21 +292,7 @@ class MechanismDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = 'RTK SUCCESS: Saving all Mechanisms in the FMEA.'
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.mechanism_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.analyses.fmea.Model.MechanismDataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.analyses.fmea.Model.MechanismDataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
@@ -386,6 +360,7 @@ class CauseDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _cause.cause_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -455,21 +430,7 @@ class CauseDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = 'RTK SUCCESS: Saving all Causes in the FMEA.'
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.cause_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.analyses.fmea.Model.CauseDataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.analyses.fmea.Model.CauseDataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
@@ -546,6 +507,7 @@ class ControlDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _control.control_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -619,21 +581,7 @@ class ControlDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = 'RTK SUCCESS: Saving all Controls in the FMEA.'
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.control_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.analyses.fmea.Model.ControlDataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.analyses.fmea.Model.ControlDataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
@@ -710,6 +658,7 @@ class ActionDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _action.action_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -787,21 +736,7 @@ class ActionDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = 'RTK SUCCESS: Saving all Actions in the FMEA.'
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.action_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.analyses.fmea.Model.ActionDataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.analyses.fmea.Model.ActionDataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
@@ -846,7 +781,12 @@ class FMEADataModel(RTKDataModel):
         """
         RTKDataModel.__init__(self, dao)
 
-        # Initialize private dictionary attributes.
+        # Initialize private dictionary attributes.  These hold the records
+        # retrieved by select_all() keyed by the ID of their parent.
+        self._dic_mechanisms = {}
+        self._dic_causes = {}
+        self._dic_controls = {}
+        self._dic_actions = {}
 
         # Initialize private list attributes.
 
@@ -869,7 +809,9 @@ class FMEADataModel(RTKDataModel):
         Retrieve and build the FMEA tree for Parent ID.
 
         The Parent ID is one of Function ID (functional FMEA) or Hardware ID
-        (hardware FMEA).
+        (hardware FMEA).  Each of the Mode, Mechanism, Cause, Control, and
+        Action tables is queried once for the entire FMEA and the tree is then
+        assembled in memory.
 
         :param str parent_id: the Function ID (functional FMEA) or Hardware ID
                               (hardware FMEA) to retrieve the FMEA and build
@@ -879,11 +821,50 @@ class FMEADataModel(RTKDataModel):
         """
         self._functional = kwargs['functional']
 
-        RTKDataModel.select_all(self)
+        _session = RTKDataModel.select_all(self)
 
         _modes = self.dtm_mode.select_all(
             parent_id, functional=self._functional).nodes
 
+        if self._functional:
+            _mode_filter = RTKMode.function_id == parent_id
+            self._dic_mechanisms = {}
+            self._dic_causes = {}
+            _control_join = [(RTKMode, RTKControl.mode_id == RTKMode.mode_id)]
+            _action_join = [(RTKMode, RTKAction.mode_id == RTKMode.mode_id)]
+            _parent_key = 'mode_id'
+        else:
+            _mode_filter = RTKMode.hardware_id == parent_id
+            _cause_join = [
+                (RTKMechanism,
+                 RTKCause.mechanism_id == RTKMechanism.mechanism_id),
+                (RTKMode, RTKMechanism.mode_id == RTKMode.mode_id)
+            ]
+            _control_join = [
+                (RTKCause, RTKControl.cause_id == RTKCause.cause_id)
+            ] + _cause_join
+            _action_join = [
+                (RTKCause, RTKAction.cause_id == RTKCause.cause_id)
+            ] + _cause_join
+            _parent_key = 'cause_id'
+
+            self._dic_mechanisms = self._do_select_children(
+                _session, self.dtm_mechanism, RTKMechanism,
+                [(RTKMode, RTKMechanism.mode_id == RTKMode.mode_id)],
+                _mode_filter, 'mode_id', 'mechanism_id', 'description')
+            self._dic_causes = self._do_select_children(
+                _session, self.dtm_cause, RTKCause, _cause_join, _mode_filter,
+                'mechanism_id', 'cause_id', 'description')
+
+        self._dic_controls = self._do_select_children(
+            _session, self.dtm_control, RTKControl, _control_join,
+            _mode_filter, _parent_key, 'control_id', 'description')
+        self._dic_actions = self._do_select_children(
+            _session, self.dtm_action, RTKAction, _action_join, _mode_filter,
+            _parent_key, 'action_id', 'action_status')
+
+        _session.close()
+
         for _key in _modes:
             _mode = _modes[_key].data
             if _mode is not None:
@@ -899,8 +880,68 @@ class FMEADataModel(RTKDataModel):
                 else:
                     self._do_add_mechanisms(_mode.mode_id, _node_id)
 
+        # Clear the modified flags only once the whole FMEA tree is built so
+        # nothing read here is written back by the next update_all().
+        for _datamodel in [
+                self.dtm_mechanism, self.dtm_cause, self.dtm_control,
+                self.dtm_action
+        ]:
+            _datamodel._do_mark_clean()  # pylint: disable=protected-access
+        self._do_mark_clean()
+
         return self.tree
 
+    @staticmethod
+    def _do_select_children(session, datamodel, table, joins, mode_filter,
+                            parent_key, id_key, tag_key):
+        """
+        Retrieve every record in table belonging to the FMEA with one query.
+
+        The records are also loaded into the datamodel's treelib Tree() so
+        its select() and last_id work the same as after its own select_all().
+
+        :param session: the SQLAlchemy session to query with.
+        :param datamodel: the Mode, Mechanism, Cause, Control, or Action data
+                          model the table belongs to.
+        :param table: the RTK<MODULE> class of the table to query.
+        :param list joins: list of (RTK<MODULE> class, ON clause) tuples
+                           joining table to RTKMode.
+        :param mode_filter: the filter selecting the FMEA's failure Modes.
+        :param str parent_key: the name of the attribute holding the ID of the
+                               record's parent in the FMEA.
+        :param str id_key: the name of the attribute holding the record's ID.
+        :param str tag_key: the name of the attribute used to tag the record
+                            in the datamodel's treelib Tree().
+        :return: dictionary of the records; key is the parent ID, value is a
+                 list of the records belonging to that parent.
+        :rtype: dict
+        """
+        _dic_children = {}
+
+        for _node in datamodel.tree.children(datamodel.tree.root):
+            datamodel.tree.remove_node(_node.identifier)
+
+        _query = session.query(table)
+        for _table, _on_clause in joins:
+            _query = _query.join(_table, _on_clause)
+
+        for _entity in _query.filter(mode_filter).order_by(
+                getattr(table, id_key)).all():
+            # We get and then set the attributes to replace any None values
+            # (NULL fields in the database) with their default value.
+            _attributes = _entity.get_attributes()
+            _entity.set_attributes(_attributes)
+
+            _entity_id = getattr(_entity, id_key)
+            datamodel.tree.create_node(
+                getattr(_entity, tag_key), _entity_id, parent=0, data=_entity)
+            datamodel.last_id = max(datamodel.last_id, _entity_id)
+
+            _dic_children.setdefault(getattr(_entity, parent_key),
+                                     []).append(_entity)
+
+        return _dic_children
+
     def _do_add_mechanisms(self, mode_id, parent_id):
         """
         Add the failure mechanisms to the FMEA tree for Mode ID.
@@ -912,18 +953,15 @@ class FMEADataModel(RTKDataModel):
         """
         _return = False
 
-        _mechanisms = self.dtm_mechanism.select_all(mode_id).nodes
-        for _key in _mechanisms:
-            _mechanism = _mechanisms[_key].data
-            if _mechanism is not None:
-                _node_id = parent_id + '.' + str(_mechanism.mechanism_id)
-                self.tree.create_node(
-                    tag=_mechanism.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_mechanism)
+        for _mechanism in self._dic_mechanisms.get(mode_id, []):
+            _node_id = parent_id + '.' + str(_mechanism.mechanism_id)
+            self.tree.create_node(
+                tag=_mechanism.description,
+                identifier=_node_id,
+                parent=parent_id,
+                data=_mechanism)
 
-                self._do_add_causes(_mechanism.mechanism_id, _node_id)
+            self._do_add_causes(_mechanism.mechanism_id, _node_id)
 
         return _return
 
@@ -938,19 +976,16 @@ class FMEADataModel(RTKDataModel):
         """
         _return = False
 
-        _causes = self.dtm_cause.select_all(mechanism_id).nodes
-        for _key in _causes:
-            _cause = _causes[_key].data
-            if _cause is not None:
-                _node_id = parent_id + '.' + str(_cause.cause_id)
-                self.tree.create_node(
-                    tag=_cause.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_cause)
+        for _cause in self._dic_causes.get(mechanism_id, []):
+            _node_id = parent_id + '.' + str(_cause.cause_id)
+            self.tree.create_node(
+                tag=_cause.description,
+                identifier=_node_id,
+                parent=parent_id,
+                data=_cause)
 
-                self._do_add_controls(_cause.cause_id, _node_id)
-                self._do_add_actions(_cause.cause_id, _node_id)
+            self._do_add_controls(_cause.cause_id, _node_id)
+            self._do_add_actions(_cause.cause_id, _node_id)
 
         return _return
 
@@ -966,21 +1001,16 @@ class FMEADataModel(RTKDataModel):
         """
         _return = False
 
-        _controls = self.dtm_control.select_all(
-            cause_id, functional=self._functional).nodes
-
-        for _key in _controls:
-            _control = _controls[_key].data
-            if _control is not None:
-                # Since Controls and Actions are at the same level in the FMEA
-                # tree, we prepend a zero to the Control ID to differentiate it
-                # from an Action.
-                _node_id = parent_id + '.0' + str(_control.control_id)
-                self.tree.create_node(
-                    tag=_control.description,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_control)
+        for _control in self._dic_controls.get(cause_id, []):
+            # Since Controls and Actions are at the same level in the FMEA
+            # tree, we prepend a zero to the Control ID to differentiate it
+            # from an Action.
+            _node_id = parent_id + '.0' + str(_control.control_id)
+            self.tree.create_node(
+                tag=_control.description,
+                identifier=_node_id,
+                parent=parent_id,
+                data=_control)
 
         return _return
 
@@ -996,17 +1026,13 @@ class FMEADataModel(RTKDataModel):
         """
         _return = False
 
-        _actions = self.dtm_action.select_all(
-            cause_id, functional=self._functional).nodes
-        for _key in _actions:
-            _action = _actions[_key].data
-            if _action is not None:
-                _node_id = parent_id + '.' + str(_action.action_id)
-                self.tree.create_node(
-                    tag=_action.action_category,
-                    identifier=_node_id,
-                    parent=parent_id,
-                    data=_action)
+        for _action in self._dic_actions.get(cause_id, []):
+            _node_id = parent_id + '.' + str(_action.action_id)
+            self.tree.create_node(
+                tag=_action.action_category,
+                identifier=_node_id,
+                parent=parent_id,
+                data=_action)
 
         return _return
 
@@ -1138,21 +1164,7 @@ class FMEADataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = 'RTK SUCCESS: Saving all Controls in the FMEA.'
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.identifier)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.analyses.fmea.Model.FMEADataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.analyses.fmea.Model.FMEADataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
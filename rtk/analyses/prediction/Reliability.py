@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+"""
+Contains functions for performing MIL-HDBK-217F hazard rate predictions on
+whole populations of components at once.
+"""
+
+# -*- coding: utf-8 -*-
+#
+#       rtk.analyses.prediction.Reliability.py is part of The RTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+#    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#    "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#    LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+#    PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER
+#    OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#    EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#    PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#    PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#    LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#    NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#    SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# Add NLS support.
+import gettext
+
+import numpy as np
+
+# Import other RTK modules.
+try:
+    import Configuration
+    from hardware.component.integrated_circuit.Logic import Logic
+    from hardware.component.resistor.fixed.Film import Film
+except ImportError:
+    import rtk.Configuration as Configuration
+    from rtk.hardware.component.integrated_circuit.Logic import Logic
+    from rtk.hardware.component.resistor.fixed.Film import Film
+
+__author__ = 'Andrew Rowland'
+__email__ = 'andrew.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2007 - 2017 Andrew "weibullguy" Rowland'
+
+_ = gettext.gettext
+
+# Upper limits of the Logic IC gate count ranges used to select C1 and the
+# parts count base hazard rate.
+_GATE_LIMITS = [0, 100, 1000, 3000, 10000, 30000, 60000]
+
+# Lower limits of the Film resistor resistance ranges used to select piR.
+_RESISTANCE_LIMITS = [1.0E5, 1.0E6, 1.0E7]
+
+
+def _get_attributes(parts, attributes):
+    """
+    Function to gather the same attributes from a list of components into
+    NumPy arrays.
+
+    :param list parts: the list of component data model instances.
+    :param tuple attributes: the names of the attributes to gather.
+    :return: _dic_arrays; dictionary of {attribute name: array of values}.
+    :rtype: dict
+    """
+
+    _dic_arrays = {}
+    for _attribute in attributes:
+        _dic_arrays[_attribute] = np.array([getattr(_part, _attribute)
+                                            for _part in parts])
+
+    return _dic_arrays
+
+
+def _in_range(index, size):
+    """
+    Function to determine which entries of an index array point into a
+    lookup table of the given size.
+
+    :param index: the array of zero-based lookup table indices.
+    :type index: :py:class:`numpy.ndarray`
+    :param int size: the number of entries in the lookup table.
+    :return: boolean array; True where the index is valid.
+    :rtype: :py:class:`numpy.ndarray`
+    """
+
+    return (index >= 0) & (index < size)
+
+
+def _lookup(table, *indices):
+    """
+    Function to retrieve values from a (possibly nested) lookup table for
+    every row of the index arrays.  Indices outside the table are clipped so
+    the lookup always succeeds; callers mask those rows with _in_range().
+
+    :param list table: the lookup table.
+    :param indices: the arrays of zero-based indices, one per table
+                    dimension.
+    :return: array of looked up values.
+    :rtype: :py:class:`numpy.ndarray`
+    """
+
+    _table = np.asarray(table)
+    _indices = tuple(np.clip(_index, 0, _table.shape[_dim] - 1)
+                     for _dim, _index in enumerate(indices))
+
+    return _table[_indices]
+
+
+def _adjust_hazard_rate(parts, hazard_rate):
+    """
+    Function to apply the user adjustment factors, duty cycle, quantity, and
+    the hazard rate multiplier to an array of model hazard rates.
+
+    :param list parts: the list of component data model instances.
+    :param hazard_rate: the array of model hazard rates.
+    :type hazard_rate: :py:class:`numpy.ndarray`
+    :return: array of active hazard rates.
+    :rtype: :py:class:`numpy.ndarray`
+    """
+
+    _data = _get_attributes(parts, ('add_adj_factor', 'duty_cycle',
+                                    'mult_adj_factor', 'quantity'))
+
+    hazard_rate = (hazard_rate + _data['add_adj_factor']) * \
+                  (_data['duty_cycle'] / 100.0) * \
+                  _data['mult_adj_factor'] * _data['quantity']
+
+    return hazard_rate / Configuration.FRMULT
+
+
+def _do_finish_part(part):
+    """
+    Function to calculate the overstress condition and operating point ratios
+    of a component whose active hazard rate has been calculated.
+
+    :param part: the component data model instance.
+    """
+
+    part._overstressed()                    # pylint: disable=W0212
+
+    part.current_ratio = part.operating_current / part.rated_current
+    part.voltage_ratio = part.operating_voltage / part.rated_voltage
+    part.power_ratio = part.operating_power / part.rated_power
+
+
+def _calculate_by_part(parts):
+    """
+    Function to calculate the hazard rate of each component with the
+    component's own calculate_part() method.
+
+    :param list parts: the list of component data model instances.
+    :return: False if successful or True if an error is encountered.
+    :rtype: bool
+    """
+
+    _return = False
+    for _part in parts:
+        _return = _part.calculate_part() or _return
+
+    return _return
+
+
+def _calculate_logic(parts):
+    """
+    Function to calculate the hazard rates of a list of Logic ICs.
+
+    :param list parts: the list of Logic IC data model instances.
+    :return: False if successful or True if an error is encountered.
+    :rtype: bool
+    """
+
+    _data = _get_attributes(parts, ('hazard_rate_type', 'quality',
+                                    'environment_active', 'technology',
+                                    'family', 'n_gates', 'package', 'n_pins',
+                                    'years_production', 'case_temperature',
+                                    'operating_power', 'thermal_resistance',
+                                    'base_hr'))
+
+    _quality = _data['quality'] - 1
+    _environment = _data['environment_active'] - 1
+    _technology = _data['technology'] - 1
+    _family = _data['family'] - 1
+    _gates = np.searchsorted(_GATE_LIMITS, _data['n_gates']) - 1
+
+    _count = _data['hazard_rate_type'] == 1
+    _stress = (_data['hazard_rate_type'] == 2) & \
+        _in_range(_family, len(Logic._Ea[0]))
+
+    with np.errstate(all='ignore'):
+        _piQ = _lookup(Logic._piQ, _quality)
+
+        # MIL-HDBK-217F parts count.
+        _lambdab = _lookup(Logic._lst_lambdab_count, _technology, _gates,
+                           _environment)
+
+        # MIL-HDBK-217F parts stress.
+        _C1 = _lookup(Logic._C1, _technology, _gates)
+        _junction_temperature = _data['case_temperature'] + \
+            _data['operating_power'] * _data['thermal_resistance']
+        _Ea = _lookup(Logic._Ea, _technology, _family)
+        _piT = 0.1 * np.exp((-_Ea / 8.617E-5) *
+                            ((1.0 / (_junction_temperature + 273.0)) -
+                             (1.0 / 296.0)))
+
+        _package = _data['package']
+        _conditions = [np.in1d(_package, [1, 2, 3]), _package == 4,
+                       _package == 5, _package == 6]
+        _constant0 = np.select(_conditions, [2.8E-4, 9.0E-5, 3.0E-5, 3.0E-5],
+                               3.6E-4)
+        _constant1 = np.select(_conditions, [1.08, 1.51, 1.82, 2.01], 1.08)
+        _C2 = _constant0 * np.power(_data['n_pins'].astype(float), _constant1)
+
+        _piL = 0.01 * np.exp(5.35 - 0.35 * _data['years_production'])
+        _piE = _lookup(Logic._piE, _environment)
+
+        _hazard_rate = np.where(_count, _lambdab * _piQ,
+                                (_C1 * _piT + _C2 * _piE) * _piQ * _piL)
+        _hazard_rate = _adjust_hazard_rate(parts, _hazard_rate)
+
+    # Any part the arrays can't reproduce exactly (out of range indices,
+    # unknown models, arithmetic errors) is calculated the slow way so it
+    # ends up in the same state calculate_part() would leave it in.
+    _vectorized = (_count | _stress) & np.isfinite(_hazard_rate) & \
+        _in_range(_quality, len(Logic._piQ)) & \
+        _in_range(_environment, len(Logic._piE)) & \
+        _in_range(_technology, len(Logic._C1)) & \
+        (_data['n_gates'] > 0) & (_data['n_gates'] < 60001)
+
+    _lst_fallback = []
+    for _idx, _part in enumerate(parts):
+        if not _vectorized[_idx]:
+            _lst_fallback.append(_part)
+            continue
+
+        _part.hazard_rate_model = {}
+        _part.piQ = float(_piQ[_idx])
+        _part.hazard_rate_model['piQ'] = _part.piQ
+
+        if _count[_idx]:
+            _part._lambdab_count = \
+                Logic._lst_lambdab_count[_technology[_idx]][_gates[_idx]]
+            _part.hazard_rate_model['equation'] = 'lambdab * piQ'
+            _part.hazard_rate_model['lambdab'] = float(_lambdab[_idx])
+        else:
+            _part.C1 = float(_C1[_idx])
+            _part.junction_temperature = float(_junction_temperature[_idx])
+            _part.piT = float(_piT[_idx])
+            _part.C2 = float(_C2[_idx])
+            _part.piL = float(_piL[_idx])
+            _part.piE = float(_piE[_idx])
+            _part.hazard_rate_model['equation'] = \
+                '(C1 * piT + C2 * piE) * piQ * piL'
+            _part.hazard_rate_model['C1'] = _part.C1
+            _part.hazard_rate_model['piT'] = _part.piT
+            _part.hazard_rate_model['C2'] = _part.C2
+            _part.hazard_rate_model['piL'] = _part.piL
+            _part.hazard_rate_model['lambdab'] = _part.base_hr
+            _part.hazard_rate_model['piE'] = _part.piE
+
+        _part.hazard_rate_active = float(_hazard_rate[_idx])
+        _do_finish_part(_part)
+
+    return _calculate_by_part(_lst_fallback)
+
+
+def _calculate_film(parts):
+    """
+    Function to calculate the hazard rates of a list of fixed Film resistors.
+
+    :param list parts: the list of Film resistor data model instances.
+    :return: False if successful or True if an error is encountered.
+    :rtype: bool
+    """
+
+    _data = _get_attributes(parts, ('hazard_rate_type', 'quality',
+                                    'environment_active', 'specification',
+                                    'operating_power', 'rated_power',
+                                    'temperature_active', 'resistance'))
+
+    _quality = _data['quality'] - 1
+    _environment = _data['environment_active'] - 1
+    _specification = _data['specification'] - 1
+
+    _count = (_data['hazard_rate_type'] == 1) & \
+        _in_range(_quality, len(Film._lst_piQ_count)) & \
+        _in_range(_specification, len(Film._lambdab_count))
+    _stress = (_data['hazard_rate_type'] == 2) & \
+        _in_range(_quality, len(Film._lst_piQ_stress))
+
+    with np.errstate(all='ignore'):
+        # MIL-HDBK-217F parts count.
+        _lambdab_count = _lookup(Film._lambdab_count, _specification,
+                                 _environment)
+        _piQ_count = _lookup(Film._lst_piQ_count, _quality)
+
+        # MIL-HDBK-217F parts stress.
+        _temperature = _data['temperature_active'] + 273.0
+        _ratio = _data['operating_power'] / _data['rated_power']
+        _lambdab_stress = np.where(
+            _data['specification'] < 3,
+            3.25E-4 * np.exp((_temperature / 343.0)**3.0) *
+            np.exp(_ratio * (_temperature / 273.0)),
+            5.0E-5 * np.exp(3.5 * (_temperature / 343.0)) *
+            np.exp(_ratio * (_temperature / 273.0)))
+        _piR = _lookup(Film._lst_piR,
+                       np.searchsorted(_RESISTANCE_LIMITS,
+                                       _data['resistance'], side='right'))
+        _piQ_stress = _lookup(Film._lst_piQ_stress, _quality)
+        _piE = _lookup(Film._lst_piE, _environment)
+
+        _hazard_rate = np.where(_count, _lambdab_count * _piQ_count,
+                                _lambdab_stress * _piR * _piQ_stress * _piE)
+        _hazard_rate = _adjust_hazard_rate(parts, _hazard_rate)
+
+    _vectorized = (_count | _stress) & np.isfinite(_hazard_rate) & \
+        _in_range(_environment, len(Film._lst_piE))
+
+    _lst_fallback = []
+    for _idx, _part in enumerate(parts):
+        if not _vectorized[_idx]:
+            _lst_fallback.append(_part)
+            continue
+
+        _part.hazard_rate_model = {}
+        if _count[_idx]:
+            _part._lst_lambdab_count = \
+                Film._lambdab_count[_specification[_idx]]
+            _part.base_hr = float(_lambdab_count[_idx])
+            _part.piQ = float(_piQ_count[_idx])
+            _part.hazard_rate_model['equation'] = 'lambdab * piQ'
+        else:
+            _part.base_hr = float(_lambdab_stress[_idx])
+            _part.piR = float(_piR[_idx])
+            _part.piQ = float(_piQ_stress[_idx])
+            _part.piE = float(_piE[_idx])
+            _part.hazard_rate_model['equation'] = 'lambdab * piR * piQ * piE'
+            _part.hazard_rate_model['piR'] = _part.piR
+            _part.hazard_rate_model['piE'] = _part.piE
+        _part.hazard_rate_model['lambdab'] = _part.base_hr
+        _part.hazard_rate_model['piQ'] = _part.piQ
+
+        _part.hazard_rate_active = float(_hazard_rate[_idx])
+        _do_finish_part(_part)
+
+    return _calculate_by_part(_lst_fallback)
+
+
+# Vectorized calculation functions keyed by the component class they handle.
+# Subclasses are deliberately not matched; a subclass may override the model.
+_CALCULATORS = {Logic: _calculate_logic,
+                Film: _calculate_film}
+
+
+def calculate_parts(parts):
+    """
+    Function to calculate the MIL-HDBK-217F hazard rates of a list of
+    components.  Components are grouped by class and each group with a
+    vectorized model is calculated with array operations; every other
+    component is calculated with its own calculate_part() method.  The
+    components are left in the same state calculate_part() leaves them in.
+
+    :param list parts: the list of component data model instances.
+    :return: False if successful or True if an error is encountered.
+    :rtype: bool
+    """
+
+    _dic_groups = {}
+    for _part in parts:
+        _dic_groups.setdefault(type(_part), []).append(_part)
+
+    _return = False
+    for _class, _parts in _dic_groups.items():
+        _calculator = _CALCULATORS.get(_class, _calculate_by_part)
+        _return = _calculator(_parts) or _return
+
+    return _return
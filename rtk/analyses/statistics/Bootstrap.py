@@ -0,0 +1,483 @@
+#!/usr/bin/env python
+"""
+Contains functions for calculating non-parametric bootstrap confidence bounds
+on survival and reliability growth estimates.
+"""
+
+# -*- coding: utf-8 -*-
+#
+#       rtk.analyses.statistics.Bootstrap.py is part of The RTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
+#
+# Redistribution and use in source and binary forms, with or without 
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, 
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice, 
+#    this list of conditions and the following disclaimer in the documentation 
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors 
+#    may be used to endorse or promote products derived from this software 
+#    without specific prior written permission.
+#
+#    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS 
+#    "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT 
+#    LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A 
+#    PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER 
+#    OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+#    EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+#    PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR 
+#    PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF 
+#    LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING 
+#    NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS 
+#    SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# Import mathematical functions.
+from functools import partial
+import multiprocessing
+import numpy as np
+from numpy.linalg import LinAlgError
+import scipy.optimize as optimize
+from scipy.stats import norm                # pylint: disable=E0611
+
+# Import other RTK modules.
+try:
+    from analyses.statistics.Distributions import LogNormal, Weibull, \
+        split_data_set, trim_data_set
+    from analyses.statistics.growth.CrowAMSAA import \
+        calculate_crow_amsaa_parameters
+    from analyses.survival.KaplanMeier import kaplan_meier, kaplan_meier_mean
+    from analyses.survival.MCF import mean_cumulative_function
+except ImportError:                         # pragma: no cover
+    from rtk.analyses.statistics.Distributions import LogNormal, Weibull, \
+        split_data_set, trim_data_set
+    from rtk.analyses.statistics.growth.CrowAMSAA import \
+        calculate_crow_amsaa_parameters
+    from rtk.analyses.survival.KaplanMeier import kaplan_meier, \
+        kaplan_meier_mean
+    from rtk.analyses.survival.MCF import mean_cumulative_function
+
+__author__ = 'Andrew Rowland'
+__email__ = 'andrew.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2007 - 2015 Andrew "weibullguy" Rowland'
+
+# The number of resamples refit by each bootstrap task.
+_BOOTSTRAP_CHUNK = 100
+
+
+def _expand_units(samples, order, starts, counts):
+    """
+    Function to find the records and the new unit numbers of a resample of
+    units.
+
+    :param ndarray samples: the indices of the units in the resample.
+    :param ndarray order: the record indices sorted by unit.
+    :param ndarray starts: the position in order of each unit's first record.
+    :param ndarray counts: the number of records of each unit.
+    :return: (_records, _units); the record indices in the resample and the
+             unit number of each record.  Each unit drawn is a new unit, even
+             if it is drawn more than once.
+    :rtype: tuple of ndarrays
+    """
+
+    _counts = counts[samples]
+    _offset = np.arange(np.sum(_counts)) - \
+        np.repeat(np.cumsum(_counts) - _counts, _counts)
+    _records = order[np.repeat(starts[samples], _counts) + _offset]
+    _units = np.repeat(np.arange(len(samples)), _counts)
+
+    return _records, _units
+
+
+def _refit(task):
+    """
+    Function to calculate the statistic for a block of resamples.  This is run
+    by the worker processes started by bootstrap() so it must be a
+    module-level function and the statistic must be a module-level function
+    or a functools.partial of one.
+
+    :param tuple task: the (statistic, data set, record order, unit starts,
+                       unit counts, resamples, number of statistic values) of
+                       the block.
+    :return: _values; the statistic for each resample (rows).  Resamples the
+             statistic can't be calculated for are NaN.
+    :rtype: ndarray
+    """
+
+    (_statistic, _data, _order, _starts, _counts, _samples, _n_values) = task
+
+    _values = np.full((len(_samples), _n_values), np.nan)
+    for _index, _sample in enumerate(_samples):
+        (_records, _units) = _expand_units(_sample, _order, _starts, _counts)
+        try:
+            _values[_index] = _statistic(_data[_records], _units)
+        except(ArithmeticError, IndexError, TypeError, ValueError,
+               LinAlgError):
+            pass
+
+    return _values
+
+
+def _map(tasks, workers):
+    """
+    Function to run bootstrap tasks in this process or a process pool.
+
+    :param list tasks: the _refit() tasks to run.
+    :param int workers: the number of worker processes to use.  If None, one
+                        worker per CPU is used.  If 1, the tasks are run in
+                        this process.
+    :return: _values; the statistic for each resample of every task.
+    :rtype: ndarray
+    """
+
+    if workers == 1:
+        _values = [_refit(_task) for _task in tasks]
+    else:
+        _pool = multiprocessing.Pool(processes=workers)
+        try:
+            _values = _pool.map(_refit, tasks, chunksize=1)
+        finally:
+            _pool.close()
+            _pool.join()
+
+    return np.concatenate(_values)
+
+
+def bootstrap(data, statistic, n_resamples=2000, conf=0.75,
+              method='percentile', units=None, seed=None, workers=None):
+    """
+    Function to calculate non-parametric bootstrap confidence bounds on a
+    statistic.  Units are resampled with replacement and all the records of
+    each unit drawn are passed to the statistic.
+
+    :param ndarray data: the data set; one record per row.
+    :param statistic: the function that calculates the statistic.  It is
+                      passed the records and the unit number of each record
+                      and returns a list of floats.  It must be a module-level
+                      function or a functools.partial of one.
+    :keyword int n_resamples: the number of bootstrap resamples.
+    :keyword float conf: the two-sided confidence level of the bounds.
+    :keyword str method: the interval method; one of:
+                         * percentile = percentile interval (default)
+                         * bca = bias corrected and accelerated interval
+    :keyword ndarray units: the unit each record belongs to.  If None, each
+                            record is a unit.
+    :keyword int seed: the seed for the random number generator.
+    :keyword int workers: the number of worker processes to use.  If None, one
+                          worker per CPU is used.  If 1, the resamples are
+                          refit in this process.
+    :return: (_lower, _point, _upper); the lower bound, point estimate, and
+             upper bound of each statistic value.
+    :rtype: tuple of ndarrays
+    """
+
+    _data = np.asarray(data)
+    if units is None:
+        units = np.arange(len(_data))
+
+    (__, _unit) = np.unique(units, return_inverse=True)
+    _order = np.argsort(_unit, kind='mergesort')
+    _counts = np.bincount(_unit)
+    _starts = np.cumsum(_counts) - _counts
+    _n_units = len(_counts)
+
+    _point = np.asarray(statistic(_data, _unit), dtype=float)
+    _n_values = len(_point)
+
+    # Draw all the resamples up front so the results only depend on the seed.
+    _random = np.random.RandomState(seed)
+    _samples = _random.randint(0, _n_units, size=(n_resamples, _n_units))
+    _tasks = [(statistic, _data, _order, _starts, _counts,
+               _samples[_start:_start + _BOOTSTRAP_CHUNK], _n_values)
+              for _start in range(0, n_resamples, _BOOTSTRAP_CHUNK)]
+
+    # The jackknife (leave one unit out) estimates give the acceleration of
+    # the BCa interval.
+    if method == 'bca':
+        _n_jack = _n_units - 1
+        _jack = np.arange(_n_jack)[np.newaxis, :]
+        _jack = _jack + (_jack >= np.arange(_n_units)[:, np.newaxis])
+        _tasks += [(statistic, _data, _order, _starts, _counts,
+                    _jack[_start:_start + _BOOTSTRAP_CHUNK], _n_values)
+                   for _start in range(0, _n_units, _BOOTSTRAP_CHUNK)]
+
+    _values = _map(_tasks, workers)
+    _resamples = _values[:n_resamples]
+
+    _alpha = (1.0 - conf) / 2.0
+    if method == 'bca':
+        _jack = _values[n_resamples:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            _bias = norm.ppf(np.sum(_resamples < _point, axis=0) /
+                             np.sum(np.isfinite(_resamples), axis=0,
+                                    dtype=float))
+            _diff = np.nanmean(_jack, axis=0) - _jack
+            _accel = np.nansum(_diff**3.0, axis=0) / \
+                (6.0 * np.nansum(_diff**2.0, axis=0)**1.5)
+        _accel[np.logical_not(np.isfinite(_accel))] = 0.0
+
+        _z = norm.ppf([_alpha, 1.0 - _alpha])
+        _lower = np.zeros(_n_values)
+        _upper = np.zeros(_n_values)
+        for _index in range(_n_values):
+            _q = norm.cdf(_bias[_index] + (_bias[_index] + _z) /
+                          (1.0 - _accel[_index] * (_bias[_index] + _z)))
+            (_lower[_index],
+             _upper[_index]) = np.nanpercentile(_resamples[:, _index],
+                                                100.0 * _q)
+    else:
+        (_lower, _upper) = np.nanpercentile(_resamples,
+                                            [100.0 * _alpha,
+                                             100.0 * (1.0 - _alpha)], axis=0)
+
+    return _lower, _point, _upper
+
+
+def _weibull_score_prime(pars, data):
+    """
+    Function to find the Jacobian of the Weibull score, which is the negative
+    of the observed information matrix.
+
+    :param list pars: the values of eta and beta.
+    :param ndarray data: the data set in the form returned by
+                         split_data_set().
+    :return: the 2x2 Jacobian of [del_eta, del_beta].
+    :rtype: ndarray
+    """
+
+    return -Weibull().observed_information(pars, data)
+
+
+def _weibull_statistic(data, units, initial):  # pylint: disable=W0613
+    """
+    Function to find the Weibull maximum likelihood estimates of a resample by
+    solving for the zeros of the analytic partial derivatives of the
+    log-likelihood using their analytic Jacobian.
+
+    :param ndarray data: the records of the resample.
+    :param ndarray units: the unit number of each record.
+    :param list initial: the starting values of eta and beta.
+    :return: [eta, beta]
+    :rtype: list of floats
+    """
+
+    (_params, __, _ier, __) = optimize.fsolve(Weibull().score, initial,
+                                              args=(split_data_set(data),),
+                                              fprime=_weibull_score_prime,
+                                              full_output=True)
+    if _ier != 1:
+        raise ArithmeticError
+
+    return _params
+
+
+def _lognormal_statistic(data, units):      # pylint: disable=W0613
+    """
+    Function to find the LogNormal maximum likelihood estimates of a resample.
+
+    :param ndarray data: the records of the resample.
+    :param ndarray units: the unit number of each record.
+    :return: [mu, sigma]
+    :rtype: list of floats
+    """
+
+    return LogNormal().maximum_likelihood_estimate(data, 0.0, np.inf)[0]
+
+
+def _kaplan_meier_mean_statistic(data, units, conf):   # pylint: disable=W0613
+    """
+    Function to find the Kaplan-Meier MTBF of a resample.
+
+    :param ndarray data: the records of the resample in the form passed to
+                         kaplan_meier().
+    :param ndarray units: the unit number of each record.
+    :param float conf: the confidence level passed to kaplan_meier().
+    :return: [MTBF]
+    :rtype: list of floats
+    """
+
+    (_km, _rank) = kaplan_meier([tuple(_record) for _record in data], 0.0,
+                                np.inf, conf)
+
+    return [kaplan_meier_mean(_km, _rank, conf)[1]]
+
+
+def _mcf_statistic(data, units, times):
+    """
+    Function to find the MCF of a resample at a fixed set of times.
+
+    :param ndarray data: the failure and censoring times of the resample in
+                         the form passed to mean_cumulative_function().
+    :param ndarray units: the system number of each time.
+    :param ndarray times: the times at which to find the MCF.
+    :return: the MCF at each time.
+    :rtype: ndarray
+    """
+
+    _data = {}
+    for _unit, _time in zip(units, data):
+        _data.setdefault(_unit, []).append(_time)
+
+    _mcf = np.asarray(mean_cumulative_function(_data))
+    _index = np.searchsorted(_mcf[:, 0], times, side='right') - 1
+
+    return np.where(_index >= 0, _mcf[np.maximum(_index, 0), 3], 0.0)
+
+
+def _crow_amsaa_statistic(data, units, t_star):     # pylint: disable=W0613
+    """
+    Function to find the Crow-AMSAA parameters of a resample of exact failure
+    times.
+
+    :param ndarray data: the (number of failures, failure time) records of the
+                         resample.
+    :param ndarray units: the unit number of each record.
+    :param float t_star: the termination time of the test.
+    :return: [alpha, beta]
+    :rtype: list of floats
+    """
+
+    _data = data[np.argsort(data[:, 1], kind='mergesort')]
+
+    return list(calculate_crow_amsaa_parameters(_data[:, 0].tolist(),
+                                                _data[:, 1].tolist(), t_star))
+
+
+def bootstrap_weibull(data, start, end, n_resamples=2000, conf=0.75,
+                      method='percentile', seed=None, workers=None):
+    """
+    Function to calculate bootstrap bounds on the Weibull parameters.  The
+    point estimates start from the Weibull.maximum_likelihood_estimate()
+    parameters and each resample is refit from the point estimates.  The
+    keywords are the same as those of bootstrap().
+
+    :param ndarray data: the data set in the form passed to
+                         Weibull.maximum_likelihood_estimate().
+    :param float start: the minimum time to include in the fit.
+    :param float end: the maximum time to include in the fit.
+
+    :return: (_lower, _point, _upper); the bounds and point estimates of
+             [eta, beta].
+    :rtype: tuple of ndarrays
+    """
+
+    (_data, __, __, __) = trim_data_set(data, start, end)
+    _initial = Weibull().maximum_likelihood_estimate(_data, start, end)[0][:2]
+    _initial = _weibull_statistic(_data, None, _initial)
+
+    return bootstrap(_data, partial(_weibull_statistic, initial=_initial),
+                     n_resamples, conf, method, None, seed, workers)
+
+
+def bootstrap_lognormal(data, start, end, n_resamples=2000, conf=0.75,
+                        method='percentile', seed=None, workers=None):
+    """
+    Function to calculate bootstrap bounds on the LogNormal parameters.  The
+    keywords are the same as those of bootstrap().
+
+    :param ndarray data: the data set in the form passed to
+                         LogNormal.maximum_likelihood_estimate().
+    :param float start: the minimum time to include in the fit.
+    :param float end: the maximum time to include in the fit.
+
+    :return: (_lower, _point, _upper); the bounds and point estimates of
+             [mu, sigma].
+    :rtype: tuple of ndarrays
+    """
+
+    (_data, __, __, __) = trim_data_set(data, start, end)
+
+    return bootstrap(_data, _lognormal_statistic, n_resamples, conf, method,
+                     None, seed, workers)
+
+
+def bootstrap_kaplan_meier_mean(data, start, end, n_resamples=2000,
+                                conf=0.75, method='percentile', seed=None,
+                                workers=None):
+    """
+    Function to calculate bootstrap bounds on the Kaplan-Meier MTBF.  The
+    keywords are the same as those of bootstrap().
+
+    :param list data: the data set in the form passed to kaplan_meier().
+    :param float start: time at which to start analysis.
+    :param float end: time at which to stop analysis.
+
+    :return: (_lower, _point, _upper); the bounds and point estimate of the
+             MTBF.
+    :rtype: tuple of ndarrays
+    """
+
+    # Keep each record a tuple rather than letting numpy split it into
+    # columns.
+    _records = [_record for _record in data
+                if float(_record[1]) >= start and float(_record[2]) <= end]
+    _data = np.empty(len(_records), dtype=object)
+    _data[:] = _records
+
+    return bootstrap(_data, partial(_kaplan_meier_mean_statistic, conf=conf),
+                     n_resamples, conf, method, None, seed, workers)
+
+
+def bootstrap_mcf(data, n_resamples=2000, conf=0.75, method='percentile',
+                  seed=None, workers=None):
+    """
+    Function to calculate bootstrap bounds on the MCF.  Systems are resampled
+    and the MCF of each resample is found at the unique failure times of the
+    data set.  The keywords are the same as those of bootstrap().
+
+    :param dict data: the data set in the form passed to
+                      mean_cumulative_function().
+
+    :return: (_times, _lower, _point, _upper); the unique failure times and
+             the bounds and point estimates of the MCF at each.
+    :rtype: tuple of ndarrays
+    """
+
+    _units = []
+    _data = []
+    for _key in data.iterkeys():
+        _units.extend([_key] * len(data[_key]))
+        _data.extend(data[_key])
+    _units = np.array(_units)
+    _data = np.array(_data, dtype=object)
+
+    _times = np.asarray(mean_cumulative_function(data))[:, 0]
+
+    (_lower, _point,
+     _upper) = bootstrap(_data, partial(_mcf_statistic, times=_times),
+                         n_resamples, conf, method, _units, seed, workers)
+
+    return _times, _lower, _point, _upper
+
+
+def bootstrap_crow_amsaa(n_failures, fail_times, t_star=0.0,
+                         n_resamples=2000, conf=0.75, method='percentile',
+                         seed=None, workers=None):
+    """
+    Function to calculate bootstrap bounds on the Crow-AMSAA parameters of
+    exact failure times.  Failures are resampled.  The keywords are the same
+    as those of bootstrap().
+
+    :param list n_failures: list of failure counts at each failure time.
+    :param list fail_times: list of failure times.
+    :param float t_star: the termination time for time terminated (Type I)
+                         tests.  If zero, the last failure time is used.
+
+    :return: (_lower, _point, _upper); the bounds and point estimates of
+             [alpha, beta].
+    :rtype: tuple of ndarrays
+    """
+
+    if t_star <= 0.0:
+        t_star = max(fail_times)
+
+    _data = np.column_stack((n_failures, fail_times)).astype(float)
+
+    return bootstrap(_data, partial(_crow_amsaa_statistic, t_star=t_star),
+                     n_resamples, conf, method, None, seed, workers)
@@ -43,7 +43,6 @@ from collections import OrderedDict
 
 # Import mathematical functions.
 import numpy as np
-import scipy.misc as misc
 import scipy.optimize as optimize
 from scipy.special import gamma
 from scipy.stats import chi2, expon, exponweib, lognorm, norm     # pylint: disable=E0611
@@ -80,10 +79,15 @@ def fisher_information(model, p0, X, noise=1.0):    # pylint: disable=C0103
 
     _D = np.zeros((len(p0), X.size))
 
+    # The partial derivatives are central differences evaluated over the
+    # entire grid at once rather than one point at a time.
+    _dx = 1.0e-6
     for i, argname in enumerate(_labels):
-        _D[i, :] = [misc.derivative(
-            lambda p: model(x, **dict(_p0dict, **{argname: p})),
-            _p0dict[argname], dx=1.0e-6) for x in X]
+        _lower = model(X, **dict(_p0dict,
+                                 **{argname: _p0dict[argname] - _dx}))
+        _upper = model(X, **dict(_p0dict,
+                                 **{argname: _p0dict[argname] + _dx}))
+        _D[i, :] = (-0.5 * _lower + 0.5 * _upper) / _dx
 
     _fisher = 1.0 / noise**2 * np.einsum('mk, nk', _D, _D)
 
@@ -157,40 +161,160 @@ def format_data_set(data, start, end):
     if end > 0.0:
         _data = [_rec for _rec in _data if float(_rec[2]) <= end]
 
-    # Expand the data set so there is one record for each failure.  Loop
-    # through the failure quantity passed for each record.
-    _data2 = []
-    for __, _record in enumerate(_data):
-        for __ in range(int(_record[5])):
-            _data2.append((_record[0], _record[1], _record[2], _record[3],
-                           _record[4], 1))
-    _data = np.array(_data2)
-
     # Replace the string status with integer status.
-    _n_suspensions = 0
-    _n_failures = 0
+    _status = []
     for _record in _data:
         if _record[4] == 'Right Censored' or str(_record[4]) == '2':
-            _record[2] = np.inf
-            _record[4] = 2
-            _n_suspensions += 1
+            _status.append(2)
         elif(_record[4] == 'Left Censored' or
              _record[4] == 'Interval Censored' or str(_record[4]) == '3'):
-            _record[4] = 3
-            _n_failures += 1
+            _status.append(3)
         else:
-            _record[4] = 1
-            _n_failures += 1
+            _status.append(1)
+    _status = np.array(_status, dtype=float)
+    _quantity = np.array([int(_record[5]) for _record in _data], dtype=int)
+
+    _n_suspensions = int(np.sum(_quantity[_status == 2]))
+    _n_failures = int(np.sum(_quantity[_status != 2]))
 
     # Coerce the data set into the form necessary for fitting to functions.
-    _data = np.vstack((_data[:, 1], _data[:, 2], _data[:, 5], _data[:, 4],
-                       _data[:, 3]))
-    _data = np.array(np.transpose(_data), dtype=float)
+    # Right censored records have no right of the interval.
+    _data = np.array([(_record[1], _record[2], 1, 0.0, _record[3])
+                      for _record in _data], dtype=float).reshape(-1, 5)
+    _data[_status == 2, 1] = np.inf
+    _data[:, 3] = _status
+
+    # Expand the data set so there is one record for each failure.
+    _data = np.repeat(_data, _quantity, axis=0)
     _n_records = len(_data)
 
     return(_data, _n_records, _n_suspensions, _n_failures)
 
 
+class CensoredData(object):
+    """
+    Class to hold a data set split by the status of each observation.  The
+    status masks are applied once when the data set is created so the
+    log-likelihood and partial derivative methods don't need to search the
+    status column every time they are evaluated.
+    """
+
+    def __init__(self, data):
+        """
+        Method to initialize a CensoredData instance.
+
+        :param ndarray data: the data set to split.
+                             * 0 - left of the observation time interval
+                             * 1 - right of the observation time interval
+                             * 2 - number of events occurring at the
+                                   observation time
+                             * 3 - status, where status is:
+                                * 1 - event
+                                * 2 - right censored
+                                * 3 - left censored
+                                * 4 - interval censored
+        """
+
+        _event = data[:, 3] == 1
+        _right = data[:, 3] == 2
+        _interval = np.logical_or(data[:, 3] == 3, data[:, 3] == 4)
+
+        self.event_t = data[_event, 1]
+        self.event_n = data[_event, 2]
+        self.right_t = data[_right, 1]
+        self.right_n = data[_right, 2]
+        self.interval_lt = data[_interval, 0]
+        self.interval_rt = data[_interval, 1]
+        self.interval_n = data[_interval, 2]
+
+
+def split_data_set(data):
+    """
+    Function to split a data set by the status of each observation.
+
+    :param data: the data set to split.  This is either a numpy array in the
+                 form returned by format_data_set() or a CensoredData instance
+                 that has already been split.
+    :return: _data; the data set split by status.
+    :rtype: :class:`CensoredData`
+    """
+
+    if isinstance(data, CensoredData):
+        _data = data
+    elif isinstance(data, PreparedData):
+        if data.censored is None:
+            data.censored = CensoredData(data.raw)
+        _data = data.censored
+    else:
+        _data = CensoredData(data)
+
+    return _data
+
+
+class PreparedData(object):
+    """
+    Class to hold a data set that has been sorted by the right of the interval
+    and trimmed to a time window.  A PreparedData instance can be passed to the
+    maximum_likelihood_estimate() methods and to regression() in place of the
+    data set so several fits over the same window share the work.
+    """
+
+    def __init__(self, data, start, end):
+        """
+        Method to initialize a PreparedData instance.
+
+        :param ndarray data: the data set to prepare in the form returned by
+                             format_data_set().
+        :param float start: the minimum time to include in the fits.
+        :param float end: the maximum time to include in the fits.
+        """
+
+        self.raw = data
+        self.start = start
+        self.end = end
+        (self.data, self.n_suspensions,
+         self.n_failures, self.n_records) = trim_data_set(data, start, end)
+
+        # These are filled in by the first fit that needs them.
+        self.censored = None
+        self.median_ranks = None
+
+
+def trim_data_set(data, start, end):
+    """
+    Function to sort a data set by the right of the interval and remove the
+    records occurring before the start time and after the end time.
+
+    :param data: the data set to trim.  This is either a numpy array in the
+                 form returned by format_data_set() or a PreparedData
+                 instance.  A PreparedData instance for the same window is
+                 not sorted again.
+    :param float start: the minimum time to include in the fit.
+    :param float end: the maximum time to include in the fit.
+    :return: (_data, _n_suspensions, _n_failures, _n_records); a copy of the
+             trimmed data set and the number of suspensions, failures and
+             records in it.
+    :rtype: tuple
+    """
+
+    if isinstance(data, PreparedData):
+        if data.start == start and data.end == end:
+            return (data.data.copy(), data.n_suspensions, data.n_failures,
+                    data.n_records)
+        data = data.raw
+
+    _data = np.array(data, dtype=float)
+    _data = _data[np.argsort(_data[:, 1], kind='mergesort')]
+    _data = _data[np.logical_and(_data[:, 0] >= start, _data[:, 1] <= end)]
+
+    # Count the number of suspensions, failures, and records.
+    _n_suspensions = np.sum(_data[_data[:, 3] == 2, 2])
+    _n_failures = np.sum(_data[np.in1d(_data[:, 3], [1, 3, 4]), 2])
+    _n_records = len(_data)
+
+    return (_data, _n_suspensions, _n_failures, _n_records)
+
+
 class Exponential(object):
     """
     Class for the Exponential distribution.
@@ -234,26 +358,25 @@ class Exponential(object):
         """
 
 # TODO: Extend this to the two-parameter Exponential
+        _data = split_data_set(data)
+
         # Calculate the value of the log-likelihood for the event observations.
-        _event_t = data[np.where(data[:, 3] == 1)][:, 1]
-        _event_n = data[np.where(data[:, 3] == 1)][:, 2]
+        _event_t = _data.event_t
+        _event_n = _data.event_n
         _event_ll = np.sum(_event_n *
                            np.log((theta * np.exp(-theta * _event_t))))
 
         # Calculate the value of the log-likelihood for the right-censored
         # observations.
-        _right_t = data[np.where(data[:, 3] == 2)][:, 1]
-        _right_n = data[np.where(data[:, 3] == 2)][:, 2]
+        _right_t = _data.right_t
+        _right_n = _data.right_n
         _right_ll = np.sum(_right_n * theta * _right_t)
 
         # Calculate the value of the log-likelihood for the left- and interval-
         # censored observations.
-        _interval_lt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 0]
-        _interval_rt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 1]
-        _interval_n = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                  data[:, 3] == 4))][:, 2]
+        _interval_lt = _data.interval_lt
+        _interval_rt = _data.interval_rt
+        _interval_n = _data.interval_n
 
         _interval_ll = np.sum(_interval_n *
                               ((-theta * _interval_lt) -
@@ -368,26 +491,25 @@ class Exponential(object):
                                 * 4 - interval censored
         """
 
+        _data = split_data_set(data)
+
         # Calculate the value of the log-likelihood for the event observations.
-        _event_t = data[np.where(data[:, 3] == 1)][:, 1]
-        _event_n = data[np.where(data[:, 3] == 1)][:, 2]
+        _event_t = _data.event_t
+        _event_n = _data.event_n
         _event_ll = np.sum(_event_n * ((1.0 / theta) - _event_t))
 
         # Calculate the value of the log-likelihood for the right-censored
         # observations.
-        _right_t = data[np.where(data[:, 3] == 2)][:, 1]
-        _right_n = data[np.where(data[:, 3] == 2)][:, 2]
+        _right_t = _data.right_t
+        _right_n = _data.right_n
         _right_ll = np.sum(_right_n * _right_t)
 
         # Calculate the value of the log-likelihood for the left- and interval-
         # censored observations.  Use the midpoint of the interval as an
         # approximation.
-        _interval_lt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 0]
-        _interval_rt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 1]
-        _interval_n = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                  data[:, 3] == 4))][:, 2]
+        _interval_lt = _data.interval_lt
+        _interval_rt = _data.interval_rt
+        _interval_n = _data.interval_n
 
         # Following are the exact equations for the interval censored
         # observations.
@@ -400,6 +522,49 @@ class Exponential(object):
 
         return _del_theta
 
+    def observed_information(self, theta, data):    # pylint: disable=R0201
+        """
+        Method to calculate the observed information of the exponential
+        log-likelihood function; the negative of the derivative of
+        partial_derivatives() with respect to theta.  This is the Jacobian
+        passed to scipy.optimize.fsolve() when finding the value of theta.
+
+        :param float theta: the scale parameter value at which to evaluate the
+                            observed information.
+        :param ndarray data: the data set to calculate the observed
+                             information for.
+                             * 0 - left of the observation time interval
+                             * 1 - right of the observation time interval
+                             * 2 - number of events occurring at the
+                                   observation time
+                             * 3 - status, where status is:
+                                * 1 - event
+                                * 2 - right censored
+                                * 3 - left censored
+                                * 4 - interval censored
+        :return: _info; the observed information.
+        :rtype: float
+        """
+
+        _data = split_data_set(data)
+
+        # The right-censored observations are linear in theta so they don't
+        # contribute to the observed information.
+        _event_info = np.sum(_data.event_n) / theta**2.0
+
+        _exp_l = np.exp(-theta * _data.interval_lt)
+        _exp_r = np.exp(-theta * _data.interval_rt)
+        _n = (_data.interval_lt * _exp_l) - (_data.interval_rt * _exp_r)
+        _d = _exp_l - _exp_r
+        _dn = (_data.interval_rt**2.0 * _exp_r) - \
+              (_data.interval_lt**2.0 * _exp_l)
+        _interval_info = np.sum(_data.interval_n *
+                                ((_dn * _d) + _n**2.0) / _d**2.0)
+
+        _info = _event_info + _interval_info
+
+        return _info
+
     def maximum_likelihood_estimate(self, data, start, end):
         """
         Method to fit data to a parametric distribution and find point
@@ -434,28 +599,25 @@ class Exponential(object):
 
         # Sort data by the right of the interval.  Remove records occurring
         # before the start time and after the end time.
-        _data = sorted(data, key=lambda x: float(x[1]))
-        _data = [_rec for _rec in _data if float(_rec[0]) >= start]
-        _data = [_rec for _rec in _data if float(_rec[1]) <= end]
-        _data = np.array(_data)
-
-        # Count the number of suspensions, failures, and records.
-        _n_suspensions = sum(x[2] for x in _data if x[3] == 2)
-        _n_failures = sum(x[2] for x in _data
-                          if x[3] == 1 or x[3] == 3 or x[3] == 4)
-        _n_records = len(_data)
+        (_data, _n_suspensions,
+         _n_failures, _n_records) = trim_data_set(data, start, end)
 
         # Estimate the initial guess for the scale parameter using the fit
         # function from scipy.stats.  Then minimize the partial derivitive of
         # the likelihood function to find the final theta value.
+        # The data set is split by status once and the observed information
+        # is used as the Jacobian so fsolve doesn't have to estimate it.
+        _split = split_data_set(_data)
         _theta = 1.0 / expon.fit(_data[:, 1])[1]
-        _parameters[0] = optimize.fsolve(self.partial_derivatives, _theta,
-                                         args=(_data))[0]
+        _parameters[0] = optimize.fsolve(
+            self.partial_derivatives, _theta, args=(_split),
+            fprime=lambda theta, data: [-self.observed_information(theta,
+                                                                   data)])[0]
 
         _fI = fisher_information(self.log_pdf, _parameters, _data[:, 3])
         _variance[0] = 1.0 / _fI[0, 0]
 
-        _gof[0] = self.log_likelihood(_parameters[0], _parameters[1], _data)
+        _gof[0] = self.log_likelihood(_parameters[0], _parameters[1], _split)
         _gof[1] = -2.0 * _gof[0] + 2.0
         _gof[2] = -2.0 * _gof[0] + (np.log(_n_records) - np.log(np.pi))
 
@@ -619,29 +781,28 @@ class Gaussian(object):
                                 * 3 - interval censored
         """
 
+        _data = split_data_set(data)
+
         # Calculate the value of the log-likelihood for the event observations.
-        _event_t = data[np.where(data[:, 3] == 1)][:, 1]
-        _event_n = data[np.where(data[:, 3] == 1)][:, 2]
+        _event_t = _data.event_t
+        _event_n = _data.event_n
         _event_ll = np.sum(_event_n *
                            np.log((1.0 / x[1]) *
                                   norm.pdf((_event_t - x[0]) / x[1])))
 
         # Calculate the value of the log-likelihood for the right-censored
         # observations.
-        _right_t = data[np.where(data[:, 3] == 2)][:, 1]
-        _right_n = data[np.where(data[:, 3] == 2)][:, 2]
+        _right_t = _data.right_t
+        _right_n = _data.right_n
         _right_ll = np.sum(_right_n *
                            np.log((1.0 - norm.cdf((np.log(_right_t) - x[0]) /
                                                   x[1]))))
 
         # Calculate the value of the log-likelihood for the left- and interval-
         # censored observations.
-        _interval_lt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 0]
-        _interval_rt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 1]
-        _interval_n = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                  data[:, 3] == 4))][:, 2]
+        _interval_lt = _data.interval_lt
+        _interval_rt = _data.interval_rt
+        _interval_n = _data.interval_n
 
         _interval_ll = np.sum(_interval_n *
                               np.log(norm.cdf((_interval_rt - x[0]) / x[1]) -
@@ -802,12 +963,11 @@ class Gaussian(object):
 
         return(_mu_l, _mu_u, _sigma[1], _sigma[0])
 
-    def partial_derivatives(self, pars, data):         # pylint: disable=C0103, R0201, R0914
+    def score(self, pars, data):         # pylint: disable=C0103, R0201, R0914
         """
-        Method to calculate the value of the partial derivatives of the
-        gaussian log-likelihood function with respect to mu and sigma.  This
-        function is passed as an argument to scipy.optimize.fsolve() to find
-        the values of mu and sigma that simultaneously minimizes the partials.
+        Method to calculate the values of the partial derivatives of the
+        gaussian log-likelihood function with respect to mu and sigma.  These
+        are both zero at the maximum likelihood estimates.
 
         :param list pars: the values of mu and sigma at which to calculate the
                           partials.
@@ -823,9 +983,11 @@ class Gaussian(object):
                                 * 4 - interval censored
         """
 
+        _data = split_data_set(data)
+
         # Calculate the value of the log-likelihood for the event observations.
-        _event_t = data[np.where(data[:, 3] == 1)][:, 1]
-        _event_n = data[np.where(data[:, 3] == 1)][:, 2]
+        _event_t = _data.event_t
+        _event_n = _data.event_n
         _event_sigma = np.sum(_event_n *
                               (((_event_t - pars[0]) / pars[1]**3.0) -
                                (1.0 / pars[1])))
@@ -834,8 +996,8 @@ class Gaussian(object):
 
         # Calculate the value of the log-likelihood for the right-censored
         # observations.
-        _right_t = data[np.where(data[:, 3] == 2)][:, 1]
-        _right_n = data[np.where(data[:, 3] == 2)][:, 2]
+        _right_t = _data.right_t
+        _right_n = _data.right_n
 
         _norm = (_right_t - pars[0]) / pars[1]
         _cdf = norm.cdf(_norm)
@@ -848,12 +1010,9 @@ class Gaussian(object):
         # Calculate the value of the log-likelihood for the left- and interval-
         # censored observations.  Use the midpoint of the interval as an
         # approximation.
-        _interval_lt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 0]
-        _interval_rt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 1]
-        _interval_n = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                  data[:, 3] == 4))][:, 2]
+        _interval_lt = _data.interval_lt
+        _interval_rt = _data.interval_rt
+        _interval_n = _data.interval_n
 
         # Following are the exact equations for the interval censored
         # observations.
@@ -875,8 +1034,122 @@ class Gaussian(object):
         _del_mu = _event_mu + _right_mu - _interval_mu
         _del_sigma = _event_sigma + _right_sigma - _interval_sigma
 
+        return [_del_mu, _del_sigma]
+
+    def partial_derivatives(self, pars, data):         # pylint: disable=C0103, R0201
+        """
+        Method to calculate the value of the partial derivatives of the
+        gaussian log-likelihood function with respect to mu and sigma.  This
+        function is passed as an argument to scipy.optimize.fsolve() to find
+        the values of mu and sigma that simultaneously minimizes the partials.
+
+        :param list pars: the values of mu and sigma at which to calculate the
+                          partials.
+        :param ndarray data: the data set to calculate the log-likelihood for.
+                             * 0 - left of the observation time interval
+                             * 1 - right of the observation time interval
+                             * 2 - number of events occurring at the
+                                   observation time
+                             * 3 - status, where status is:
+                                * 1 - event
+                                * 2 - right censored
+                                * 3 - left censored
+                                * 4 - interval censored
+        """
+
+        (_del_mu, _del_sigma) = self.score(pars, data)
+
         return _del_mu * _del_sigma
 
+    def observed_information(self, pars, data):     # pylint: disable=C0103, R0201, R0914
+        """
+        Method to calculate the observed information of the gaussian
+        log-likelihood function; the negative of the derivatives of score()
+        with respect to mu and sigma.  This is used to build the Jacobian
+        passed to scipy.optimize.fsolve() when finding mu and sigma.
+
+        :param list pars: the values of mu and sigma at which to calculate the
+                          observed information.
+        :param ndarray data: the data set to calculate the observed
+                             information for.
+                             * 0 - left of the observation time interval
+                             * 1 - right of the observation time interval
+                             * 2 - number of events occurring at the
+                                   observation time
+                             * 3 - status, where status is:
+                                * 1 - event
+                                * 2 - right censored
+                                * 3 - left censored
+                                * 4 - interval censored
+        :return: _info; the observed information ordered [mu, sigma].
+        :rtype: ndarray
+        """
+
+        _data = split_data_set(data)
+
+        # Calculate the derivatives for the event observations.
+        _event_n = _data.event_n
+        _event_u = _data.event_t - pars[0]
+        _mu_mu = -np.sum(_event_n) / pars[1]**2.0
+        _mu_sigma = -2.0 * np.sum(_event_n * _event_u) / pars[1]**3.0
+        _sigma_mu = -np.sum(_event_n) / pars[1]**3.0
+        _sigma_sigma = np.sum(_event_n *
+                              ((1.0 / pars[1]**2.0) -
+                               (3.0 * _event_u / pars[1]**4.0)))
+
+        # Calculate the derivatives for the right-censored observations.  _h
+        # is the ratio of the pdf to the survival function used by score()
+        # and _g is _h times the standardized time.
+        _right_n = _data.right_n
+        _norm = (_data.right_t - pars[0]) / pars[1]
+        _h = norm.pdf(_norm) / (1.000000001 - norm.cdf(_norm))
+        _dh = _h * (_h - _norm)
+        _g = _norm * _h
+        _dg = _h + (_norm * _dh)
+        _mu_mu -= np.sum(_right_n * _dh) / pars[1]**2.0
+        _mu_sigma -= np.sum(_right_n * (_h + (_norm * _dh))) / pars[1]**2.0
+        _sigma_mu -= np.sum(_right_n * _dg) / pars[1]**2.0
+        _sigma_sigma -= np.sum(_right_n * (_g + (_norm * _dg))) / pars[1]**2.0
+
+        # Calculate the derivatives for the left- and interval-censored
+        # observations.  _a, _b and _d are the numerators and denominator of
+        # the ratios used by score(); _b2 and _b3 are the higher powers of the
+        # standardized time needed to differentiate them.
+        _interval_n = _data.interval_n
+        _norm_r = (_data.interval_rt - pars[0]) / pars[1]
+        _pdf_r = norm.pdf(_norm_r)
+        _norm_l = (_data.interval_lt - pars[0]) / pars[1]
+        _pdf_l = norm.pdf(_norm_l)
+
+        _a = _pdf_r - _pdf_l
+        _b = (_norm_r * _pdf_r) - (_norm_l * _pdf_l)
+        _b2 = (_norm_r**2.0 * _pdf_r) - (_norm_l**2.0 * _pdf_l)
+        _b3 = (_norm_r**3.0 * _pdf_r) - (_norm_l**3.0 * _pdf_l)
+        _d = norm.cdf(_norm_r) - norm.cdf(_norm_l)
+
+        _ra = _a / _d
+        _rb = _b / _d
+        _ra_mu = (_b + (_ra * _a)) / (pars[1] * _d)
+        _ra_sigma = (_b2 + (_ra * _b)) / (pars[1] * _d)
+        _rb_mu = (_b2 - _a + (_rb * _a)) / (pars[1] * _d)
+        _rb_sigma = (_b3 - _b + (_rb * _b)) / (pars[1] * _d)
+
+        _interval_mu_mu = (1.0 / pars[1]) * np.sum(_interval_n * _ra_mu)
+        _interval_mu_sigma = (1.0 / pars[1]) * \
+            np.sum(_interval_n * (_ra_sigma - (_ra / pars[1])))
+        _interval_sigma_mu = (1.0 / pars[1]) * np.sum(_interval_n * _rb_mu)
+        _interval_sigma_sigma = (1.0 / pars[1]) * \
+            np.sum(_interval_n * (_rb_sigma - (_rb / pars[1])))
+
+        _mu_mu -= _interval_mu_mu
+        _mu_sigma -= _interval_mu_sigma
+        _sigma_mu -= _interval_sigma_mu
+        _sigma_sigma -= _interval_sigma_sigma
+
+        _info = -np.array([[_mu_mu, _mu_sigma], [_sigma_mu, _sigma_sigma]])
+
+        return _info
+
     def maximum_likelihood_estimate(self, data, start, end):    # pylint: disable=R0914
         """
         Method to fit data to a parametric distribution and find point
@@ -909,6 +1182,18 @@ class Gaussian(object):
 
             return [self.partial_derivatives(pars, data), 0.0]
 
+        def _shadow_prime(pars, data):
+            """
+            Jacobian of the shadow function built from the score and the
+            observed information.
+            """
+
+            (_del_mu, _del_sigma) = self.score(pars, data)
+            _info = self.observed_information(pars, data)
+
+            return [-(_del_sigma * _info[0]) - (_del_mu * _info[1]),
+                    [0.0, 0.0]]
+
         # Initialize lists to hold results.
         _parameters = [0.0, 0.0]            # Scale and location parameters.
         _variance = [0.0, 0.0, 0.0]         # Scale variance, covariance,
@@ -917,16 +1202,8 @@ class Gaussian(object):
 
         # Sort data by the right of the interval.  Remove records occurring
         # before the start time and after the end time.
-        _data = sorted(data, key=lambda x: float(x[1]))
-        _data = [_rec for _rec in _data if float(_rec[0]) >= start]
-        _data = [_rec for _rec in _data if float(_rec[1]) <= end]
-        _data = np.array(_data)
-
-        # Count the number of suspensions, failures, and records.
-        _n_suspensions = sum(x[2] for x in _data if x[3] == 2)
-        _n_failures = sum(x[2] for x in _data
-                          if x[3] == 1 or x[3] == 3 or x[3] == 4)
-        _n_records = len(_data)
+        (_data, _n_suspensions,
+         _n_failures, _n_records) = trim_data_set(data, start, end)
 
         # Adjust the right-censored times to be the mid-point between the
         # censored time and the maximum oberserved time in the data set.
@@ -946,7 +1223,8 @@ class Gaussian(object):
         # values to scipy.optimize.fsolve.
         (_mu, _sigma) = norm.fit(np.array(_data[:, 1], dtype=float))
         _params = optimize.fsolve(_shadow_func, [_mu, _sigma],
-                                  args=(data))
+                                  args=(split_data_set(data)),
+                                  fprime=_shadow_prime)
 
         _parameters[0] = _params[0]
         _parameters[1] = _params[1]
@@ -1142,9 +1420,11 @@ class LogNormal(object):
                                 * 3 - interval censored
         """
 
+        _data = split_data_set(data)
+
         # Calculate the value of the log-likelihood for the event observations.
-        _event_t = data[np.where(data[:, 3] == 1)][:, 1]
-        _event_n = data[np.where(data[:, 3] == 1)][:, 2]
+        _event_t = _data.event_t
+        _event_n = _data.event_n
         _event_ll = np.sum(_event_n *
                            np.log((1.0 / (_event_t * pars[1])) *
                                   norm.pdf((np.log(_event_t) - pars[0]) /
@@ -1152,20 +1432,17 @@ class LogNormal(object):
 
         # Calculate the value of the log-likelihood for the right-censored
         # observations.
-        _right_t = data[np.where(data[:, 3] == 2)][:, 1]
-        _right_n = data[np.where(data[:, 3] == 2)][:, 2]
+        _right_t = _data.right_t
+        _right_n = _data.right_n
         _right_ll = np.sum(_right_n *
                            (1.0 - norm.cdf((np.log(_right_t) - pars[0]) /
                                            pars[1])))
 
         # Calculate the value of the log-likelihood for the left- and interval-
         # censored observations.
-        _interval_lt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 0]
-        _interval_rt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 1]
-        _interval_n = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                  data[:, 3] == 4))][:, 2]
+        _interval_lt = _data.interval_lt
+        _interval_rt = _data.interval_rt
+        _interval_n = _data.interval_n
 
         _interval_ll = np.sum(_interval_n *
                               np.log(norm.cdf(
@@ -1278,12 +1555,11 @@ class LogNormal(object):
 
         return(_lower, _upper)
 
-    def partial_derivatives(self, pars, data):         # pylint: disable=C0103, R0201, R0914
+    def score(self, pars, data):         # pylint: disable=C0103, R0201, R0914
         """
-        Method to calculate the value of the partial derivatives of the
-        lognormal log-likelihood function with respect to mu and sigma.  This
-        function is passed as an argument to scipy.optimize.fsolve() to find
-        the values of mu and sigma that simultaneously minimizes the partials.
+        Method to calculate the values of the partial derivatives of the
+        lognormal log-likelihood function with respect to mu and sigma.  These
+        are both zero at the maximum likelihood estimates.
 
         :param list pars: the values of mu and sigma at which to calculate the
                           partials.
@@ -1299,9 +1575,11 @@ class LogNormal(object):
                                 * 4 - interval censored
         """
 
+        _data = split_data_set(data)
+
         # Calculate the value of the log-likelihood for the event observations.
-        _event_t = data[np.where(data[:, 3] == 1)][:, 1]
-        _event_n = data[np.where(data[:, 3] == 1)][:, 2]
+        _event_t = _data.event_t
+        _event_n = _data.event_n
         _event_sigma = np.sum(_event_n *
                               (((np.log(_event_t) - pars[0]) / pars[1]**3.0) -
                                (1.0 / pars[1])))
@@ -1310,8 +1588,8 @@ class LogNormal(object):
 
         # Calculate the value of the log-likelihood for the right-censored
         # observations.
-        _right_t = data[np.where(data[:, 3] == 2)][:, 1]
-        _right_n = data[np.where(data[:, 3] == 2)][:, 2]
+        _right_t = _data.right_t
+        _right_n = _data.right_n
 
         _norm = (np.log(_right_t) - pars[0]) / pars[1]
         _cdf = norm.cdf(_norm)
@@ -1324,12 +1602,9 @@ class LogNormal(object):
         # Calculate the value of the log-likelihood for the left- and interval-
         # censored observations.  Use the midpoint of the interval as an
         # approximation.
-        _interval_lt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 0]
-        _interval_rt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 1]
-        _interval_n = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                  data[:, 3] == 4))][:, 2]
+        _interval_lt = _data.interval_lt
+        _interval_rt = _data.interval_rt
+        _interval_n = _data.interval_n
 
         # Following are the exact equations for the interval censored
         # observations.
@@ -1351,8 +1626,121 @@ class LogNormal(object):
         _del_mu = _event_mu + _right_mu - _interval_mu
         _del_sigma = _event_sigma + _right_sigma - _interval_sigma
 
+        return [_del_mu, _del_sigma]
+
+    def partial_derivatives(self, pars, data):         # pylint: disable=C0103, R0201
+        """
+        Method to calculate the value of the partial derivatives of the
+        lognormal log-likelihood function with respect to mu and sigma.  This
+        function is passed as an argument to scipy.optimize.fsolve() to find
+        the values of mu and sigma that simultaneously minimizes the partials.
+
+        :param list pars: the values of mu and sigma at which to calculate the
+                          partials.
+        :param ndarray data: the data set to calculate the log-likelihood for.
+                             * 0 - left of the observation time interval
+                             * 1 - right of the observation time interval
+                             * 2 - number of events occurring at the
+                                   observation time
+                             * 3 - status, where status is:
+                                * 1 - event
+                                * 2 - right censored
+                                * 3 - left censored
+                                * 4 - interval censored
+        """
+
+        (_del_mu, _del_sigma) = self.score(pars, data)
+
         return _del_mu * _del_sigma
 
+    def observed_information(self, pars, data):     # pylint: disable=C0103, R0201, R0914
+        """
+        Method to calculate the observed information of the lognormal
+        log-likelihood function; the negative of the derivatives of score()
+        with respect to mu and sigma.  This is used to build the Jacobian
+        passed to scipy.optimize.fsolve() when finding mu and sigma.
+
+        :param list pars: the values of mu and sigma at which to calculate the
+                          observed information.
+        :param ndarray data: the data set to calculate the observed
+                             information for.
+                             * 0 - left of the observation time interval
+                             * 1 - right of the observation time interval
+                             * 2 - number of events occurring at the
+                                   observation time
+                             * 3 - status, where status is:
+                                * 1 - event
+                                * 2 - right censored
+                                * 3 - left censored
+                                * 4 - interval censored
+        :return: _info; the observed information ordered [mu, sigma].
+        :rtype: ndarray
+        """
+
+        _data = split_data_set(data)
+
+        # Calculate the derivatives for the event observations.
+        _event_n = _data.event_n
+        _event_u = np.log(_data.event_t) - pars[0]
+        _mu_mu = -np.sum(_event_n) / pars[1]**2.0
+        _mu_sigma = -2.0 * np.sum(_event_n * _event_u) / pars[1]**3.0
+        _sigma_mu = -np.sum(_event_n) / pars[1]**3.0
+        _sigma_sigma = np.sum(_event_n *
+                              ((1.0 / pars[1]**2.0) -
+                               (3.0 * _event_u / pars[1]**4.0)))
+
+        # Calculate the derivatives for the right-censored observations.  _h
+        # is the ratio of the pdf to the survival function used by score()
+        # and _g is _h times the standardized time.
+        _right_n = _data.right_n
+        _norm = (np.log(_data.right_t) - pars[0]) / pars[1]
+        _h = norm.pdf(_norm) / (1.000000001 - norm.cdf(_norm))
+        _dh = _h * (_h - _norm)
+        _g = _norm * _h
+        _dg = _h + (_norm * _dh)
+        _mu_mu -= np.sum(_right_n * _dh) / pars[1]**2.0
+        _mu_sigma -= np.sum(_right_n * (_h + (_norm * _dh))) / pars[1]**2.0
+        _sigma_mu -= np.sum(_right_n * _dg) / pars[1]**2.0
+        _sigma_sigma -= np.sum(_right_n * (_g + (_norm * _dg))) / pars[1]**2.0
+
+        # Calculate the derivatives for the left- and interval-censored
+        # observations.  _a, _b and _d are the numerators and denominator of
+        # the ratios used by score(); _b2 and _b3 are the higher powers of the
+        # standardized time needed to differentiate them.
+        _interval_n = _data.interval_n
+        _norm_r = (np.log(_data.interval_rt) - pars[0]) / pars[1]
+        _pdf_r = norm.pdf(_norm_r)
+        _norm_l = (np.log(_data.interval_lt) - pars[0]) / pars[1]
+        _pdf_l = norm.pdf(_norm_l)
+
+        _a = _pdf_r - _pdf_l
+        _b = (_norm_r * _pdf_r) - (_norm_l * _pdf_l)
+        _b2 = (_norm_r**2.0 * _pdf_r) - (_norm_l**2.0 * _pdf_l)
+        _b3 = (_norm_r**3.0 * _pdf_r) - (_norm_l**3.0 * _pdf_l)
+        _d = norm.cdf(_norm_r) - norm.cdf(_norm_l)
+
+        _ra = _a / _d
+        _rb = _b / _d
+        _ra_mu = (_b + (_ra * _a)) / (pars[1] * _d)
+        _ra_sigma = (_b2 + (_ra * _b)) / (pars[1] * _d)
+        _rb_mu = (_b2 - _a + (_rb * _a)) / (pars[1] * _d)
+        _rb_sigma = (_b3 - _b + (_rb * _b)) / (pars[1] * _d)
+
+        _interval_mu_mu = pars[1] * np.sum(_interval_n * _ra_mu)
+        _interval_mu_sigma = np.sum(_interval_n * (_ra + pars[1] * _ra_sigma))
+        _interval_sigma_mu = (1.0 / pars[1]) * np.sum(_interval_n * _rb_mu)
+        _interval_sigma_sigma = (1.0 / pars[1]) * \
+            np.sum(_interval_n * (_rb_sigma - (_rb / pars[1])))
+
+        _mu_mu -= _interval_mu_mu
+        _mu_sigma -= _interval_mu_sigma
+        _sigma_mu -= _interval_sigma_mu
+        _sigma_sigma -= _interval_sigma_sigma
+
+        _info = -np.array([[_mu_mu, _mu_sigma], [_sigma_mu, _sigma_sigma]])
+
+        return _info
+
     def maximum_likelihood_estimate(self, data, start, end):    # pylint: disable=R0914
         """
         Method to fit data to a parametric distribution and find point
@@ -1385,6 +1773,18 @@ class LogNormal(object):
 
             return [self.partial_derivatives(pars, data), 0.0]
 
+        def _shadow_prime(pars, data):
+            """
+            Jacobian of the shadow function built from the score and the
+            observed information.
+            """
+
+            (_del_mu, _del_sigma) = self.score(pars, data)
+            _info = self.observed_information(pars, data)
+
+            return [-(_del_sigma * _info[0]) - (_del_mu * _info[1]),
+                    [0.0, 0.0]]
+
         # Initialize lists to hold results.
         _parameters = [0.0, 0.0]            # Scale and shape parameters.
         _variance = [0.0, 0.0, 0.0]         # Scale variance, covariance,
@@ -1393,16 +1793,8 @@ class LogNormal(object):
 
         # Sort data by the right of the interval.  Remove records occurring
         # before the start time and after the end time.
-        _data = sorted(data, key=lambda x: float(x[1]))
-        _data = [_rec for _rec in _data if float(_rec[0]) >= start]
-        _data = [_rec for _rec in _data if float(_rec[1]) <= end]
-        _data = np.array(_data)
-
-        # Count the number of suspensions, failures, and records.
-        _n_suspensions = sum(x[2] for x in _data if x[3] == 2)
-        _n_failures = sum(x[2] for x in _data
-                          if x[3] == 1 or x[3] == 3 or x[3] == 4)
-        _n_records = len(_data)
+        (_data, _n_suspensions,
+         _n_failures, _n_records) = trim_data_set(data, start, end)
 
         # Adjust the right-censored times to be the mid-point between the
         # censored time and the maximum observed time in the data set.
@@ -1422,8 +1814,9 @@ class LogNormal(object):
         # values to scipy.optimize.fsolve.
         (_sigma, __,
          _mu) = lognorm.fit(np.array(_data[:, 1], dtype=float), floc=0)
+        _split = split_data_set(_data)
         _params = optimize.fsolve(_shadow_func, [np.log(_mu), _sigma],
-                                  args=(_data))
+                                  args=(_split), fprime=_shadow_prime)
 
         _parameters[0] = _params[0]
         _parameters[1] = _params[1]
@@ -1434,7 +1827,8 @@ class LogNormal(object):
         _variance[2] = 1.0 / np.diag(_fI)[1]
 
         # Calculate the MLE, AIC, and BIC.
-        _gof[0] = self.log_likelihood([_parameters[0], _parameters[1]], _data)
+        _gof[0] = self.log_likelihood([_parameters[0], _parameters[1]],
+                                      _split)
         _gof[1] = -2.0 * _gof[0] + 4.0
         _gof[2] = -2.0 * _gof[0] + 4.0 * np.log(_n_records)
 
@@ -1627,9 +2021,11 @@ class Weibull(object):
                                 * 3 - interval censored
         """
 
+        _data = split_data_set(data)
+
         # Calculate the value of the log-likelihood for the event observations.
-        _event_t = data[np.where(data[:, 3] == 1)][:, 1]
-        _event_n = data[np.where(data[:, 3] == 1)][:, 2]
+        _event_t = _data.event_t
+        _event_n = _data.event_n
         _event_ll = np.sum(_event_n *
                            np.log((pars[1] / pars[0]) *
                                   ((_event_t / pars[0])**(pars[1] - 1.0)) *
@@ -1637,18 +2033,15 @@ class Weibull(object):
 
         # Calculate the value of the log-likelihood for the right-censored
         # observations.
-        _right_t = data[np.where(data[:, 3] == 2)][:, 1]
-        _right_n = data[np.where(data[:, 3] == 2)][:, 2]
+        _right_t = _data.right_t
+        _right_n = _data.right_n
         _right_ll = np.sum(_right_n * (_right_t / pars[0])**pars[1])
 
         # Calculate the value of the log-likelihood for the left- and interval-
         # censored observations.
-        _interval_lt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 0]
-        _interval_rt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 1]
-        _interval_n = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                  data[:, 3] == 4))][:, 2]
+        _interval_lt = _data.interval_lt
+        _interval_rt = _data.interval_rt
+        _interval_n = _data.interval_n
 
         _interval_ll = np.sum(_interval_n *
                               np.log(np.exp(-(_interval_lt /
@@ -1785,12 +2178,11 @@ class Weibull(object):
 
         return(_eta_l, _eta_u, _beta_l, _beta_u)
 
-    def partial_derivatives(self, x, data):     # pylint: disable=C0103, R0201, R0914
+    def score(self, x, data):       # pylint: disable=C0103, R0201, R0914
         """
-        Method to calculate the value of the partial derivatives of the
-        weibull log-likelihood function with respect to mu and sigma.  This
-        function is passed as an argument to scipy.optimize.fsolve() to find
-        the values of mu and sigma that simultaneously minimizes the partials.
+        Method to calculate the values of the partial derivatives of the
+        weibull log-likelihood function with respect to eta and beta.  These
+        are both zero at the maximum likelihood estimates.
 
         :param list x: the values of eta and beta at which to calculate the
                        partials.
@@ -1806,9 +2198,11 @@ class Weibull(object):
                                 * 4 - interval censored
         """
 
+        _data = split_data_set(data)
+
         # Calculate the value of the log-likelihood for the event observations.
-        _event_t = data[np.where(data[:, 3] == 1)][:, 1]
-        _event_n = data[np.where(data[:, 3] == 1)][:, 2]
+        _event_t = _data.event_t
+        _event_n = _data.event_n
         _event_ll_beta = np.sum(_event_n) / x[1] + \
             np.sum(_event_n * np.log(_event_t / x[0])) - \
             np.sum(_event_n * (_event_t / x[0])**x[1] *
@@ -1819,8 +2213,8 @@ class Weibull(object):
 
         # Calculate the value of the log-likelihood for the right-censored
         # observations.
-        _right_t = data[np.where(data[:, 3] == 2)][:, 1]
-        _right_n = data[np.where(data[:, 3] == 2)][:, 2]
+        _right_t = _data.right_t
+        _right_n = _data.right_n
         _right_ll_beta = np.sum(_right_n * (_right_t / x[0])**x[1] *
                                 np.log(_right_t / x[0]))
         _right_ll_eta = (x[1] / x[0]) * \
@@ -1829,12 +2223,9 @@ class Weibull(object):
         # Calculate the value of the log-likelihood for the left- and interval-
         # censored observations.  Use the midpoint of the interval as an
         # approximation.
-        _interval_lt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 0]
-        _interval_rt = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                   data[:, 3] == 4))][:, 1]
-        _interval_n = data[np.where(np.logical_or(data[:, 3] == 3,
-                                                  data[:, 3] == 4))][:, 2]
+        _interval_lt = _data.interval_lt
+        _interval_rt = _data.interval_rt
+        _interval_n = _data.interval_n
 
         # Following are the exact equations for the interval censored
         # observations.
@@ -1858,8 +2249,131 @@ class Weibull(object):
         _del_beta = _event_ll_beta - _right_ll_beta + _interval_ll_beta
         _del_eta = _event_ll_eta + _right_ll_eta + _interval_ll_eta
 
+        return [_del_eta, _del_beta]
+
+    def partial_derivatives(self, x, data):     # pylint: disable=C0103, R0201
+        """
+        Method to calculate the value of the partial derivatives of the
+        weibull log-likelihood function with respect to mu and sigma.  This
+        function is passed as an argument to scipy.optimize.fsolve() to find
+        the values of mu and sigma that simultaneously minimizes the partials.
+
+        :param list x: the values of eta and beta at which to calculate the
+                       partials.
+        :param ndarray data: the data set to calculate the log-likelihood for.
+                             * 0 - left of the observation time interval
+                             * 1 - right of the observation time interval
+                             * 2 - number of events occurring at the
+                                   observation time
+                             * 3 - status, where status is:
+                                * 1 - event
+                                * 2 - right censored
+                                * 3 - left censored
+                                * 4 - interval censored
+        """
+
+        (_del_eta, _del_beta) = self.score(x, data)
+
         return _del_eta * _del_beta
 
+    def observed_information(self, x, data):    # pylint: disable=C0103, R0201, R0914
+        """
+        Method to calculate the observed information of the weibull
+        log-likelihood function; the negative of the derivatives of score()
+        with respect to eta and beta.  This is used to build the Jacobian
+        passed to scipy.optimize.fsolve() when finding eta and beta.
+
+        :param list x: the values of eta and beta at which to calculate the
+                       observed information.
+        :param ndarray data: the data set to calculate the observed
+                             information for.
+                             * 0 - left of the observation time interval
+                             * 1 - right of the observation time interval
+                             * 2 - number of events occurring at the
+                                   observation time
+                             * 3 - status, where status is:
+                                * 1 - event
+                                * 2 - right censored
+                                * 3 - left censored
+                                * 4 - interval censored
+        :return: _info; the observed information ordered [eta, beta].
+        :rtype: ndarray
+        """
+
+        _data = split_data_set(data)
+
+        # Calculate the derivatives for the event observations.
+        _event_n = _data.event_n
+        _n_events = np.sum(_event_n)
+        _log = np.log(_data.event_t / x[0])
+        _pow = (_data.event_t / x[0])**x[1]
+        _eta_eta = (x[1] / x[0]**2.0) * \
+            (_n_events - (1.0 + x[1]) * np.sum(_event_n * _pow))
+        _eta_beta = (np.sum(_event_n * _pow * (1.0 + x[1] * _log)) -
+                     _n_events) / x[0]
+        _beta_eta = _eta_beta
+        _beta_beta = -(_n_events / x[1]**2.0) - \
+            np.sum(_event_n * _pow * _log**2.0)
+
+        # Calculate the derivatives for the right-censored observations.
+        _right_n = _data.right_n
+        _log = np.log(_data.right_t / x[0])
+        _pow = (_data.right_t / x[0])**x[1]
+        _eta_eta -= (x[1] * (1.0 + x[1]) / x[0]**2.0) * \
+            np.sum(_right_n * _pow)
+        _eta_beta += np.sum(_right_n * _pow * (1.0 + x[1] * _log)) / x[0]
+        _beta_eta += np.sum(_right_n * _pow * (1.0 + x[1] * _log)) / x[0]
+        _beta_beta -= np.sum(_right_n * _pow * _log**2.0)
+
+        # Calculate the derivatives for the left- and interval-censored
+        # observations.  These use the same offset as score() so the left
+        # time can be zero.
+        _interval_n = _data.interval_n
+
+        _nr = _data.interval_rt / x[0]
+        _nr_b = (_nr + 0.000001)**x[1]
+        _nr_exp = np.exp(-(_nr_b))
+        _nr_eta = -x[1] * _nr_b * _nr / ((_nr + 0.000001) * x[0])
+        _nr_beta = _nr_b * np.log(_nr + 0.000001)
+
+        _nl = _data.interval_lt / x[0]
+        _nl_b = (_nl + 0.000001)**x[1]
+        _nl_exp = np.exp(-(_nl_b))
+        _nl_eta = -x[1] * _nl_b * _nl / ((_nl + 0.000001) * x[0])
+        _nl_beta = _nl_b * np.log(_nl + 0.000001)
+
+        _d = _nl_exp - _nr_exp
+        _d_eta = (_nr_exp * _nr_eta) - (_nl_exp * _nl_eta)
+        _d_beta = (_nr_exp * _nr_beta) - (_nl_exp * _nl_beta)
+
+        # The derivatives of Q * log(Q) * exp(-Q) and Q * exp(-Q) with respect
+        # to Q for the right and left times.
+        _f_r = (np.log(_nr_b) + 1.0 - _nr_b * np.log(_nr_b)) * _nr_exp
+        _f_l = (np.log(_nl_b) + 1.0 - _nl_b * np.log(_nl_b)) * _nl_exp
+        _g_r = (1.0 - _nr_b) * _nr_exp
+        _g_l = (1.0 - _nl_b) * _nl_exp
+
+        _n = (-_nl_b * np.log(_nl_b) * _nl_exp) + \
+             (_nr_b * np.log(_nr_b) * _nr_exp)
+        _n_eta = (_f_r * _nr_eta) - (_f_l * _nl_eta)
+        _n_beta = (_f_r * _nr_beta) - (_f_l * _nl_beta)
+        _beta_eta += np.sum(_interval_n * (_n_eta - (_n / _d) * _d_eta) / _d)
+        _beta_beta += np.sum(_interval_n *
+                             (_n_beta - (_n / _d) * _d_beta) / _d)
+
+        _n = ((x[1] / x[0]) * _nl_b * _nl_exp) - \
+             ((x[1] / x[0]) * _nr_b * _nr_exp)
+        _n_eta = -(_n / x[0]) + \
+            (x[1] / x[0]) * ((_g_l * _nl_eta) - (_g_r * _nr_eta))
+        _n_beta = (_n / x[1]) + \
+            (x[1] / x[0]) * ((_g_l * _nl_beta) - (_g_r * _nr_beta))
+        _eta_eta += np.sum(_interval_n * (_n_eta - (_n / _d) * _d_eta) / _d)
+        _eta_beta += np.sum(_interval_n * (_n_beta - (_n / _d) * _d_beta) / _d)
+
+        _info = -np.array([[_eta_eta, _eta_beta], [_beta_eta, _beta_beta]])
+
+        return _info
+
     def maximum_likelihood_estimate(self, data, start, end):
         """
         Method to fit data to a parametric distribution and find point
@@ -1892,6 +2406,18 @@ class Weibull(object):
 
             return [self.partial_derivatives(pars, data), 0.0]
 
+        def _shadow_prime(pars, data):
+            """
+            Jacobian of the shadow function built from the score and the
+            observed information.
+            """
+
+            (_del_eta, _del_beta) = self.score(pars, data)
+            _info = self.observed_information(pars, data)
+
+            return [-(_del_beta * _info[0]) - (_del_eta * _info[1]),
+                    [0.0, 0.0]]
+
         # Initialize lists to hold results.
         _parameters = [0.0, 0.0, 0.0]       # Scale, shape, and location
                                             # parameters.
@@ -1901,16 +2427,8 @@ class Weibull(object):
 
         # Sort data by the right of the interval.  Remove records occurring
         # before the start time and after the end time.
-        _data = sorted(data, key=lambda x: float(x[1]))
-        _data = [_rec for _rec in _data if float(_rec[0]) >= start]
-        _data = [_rec for _rec in _data if float(_rec[1]) <= end]
-        _data = np.array(_data)
-
-        # Count the number of suspensions, failures, and records.
-        _n_suspensions = sum(x[2] for x in _data if x[3] == 2)
-        _n_failures = sum(x[2] for x in _data
-                          if x[3] == 1 or x[3] == 3 or x[3] == 4)
-        _n_records = len(_data)
+        (_data, _n_suspensions,
+         _n_failures, _n_records) = trim_data_set(data, start, end)
 
         # Adjust the right-censored times to be the mid-point between the
         # censored time and the maximum oberserved time in the data set.
@@ -1931,7 +2449,9 @@ class Weibull(object):
         (__, _beta,
          __, _eta) = exponweib.fit(np.array(_data[:, 4], dtype=float),
                                    f0=1, floc=0)
-        _params = optimize.fsolve(_shadow_func, [_eta, _beta], args=(data))
+        _params = optimize.fsolve(_shadow_func, [_eta, _beta],
+                                  args=(split_data_set(data)),
+                                  fprime=_shadow_prime)
 
         _parameters[0] = _params[0]
         _parameters[1] = _params[1]
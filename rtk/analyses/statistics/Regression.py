@@ -41,6 +41,13 @@ import numpy as np
 from scipy.stats import norm                # pylint: disable=E0611
 import scipy.optimize as optim
 
+try:
+    from analyses.statistics.Distributions import PreparedData, \
+                                                  trim_data_set
+except ImportError:
+    from rtk.analyses.statistics.Distributions import PreparedData, \
+                                                      trim_data_set
+
 __author__ = 'Andrew Rowland'
 __email__ = 'andrew.rowland@reliaqual.com'
 __organization__ = 'ReliaQual Associates, LLC'
@@ -84,23 +91,36 @@ def adjusted_rank(data):
     """
 
     # Initialize some local variables.
-    _adjusted_rank = []
-    _prev_adj_rank = 0
     _n_failures = len(data)
-    _rev_rank = _n_failures
-
-    for _record in data:
-        if _record[3] != 1:
-            _adj_rank = -1
-        else:
-            _adj_rank = (_rev_rank * 1.0 * _prev_adj_rank +
-                         (_n_failures + 1)) / (_rev_rank + 1)
-            _prev_adj_rank = _adj_rank
-
-        _adjusted_rank.append(_adj_rank)
-        _rev_rank -= 1
-
-    return np.array(_adjusted_rank, dtype=float)
+    _adjusted_rank = np.full(_n_failures, -1.0)
+
+    _event = data[:, 3] == 1
+    if not np.any(_event):
+        return _adjusted_rank
+
+    # Each event's adjusted rank is found from the previous one by:
+    #
+    #   adj = (rev_rank * prev_adj + (n + 1)) / (rev_rank + 1)
+    #
+    # so (n + 1 - adj) is the running product of rev_rank / (rev_rank + 1)
+    # over the events.  Within a run of events with no censored records
+    # between them the product telescopes to last rev_rank / (first rev_rank
+    # + 1), so only the runs need to be multiplied together.
+    _rev_rank = np.arange(_n_failures, 0, -1, dtype=float)[_event]
+    _first = np.ones(len(_rev_rank), dtype=bool)
+    _first[1:] = np.diff(_rev_rank) != -1.0
+    _run = np.cumsum(_first) - 1
+    _run_first = _rev_rank[_first]
+    _run_last = _rev_rank[np.append(np.where(_first)[0][1:] - 1,
+                                    len(_rev_rank) - 1)]
+    _run_factor = np.cumprod(np.append(1.0, _run_last[:-1] /
+                                       (_run_first[:-1] + 1.0)))
+
+    _adjusted_rank[_event] = (_n_failures + 1.0) - \
+        (_n_failures + 1.0) * _run_factor[_run] * _rev_rank / \
+        (_run_first[_run] + 1.0)
+
+    return _adjusted_rank
 
 
 def bernard_ranks(data, grouped=False):
@@ -124,30 +144,24 @@ def bernard_ranks(data, grouped=False):
     :rtype: ndarray of floats
     """
 
-    # Initialize local variables.
-    _mr = []
-
-    # Calculate the adjusted ranks to account for suspended data.
-    _adj_rank = np.asmatrix(adjusted_rank(data)).T
-    _cum_failures = np.asmatrix(np.cumsum(data[:, 2])).T
-    _data = np.concatenate((data, _adj_rank, _cum_failures), axis=1)
+    # Exact data is ranked by the adjusted ranks to account for suspended
+    # data and grouped data by the cumulative number of failures.
+    _cum_failures = np.cumsum(data[:, 2])
 
     if not grouped:
+        _rank = adjusted_rank(data)
         _n_failures = len(data)
         _status = 1
     else:
-        _n_failures = _cum_failures[-1, 0]
+        _rank = _cum_failures
+        _n_failures = _cum_failures[-1]
         _status = 3
 
     # Calculate Bernard's approximation.
-    for _record in _data:
-        if _record[0, 3] != _status:
-            _mr.append(np.nan)
-        else:
-            _b_rank = (_record[0, 5] - 0.3) / (_n_failures + 0.4)
-            _mr.append(_b_rank)
+    _mr = np.where(data[:, 3] == _status,
+                   (_rank - 0.3) / (_n_failures + 0.4), np.nan)
 
-    return np.array(_mr, dtype=float)
+    return _mr
 
 
 def regression(data, start, end, dist='exponential'):  # pylint: disable=R0914
@@ -164,6 +178,9 @@ def regression(data, start, end, dist='exponential'):  # pylint: disable=R0914
                                 * 3 = Status of observation
                                 * 4 = Time between failures or interarrival
                                       time
+                         or a PreparedData instance for the same window, in
+                         which case the median ranks are shared with the other
+                         fits using it.
     :param float start: the minimum time to include in the fit.  Used to
                         exclude outliers.
     :param float end: the maximum time to include in the fit.  Used to exclude
@@ -185,20 +202,12 @@ def regression(data, start, end, dist='exponential'):  # pylint: disable=R0914
 
     # Sort data by the right of the interval.  Remove records occurring before
     # the start time and after the end time.
-    _data = sorted(data, key=lambda x: float(x[1]))
-    _data = [_rec for _rec in _data if float(_rec[0]) >= start]
-    _data = [_rec for _rec in _data if float(_rec[1]) <= end]
-    _data = np.array(_data)
-
-    # Count the number of suspensions, failures, and records.
-    _n_suspensions = sum(x[2] for x in _data if x[3] == 2)
-    _n_failures = sum(x[2] for x in _data
-                      if x[3] == 1 or x[3] == 3 or x[3] == 4)
-    _n_records = len(_data)
+    (_data, _n_suspensions,
+     _n_failures, _n_records) = trim_data_set(data, start, end)
 
     # Retrieve the failure times for all non-censored data.
-    _x = _data[np.where(_data[:, 3] == 1), 1]
-    _x = np.array(_x.tolist()[0])
+    _event = _data[:, 3] == 1
+    _x = _data[_event, 1]
 
     # TODO: Move this to the View module.
     #if len(_x) == 0:
@@ -213,7 +222,14 @@ def regression(data, start, end, dist='exponential'):  # pylint: disable=R0914
     #    return False
 
     # Calculate median ranks.  This accounts for censored observations.
-    _median_rank = bernard_ranks(_data)
+    # Only the ranks of the failures are regressed against the failure times.
+    if(isinstance(data, PreparedData) and data.start == start and
+       data.end == end):
+        if data.median_ranks is None:
+            data.median_ranks = bernard_ranks(_data)
+        _median_rank = data.median_ranks[_event]
+    else:
+        _median_rank = bernard_ranks(_data)[_event]
 
     # Linearize the median ranks (probability of failure) depending on the
     # s-distribution.  Fit the linearized median ranks to a straight line using
@@ -265,7 +281,7 @@ def regression(data, start, end, dist='exponential'):  # pylint: disable=R0914
         _parameters[1] = _p[1]
         _parameters[0] = np.exp(-_p[0] / _p[1])
 
-    _yhat = np.array([x for x in _info['fvec'] if np.logical_not(np.isnan(x))])
+    _yhat = _info['fvec'][np.logical_not(np.isnan(_info['fvec']))]
 
     # Calculate the variance and covariance of the parameters.
     _SSE = np.sum(_yhat**2.0)
@@ -41,6 +41,7 @@ import gettext
 
 # Import modules for mathematics.
 from math import ceil, exp, log, sqrt
+import multiprocessing
 import numpy as np
 from scipy.optimize import fsolve
 
@@ -51,6 +52,11 @@ __copyright__ = 'Copyright 2015 Andrew "Weibullguy" Rowland'
 
 _ = gettext.gettext
 
+# The number of failure histories simulated by each simulate_crow_amsaa()
+# task.  The tasks are seeded from the study seed, so the results do not
+# depend on how many worker processes run the tasks.
+_SIMULATION_CHUNK = 1000
+
 
 # These are the Cramer-von Mises critical values for Crow-AMSAA GoF tests.
 CVM_TABLE = {2: {0.2: 0.138, 0.15: 0.149, 0.1: 0.162, 0.05: 0.175,
@@ -547,3 +553,112 @@ def cramer_vonmises_critical_value(df, confidence):
             _cvm = _b + _m * _conf
 
     return _cvm
+
+
+def _simulate_failure_histories(task):
+    """
+    Function to simulate a block of Crow-AMSAA failure histories and refit
+    the model at the end of each test phase.  This is run by the worker
+    processes started by simulate_crow_amsaa() so it must be a module-level
+    function.
+
+    :param tuple task: the (scale, shape, phase end times, number of
+                       histories, seed) of the block.
+    :return: (_beta_hat, _mtbf); the estimated shape parameter and
+             instantaneous MTBF for each history (rows) at the end of each
+             test phase (columns).
+    :rtype: tuple of ndarrays
+    """
+
+    (_alpha, _beta, _times, _n_histories, _seed) = task
+
+    _random = np.random.RandomState(_seed)
+    _n_phases = len(_times)
+
+    # The number of failures in each phase is Poisson with mean equal to the
+    # increase in the expected cumulative number of failures, alpha * T^beta.
+    _cum_expected = _alpha * _times**_beta
+    _expected = np.diff(np.concatenate(([0.0], _cum_expected)))
+    _n_failures = _random.poisson(_expected, size=(_n_histories, _n_phases))
+
+    # Given the number of failures in a phase, the expected cumulative number
+    # of failures at each failure time is uniform over the phase.  Only the
+    # sum of the logarithm of the failure times is needed to refit the model.
+    _cell = np.repeat(np.arange(_n_histories * _n_phases),
+                      _n_failures.ravel())
+    _phase = _cell % _n_phases
+    _fail_times = ((_cum_expected[_phase] - _expected[_phase] *
+                    _random.uniform(size=len(_cell))) / _alpha)**(1.0 / _beta)
+    _sum_logt = np.bincount(_cell, weights=np.log(_fail_times),
+                            minlength=_n_histories * _n_phases)
+    _sum_logt = np.cumsum(_sum_logt.reshape(_n_histories, _n_phases), axis=1)
+    _n_failures = np.cumsum(_n_failures, axis=1)
+
+    # Refit the model to each history using all the failures up to the end of
+    # each phase.  These are the calculate_crow_amsaa_parameters() estimates
+    # for a time terminated test.  Histories without failures give NaN.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _beta_hat = _n_failures / (_n_failures * np.log(_times) - _sum_logt)
+        _mtbf = _times / (_n_failures * _beta_hat)
+
+    return _beta_hat, _mtbf
+
+
+def simulate_crow_amsaa(alpha, beta, phase_times, mtbfg, n_histories=10000,
+                        percentiles=(5.0, 50.0, 95.0), seed=None,
+                        workers=None):
+    """
+    Function to simulate failure histories from a planned Crow-AMSAA model to
+    find how likely a reliability growth test is to demonstrate the goal MTBF.
+    Each history is refit at the end of every test phase with all the failures
+    up to that time.
+
+    :param float alpha: the planned Crow-AMSAA scale parameter.
+    :param float beta: the planned Crow-AMSAA shape parameter.
+    :param list phase_times: the test time of each test phase.
+    :param float mtbfg: the goal MTBF.
+    :keyword int n_histories: the number of failure histories to simulate.
+    :keyword tuple percentiles: the percentiles of the estimates to return.
+    :keyword int seed: the seed for the random number generator.  Studies with
+                       the same seed return the same results.
+    :keyword int workers: the number of worker processes to use.  If None, one
+                          worker per CPU is used.  If 1, the histories are
+                          simulated in this process.
+    :return: (_probability, _mtbf_bands, _beta_bands); the probability the
+             estimated instantaneous MTBF is at least the goal MTBF at the end
+             of each phase and the percentiles of the estimated instantaneous
+             MTBF and shape parameter at the end of each phase (one row per
+             phase, one column per percentile).
+    :rtype: tuple of ndarrays
+    """
+
+    _times = np.cumsum(phase_times, dtype=float)
+
+    _random = np.random.RandomState(seed)
+    _tasks = []
+    for _start in range(0, n_histories, _SIMULATION_CHUNK):
+        _tasks.append((alpha, beta, _times,
+                       min(_SIMULATION_CHUNK, n_histories - _start),
+                       _random.randint(0, 2**31 - 1)))
+
+    if workers == 1:
+        _results = [_simulate_failure_histories(_task) for _task in _tasks]
+    else:
+        _pool = multiprocessing.Pool(processes=workers)
+        try:
+            _results = _pool.map(_simulate_failure_histories, _tasks,
+                                 chunksize=1)
+        finally:
+            _pool.close()
+            _pool.join()
+
+    _beta_hat = np.concatenate([_result[0] for _result in _results])
+    _mtbf = np.concatenate([_result[1] for _result in _results])
+
+    with np.errstate(invalid='ignore'):
+        _probability = np.mean(_mtbf >= mtbfg, axis=0)
+    _mtbf_bands = np.transpose(np.nanpercentile(_mtbf, percentiles, axis=0))
+    _beta_bands = np.transpose(np.nanpercentile(_beta_hat, percentiles,
+                                                axis=0))
+
+    return _probability, _mtbf_bands, _beta_bands
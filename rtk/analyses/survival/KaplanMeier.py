@@ -38,7 +38,6 @@ Contains functions for performing Kaplan-Meier survival analysis.
 
 # Import mathematical functions.
 from math import sqrt
-import lifelines as nonpar
 import numpy as np
 from scipy.stats import norm                # pylint: disable=E0611
 
@@ -132,6 +131,10 @@ def kaplan_meier(data, start, end, conf=0.75, conftype=3):  # pylint: disable=W0
     :rtype: ndarray, ndarray
     """
 # WARNING: Refactor kaplan_meier; current McCabe Complexity metric=12.
+    # lifelines is slow to import so wait until a Kaplan-Meier analysis is
+    # requested.
+    import lifelines as nonpar
+
     _kmf = nonpar.KaplanMeierFitter(alpha=conf)
 
     # Sort data by the right of the interval.  Remove records occurring before
@@ -156,12 +159,9 @@ def kaplan_meier(data, start, end, conf=0.75, conftype=3):  # pylint: disable=W0
     _data = np.vstack((_data[:, 1], _data[:, 2], _data[:, 5], _data[:, 4]))
     _data = np.array(np.transpose(_data), dtype=float)
 
-    # For those records with more than one observation, append the record
-    # n - 1 times to the data set to account for the multiple observations.
-    for _row in _data:
-        if _row[2] > 1:
-            for i in range(int(_row[2]) - 1):   # pylint: disable=W0612
-                _data = np.vstack((_data, _row))
+    # Records with more than one observation are passed to the fit method
+    # with the quantity as a frequency weight rather than being repeated.
+    _weights = _data[:, 2]
 
     # Adjust the interval-censored times so they can be passed to the
     # fit method.
@@ -172,14 +172,17 @@ def kaplan_meier(data, start, end, conf=0.75, conftype=3):  # pylint: disable=W0
     _data[np.where(_data[:, 3] == 3), 3] = 1
 
     # Estimate the Kaplan-Meier survival function.
-    _fit = _kmf.fit(_data[:, 1], event_observed=_data[:, 3])
+    _fit = _kmf.fit(_data[:, 1], event_observed=_data[:, 3],
+                    weights=_weights)
     _kaplan_meier = np.vstack((np.unique(_fit.durations),
                                _fit.confidence_interval_.values[1:, 1],
                                _fit.survival_function_.values[1:, 0],
                                _fit.confidence_interval_.values[1:, 0]))
     _kaplan_meier = np.transpose(_kaplan_meier)
 
-    _r = np.where(_fit.event_observed == 1)[0] + 1
+    # Find the rank of each event among the individual observations.
+    _events = np.repeat(_data[:, 3], _weights.astype(int))
+    _r = np.where(_events == 1)[0] + 1
 
     return _kaplan_meier, _r
 
@@ -83,6 +83,71 @@ def format_data(data):
     return _data
 
 
+def _flatten_data(data):
+    """
+    Helper function to flatten the MCF dataset into arrays so the d.(tk) and
+    delta.(tk) statistics can be found without a systems x times matrix.
+
+    :param dict data: a dictionary with the system id as the key and a list of
+                      the failure/censoring times as the value.
+    :return: (_system, _fail_times, _censor_times); an array of the system
+             index of each failure, an array of the failure times, and an
+             array of the censoring time of each system.  Systems are indexed
+             in the order of data.iterkeys().
+    :rtype: (numpy array, numpy array, numpy array)
+    """
+
+    _system = []
+    _fail_times = []
+    _censor_times = []
+    for _index, _key in enumerate(data.iterkeys()):
+        _times = data[_key]
+        _failures = [_time for _time in _times
+                     if not isinstance(_time, basestring)]
+        _system.extend([_index] * len(_failures))
+        _fail_times.extend(_failures)
+
+        # The last entry is the censoring time.  A system without any times is
+        # never in the risk set.
+        try:
+            _censor_time = float(_times[-1].rstrip('+'))
+        except AttributeError:
+            _censor_time = float(_times[-1])
+        except IndexError:
+            _censor_time = -np.inf
+        _censor_times.append(_censor_time)
+
+    return (np.array(_system, dtype=int), np.array(_fail_times, dtype=float),
+            np.array(_censor_times, dtype=float))
+
+
+def _recurrences(system, fail_times, times):
+    """
+    Helper function to find the (time, system) cells with a recurrence.  A
+    system that recurs more than once at the same time occupies one cell.
+
+    :param numpy array system: the system index of each failure.
+    :param numpy array fail_times: the failure times.
+    :param numpy array times: the unique and sorted failure times.
+    :return: (_index, _system); an array of the unique failure time index and
+             an array of the system index of each cell with a recurrence.
+    :rtype: (numpy array, numpy array)
+    """
+
+    _N = len(times)
+    if _N == 0 or len(system) == 0:
+        return np.array([], dtype=int), np.array([], dtype=int)
+
+    _index = np.searchsorted(times, fail_times)
+    _found = _index < _N
+    _found[_found] = times[_index[_found]] == fail_times[_found]
+
+    _n_systems = system.max() + 1
+    _cells = np.unique(_index[_found] * _n_systems + system[_found])
+
+    return _cells // _n_systems, _cells % _n_systems
+
+
 def d_matrix(data, times):
     """
     Function to create d.(tk) array for use in calculating the mean cumulative
@@ -97,30 +162,17 @@ def d_matrix(data, times):
     :rtype: numpy 1-D matrix of integers
     """
 
-    _d_matrix = []
-    _N = len(times)
-
-    # Iterate through:
-    #   --> Each key (unique system)
-    #       --> Each failure time for that key (unique system)
-    #           --> Each unique failure time
-    # If the system failure time is equal to the unique failure time, set the
-    # count of system recurrences for that system/failure time cell to one.
-    for key in data.iterkeys():
-        _d_row = [0] * _N
-        for _fail_time in data[key]:
-            for i in range(_N):
-                if _fail_time == times[i]:
-                    _d_row[i] = 1
+    _times = np.asarray(times, dtype=float)
+    _system, _fail_times, __ = _flatten_data(data)
 
-        _d_matrix.append(_d_row)
+    # The rows are unique failure times and the columns are unique systems.
+    # The row-column intersection (cell) is the count of failures for a
+    # system at a failure time.
+    _d_matrix = np.zeros((len(_times), len(data)))
+    _index, _system = _recurrences(_system, _fail_times, _times)
+    _d_matrix[_index, _system] = 1.0
 
-    # Transform to a numpy matrix and transpose so the rows are unique failure
-    # times and the columns are unique systems.  The row-column intersection
-    # (cell) is the count of failures for a system at a failure time.
-    _d_matrix = np.matrix(_d_matrix, dtype=float).transpose()
-
-    return _d_matrix
+    return np.matrix(_d_matrix)
 
 
 def delta_matrix(data, times):
@@ -137,33 +189,15 @@ def delta_matrix(data, times):
     :rtype: numpy 1-D matrix of integers
     """
 
-    _delta_matrix = []
-    _N = len(times)
-
-    # Iterate through:
-    #   --> Each key (unique system)
-    #       --> Each unique failure time
-    # If the system censoring time is greater than or equal to the unique
-    # failure time, set the system operating indicator variable for that
-    # system/failure time cell to one.
-    for key in data.iterkeys():
-        _delta_row = [0] * _N
-        try:
-            _censor_time = data[key][-1].rstrip('+')
-        except AttributeError:
-            _censor_time = data[key][-1]
-        for i in range(_N):
-            if float(_censor_time) >= times[i]:
-                _delta_row[i] = 1
-
-        _delta_matrix.append(_delta_row)
+    _times = np.asarray(times, dtype=float)
+    __, __, _censor_times = _flatten_data(data)
 
-    # Transform to a numpy matrix and transpose so the rows are unique failure
-    # times and the columns are unique systems.  The row-column intersection
-    # (cell) is the count of failures for a system at a failure time.
-    _delta_matrix = np.matrix(_delta_matrix, dtype=float).transpose()
+    # The rows are unique failure times and the columns are unique systems.
+    # A system is operating at every failure time up to its censoring time.
+    _delta_matrix = np.greater_equal(_censor_times[np.newaxis, :],
+                                     _times[:, np.newaxis])
 
-    return _delta_matrix
+    return np.matrix(_delta_matrix, dtype=float)
 
 
 def mean_cumulative_function(data, conf=0.75):
@@ -198,26 +232,31 @@ def mean_cumulative_function(data, conf=0.75):
     _conf = 1.0 - ((1.0 - conf) / 2.0)
     _z_norm = norm.ppf(_conf)
 
-    # Create the d matrix and the delta matrix for the data set.
-    _times = reduce(lambda x, y: x + y, data.values())
-    _times = set([float(f) for f in _times
-                  if isinstance(f, float) or isinstance(f, int)])
-    _times = sorted(list(_times))
+    # Find the number of recurrences (d.(tk)) and the number of systems at
+    # risk (delta.(tk)) at each unique failure time without building the
+    # systems x times d and delta matrices.
+    _system, _fail_times, _censor_times = _flatten_data(data)
+    _times = np.unique(_fail_times)
+    _N = len(_times)
 
-    _d_matrix = d_matrix(data, _times)
-    _delta_matrix = delta_matrix(data, _times)
+    _index, _system = _recurrences(_system, _fail_times, _times)
+    _d_dot = np.bincount(_index, minlength=_N).astype(float)
 
-    _delta_dot = _delta_matrix.sum(axis=1)
-    _d_dot = _d_matrix.sum(axis=1)
+    _sorted = np.sort(_censor_times)
+    _delta_dot = len(_sorted) - np.searchsorted(_sorted, _times)
+    _delta_dot = _delta_dot.astype(float)
 
     _d_bar = _d_dot / _delta_dot
 
     # Calculate the MCF at each unique failure time.
-    _mu_hat = _d_bar.cumsum(axis=0)
+    _mu_hat = _d_bar.cumsum()
 
     # Calculate the variance and standard error of the MCF at each unique
-    # failure time.
-    _mu_var = mcf_variance(_delta_matrix, _d_matrix, _delta_dot, _d_bar)
+    # failure time.  Only the recurrences of systems still in the risk set
+    # contribute, and each occupied cell holds a single recurrence.
+    _at_risk = _censor_times[_system] >= _times[_index]
+    _s_1 = np.bincount(_index[_at_risk], minlength=_N).astype(float)
+    _mu_var = _variance_from_sums(_delta_dot, _d_bar, _s_1, _s_1)
     _mu_se = np.sqrt(_mu_var)
 
     # Calculate the lower and upper bounds on the MCF at each unique failure
@@ -227,12 +266,8 @@ def mean_cumulative_function(data, conf=0.75):
     _mu_hat_ll = np.divide(_mu_hat, _w)
     _mu_hat_ul = np.multiply(_mu_hat, _w)
 
-    _times = np.matrix(_times).transpose().tolist()
-
-    _mcf = np.concatenate((_times, _d_dot), axis=1)
-    _mcf = np.concatenate((_mcf, _mu_hat_ll), axis=1)
-    _mcf = np.concatenate((_mcf, _mu_hat), axis=1)
-    _mcf = np.concatenate((_mcf, _mu_hat_ul), axis=1)
+    _mcf = np.matrix(np.column_stack((_times, _d_dot, _mu_hat_ll, _mu_hat,
+                                      _mu_hat_ul)))
 
     return _mcf
 
@@ -254,14 +289,49 @@ def mcf_variance(delta, d_mat, delta_dot, d_bar):
     :rtype: numpy array
     """
 
-    _temp1 = np.divide(delta, delta_dot)
-    _temp2 = np.subtract(d_mat, d_bar)
+    _delta = np.asarray(delta)
+    _d_mat = np.asarray(d_mat)
+
+    _s_1 = np.sum(np.multiply(_delta, _d_mat), axis=1)
+    _s_2 = np.sum(np.multiply(_delta, np.power(_d_mat, 2.0)), axis=1)
+
+    _variance = _variance_from_sums(np.ravel(delta_dot), np.ravel(d_bar),
+                                    _s_1, _s_2)
+
+    return np.matrix(_variance).transpose()
+
+
+def _variance_from_sums(delta_dot, d_bar, s_1, s_2):
+    """
+    Helper function to calculate the variance of d(tk) for the MCF from
+    running sums rather than from the d and delta matrices.  The variance at
+    time tk is:
+
+        SUM[(delta_i(tk) / delta.(tk))^2 * (d_i(tk) - d_bar(tk))^2]
+
+    Since delta_i(tk) is zero or one, this expands to:
+
+        (S2 - 2 * d_bar(tk) * S1 + delta.(tk) * d_bar(tk)^2) / delta.(tk)^2
+
+    where S1 and S2 are the sums of d_i(tk) and d_i(tk)^2 over the systems in
+    the risk set at time tk.
+
+    :param numpy array delta_dot: the risk population at each time.
+    :param numpy array d_bar: the fraction of the risk population that failed
+                              at each time.
+    :param numpy array s_1: the sum of recurrences of the systems in the risk
+                            set at each time.
+    :param numpy array s_2: the sum of squared recurrences of the systems in
+                            the risk set at each time.
+    :return: _variance; an array containing the variance at each time.
+    :rtype: numpy array
+    """
 
-    _variance = np.multiply(_temp1, _temp2)
-    _variance = np.power(_variance, 2.0)
-    _variance = np.sum(_variance, axis=1)
+    _variance = (s_2 - 2.0 * d_bar * s_1 + delta_dot * d_bar**2.0) / \
+        delta_dot**2.0
 
-    return _variance
+    # Guard against round-off taking a zero variance negative.
+    return np.maximum(_variance, 0.0)
 
 
 def mil_handbook(times):
@@ -42,123 +42,225 @@ __copyright__ = 'Copyright 2007 - 2015 Andrew "weibullguy" Rowland'
 #    SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 # Import mathematical functions.
-import lifelines as nonpar
 import numpy as np
+from scipy import sparse
 from scipy.stats import norm                # pylint: disable=E0611
-from math import sqrt
 
 
-def turnbull_s(_tau_):
+def format_data(data, start, end):
     """
-
-    Keyword Arguments:
-    _tau_ --
+    Function to coerce a survival data set into the form used by the Turnbull
+    functions.
+
+    :param array-like data: the data set to fit.  This is a list of tuples
+                            where each tuple contains the following, in order:
+                            * 0 = Observed unit ID
+                            * 1 = Interval start time
+                            * 2 = Interval end time
+                            * 3 = Time between failures or interarrival time
+                            * 4 = Status of observation
+                            * 5 = Quantity of observations
+                            * 6 = Date of observation
+    :param float start: time at which to start analysis.
+    :param float end: time at which to stop analysis.
+    :return: _data; the data set where each row contains the following, in
+             order:
+             * Interval start time
+             * Interval end time
+             * Quantity of observations
+             * Status of observation (0 = right censored, 1 = event,
+               3 = left or interval censored)
+    :rtype: ndarray
     """
 
-    m = len(_tau_)
-    _status_ = []
-
-    for i in range(m - 1):
-        _status_.append(1)
-
-    # survival = importr('survival')
-
-    # _times_ = robjects.FloatVector(_tau_[:m-1])
-    # _status_ = robjects.IntVector(_status_)
-
-    # _surv_ = survival.Surv(_times_, _status_)
-    # robjects.globalenv['surv'] = _surv_
-    # _ekm_ = survival.survfit(robjects.Formula('surv ~ 1'))
-
-    _So_ = []
-    # for i in range(len(_ekm_[5])):
-    #     _So_.append(_ekm_[5][i])
-
-    _p_ = []
-    for i in range(len(_So_) - 1):
-        _p_.append([_So_[i] - _So_[i + 1]])
-
-    return(_p_)
-
-
-def interv(x, inf, sup):
-
-    if(x[0] >= inf and x[1] <= sup):
-        _interv_ = 1
-    else:
-        _interv_ = 0
-
-    return(_interv_)
+    # Sort data by the right of the interval.  Remove records occurring before
+    # the start time and after the end time.
+    _data = sorted(data, key=lambda x: (float(x[2]), float(x[1])))
+    _data = [_rec for _rec in _data
+             if float(_rec[1]) >= start and float(_rec[2]) <= end]
 
+    # Replace the string status with integer status.
+    _status = np.array([str(_rec[4]) for _rec in _data])
+    _int_status = np.ones(len(_data))
+    _int_status[np.in1d(_status, ['Right Censored', '2'])] = 0
+    _int_status[np.in1d(_status, ['Left Censored', 'Interval Censored',
+                                  '3'])] = 3
 
-def turnbull_A(_dataset_, _tau_):
+    return np.column_stack(([float(_rec[1]) for _rec in _data],
+                            [float(_rec[2]) for _rec in _data],
+                            [float(_rec[5]) for _rec in _data],
+                            _int_status))
 
-    _tau2_ = []
-    _A_ = []
 
-    _n_records_ = len(_dataset_)
-
-    _left_ = _tau_[:-1]
-    _right_ = _tau_[1:]
-    for i in range(_n_records_):
-        _idx_start_ = _tau_.index(_dataset_[i][0])
-        _idx_stop_ = _tau_.index(_dataset_[i][1]) - 1
-
-        _a_ = [0]*(len(_left_) - 1)
-        for j in range(_idx_start_, _idx_stop_):
-            _a_[j] = 1
-
-        if((_idx_stop_ - _idx_start_) == 0):
-            _a_[_idx_start_] = 1
-
-        _A_.append(_a_)
-
-    return(_A_)
-
-
-def turnbull(_dataset_, _reltime_, _conf_=0.75, eps=1E-13, iter_max=200):
+def turnbull_A(data, tau):
     """
-    Keyword Arguments:
-    _dataset_ --
-    _conf_    -- the confidence level of the estimates.
+    Function to build the Turnbull indicator matrix.  The time grid divides
+    time into the intervals (tau[j - 1], tau[j]], with the first interval open
+    to the left and an extra last interval after the last grid point.  Each
+    observation covers a run of these grid intervals: an event the interval
+    ending at the event time, a right censored unit every interval after the
+    censoring time, and a left or interval censored unit the intervals between
+    its two times.  The survival function can only drop in the innermost
+    intervals, the runs starting where some observation's run starts and
+    ending at the next place some observation's run ends, so these are the
+    columns of the matrix.  Element (i, j) is True if the i-th observation
+    covers the j-th innermost interval.
+
+    :param ndarray data: the data set as returned by format_data().
+    :param ndarray tau: the sorted, unique time grid.
+    :return: _A, _last; the n observations by m innermost intervals indicator
+             matrix and the index of the last grid interval in each innermost
+             interval.
+    :rtype: scipy.sparse.csr_matrix of booleans, ndarray of integers
     """
 
-    from numpy import amax, array, matrix
-
-    _l_ = [i[0] for i in _dataset_]
-    _r_ = [i[1] for i in _dataset_]
-    _tau_ = list(set(_l_+_r_))
-    _p_ = matrix(turnbull_s(_tau_))
-    _A_ = matrix(turnbull_A(_dataset_, _tau_))
-
-    _n_ = len(_dataset_)
-    _m_ = len(_tau_) - 1
-    _Q_ = matrix([1]*_m_)
+    _n_intervals = len(tau) + 1
+
+    # Find the first and last grid interval each observation covers.
+    _right = np.searchsorted(tau, data[:, 1])
+    _first = np.where(data[:, 3] == 0, _right + 1, _right)
+    _last = np.where(data[:, 3] == 0, _n_intervals - 1, _right)
+    _interval = data[:, 3] == 3
+    _first[_interval] = np.minimum(
+        np.searchsorted(tau, data[_interval, 0]) + 1, _right[_interval])
+
+    # The innermost intervals are each start of a run immediately followed by
+    # the end of a run.  Starts sort ahead of ends at the same grid interval.
+    _ends = np.concatenate((np.unique(_first), np.unique(_last)))
+    _is_last = np.concatenate((np.zeros(len(np.unique(_first)), dtype=bool),
+                               np.ones(len(np.unique(_last)), dtype=bool)))
+    _order = np.lexsort((_is_last, _ends))
+    _ends = _ends[_order]
+    _is_last = _is_last[_order]
+    _pairs = np.where(np.logical_not(_is_last[:-1]) & _is_last[1:])[0]
+    _inner_first = _ends[_pairs]
+    _inner_last = _ends[_pairs + 1]
+
+    # An observation covers every innermost interval inside its own run.
+    _col_first = np.searchsorted(_inner_first, _first)
+    _n_cols = np.searchsorted(_inner_last, _last, side='right') - _col_first
+    _rows = np.repeat(np.arange(len(data)), _n_cols)
+    _cols = np.arange(np.sum(_n_cols)) - \
+        np.repeat(np.cumsum(_n_cols) - _n_cols - _col_first, _n_cols)
+
+    _A = sparse.csr_matrix((np.ones(len(_rows), dtype=bool), (_rows, _cols)),
+                           shape=(len(data), len(_inner_first)))
+
+    return _A, _inner_last
+
+
+def turnbull(data, start, end, conf=0.75, conftype=3,  # pylint: disable=W0613
+             eps=1.0E-8, iter_max=10000):
+    """
+    Function to calculate the Turnbull non-parametric maximum likelihood
+    estimates of the survival function for left, right, and interval censored
+    data.  The estimates are found with the self-consistency (EM) algorithm
+    from Turnbull, "The Empirical Distribution Function with Arbitrarily
+    Grouped, Censored and Truncated Data." Journal of the Royal Statistical
+    Society 1976;38:290-295.  Without left or interval censored observations
+    the estimates are the same as the Kaplan-Meier estimates.
+
+    :param array-like data: the data set to fit.  This is a list of tuples
+                            where each tuple contains the following, in order:
+                            * 0 = Observed unit ID
+                            * 1 = Interval start time
+                            * 2 = Interval end time
+                            * 3 = Time between failures or interarrival time
+                            * 4 = Status of observation
+                            * 5 = Quantity of observations
+                            * 6 = Date of observation
+    :param float start: time at which to start analysis.
+    :param float end: time at which to stop analysis (helps eliminate stretched
+                      plots due to small number of events at high hours).
+    :param float conf: the confidence level of the Turnbull estimates.
+    :param int conftype: the confidence interval type for the Turnbull
+                         estimates.
+                         Confidence type is one of:
+                         * 1 = lower one-sided
+                         * 2 = upper one-sided
+                         * 3 = two-sided (default)
+    :param float eps: the largest change in any interval probability at which
+                      the estimates are considered converged.
+    :param int iter_max: the maximum number of iterations.
+    :return: _turnbull; the matrix of results where each row in the matrix
+             contains the following, in order:
+             * Time of observation
+             * Lower bound on S(t)
+             * Point estimate of S(t)
+             * Upper bound on S(t)
+             _r; the array of observations during which an event occurred.
+    :rtype: ndarray, ndarray
+    """
 
+    _data = format_data(data, start, end)
+
+    # Find the rank of each event among the individual observations.
+    _events = np.repeat(_data[:, 3] != 0, _data[:, 2].astype(int))
+    _r = np.where(_events)[0] + 1
+
+    # Observations with the same times and status have the same row in the
+    # indicator matrix, so they are combined into one weighted observation.
+    # Only the start time of left and interval censored observations is used.
+    _data[_data[:, 3] != 3, 0] = 0.0
+    (_unique, _index) = np.unique(_data[:, [0, 1, 3]], axis=0,
+                                  return_inverse=True)
+    _weights = np.bincount(_index, weights=_data[:, 2])
+    _n_obs = np.sum(_weights)
+    _data = np.column_stack((_unique[:, 0], _unique[:, 1], _weights,
+                             _unique[:, 2]))
+
+    _tau = np.unique(np.concatenate((_data[_data[:, 3] == 3, 0],
+                                     _data[:, 1])))
+    (_A, _last) = turnbull_A(_data, _tau)
+
+    # Iterate the self-consistency equations starting from equal probability
+    # in each innermost interval.
+    _p = np.ones(_A.shape[1]) / _A.shape[1]
     i = 0
-    _maxdiff_ = 1
-    while(_maxdiff_ >= eps and i < iter_max):
-
+    _maxdiff = 1.0
+    while _maxdiff >= eps and i < iter_max:
         i += 1
-        _diff_ = _Q_ - _p_
-        _maxdiff_ = amax(_diff_)
-
-        _Q_ = _p_
-        _C_ = _A_ * _p_
-        _invC_ = matrix([1.0 / i for i in array(_C_)])
-        x = (_A_.T * _invC_) / _n_
-        try:
-            _p_ = _p_ * x
-        except ValueError:
-            print i, len(_p_), len(x)
-
-    # surv = round(c(1, 1-cumsum(_p_)), digits=5)
-    # right = data$right
-
-    # if(any(!(is.finite(right))))
-    #     t <- max(right[is.finite(right)])
-    #     return(list(time=tau[tau<t],surv=surv[tau<t]))
-    # else
-    #     return(list(time=tau,surv=surv))
-
-    return
+        _p_new = _p * _A.T.dot(_weights / _A.dot(_p)) / _n_obs
+        _maxdiff = np.amax(np.abs(_p_new - _p))
+        _p = _p_new
+
+    # The probability of each innermost interval is removed from S(t) at the
+    # end of the interval.
+    _n_intervals = len(_tau) + 1
+    _S = np.maximum(1.0 - np.cumsum(np.bincount(_last, weights=_p,
+                                                minlength=_n_intervals))[:-1],
+                    0.0)
+
+    # Calculate Greenwood's variance using the expected number of failures in
+    # each interval.  Right censored units are at risk until their censoring
+    # time, the other units until their expected failure interval.
+    _censored = _data[:, 3] == 0
+    _failed = np.logical_not(_censored)
+    _deaths = np.bincount(_last,
+                          weights=_p * _A[_failed].T.dot(
+                              _weights[_failed] / _A[_failed].dot(_p)),
+                          minlength=_n_intervals)
+    _at_risk = np.cumsum(_deaths[::-1])[::-1][:-1] + \
+        np.bincount(np.searchsorted(_tau, _data[_censored, 1]),
+                    weights=_weights[_censored],
+                    minlength=len(_tau))[::-1].cumsum()[::-1]
+    _deaths = _deaths[:-1]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _var = _deaths / (_at_risk * (_at_risk - _deaths))
+        _var[np.logical_not(np.isfinite(_var))] = 0.0
+        _log_S = np.log(_S)
+        _z_norm = norm.ppf((1.0 + conf) / 2.0)
+        _delta = _z_norm * np.sqrt(np.cumsum(_var)) / _log_S
+        _S_ll = np.exp(-np.exp(np.log(-_log_S) - _delta))
+        _S_ul = np.exp(-np.exp(np.log(-_log_S) + _delta))
+
+    # The bounds are not defined where S(t) is zero or one.
+    _S_ll[np.logical_not(np.isfinite(_S_ll))] = _S[
+        np.logical_not(np.isfinite(_S_ll))]
+    _S_ul[np.logical_not(np.isfinite(_S_ul))] = _S[
+        np.logical_not(np.isfinite(_S_ul))]
+
+    _turnbull = np.transpose(np.vstack((_tau, _S_ll, _S, _S_ul)))
+
+    return _turnbull, _r
@@ -9,80 +9,51 @@ The Data Access Object (DAO) Package.
 """
 
 import gettext
+import importlib
+import sys
+from functools import partial
 
-from sqlalchemy import create_engine, exc, MetaData     # pylint: disable=E0401
-from sqlalchemy.ext.declarative import declarative_base # pylint: disable=E0401
-from sqlalchemy.orm import sessionmaker                 # pylint: disable=E0401
-from sqlalchemy_utils import create_database            # pylint: disable=E0401
+# pylint: disable=E0401
+from sqlalchemy import create_engine, event, exc, inspect, MetaData
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import mapper, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 # Import other RTK modules.
 import RTKCommonDB                                      # pylint: disable=E0401
 
-# Import tables objects for the RTK Common database.
-from .RTKUser import RTKUser
-from .RTKGroup import RTKGroup
-from .RTKEnviron import RTKEnviron
-from .RTKModel import RTKModel
-from .RTKType import RTKType
-from .RTKCategory import RTKCategory
-from .RTKSubCategory import RTKSubCategory
-from .RTKPhase import RTKPhase
-from .RTKDistribution import RTKDistribution
-from .RTKManufacturer import RTKManufacturer
-from .RTKUnit import RTKUnit
-from .RTKMethod import RTKMethod
-from .RTKCriticality import RTKCriticality
-from .RTKRPN import RTKRPN
-from .RTKLevel import RTKLevel
-from .RTKApplication import RTKApplication
-from .RTKHazards import RTKHazards
-from .RTKStakeholders import RTKStakeholders
-from .RTKStatus import RTKStatus
-from .RTKCondition import RTKCondition
-from .RTKFailureMode import RTKFailureMode
-from .RTKMeasurement import RTKMeasurement
-from .RTKLoadHistory import RTKLoadHistory
-
-# Import RTK Program database table objects.
-from .RTKAction import RTKAction
-from .RTKAllocation import RTKAllocation
-from .RTKCause import RTKCause
-from .RTKControl import RTKControl
-from .RTKDesignElectric import RTKDesignElectric
-from .RTKDesignMechanic import RTKDesignMechanic
-from .RTKEnvironment import RTKEnvironment
-from .RTKFailureDefinition import RTKFailureDefinition
-from .RTKFunction import RTKFunction
-from .RTKGrowthTest import RTKGrowthTest
-from .RTKHardware import RTKHardware
-from .RTKHazardAnalysis import RTKHazardAnalysis
-from .RTKIncident import RTKIncident
-from .RTKIncidentAction import RTKIncidentAction
-from .RTKIncidentDetail import RTKIncidentDetail
-from .RTKMatrix import RTKMatrix
-from .RTKMechanism import RTKMechanism
-from .RTKMilHdbkF import RTKMilHdbkF
-from .RTKMission import RTKMission
-from .RTKMissionPhase import RTKMissionPhase
-from .RTKMode import RTKMode
-from .RTKNSWC import RTKNSWC
-from .RTKOpLoad import RTKOpLoad
-from .RTKOpStress import RTKOpStress
-from .RTKProgramInfo import RTKProgramInfo
-from .RTKReliability import RTKReliability          # pylint: disable=E0401
-from .RTKRequirement import RTKRequirement
-from .RTKRevision import RTKRevision
-from .RTKSimilarItem import RTKSimilarItem
-from .RTKSoftware import RTKSoftware
-from .RTKSoftwareDevelopment import RTKSoftwareDevelopment
-from .RTKSoftwareReview import RTKSoftwareReview
-from .RTKSoftwareTest import RTKSoftwareTest
-from .RTKStakeholder import RTKStakeholder
-from .RTKSurvival import RTKSurvival
-from .RTKSurvivalData import RTKSurvivalData
-from .RTKTest import RTKTest
-from .RTKTestMethod import RTKTestMethod
-from .RTKValidation import RTKValidation
+# The table classes are imported the first time they are used rather than
+# when the dao package is imported.  RTK_COMMON_TABLES and RTK_PROGRAM_TABLES
+# are the names of the table classes in the RTK Common and RTK Program
+# databases.
+RTK_COMMON_TABLES = ('RTKSiteInfo', 'RTKUser', 'RTKGroup', 'RTKEnviron',
+                     'RTKModel', 'RTKType', 'RTKCategory', 'RTKSubCategory',
+                     'RTKPhase', 'RTKDistribution', 'RTKManufacturer',
+                     'RTKUnit', 'RTKMethod', 'RTKCriticality', 'RTKRPN',
+                     'RTKLevel', 'RTKApplication', 'RTKHazards',
+                     'RTKStakeholders', 'RTKStatus', 'RTKCondition',
+                     'RTKFailureMode', 'RTKMeasurement', 'RTKLoadHistory')
+RTK_PROGRAM_TABLES = ('RTKAction', 'RTKAllocation', 'RTKCause', 'RTKControl',
+                      'RTKDesignElectric', 'RTKDesignMechanic',
+                      'RTKEnvironment', 'RTKFailureDefinition', 'RTKFunction',
+                      'RTKGrowthTest', 'RTKHardware', 'RTKHazardAnalysis',
+                      'RTKIncident', 'RTKIncidentAction', 'RTKIncidentDetail',
+                      'RTKMatrix', 'RTKMechanism', 'RTKMilHdbkF',
+                      'RTKMission', 'RTKMissionPhase', 'RTKMode', 'RTKNSWC',
+                      'RTKOpLoad', 'RTKOpStress', 'RTKProgramInfo',
+                      'RTKReliability', 'RTKRequirement', 'RTKRevision',
+                      'RTKSimilarItem', 'RTKSoftware',
+                      'RTKSoftwareDevelopment', 'RTKSoftwareReview',
+                      'RTKSoftwareTest', 'RTKStakeholder', 'RTKSurvival',
+                      'RTKSurvivalData', 'RTKTest', 'RTKTestMethod',
+                      'RTKValidation')
+
+# Tables that share relationships.  SQLAlchemy can only configure the
+# relationships once every table in the group has been imported.
+RTK_TABLE_GROUPS = (('RTKCategory', 'RTKSubCategory', 'RTKFailureMode'),
+                    tuple(_table for _table in RTK_PROGRAM_TABLES
+                          if _table != 'RTKProgramInfo'))
 
 RTK_BASE = declarative_base()
 
@@ -95,6 +66,73 @@ __organization__ = 'ReliaQual Associates, LLC'
 __copyright__ = 'Copyright 2007 - 2015 Andrew "weibullguy" Rowland'
 
 
+def get_table(name):
+    """
+    Function to return an RTK table class by name, importing it if needed.
+
+    :param str name: the name of the table class, e.g. RTKRevision.
+    :return: the table class.
+    :raise: KeyError if name is not an RTK table class.
+    """
+
+    if name not in RTK_COMMON_TABLES and name not in RTK_PROGRAM_TABLES:
+        raise KeyError(name)
+
+    _module = importlib.import_module('.' + name,
+                                      __name__.rpartition('.')[0])
+
+    return getattr(_module, name)
+
+
+def _import_related_tables():
+    """
+    Function to import the rest of each group of related tables when one of
+    the tables in the group has been imported.  This is called by SQLAlchemy
+    before the mappers are configured.
+
+    :return: None
+    :rtype: None
+    """
+
+    _package = __name__.rpartition('.')[0]
+    for _group in RTK_TABLE_GROUPS:
+        if any(_package + '.' + _name in sys.modules for _name in _group):
+            for _name in _group:
+                get_table(_name)
+
+    return None
+
+
+event.listen(mapper, 'before_configured', _import_related_tables)
+
+
+def _set_sqlite_pragmas(connection, __, profile):
+    """
+    Function to set the SQLite PRAGMAs in the engine profile on each new
+    connection to an SQLite database.
+
+    :param connection: the DBAPI connection to the database.
+    :param dict profile: the engine profile.
+    :return: None
+    :rtype: None
+    """
+
+    _cursor = connection.cursor()
+    _cursor.execute('PRAGMA journal_mode={0:s}'.format(
+        str(profile['journal_mode'])))
+    _cursor.execute('PRAGMA synchronous={0:s}'.format(
+        str(profile['synchronous'])))
+    _cursor.execute('PRAGMA cache_size={0:d}'.format(
+        int(profile['cache_size'])))
+    _cursor.execute('PRAGMA mmap_size={0:d}'.format(
+        int(profile['mmap_size'])))
+    _cursor.execute('PRAGMA temp_store={0:s}'.format(
+        str(profile['temp_store'])))
+    _cursor.close()
+
+    return None
+
+
 class DAO(object):
     """
     This is the data access controller class.
@@ -106,6 +144,7 @@ class DAO(object):
     engine = None
     metadata = None
     session = None
+    sessions = None
 
     def __init__(self):
         """
@@ -124,40 +163,131 @@ class DAO(object):
 
         # Initialize public scalar instance attributes.
 
-    def db_connect(self, database):
+    def db_connect(self, database, profile=None):
         """
         Method to perform database connection using database settings from
         the configuration file.
 
         :param str database: the absolute path to the database to connect to.
+        :keyword dict profile: the engine profile to connect with.  The keys
+                               are those of the Configuration RTK_DB_PROFILE.
+                               If None, the SQLAlchemy defaults are used.
         :return: False if successful, True if an error occurs.
         :rtype: bool
         """
 
-        self.engine = create_engine(database, echo=False)
+        _url = make_url(database)
+        _memory = (_url.drivername.startswith('sqlite') and
+                   _url.database in (None, '', ':memory:'))
+
+        # An SQLite in-memory database only exists for the connection that
+        # created it, so it can't use a pool of connections.
+        _kwargs = {'echo': False}
+        if profile is not None and not _memory:
+            _kwargs['poolclass'] = QueuePool
+            _kwargs['pool_size'] = int(profile['pool_size'])
+            _kwargs['max_overflow'] = int(profile['max_overflow'])
+            _kwargs['pool_timeout'] = float(profile['pool_timeout'])
+
+        self.engine = create_engine(_url, **_kwargs)
+        if profile is not None and _url.drivername.startswith('sqlite'):
+            event.listen(self.engine, 'connect',
+                         partial(_set_sqlite_pragmas, profile=profile))
+
         self.metadata = MetaData(self.engine)
 
         self.session = self.RTK_SESSION(bind=self.engine,
                                         autoflush=True,
                                         autocommit=False,
                                         expire_on_commit=False)
+        self.sessions = scoped_session(sessionmaker(bind=self.engine,
+                                                    autoflush=False,
+                                                    autocommit=False,
+                                                    expire_on_commit=False))
+
+        return False
+
+    def db_close(self):
+        """
+        Method to close the connection to the database.  The pooled
+        connections are closed as well.
+
+        :return: False if successful, True if an error occurs.
+        :rtype: bool
+        """
+
+        if self.sessions is not None:
+            self.sessions.remove()
+            self.sessions = None
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+        if self.engine is not None:
+            self.engine.dispose()
+            self.engine = None
 
         return False
 
-    def _db_table_create(self, table):
+    def db_session(self):
         """
-        Method to check if the passed table exists and create it if not.
+        Method to return the session to use for a unit of work against the
+        connected database.  Each thread reuses one session for all of its
+        units of work; closing the session at the end of a unit of work
+        returns its connection to the pool.
+
+        :return: the session for the unit of work.
+        :rtype: :py:class:`sqlalchemy.orm.Session`
+        """
+
+        return self.sessions()
 
-        :param table: the table to check for.
+    def _db_tables_create(self, tables):
+        """
+        Method to create the passed tables, and their indexes, that don't
+        already exist.  The tables are created in a single transaction and in
+        the order required by their foreign keys.  The transaction is rolled
+        back if any table or index can't be created.
+
+        :param list tables: the list of tables to create.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
         _return = False
 
-        if not self.engine.dialect.has_table(self.engine.connect(),
-                                             str(table)):
-            table.create(bind=self.engine)
+        try:
+            with self.engine.begin() as _connection:
+                RTKCommonDB.RTK_BASE.metadata.create_all(
+                    bind=_connection, tables=tables, checkfirst=True)
+        except exc.SQLAlchemyError:
+            _return = True
+
+        return _return
+
+    @staticmethod
+    def _db_bulk_insert(entities, session):
+        """
+        Method to write a list of new records in a single transaction.  The
+        records are written with one executemany INSERT for each table so
+        the records must be ordered parents first and have their primary
+        keys set.
+
+        :param list entities: the list of records to write.
+        :param session: the SQLAlchemy scoped_session instance used to
+                        communicate with the database.
+        :type session: :py:class:`sqlalchemy.orm.scoped_session`
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+
+        _return = False
+
+        try:
+            session.bulk_save_objects(entities)
+            session.commit()
+        except exc.SQLAlchemyError:
+            session.rollback()
+            _return = True
 
         return _return
 
@@ -174,198 +304,89 @@ class DAO(object):
         :rtype: bool
         """
 
+        # pylint: disable=E0401
+        from sqlalchemy_utils import create_database
+        from .RTKUser import RTKUser
+        from .RTKGroup import RTKGroup
+        from .RTKEnviron import RTKEnviron
+        from .RTKModel import RTKModel
+        from .RTKType import RTKType
+        from .RTKCategory import RTKCategory
+        from .RTKSubCategory import RTKSubCategory
+        from .RTKPhase import RTKPhase
+        from .RTKDistribution import RTKDistribution
+        from .RTKManufacturer import RTKManufacturer
+        from .RTKUnit import RTKUnit
+        from .RTKMethod import RTKMethod
+        from .RTKCriticality import RTKCriticality
+        from .RTKRPN import RTKRPN
+        from .RTKLevel import RTKLevel
+        from .RTKApplication import RTKApplication
+        from .RTKHazards import RTKHazards
+        from .RTKStakeholders import RTKStakeholders
+        from .RTKStatus import RTKStatus
+        from .RTKCondition import RTKCondition
+        from .RTKFailureMode import RTKFailureMode
+        from .RTKMeasurement import RTKMeasurement
+        from .RTKLoadHistory import RTKLoadHistory
+
         try:
             create_database(database)
         except IOError:
             return True
 
-        self._db_table_create(RTKUser.__table__)
-        self._db_table_create(RTKGroup.__table__)
-        for _key in RTKCommonDB.RTK_GROUPS:
-            _group = RTKGroup()
-            _group.group_id = _key
-            self.db_add([_group, ], session)
-            session.commit()
-            _group.set_attributes(RTKCommonDB.RTK_GROUPS[_key])
-            session.commit()
-
-        self._db_table_create(RTKEnviron.__table__)
-        for _key in RTKCommonDB.RTK_ENVIRONS:
-            _environ = RTKEnviron()
-            _environ.environ_id = _key
-            self.db_add([_environ, ], session)
-            session.commit()
-            _environ.set_attributes(RTKCommonDB.RTK_ENVIRONS[_key])
-            session.commit()
-
-        self._db_table_create(RTKModel.__table__)
-        for _key in RTKCommonDB.RTK_MODELS:
-            _model = RTKModel()
-            _model.model_id = _key
-            self.db_add([_model, ], session)
-            session.commit()
-            _model.set_attributes(RTKCommonDB.RTK_MODELS[_key])
-            session.commit()
-
-        self._db_table_create(RTKType.__table__)
-        for _key in RTKCommonDB.RTK_TYPES:
-            _type = RTKType()
-            _type.type_id = _key
-            self.db_add([_type, ], session)
-            session.commit()
-            _type.set_attributes(RTKCommonDB.RTK_TYPES[_key])
-            session.commit()
-
-        self._db_table_create(RTKCategory.__table__)
-        for _key in RTKCommonDB.RTK_CATEGORIES:
-            _category = RTKCategory()
-            _category.category_id = _key
-            self.db_add([_category, ], session)
-            session.commit()
-            _category.set_attributes(RTKCommonDB.RTK_CATEGORIES[_key])
-            session.commit()
-
-        self._db_table_create(RTKSubCategory.__table__)
-        self._db_table_create(RTKFailureMode.__table__)
-
-        self._db_table_create(RTKPhase.__table__)
-        for _key in RTKCommonDB.RTK_PHASES:
-            _phase = RTKPhase()
-            _phase.phase_id = _key
-            self.db_add([_phase, ], session)
-            session.commit()
-            _phase.set_attributes(RTKCommonDB.RTK_PHASES[_key])
-            session.commit()
-
-        self._db_table_create(RTKDistribution.__table__)
-        for _key in RTKCommonDB.RTK_DISTRIBUTIONS:
-            _distribution = RTKDistribution()
-            _distribution.distribution_id = _key
-            self.db_add([_distribution, ], session)
-            session.commit()
-            _distribution.set_attributes(RTKCommonDB.RTK_DISTRIBUTIONS[_key])
-            session.commit()
-
-        self._db_table_create(RTKManufacturer.__table__)
-        for _key in RTKCommonDB.RTK_MANUFACTURERS:
-            _manufacturer = RTKManufacturer()
-            _manufacturer.manufacturer_id = _key
-            self.db_add([_manufacturer, ], session)
-            session.commit()
-            _manufacturer.set_attributes(RTKCommonDB.RTK_MANUFACTURERS[_key])
-            session.commit()
-
-        self._db_table_create(RTKUnit.__table__)
-        for _key in RTKCommonDB.RTK_UNITS:
-            _unit = RTKUnit()
-            _unit.unit_id = _key
-            self.db_add([_unit, ], session)
-            session.commit()
-            _unit.set_attributes(RTKCommonDB.RTK_UNITS[_key])
-            session.commit()
-
-        self._db_table_create(RTKMethod.__table__)
-        for _key in RTKCommonDB.RTK_METHODS:
-            _method = RTKMethod()
-            _method.method_id = _key
-            self.db_add([_method, ], session)
-            session.commit()
-            _method.set_attributes(RTKCommonDB.RTK_METHODS[_key])
-            session.commit()
-
-        self._db_table_create(RTKCriticality.__table__)
-        for _key in RTKCommonDB.RTK_CRITICALITIES:
-            _criticality = RTKCriticality()
-            _criticality.criticality_id = _key
-            self.db_add([_criticality, ], session)
-            session.commit()
-            _criticality.set_attributes(RTKCommonDB.RTK_CRITICALITIES[_key])
-            session.commit()
-
-        self._db_table_create(RTKRPN.__table__)
-        for _key in RTKCommonDB.RTK_RPNS:
-            _rpn = RTKRPN()
-            _rpn.rpn_id = _key
-            self.db_add([_rpn, ], session)
-            session.commit()
-            _rpn.set_attributes(RTKCommonDB.RTK_RPNS[_key])
-            session.commit()
-
-        self._db_table_create(RTKLevel.__table__)
-        for _key in RTKCommonDB.RTK_LEVELS:
-            _level = RTKLevel()
-            _level.level_id = _key
-            self.db_add([_level, ], session)
-            session.commit()
-            _level.set_attributes(RTKCommonDB.RTK_LEVELS[_key])
-            session.commit()
-
-        self._db_table_create(RTKApplication.__table__)
-        for _key in RTKCommonDB.RTK_APPLICATIONS:
-            _application = RTKApplication()
-            _application.application_id = _key
-            self.db_add([_application, ], session)
-            session.commit()
-            _application.set_attributes(RTKCommonDB.RTK_APPLICATIONS[_key])
-            session.commit()
-
-        self._db_table_create(RTKHazards.__table__)
-        for _key in RTKCommonDB.RTK_HAZARDS:
-            _hazard = RTKHazards()
-            _hazard.hazard_id = _key
-            self.db_add([_hazard, ], session)
-            session.commit()
-            _hazard.set_attributes(RTKCommonDB.RTK_HAZARDS[_key])
-            session.commit()
-
-        self._db_table_create(RTKStakeholders.__table__)
-        for _key in RTKCommonDB.RTK_STAKEHOLDERS:
-            _stakeholder = RTKStakeholders()
-            _stakeholder.stakeholders_id = _key
-            self.db_add([_stakeholder, ], session)
-            session.commit()
-            _stakeholder.set_attributes(RTKCommonDB.RTK_STAKEHOLDERS[_key])
-            session.commit()
-
-        self._db_table_create(RTKStatus.__table__)
-        for _key in RTKCommonDB.RTK_STATUSES:
-            _status = RTKStatus()
-            _status.status_id = _key
-            self.db_add([_status, ], session)
-            session.commit()
-            _status.set_attributes(RTKCommonDB.RTK_STATUSES[_key])
-            session.commit()
-
-        self._db_table_create(RTKCondition.__table__)
-        for _key in RTKCommonDB.RTK_CONDITIONS:
-            _condition = RTKCondition()
-            _condition.condition_id = _key
-            self.db_add([_condition, ], session)
-            session.commit()
-            _condition.set_attributes(RTKCommonDB.RTK_CONDITIONS[_key])
-            session.commit()
-
-        self._db_table_create(RTKMeasurement.__table__)
-        for _key in RTKCommonDB.RTK_MEASUREMENTS:
-            _measurement = RTKMeasurement()
-            _measurement.measurement_id = _key
-            self.db_add([_measurement, ], session)
-            session.commit()
-            _measurement.set_attributes(RTKCommonDB.RTK_MEASUREMENTS[_key])
-            session.commit()
-
-        self._db_table_create(RTKLoadHistory.__table__)
-        for _key in RTKCommonDB.RTK_HISTORIES:
-            _history = RTKLoadHistory()
-            _history.history_id = _key
-            self.db_add([_history, ], session)
-            session.commit()
-            _history.set_attributes(RTKCommonDB.RTK_HISTORIES[_key])
-            session.commit()
-
-        return False
+        if self._db_tables_create([
+            RTKUser.__table__, RTKGroup.__table__, RTKEnviron.__table__,
+            RTKModel.__table__, RTKType.__table__, RTKCategory.__table__,
+            RTKSubCategory.__table__, RTKFailureMode.__table__,
+            RTKPhase.__table__, RTKDistribution.__table__,
+            RTKManufacturer.__table__, RTKUnit.__table__, RTKMethod.__table__,
+            RTKCriticality.__table__, RTKRPN.__table__, RTKLevel.__table__,
+            RTKApplication.__table__, RTKHazards.__table__,
+            RTKStakeholders.__table__, RTKStatus.__table__,
+            RTKCondition.__table__, RTKMeasurement.__table__,
+            RTKLoadHistory.__table__
+        ]):
+            return True
 
-    def db_create_program(self, database, session):
+        # Each lookup table is loaded from the RTKCommonDB dictionary.  The
+        # key is the record's ID and the value is the tuple of attributes.
+        _lst_lookups = [
+            (RTKGroup, 'group_id', RTKCommonDB.RTK_GROUPS),
+            (RTKEnviron, 'environ_id', RTKCommonDB.RTK_ENVIRONS),
+            (RTKModel, 'model_id', RTKCommonDB.RTK_MODELS),
+            (RTKType, 'type_id', RTKCommonDB.RTK_TYPES),
+            (RTKCategory, 'category_id', RTKCommonDB.RTK_CATEGORIES),
+            (RTKPhase, 'phase_id', RTKCommonDB.RTK_PHASES),
+            (RTKDistribution, 'distribution_id',
+             RTKCommonDB.RTK_DISTRIBUTIONS),
+            (RTKManufacturer, 'manufacturer_id',
+             RTKCommonDB.RTK_MANUFACTURERS),
+            (RTKUnit, 'unit_id', RTKCommonDB.RTK_UNITS),
+            (RTKMethod, 'method_id', RTKCommonDB.RTK_METHODS),
+            (RTKCriticality, 'criticality_id', RTKCommonDB.RTK_CRITICALITIES),
+            (RTKRPN, 'rpn_id', RTKCommonDB.RTK_RPNS),
+            (RTKLevel, 'level_id', RTKCommonDB.RTK_LEVELS),
+            (RTKApplication, 'application_id', RTKCommonDB.RTK_APPLICATIONS),
+            (RTKHazards, 'hazard_id', RTKCommonDB.RTK_HAZARDS),
+            (RTKStakeholders, 'stakeholders_id',
+             RTKCommonDB.RTK_STAKEHOLDERS),
+            (RTKStatus, 'status_id', RTKCommonDB.RTK_STATUSES),
+            (RTKCondition, 'condition_id', RTKCommonDB.RTK_CONDITIONS),
+            (RTKMeasurement, 'measurement_id', RTKCommonDB.RTK_MEASUREMENTS),
+            (RTKLoadHistory, 'history_id', RTKCommonDB.RTK_HISTORIES)
+        ]
+        _entities = []
+        for _table, _id, _records in _lst_lookups:
+            for _key in _records:
+                _record = _table()
+                setattr(_record, _id, _key)
+                _record.set_attributes(_records[_key])
+                _entities.append(_record)
+
+        return self._db_bulk_insert(_entities, session)
+
+    def db_create_program(self, database, session):  # pylint: disable=R0914
         """
         Method to create a new RTK Program database.
 
@@ -378,144 +399,173 @@ class DAO(object):
         :rtype: bool
         """
 
+        # pylint: disable=E0401
+        from sqlalchemy_utils import create_database
+        from .RTKAction import RTKAction
+        from .RTKAllocation import RTKAllocation
+        from .RTKCause import RTKCause
+        from .RTKControl import RTKControl
+        from .RTKDesignElectric import RTKDesignElectric
+        from .RTKDesignMechanic import RTKDesignMechanic
+        from .RTKEnvironment import RTKEnvironment
+        from .RTKFailureDefinition import RTKFailureDefinition
+        from .RTKFunction import RTKFunction
+        from .RTKGrowthTest import RTKGrowthTest
+        from .RTKHardware import RTKHardware
+        from .RTKHazardAnalysis import RTKHazardAnalysis
+        from .RTKIncident import RTKIncident
+        from .RTKIncidentAction import RTKIncidentAction
+        from .RTKIncidentDetail import RTKIncidentDetail
+        from .RTKMatrix import RTKMatrix
+        from .RTKMechanism import RTKMechanism
+        from .RTKMilHdbkF import RTKMilHdbkF
+        from .RTKMission import RTKMission
+        from .RTKMissionPhase import RTKMissionPhase
+        from .RTKMode import RTKMode
+        from .RTKNSWC import RTKNSWC
+        from .RTKOpLoad import RTKOpLoad
+        from .RTKOpStress import RTKOpStress
+        from .RTKProgramInfo import RTKProgramInfo
+        from .RTKReliability import RTKReliability
+        from .RTKRequirement import RTKRequirement
+        from .RTKRevision import RTKRevision
+        from .RTKSimilarItem import RTKSimilarItem
+        from .RTKSoftware import RTKSoftware
+        from .RTKSoftwareDevelopment import RTKSoftwareDevelopment
+        from .RTKSoftwareReview import RTKSoftwareReview
+        from .RTKSoftwareTest import RTKSoftwareTest
+        from .RTKStakeholder import RTKStakeholder
+        from .RTKSurvival import RTKSurvival
+        from .RTKSurvivalData import RTKSurvivalData
+        from .RTKTest import RTKTest
+        from .RTKTestMethod import RTKTestMethod
+        from .RTKValidation import RTKValidation
+
         try:
             create_database(database)
         except IOError:
             return True
 
-        self._db_table_create(RTKProgramInfo.__table__)
+        if self._db_tables_create([
+            RTKProgramInfo.__table__, RTKRevision.__table__,
+            RTKMission.__table__, RTKMissionPhase.__table__,
+            RTKEnvironment.__table__, RTKFailureDefinition.__table__,
+            RTKFunction.__table__, RTKRequirement.__table__,
+            RTKStakeholder.__table__, RTKMatrix.__table__,
+            RTKHardware.__table__, RTKAllocation.__table__,
+            RTKHazardAnalysis.__table__, RTKSimilarItem.__table__,
+            RTKReliability.__table__, RTKMilHdbkF.__table__,
+            RTKNSWC.__table__, RTKDesignElectric.__table__,
+            RTKDesignMechanic.__table__, RTKMode.__table__,
+            RTKMechanism.__table__, RTKCause.__table__, RTKControl.__table__,
+            RTKAction.__table__, RTKOpLoad.__table__, RTKOpStress.__table__,
+            RTKTestMethod.__table__, RTKSoftware.__table__,
+            RTKSoftwareDevelopment.__table__, RTKSoftwareReview.__table__,
+            RTKSoftwareTest.__table__, RTKValidation.__table__,
+            RTKIncident.__table__, RTKIncidentDetail.__table__,
+            RTKIncidentAction.__table__, RTKTest.__table__,
+            RTKGrowthTest.__table__, RTKSurvival.__table__,
+            RTKSurvivalData.__table__
+        ]):
+            return True
 
-        self._db_table_create(RTKRevision.__table__)
         _revision = RTKRevision()
         _revision.revision_id = 1
         _revision.description = _(u"Initial Revision")
-        self.db_add([_revision, ], session)
-        session.commit()
 
-        self._db_table_create(RTKMission.__table__)
         _mission = RTKMission()
         _mission.revision_id = _revision.revision_id
         _mission.mission_id = 1
         _mission.description = _(u"Default Mission")
-        self.db_add([_mission, ], session)
-        session.commit()
 
-        self._db_table_create(RTKMissionPhase.__table__)
         _phase = RTKMissionPhase()
         _phase.mission_id = _mission.mission_id
         _phase.phase_id = 1
         _phase.description = _(u"Default Mission Phase 1")
-        self.db_add([_phase, ], session)
-        session.commit()
-
-        self._db_table_create(RTKEnvironment.__table__)
-        self._db_table_create(RTKFailureDefinition.__table__)
-        self._db_table_create(RTKFunction.__table__)
-        self._db_table_create(RTKRequirement.__table__)
-        self._db_table_create(RTKStakeholder.__table__)
-        self._db_table_create(RTKMatrix.__table__)
 
-        self._db_table_create(RTKHardware.__table__)
         _hardware = RTKHardware()
         _hardware.revision_id = _revision.revision_id
         _hardware.hardware_id = 1
         _hardware.description = _(u"System")
-        self.db_add([_hardware, ], session)
-        session.commit()
 
-        self._db_table_create(RTKAllocation.__table__)
         _allocation = RTKAllocation()
         _allocation.hardware_id = _hardware.hardware_id
 
-        self._db_table_create(RTKHazardAnalysis.__table__)
         _hazard = RTKHazardAnalysis()
         _hazard.hardware_id = _hardware.hardware_id
 
-        self._db_table_create(RTKSimilarItem.__table__)
         _similar_item = RTKSimilarItem()
         _similar_item.hardware_id = _hardware.hardware_id
 
-        self._db_table_create(RTKReliability.__table__)
         _reliability = RTKReliability()
         _reliability.hardware_id = _hardware.hardware_id
-        self.db_add([_allocation, _hazard, _similar_item, _reliability],
-                    session)
-        session.commit()
-
-        self._db_table_create(RTKMilHdbkF.__table__)
-        self._db_table_create(RTKNSWC.__table__)
-        self._db_table_create(RTKDesignElectric.__table__)
-        self._db_table_create(RTKDesignMechanic.__table__)
-        self._db_table_create(RTKMode.__table__)
-        self._db_table_create(RTKMechanism.__table__)
-        self._db_table_create(RTKCause.__table__)
-        self._db_table_create(RTKControl.__table__)
-        self._db_table_create(RTKAction.__table__)
-        self._db_table_create(RTKOpLoad.__table__)
-        self._db_table_create(RTKOpStress.__table__)
-        self._db_table_create(RTKTestMethod.__table__)
-
-        self._db_table_create(RTKSoftware.__table__)
+
         _software = RTKSoftware()
         _software.revision_id = _revision.revision_id
         _software.software_id = 1
         _software.description = _(u"System Software")
-        self.db_add([_software, ], session)
-        session.commit()
 
-        self._db_table_create(RTKSoftwareDevelopment.__table__)
+        _entities = [
+            _revision, _mission, _phase, _hardware, _allocation, _hazard,
+            _similar_item, _reliability, _software
+        ]
         for i in range(43):
             _sw_development = RTKSoftwareDevelopment()
             _sw_development.software_id = _software.software_id
             _sw_development.question_id = i
-            self.db_add([_sw_development, ], session)
-        session.commit()
-
-        self._db_table_create(RTKSoftwareReview.__table__)
+            _entities.append(_sw_development)
+        # The rtk_software_review primary key is only the question ID so the
+        # SRR, PDR, CDR, and TRR reviews share the 50 question records.
         for i in range(50):
             _sw_review = RTKSoftwareReview()
             _sw_review.software_id = _software.software_id
             _sw_review.question_id = i
-            _sw_review.type = 'SRR'
-            self.db_add([_sw_review, ], session)
-        for i in range(38):
-            _sw_review = RTKSoftwareReview()
-            _sw_review.software_id = _software.software_id
-            _sw_review.question_id = i
-            _sw_review.type = 'PDR'
-            self.db_add([_sw_review, ], session)
-        for i in range(35):
-            _sw_review = RTKSoftwareReview()
-            _sw_review.software_id = _software.software_id
-            _sw_review.question_id = i
-            _sw_review.type = 'CDR'
-            self.db_add([_sw_review, ], session)
-        for i in range(24):
-            _sw_review = RTKSoftwareReview()
-            _sw_review.software_id = _software.software_id
-            _sw_review.question_id = i
-            _sw_review.type = 'TRR'
-            self.db_add([_sw_review, ], session)
-        session.commit()
-
-        self._db_table_create(RTKSoftwareTest.__table__)
+            _entities.append(_sw_review)
         for i in range(21):
             _sw_test = RTKSoftwareTest()
             _sw_test.software_id = _software.software_id
             _sw_test.technique_id = i
-            self.db_add([_sw_test, ], session)
-        session.commit()
-
-        self._db_table_create(RTKValidation.__table__)
-        self._db_table_create(RTKIncident.__table__)
-        self._db_table_create(RTKIncidentDetail.__table__)
-        self._db_table_create(RTKIncidentAction.__table__)
-        self._db_table_create(RTKTest.__table__)
-        self._db_table_create(RTKGrowthTest.__table__)
-        self._db_table_create(RTKSurvival.__table__)
-        self._db_table_create(RTKSurvivalData.__table__)
+            _entities.append(_sw_test)
 
-        return False
+        return self._db_bulk_insert(_entities, session)
+
+    def db_create_indexes(self):
+        """
+        Method to add any missing indexes to an existing RTK Program database.
+        RTK Program databases created before the tables declared their
+        indexes only have the primary key indexes.  Tables that don't exist
+        in the connected database are skipped.
+
+        :return: (_error_code, _Msg); the error code and associated error
+                                      message.
+        :rtype: (int, str)
+        """
+
+        _error_code = 0
+        _msg = "RTK SUCCESS: Creating indexes in the RTK Program database."
+
+        _inspector = inspect(self.engine)
+        _lst_tables = _inspector.get_table_names()
+
+        for _name in RTK_PROGRAM_TABLES:
+            _table = get_table(_name).__table__
+            if _table.name not in _lst_tables:
+                continue
+
+            _lst_indexes = [
+                _index['name'] for _index in _inspector.get_indexes(_table.name)
+            ]
+            for _index in _table.indexes:
+                if _index.name in _lst_indexes:
+                    continue
+                try:
+                    _index.create(bind=self.engine)
+                except exc.SQLAlchemyError:
+                    _error_code = 1006
+                    _msg = "RTK ERROR: Creating index {0:s} in the RTK " \
+                           "Program database.".format(_index.name)
+
+        return _error_code, _msg
 
     @staticmethod
     def db_add(item, session):
@@ -547,6 +597,55 @@ class DAO(object):
 
         return _error_code, _msg
 
+    @staticmethod
+    def db_add_many(items, session):
+        """
+        Method to add a list of new items to the RTK Program database.
+
+        All the items are added to the session and written in a single
+        transaction so the database sees one commit for the entire list.  The
+        unit of work will batch the INSERT statements for each table using
+        executemany when the primary keys are known.  If the batch fails, it
+        is rolled back and each item is retried on its own so the good items
+        are still saved and the bad items are reported.
+
+        :param list items: the list of objects to add to the RTK Program
+                           database.
+        :param session: the SQLAlchemy scoped_session instance used to
+                        communicate with the RTK Program database.
+        :type session: :py:class:`sqlalchemy.orm.scoped_session`
+        :return: (_error_code, _Msg, _failed); the error code, associated
+                 error message, and the list of indices in items that could
+                 not be added.
+        :rtype: (int, str, list)
+        """
+
+        _error_code = 0
+        _msg = "RTK SUCCESS: Adding one or more items to the RTK Program " \
+               "database."
+        _failed = []
+
+        try:
+            session.add_all(items)
+            session.commit()
+        except exc.SQLAlchemyError:
+            session.rollback()
+
+            for _index, _item in enumerate(items):
+                try:
+                    session.add(_item)
+                    session.commit()
+                except exc.SQLAlchemyError:
+                    session.rollback()
+                    _failed.append(_index)
+
+        if _failed:
+            _error_code = 1003
+            _msg = "RTK ERROR: Adding {0:d} of {1:d} items to the RTK " \
+                   "Program database.".format(len(_failed), len(items))
+
+        return _error_code, _msg, _failed
+
     @staticmethod
     def db_update(session):
         """
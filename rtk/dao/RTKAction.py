@@ -31,12 +31,14 @@ class RTKAction(RTK_BASE):
         'fld_mode_id',
         Integer,
         ForeignKey('rtk_mode.fld_mode_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     cause_id = Column(
         'fld_cause_id',
         Integer,
         ForeignKey('rtk_cause.fld_cause_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     action_id = Column(
         'fld_action_id',
         Integer,
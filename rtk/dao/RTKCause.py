@@ -36,7 +36,8 @@ class RTKCause(RTK_BASE):
         'fld_mechanism_id',
         Integer,
         ForeignKey('rtk_mechanism.fld_mechanism_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     cause_id = Column(
         'fld_cause_id',
         Integer,
@@ -29,12 +29,14 @@ class RTKControl(RTK_BASE):
         'fld_mode_id',
         Integer,
         ForeignKey('rtk_mode.fld_mode_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     cause_id = Column(
         'fld_cause_id',
         Integer,
         ForeignKey('rtk_cause.fld_cause_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     control_id = Column(
         'fld_control_id',
         Integer,
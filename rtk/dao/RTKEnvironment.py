@@ -29,7 +29,8 @@ class RTKEnvironment(RTK_BASE):
         'fld_phase_id',
         Integer,
         ForeignKey('rtk_mission_phase.fld_phase_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     # test_id = Column('fld_test_id', Integer,
     #                  ForeignKey('rtk_test.fld_test_id'),
     #                  nullable=False)
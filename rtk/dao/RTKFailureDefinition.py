@@ -29,7 +29,8 @@ class RTKFailureDefinition(RTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('rtk_revision.fld_revision_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     definition_id = Column(
         'fld_definition_id',
         Integer,
@@ -35,7 +35,8 @@ class RTKFunction(RTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('rtk_revision.fld_revision_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     function_id = Column(
         'fld_function_id',
         Integer,
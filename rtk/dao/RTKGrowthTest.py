@@ -31,7 +31,8 @@ class RTKGrowthTest(RTK_BASE):
     __table_args__ = {'extend_existing': True}
 
     test_id = Column('fld_test_id', Integer,
-                     ForeignKey('rtk_test.fld_test_id'), nullable=False)
+                     ForeignKey('rtk_test.fld_test_id'), nullable=False,
+                     index=True)
     phase_id = Column('fld_phase_id', Integer, primary_key=True,
                       autoincrement=True, nullable=False)
 
@@ -38,7 +38,8 @@ class RTKHardware(RTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('rtk_revision.fld_revision_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     hardware_id = Column(
         'fld_hardware_id',
         Integer,
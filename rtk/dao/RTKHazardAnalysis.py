@@ -31,7 +31,8 @@ class RTKHazardAnalysis(RTK_BASE):
 
     hardware_id = Column('fld_hardware_id', Integer,
                          ForeignKey('rtk_hardware.fld_hardware_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     hazard_id = Column('fld_hazard_id', Integer, primary_key=True,
                        autoincrement=True, nullable=False)
 
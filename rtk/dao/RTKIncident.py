@@ -35,7 +35,8 @@ class RTKIncident(RTK_BASE):
 
     revision_id = Column('fld_revision_id', Integer,
                          ForeignKey('rtk_revision.fld_revision_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     incident_id = Column('fld_incident_id', Integer, primary_key=True,
                          autoincrement=True, nullable=False)
 
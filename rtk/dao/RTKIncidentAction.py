@@ -33,7 +33,8 @@ class RTKIncidentAction(RTK_BASE):
 
     incident_id = Column('fld_incident_id', Integer,
                          ForeignKey('rtk_incident.fld_incident_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     action_id = Column('fld_action_id', Integer, primary_key=True,
                        autoincrement=True, nullable=False)
 
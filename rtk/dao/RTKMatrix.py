@@ -10,7 +10,7 @@ The RTKMatrix Table
 ===============================================================================
 """
 # pylint: disable=E0401
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship  # pylint: disable=E0401
 
 # Import other RTK modules.
@@ -51,9 +51,16 @@ class RTKMatrix(RTK_BASE):
     column_item_id, and row_item_id.
 
     This table shares a Many-to-One relationship with rtk_revision.
+
+    The matrix cells are always read by revision_id and matrix_type, so the
+    ix_rtk_matrix_lookup index covers those columns plus the cell columns
+    returned by the query.
     """
     __tablename__ = 'rtk_matrix'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (Index('ix_rtk_matrix_lookup', 'fld_revision_id',
+                            'fld_matrix_type', 'fld_row_item_id',
+                            'fld_column_item_id', 'fld_matrix_id',
+                            'fld_value'), {'extend_existing': True})
 
     revision_id = Column(
         'fld_revision_id',
@@ -40,7 +40,8 @@ class RTKMechanism(RTK_BASE):
         'fld_mode_id',
         Integer,
         ForeignKey('rtk_mode.fld_mode_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     mechanism_id = Column(
         'fld_mechanism_id',
         Integer,
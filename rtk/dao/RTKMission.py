@@ -30,7 +30,8 @@ class RTKMission(RTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('rtk_revision.fld_revision_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     mission_id = Column(
         'fld_mission_id',
         Integer,
@@ -30,7 +30,8 @@ class RTKMissionPhase(RTK_BASE):
         'fld_mission_id',
         Integer,
         ForeignKey('rtk_mission.fld_mission_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     phase_id = Column(
         'fld_phase_id',
         Integer,
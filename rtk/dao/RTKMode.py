@@ -40,12 +40,14 @@ class RTKMode(RTK_BASE):
         'fld_function_id',
         Integer,
         ForeignKey('rtk_function.fld_function_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     hardware_id = Column(
         'fld_hardware_id',
         Integer,
         ForeignKey('rtk_hardware.fld_hardware_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     mode_id = Column(
         'fld_mode_id',
         Integer,
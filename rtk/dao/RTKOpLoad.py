@@ -31,7 +31,8 @@ class RTKOpLoad(RTK_BASE):
 
     mechanism_id = Column('fld_mechanism_id', Integer,
                           ForeignKey('rtk_mechanism.fld_mechanism_id'),
-                          nullable=False)
+                          nullable=False,
+                          index=True)
     load_id = Column('fld_load_id', Integer, primary_key=True,
                      autoincrement=True, nullable=False)
 
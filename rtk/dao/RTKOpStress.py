@@ -29,7 +29,8 @@ class RTKOpStress(RTK_BASE):
     __table_args__ = {'extend_existing': True}
 
     load_id = Column('fld_load_id', Integer,
-                     ForeignKey('rtk_op_load.fld_load_id'), nullable=False)
+                     ForeignKey('rtk_op_load.fld_load_id'), nullable=False,
+                     index=True)
     stress_id = Column('fld_stress_id', Integer, primary_key=True,
                        autoincrement=True, nullable=False)
 
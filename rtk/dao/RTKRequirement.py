@@ -30,7 +30,8 @@ class RTKRequirement(RTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('rtk_revision.fld_revision_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     requirement_id = Column(
         'fld_requirement_id',
         Integer,
@@ -32,7 +32,8 @@ class RTKSoftware(RTK_BASE):
 
     revision_id = Column('fld_revision_id', Integer,
                          ForeignKey('rtk_revision.fld_revision_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     software_id = Column('fld_software_id', Integer, primary_key=True,
                          autoincrement=True, nullable=False)
 
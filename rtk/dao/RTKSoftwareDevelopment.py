@@ -31,7 +31,8 @@ class RTKSoftwareDevelopment(RTK_BASE):
 
     software_id = Column('fld_software_id', Integer,
                          ForeignKey('rtk_software.fld_software_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     question_id = Column('fld_question_id', Integer, primary_key=True,
                          autoincrement=True, nullable=False)
     answer = Column('fld_answer', Integer, default=0)
@@ -30,7 +30,8 @@ class RTKSoftwareTest(RTK_BASE):
 
     software_id = Column('fld_software_id', Integer,
                          ForeignKey('rtk_software.fld_software_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     technique_id = Column('fld_technique_id', Integer, primary_key=True,
                           autoincrement=True, nullable=False)
 
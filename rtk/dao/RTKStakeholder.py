@@ -29,7 +29,8 @@ class RTKStakeholder(RTK_BASE):
         'fld_revision_id',
         Integer,
         ForeignKey('rtk_revision.fld_revision_id'),
-        nullable=False)
+        nullable=False,
+        index=True)
     stakeholder_id = Column(
         'fld_stakeholder_id',
         Integer,
@@ -33,7 +33,8 @@ class RTKSurvival(RTK_BASE):
 
     revision_id = Column('fld_revision_id', Integer,
                          ForeignKey('rtk_revision.fld_revision_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     survival_id = Column('fld_survival_id', Integer, primary_key=True,
                          autoincrement=True, nullable=False)
 
@@ -32,7 +32,8 @@ class RTKSurvivalData(RTK_BASE):
 
     survival_id = Column('fld_survival_id', Integer,
                          ForeignKey('rtk_survival.fld_survival_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     record_id = Column('fld_record_id', Integer, primary_key=True,
                        autoincrement=True, nullable=False)
 
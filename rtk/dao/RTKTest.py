@@ -31,7 +31,8 @@ class RTKTest(RTK_BASE):
 
     revision_id = Column('fld_revision_id', Integer,
                          ForeignKey('rtk_revision.fld_revision_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     test_id = Column('fld_test_id', Integer, primary_key=True,
                      autoincrement=True, nullable=False)
 
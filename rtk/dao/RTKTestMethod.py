@@ -30,7 +30,8 @@ class RTKTestMethod(RTK_BASE):
 
     stress_id = Column('fld_stress_id', Integer,
                        ForeignKey('rtk_op_stress.fld_stress_id'),
-                       nullable=False)
+                       nullable=False,
+                       index=True)
     test_id = Column('fld_test_id', Integer, primary_key=True,
                      autoincrement=True, nullable=False)
 
@@ -32,7 +32,8 @@ class RTKValidation(RTK_BASE):
 
     revision_id = Column('fld_revision_id', Integer,
                          ForeignKey('rtk_revision.fld_revision_id'),
-                         nullable=False)
+                         nullable=False,
+                         index=True)
     validation_id = Column('fld_validation_id', Integer, primary_key=True,
                            autoincrement=True, nullable=False)
 
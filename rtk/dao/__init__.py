@@ -5,71 +5,71 @@
 # All rights reserved.
 # Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
 
-from .DAO import DAO
-
-# Common database.
-from .RTKSiteInfo import RTKSiteInfo
-from .RTKUser import RTKUser
-from .RTKGroup import RTKGroup
-from .RTKEnviron import RTKEnviron
-from .RTKModel import RTKModel
-from .RTKType import RTKType
-from .RTKCategory import RTKCategory
-from .RTKSubCategory import RTKSubCategory
-from .RTKPhase import RTKPhase
-from .RTKDistribution import RTKDistribution
-from .RTKManufacturer import RTKManufacturer
-from .RTKUnit import RTKUnit
-from .RTKMethod import RTKMethod
-from .RTKCriticality import RTKCriticality
-from .RTKRPN import RTKRPN
-from .RTKLevel import RTKLevel
-from .RTKApplication import RTKApplication
-from .RTKHazards import RTKHazards
-from .RTKStakeholders import RTKStakeholders
-from .RTKStatus import RTKStatus
-from .RTKCondition import RTKCondition
-from .RTKFailureMode import RTKFailureMode
-from .RTKMeasurement import RTKMeasurement
-from .RTKLoadHistory import RTKLoadHistory
-
-# Program database
-from .RTKAction import RTKAction
-from .RTKAllocation import RTKAllocation
-from .RTKCause import RTKCause
-from .RTKControl import RTKControl
-from .RTKDesignElectric import RTKDesignElectric
-from .RTKDesignMechanic import RTKDesignMechanic
-from .RTKEnvironment import RTKEnvironment
-from .RTKFailureDefinition import RTKFailureDefinition
-from .RTKFunction import RTKFunction
-from .RTKGrowthTest import RTKGrowthTest
-from .RTKHardware import RTKHardware
-from .RTKHazardAnalysis import RTKHazardAnalysis
-from .RTKIncident import RTKIncident
-from .RTKIncidentAction import RTKIncidentAction
-from .RTKIncidentDetail import RTKIncidentDetail
-from .RTKMatrix import RTKMatrix
-from .RTKMechanism import RTKMechanism
-from .RTKMilHdbkF import RTKMilHdbkF
-from .RTKMission import RTKMission
-from .RTKMissionPhase import RTKMissionPhase
-from .RTKMode import RTKMode
-from .RTKNSWC import RTKNSWC
-from .RTKOpLoad import RTKOpLoad
-from .RTKOpStress import RTKOpStress
-from .RTKProgramInfo import RTKProgramInfo
-from .RTKReliability import RTKReliability
-from .RTKRequirement import RTKRequirement
-from .RTKRevision import RTKRevision
-from .RTKSimilarItem import RTKSimilarItem
-from .RTKSoftware import RTKSoftware
-from .RTKSoftwareDevelopment import RTKSoftwareDevelopment
-from .RTKSoftwareReview import RTKSoftwareReview
-from .RTKSoftwareTest import RTKSoftwareTest
-from .RTKStakeholder import RTKStakeholder
-from .RTKSurvival import RTKSurvival
-from .RTKSurvivalData import RTKSurvivalData
-from .RTKTest import RTKTest
-from .RTKTestMethod import RTKTestMethod
-from .RTKValidation import RTKValidation
+import sys
+import types
+
+from .DAO import DAO, RTK_COMMON_TABLES, RTK_PROGRAM_TABLES, get_table
+
+_TABLES = frozenset(RTK_COMMON_TABLES + RTK_PROGRAM_TABLES)
+
+
+class _Package(types.ModuleType):
+    """
+    The dao package.  Each RTK table class is imported the first time it is
+    used, e.g. by from dao import RTKRevision, rather than when the package is
+    imported.
+    """
+
+    def __init__(self, package):
+        """
+        Method to initialize the lazy dao package from the package module.
+
+        :param package: the dao package module.
+        :type package: :py:class:`types.ModuleType`
+        """
+
+        types.ModuleType.__init__(self, package.__name__, package.__doc__)
+        self.__dict__.update(package.__dict__)
+
+        # Python 2 clears the globals of a module when it is deleted, so keep
+        # a reference to the original package module.
+        self._package = package
+
+    def __getattr__(self, name):
+        """
+        Method to import a table class the first time it is used.
+
+        :param str name: the name of the table class.
+        :return: the table class.
+        :raise: AttributeError if name is not an RTK table class.
+        """
+
+        try:
+            _table = get_table(name)
+        except KeyError:
+            raise AttributeError("'module' object has no attribute "
+                                 "'{0:s}'".format(name))
+
+        setattr(self, name, _table)
+
+        return _table
+
+    def __getattribute__(self, name):
+        """
+        Method to return an attribute of the package.  Importing a table
+        module, e.g. import dao.RTKRevision, binds the module to the package so
+        it is replaced by the table class.
+
+        :param str name: the name of the attribute.
+        :return: the attribute.
+        """
+
+        _value = types.ModuleType.__getattribute__(self, name)
+        if name in _TABLES and isinstance(_value, types.ModuleType):
+            _value = getattr(_value, name)
+            setattr(self, name, _value)
+
+        return _value
+
+
+sys.modules[__name__] = _Package(sys.modules[__name__])
@@ -7,7 +7,7 @@
 """Datamodels Package RTKDataMatrix."""
 
 import pandas as pd  # pylint: disable=E0401
-from sqlalchemy import and_  # pylint: disable=E0401
+from sqlalchemy import and_, bindparam, exc, func  # pylint: disable=E0401
 
 # Import other RTK modules.
 from dao import RTKMatrix  # pylint: disable=E0401
@@ -74,6 +74,8 @@ class RTKDataMatrix(object):
         # Initialize private scalar attributes.
         self._column_table = column_table
         self._row_table = row_table
+        self._dtf_saved = None
+        self._matrix_id = None
 
         # Initialize public dictionary attributes.
         self.dtf_matrix = None
@@ -101,44 +103,28 @@ class RTKDataMatrix(object):
         return self.dtf_matrix[col][row]
 
     # pylint: disable=R0913
-    def select_all(self,
-                   revision_id,
-                   matrix_type,
-                   rkey='rkey',
-                   ckey='ckey',
-                   rheader=0,
-                   cheader=0):
+    def _do_select_headings(self, revision_id, matrix_type, rkey, ckey,
+                            rheader, cheader):
         """
-        Select everything needed to build the matrix.
-
-        This method selects the row headngs, the column headings, and the cell
-        values for the matrix then build the matrix as a Pandas DataFrame.
+        Select the row and column headings for the Matrix.
 
         :param int revision_id: the ID of the Revision the desired Matrix is
                                 associated with.
-        :param str matrix_type: the type of the Matrix to select all rows and
-                                all columns for.
-        :keyword int rkey: the key in the row table attributes containing the
-                           module ID.
-        :keyword int ckey: the key in the column table attributes containing
-                           the module ID.
-        :keyword int rheader: the index in the row table attributes containing
-                              the text to use for the Matrix row headings.
-        :keyword int cheader: the index in the column table attributes
-                              containing the text to use for the Matrix column
-                              headings.
-        :return: False if successful or True if an error occurs.
-        :rtype: bool
+        :param str matrix_type: the type of the Matrix to select the headings
+                                for.
+        :param int rkey: the key in the row table attributes containing the
+                         module ID.
+        :param int ckey: the key in the column table attributes containing
+                         the module ID.
+        :param int rheader: the index in the row table attributes containing
+                            the text to use for the Matrix row headings.
+        :param int cheader: the index in the column table attributes
+                            containing the text to use for the Matrix column
+                            headings.
+        :return: None
+        :rtype: None
         """
-        _return = False
-
-        _session = self.dao.RTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
-
-        _column_id = 0
-        _lst_row_id = []
-        _lst_value = []
-        _dic_column = {}
+        _session = self.dao.db_session()
 
         self.n_col = 0
         self.n_row = 0
@@ -171,21 +157,69 @@ class RTKDataMatrix(object):
 
             self.n_col += 1
 
-        # Retrieve the matrix values for the desired Matrix ID.
-        for _matrix in _session.query(RTKMatrix).filter(
-                and_(RTKMatrix.revision_id == revision_id,
-                     RTKMatrix.matrix_type == matrix_type)).all():
-            if _matrix.column_item_id == _column_id:
-                _lst_row_id.append(_matrix.row_item_id)
-                _lst_value.append(_matrix.value)
-            else:
-                _lst_row_id = [_matrix.row_item_id]
-                _lst_value = [_matrix.value]
-                _column_id = _matrix.column_item_id
+        _session.close()
+
+    # pylint: disable=R0913
+    def select_all(self,
+                   revision_id,
+                   matrix_type,
+                   rkey='rkey',
+                   ckey='ckey',
+                   rheader=0,
+                   cheader=0):
+        """
+        Select everything needed to build the matrix.
 
-            _dic_column[_column_id] = pd.Series(_lst_value, index=_lst_row_id)
+        This method selects the row headngs, the column headings, and the cell
+        values for the matrix then build the matrix as a Pandas DataFrame.
 
-        self.dtf_matrix = pd.DataFrame(_dic_column)
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str matrix_type: the type of the Matrix to select all rows and
+                                all columns for.
+        :keyword int rkey: the key in the row table attributes containing the
+                           module ID.
+        :keyword int ckey: the key in the column table attributes containing
+                           the module ID.
+        :keyword int rheader: the index in the row table attributes containing
+                              the text to use for the Matrix row headings.
+        :keyword int cheader: the index in the column table attributes
+                              containing the text to use for the Matrix column
+                              headings.
+        :return: False if successful or True if an error occurs.
+        :rtype: bool
+        """
+        _return = False
+
+        self._do_select_headings(revision_id, matrix_type, rkey, ckey,
+                                 rheader, cheader)
+
+        _session = self.dao.db_session()
+
+        # Retrieve the matrix values for the desired Matrix ID and pivot them
+        # into a DataFrame with one row per row item and one column per
+        # column item.
+        _dtf_cells = pd.DataFrame(
+            _session.query(RTKMatrix.matrix_id, RTKMatrix.row_item_id,
+                           RTKMatrix.column_item_id, RTKMatrix.value).filter(
+                               and_(RTKMatrix.revision_id == revision_id,
+                                    RTKMatrix.matrix_type == matrix_type))
+            .all(),
+            columns=['matrix_id', 'row_item_id', 'column_item_id', 'value'])
+
+        if _dtf_cells.empty:
+            self._matrix_id = None
+            self.dtf_matrix = pd.DataFrame()
+        else:
+            self._matrix_id = int(_dtf_cells['matrix_id'].iloc[0])
+            self.dtf_matrix = _dtf_cells.pivot(
+                index='row_item_id', columns='column_item_id', values='value')
+            self.dtf_matrix.index.name = None
+            self.dtf_matrix.columns.name = None
+
+        # Keep a copy of the matrix as it exists in the RTK Program database
+        # so update() only needs to write the cells that have changed.
+        self._do_mark_saved()
 
         _session.close()
 
@@ -274,10 +308,59 @@ class RTKDataMatrix(object):
 
         return _error_code, _msg
 
+    def _get_dirty_cells(self):
+        """
+        Find the cells that have changed since the Matrix was last saved.
+
+        The current Matrix is compared to the copy of the Matrix made when it
+        was last selected or saved.  Cells in rows or columns that have been
+        inserted since then do not exist in the RTK Program database and are
+        flagged as new.
+
+        :return: (_lst_changed, _lst_new); the lists of (row_item_id,
+                 column_item_id, value) tuples for the changed cells that
+                 exist and do not exist in the RTK Program database.
+        :rtype: (list, list)
+        """
+        _lst_changed = []
+        _lst_new = []
+
+        _dtf_saved = self._dtf_saved.reindex(
+            index=self.dtf_matrix.index, columns=self.dtf_matrix.columns)
+        _dtf_dirty = (self.dtf_matrix != _dtf_saved) & \
+            self.dtf_matrix.notnull()
+        _dtf_dirty = _dtf_dirty.stack()
+        _dtf_dirty = _dtf_dirty[_dtf_dirty]
+
+        for _row_item_id, _column_item_id in _dtf_dirty.index:
+            _cell = (int(_row_item_id), int(_column_item_id),
+                     int(self.dtf_matrix[_column_item_id][_row_item_id]))
+            if pd.isnull(_dtf_saved[_column_item_id][_row_item_id]):
+                _lst_new.append(_cell)
+            else:
+                _lst_changed.append(_cell)
+
+        return _lst_changed, _lst_new
+
+    def _do_mark_saved(self):
+        """
+        Record the current Matrix as the Matrix saved in the database.
+
+        :return: None
+        :rtype: None
+        """
+        self._dtf_saved = self.dtf_matrix.copy()
+
     def update(self, revision_id, matrix_type):
         """
         Update the Matrix associated with Matrix type.
 
+        Only the cells that have changed since the Matrix was last selected or
+        saved are written.  Existing cells are written with a single
+        executemany UPDATE keyed on the revision ID, matrix type, row item ID,
+        and column item ID.  Cells that do not yet exist in the RTK Program
+        database are inserted in the same transaction.
+
         :param int revision_id: the Revision ID the matrix is associated with.
         :param str matrix_type: the type of the Matrix to update.
         :return: (_error_code, _msg); the error code and associated message.
@@ -286,33 +369,54 @@ class RTKDataMatrix(object):
         _error_code = 0
         _msg = 'RTK SUCCESS: Updating Matrix {0:s}.'.format(matrix_type)
 
-        _session = self.dao.RTK_SESSION(
-            bind=self.dao.engine,
-            autoflush=True,
-            autocommit=False,
-            expire_on_commit=False)
-
-        for _column_item_id in list(self.dtf_matrix.columns):
-            for _row_item_id in list(self.dtf_matrix.index):
-                _entity = _session.query(RTKMatrix).filter(
-                    and_(RTKMatrix.revision_id == revision_id,
-                         RTKMatrix.matrix_type == matrix_type,
-                         RTKMatrix.column_item_id == int(_column_item_id),
-                         RTKMatrix.row_item_id == int(_row_item_id))).first()
-
-                try:
-                    if _entity is not None:
-                        _entity.value = int(
-                            self.dtf_matrix[_column_item_id][_row_item_id])
-                        _session.add(_entity)
-                        _error_code, _msg = self.dao.db_update(_session)
-                except AttributeError:
-                    _error_code = 6
-                    _msg = 'RTK ERROR: Attempted to save non-existent ' \
-                           'entity with Column ID {0:s} and Row ID {1:s} to ' \
-                           'Matrix {2:s}.'.format(
-                               str(_column_item_id), str(_row_item_id),
-                               matrix_type)
+        _lst_changed, _lst_new = self._get_dirty_cells()
+        if not _lst_changed and not _lst_new:
+            return _error_code, _msg
+
+        _table = RTKMatrix.__table__
+
+        _session = self.dao.db_session()
+
+        try:
+            if _lst_changed:
+                _session.execute(
+                    _table.update().where(
+                        and_(RTKMatrix.revision_id == bindparam('b_revision'),
+                             RTKMatrix.matrix_type == bindparam('b_type'),
+                             RTKMatrix.row_item_id == bindparam('b_row'),
+                             RTKMatrix.column_item_id == bindparam('b_column'))
+                    ).values(fld_value=bindparam('b_value')), [{
+                        'b_revision': revision_id,
+                        'b_type': matrix_type,
+                        'b_row': _row,
+                        'b_column': _column,
+                        'b_value': _value
+                    } for _row, _column, _value in _lst_changed])
+
+            if _lst_new:
+                if self._matrix_id is None:
+                    _max_id = _session.query(func.max(
+                        RTKMatrix.matrix_id)).scalar()
+                    self._matrix_id = 0 if _max_id is None else _max_id + 1
+
+                _session.execute(_table.insert(), [{
+                    'fld_revision_id': revision_id,
+                    'fld_matrix_id': self._matrix_id,
+                    'fld_matrix_type': matrix_type,
+                    'fld_row_item_id': _row,
+                    'fld_column_item_id': _column,
+                    'fld_value': _value
+                } for _row, _column, _value in _lst_new])
+
+            _error_code, _msg = self.dao.db_update(_session)
+        except exc.SQLAlchemyError:
+            _session.rollback()
+            _error_code = 1004
+            _msg = 'RTK ERROR: Updating Matrix {0:s}.'.format(matrix_type)
+
+        if _error_code == 0:
+            _msg = 'RTK SUCCESS: Updating Matrix {0:s}.'.format(matrix_type)
+            self._do_mark_saved()
 
         _session.close()
 
@@ -6,6 +6,9 @@
 # Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
 """Datamodels Package RTKDataModel."""
 
+from sqlalchemy import inspect  # pylint: disable=E0401
+from sqlalchemy.orm import make_transient  # pylint: disable=E0401
+from sqlalchemy.orm import make_transient_to_detached  # pylint: disable=E0401
 from treelib import tree, Tree  # pylint: disable=E0401
 
 __author__ = 'Andrew Rowland'
@@ -89,8 +92,7 @@ class RTKDataModel(object):
         for _node in self.tree.children(_root):
             self.tree.remove_node(_node.identifier)
 
-        return self.dao.RTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        return self.dao.db_session()
 
     def insert(self, **kwargs):
         """
@@ -102,10 +104,9 @@ class RTKDataModel(object):
         :rtype: (int, str)
         """
         _entities = kwargs['entities']
-        _session = self.dao.RTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _session = self.dao.db_session()
 
-        _error_code, _msg = self.dao.db_add(_entities, _session)
+        _error_code, _msg, __ = self.dao.db_add_many(_entities, _session)
 
         _session.close()
 
@@ -124,8 +125,7 @@ class RTKDataModel(object):
 
         _msg = ''
 
-        _session = self.dao.RTK_SESSION(
-            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        _session = self.dao.db_session()
 
         try:
             _entity = self.tree.get_node(node_id).data
@@ -155,11 +155,7 @@ class RTKDataModel(object):
         _error_code = 0
         _msg = ''
 
-        _session = self.dao.RTK_SESSION(
-            bind=self.dao.engine,
-            autoflush=True,
-            autocommit=False,
-            expire_on_commit=False)
+        _session = self.dao.db_session()
 
         try:
             _entity = self.tree.get_node(node_id).data
@@ -174,3 +170,155 @@ class RTKDataModel(object):
         _session.close()
 
         return _error_code, _msg
+
+    def update_many(self, node_ids):
+        """
+        Update the RTK<MODULE> instances for a list of Node IDs.
+
+        All the instances are saved using a single session and transaction.
+        SQLAlchemy only writes the instances that have actually been modified
+        since they were last loaded or saved.  If the transaction fails, the
+        modified instances are saved one at a time to find which fail.
+
+        :param list node_ids: the list of Node IDs to save to the RTK Program
+                              database.
+        :return: (_error_code, _msg, _failed); the error code, associated
+                 message, and list of Node IDs that could not be saved.
+        :rtype: (int, str, list)
+        """
+        _failed = []
+        _modified = []
+
+        _session = self.dao.db_session()
+
+        for _node_id in node_ids:
+            _entity = RTKDataModel.select(self, _node_id)
+            if _entity is None:
+                _failed.append(_node_id)
+                continue
+
+            _records = []
+            for _record in self._do_get_records(_entity):
+                if inspect(_record).modified:
+                    _session.add(_record)
+                    if _session.is_modified(_record):
+                        _records.append((_record,
+                                         self._do_get_values(_record)))
+            if _records:
+                _modified.append((_node_id, _records))
+
+        _error_code, _msg = self.dao.db_update(_session)
+
+        if _error_code != 0:
+            # The rollback expired the modified instances, throwing away the
+            # unsaved changes.  Put them back before trying each one alone.
+            _session.expunge_all()
+            for _node_id, _records in _modified:
+                for _record, _values in _records:
+                    self._do_set_values(_record, _values)
+
+            for _node_id, _records in _modified:
+                for _record, _values in _records:
+                    _session.add(_record)
+                _error_code, _msg = self.dao.db_update(_session)
+                for _record, _values in _records:
+                    _session.expunge(_record)
+                    if _error_code != 0:
+                        self._do_set_values(_record, _values)
+                if _error_code != 0:
+                    _failed.append(_node_id)
+
+        _session.close()
+
+        if _failed:
+            _error_code = 6
+            _msg = 'RTK ERROR: Attempted to save {0:d} of {1:d} entities ' \
+                   'with Node IDs {2:s}.'.format(
+                       len(_failed), len(node_ids), str(_failed))
+
+        return _error_code, _msg, _failed
+
+    def update_all(self):
+        """
+        Update all the modified RTK<MODULE> instances in the RTK Program
+        database.
+
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code, _msg, __ = self.update_many(self.get_dirty())
+
+        return _error_code, _msg
+
+    def get_dirty(self):
+        """
+        Retrieve the Node IDs of the RTK<MODULE> instances that have changed.
+
+        SQLAlchemy flags an instance as modified whenever one of its
+        attributes is set, whether by set_attributes(), a calculation, or a
+        view, and clears the flag when the instance is saved.
+
+        :return: list of the Node IDs of the modified RTK<MODULE> instances.
+        :rtype: list
+        """
+        return [
+            _node.identifier for _node in self.tree.all_nodes()
+            if _node.data is not None and any(
+                inspect(_record).modified
+                for _record in self._do_get_records(_node.data))
+        ]
+
+    def _do_mark_clean(self):
+        """
+        Clear the modified flag of every RTK<MODULE> instance in the tree.
+
+        This is called at the end of select_all() because replacing NULL
+        values with their defaults flags every instance that was just read.
+
+        :return: None
+        :rtype: None
+        """
+        for _node in self.tree.all_nodes():
+            if _node.data is not None:
+                make_transient(_node.data)
+                make_transient_to_detached(_node.data)
+
+    @staticmethod
+    def _do_get_records(entity):
+        """
+        Retrieve the records saved with an RTK<MODULE> instance.
+
+        Data models whose instances carry child records that are edited
+        through the tree override this so the child records are checked and
+        saved along with the instance.
+
+        :param entity: the RTK<MODULE> instance to get the records for.
+        :return: list of the RTK<MODULE> instance and its child records.
+        :rtype: list
+        """
+        return [entity]
+
+    @staticmethod
+    def _do_get_values(entity):
+        """
+        Retrieve the value of each column attribute of an RTK<MODULE> instance.
+
+        :param entity: the RTK<MODULE> instance to get the values from.
+        :return: dictionary of {attribute name: value}.
+        :rtype: dict
+        """
+        return dict((_attribute.key, getattr(entity, _attribute.key))
+                    for _attribute in inspect(entity).mapper.column_attrs)
+
+    @staticmethod
+    def _do_set_values(entity, values):
+        """
+        Set the value of each column attribute of an RTK<MODULE> instance.
+
+        :param entity: the RTK<MODULE> instance to set the values for.
+        :param dict values: the dictionary of {attribute name: value} to set.
+        :return: None
+        :rtype: None
+        """
+        for _key, _value in values.items():
+            setattr(entity, _key, _value)
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+#
+#       rtk.datamodels.RTKDataSparseMatrix.py is part of The RTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
+"""Datamodels Package RTKDataSparseMatrix."""
+
+import pandas as pd  # pylint: disable=E0401
+from sqlalchemy import and_  # pylint: disable=E0401
+
+# Import other RTK modules.
+from dao import RTKMatrix  # pylint: disable=E0401
+from .RTKDataMatrix import RTKDataMatrix
+
+
+class RTKDataSparseMatrix(RTKDataMatrix):
+    """
+    The RTK Sparse Data Matrix model.
+
+    The Sparse Matrix stores only the non-zero cells of a Matrix in a
+    dictionary of keys.  Most traceability matrices are only sparsely
+    populated so this uses far less memory than the dense DataFrame used by
+    RTKDataMatrix and rows and columns can be inserted without touching every
+    cell.  The select(), select_all(), insert(), delete(), and update() methods
+    behave the same as RTKDataMatrix.  The dense DataFrame is built on demand
+    when the dtf_matrix attribute is first read (e.g., by a Matrix View).
+    Changes made to that DataFrame are read back into the Sparse Matrix when
+    it is updated.  The attributes of a Sparse Matrix are those of
+    RTKDataMatrix plus:
+
+    :ivar dict dic_cells: dictionary of the non-zero cells in the Matrix.  Key
+                          is the (row_item_id, column_item_id) tuple; values
+                          are the value in the cell.
+    """
+
+    def __init__(self, dao, row_table, column_table):
+        """Initialize a Sparse Matrix data model instance."""
+        # Initialize private dictionary attributes.
+        self._dic_row_links = {}
+        self._dic_column_links = {}
+
+        # Initialize private list attributes.
+        self._lst_rows = []
+        self._lst_columns = []
+
+        # Initialize private scalar attributes.
+        self._dtf_dense = None
+
+        # Initialize public dictionary attributes.
+        self.dic_cells = {}
+
+        RTKDataMatrix.__init__(self, dao, row_table, column_table)
+
+        # The cells as they exist in the RTK Program database.  This is None
+        # until the Matrix is selected.
+        self._dic_saved = None
+
+    @property
+    def dtf_matrix(self):
+        """
+        Get the Matrix as a dense Pandas DataFrame.
+
+        The DataFrame is only built the first time it is requested after the
+        Matrix is selected.
+
+        :return: the dense Matrix or None if the Matrix has not been selected.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        if self._dtf_dense is None and self._dic_saved is not None:
+            self._dtf_dense = pd.DataFrame(
+                0, index=self._lst_rows, columns=self._lst_columns)
+            for (_row, _column), _value in self.dic_cells.iteritems():
+                self._dtf_dense.at[_row, _column] = _value
+
+        return self._dtf_dense
+
+    @dtf_matrix.setter
+    def dtf_matrix(self, value):
+        """
+        Set the dense Pandas DataFrame.
+
+        :param value: the DataFrame to use for the dense Matrix.
+        :type value: :class:`pandas.DataFrame`
+        """
+        self._dtf_dense = value
+
+    def _do_link(self, row, column, value):
+        """
+        Set the value of a cell and keep the link counts current.
+
+        :param int row: the row item ID of the cell.
+        :param int column: the column item ID of the cell.
+        :param int value: the value to place in the cell.
+        """
+        _old = self.dic_cells.get((row, column), 0)
+        if value:
+            self.dic_cells[(row, column)] = value
+        else:
+            self.dic_cells.pop((row, column), None)
+
+        _delta = int(bool(value)) - int(bool(_old))
+        if _delta != 0:
+            self._dic_row_links[row] = self._dic_row_links.get(row, 0) + _delta
+            self._dic_column_links[column] = \
+                self._dic_column_links.get(column, 0) + _delta
+
+    def _do_read_dense(self):
+        """
+        Read any changes made to the dense DataFrame into the Sparse Matrix.
+
+        :return: None
+        :rtype: None
+        """
+        if self._dtf_dense is None:
+            return
+
+        _cells = self._dtf_dense.stack()
+        _cells = _cells[_cells != 0]
+
+        self.dic_cells = {}
+        self._dic_row_links = dict.fromkeys(self._lst_rows, 0)
+        self._dic_column_links = dict.fromkeys(self._lst_columns, 0)
+        for (_row, _column), _value in _cells.iteritems():
+            self._do_link(int(_row), int(_column), int(_value))
+
+    def select(self, col, row):
+        """
+        Select the value from the cell identified by col and row.
+
+        :param int col: the column item ID of the cell.
+        :param int row: the row item ID of the cell.
+        :return: the value in the cell at (col, row).
+        :rtype: int
+        :raise: KeyError if the row or column does not exist in the Matrix.
+        """
+        if self._dtf_dense is not None:
+            return self._dtf_dense[col][row]
+
+        if row not in self._dic_row_links or \
+           col not in self._dic_column_links:
+            raise KeyError((col, row))
+
+        return self.dic_cells.get((row, col), 0)
+
+    # pylint: disable=R0913
+    def select_all(self,
+                   revision_id,
+                   matrix_type,
+                   rkey='rkey',
+                   ckey='ckey',
+                   rheader=0,
+                   cheader=0):
+        """
+        Select everything needed to build the Sparse Matrix.
+
+        The row and column headings are selected the same as RTKDataMatrix.
+        Every row and column item with a heading or a cell in the RTK Program
+        database is part of the Matrix, but only the non-zero cells are
+        stored.
+
+        :param int revision_id: the ID of the Revision the desired Matrix is
+                                associated with.
+        :param str matrix_type: the type of the Matrix to select all rows and
+                                all columns for.
+        :keyword int rkey: the key in the row table attributes containing the
+                           module ID.
+        :keyword int ckey: the key in the column table attributes containing
+                           the module ID.
+        :keyword int rheader: the index in the row table attributes containing
+                              the text to use for the Matrix row headings.
+        :keyword int cheader: the index in the column table attributes
+                              containing the text to use for the Matrix column
+                              headings.
+        :return: False if successful or True if an error occurs.
+        :rtype: bool
+        """
+        _return = False
+
+        self.dic_cells = {}
+        self._dic_row_links = {}
+        self._dic_column_links = {}
+        self._dic_saved = {}
+        self._dtf_dense = None
+        self._matrix_id = None
+
+        self._do_select_headings(revision_id, matrix_type, rkey, ckey,
+                                 rheader, cheader)
+
+        for _key in self.dic_row_hdrs:
+            self._dic_row_links[_key] = 0
+        for _key in self.dic_column_hdrs:
+            self._dic_column_links[_key] = 0
+
+        _session = self.dao.db_session()
+
+        for _matrix_id, _row, _column, _value in _session.query(
+                RTKMatrix.matrix_id, RTKMatrix.row_item_id,
+                RTKMatrix.column_item_id, RTKMatrix.value).filter(
+                    and_(RTKMatrix.revision_id == revision_id,
+                         RTKMatrix.matrix_type == matrix_type)).all():
+            self._matrix_id = _matrix_id
+            self._dic_row_links.setdefault(_row, 0)
+            self._dic_column_links.setdefault(_column, 0)
+            self._do_link(_row, _column, _value)
+            self._dic_saved[(_row, _column)] = _value
+
+        _session.close()
+
+        self._lst_rows = sorted(self._dic_row_links.keys())
+        self._lst_columns = sorted(self._dic_column_links.keys())
+        self.n_row = len(self._lst_rows)
+        self.n_col = len(self._lst_columns)
+
+        return _return
+
+    def insert(self, item_id, heading, row=True):
+        """
+        Insert a row or a column into the Sparse Matrix.
+
+        :param int item_id: the ID of the row or column item to insert into the
+                            Matrix.
+        :param str heading: the heading for the new row or column.
+        :keyword bool row: indicates whether to insert a row (default) or a
+                           column.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = 'RTK SUCCESS: Inserting a row or column into the matrix.'
+
+        if row:
+            if item_id in self._dic_row_links:
+                _error_code = 6
+                _msg = 'RTK ERROR: Attempting to insert row {0:d} into a ' \
+                       'matrix already containing a row {0:d}.'.format(item_id)
+            else:
+                self.dic_row_hdrs[item_id] = heading
+                self._dic_row_links[item_id] = 0
+                self._lst_rows.append(item_id)
+                self.n_row = len(self._lst_rows)
+                if self._dtf_dense is not None:
+                    self._dtf_dense.loc[item_id] = 0
+        else:
+            if item_id in self._dic_column_links:
+                _error_code = 6
+                _msg = 'RTK ERROR: Inserting column into matrix.  Column ' \
+                       '{0:d} already exists or adjacent column {1:d} does ' \
+                       'NOT exist.'.format(item_id, self.n_col)
+            else:
+                self.dic_column_hdrs[item_id] = heading
+                self._dic_column_links[item_id] = 0
+                self._lst_columns.append(item_id)
+                self.n_col = len(self._lst_columns)
+                if self._dtf_dense is not None:
+                    self._dtf_dense[item_id] = 0
+
+        return _error_code, _msg
+
+    def delete(self, item_id, row=True):
+        """
+        Delete a column or row from the Sparse Matrix.
+
+        :param int item_id: the ID of the row or column item to delete from the
+                            Matrix.
+        :param bool row: indicates whether to delete a row (default) or a
+                         column identified by identifier.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code = 0
+        _msg = 'RTK SUCCESS: Removing a row or column from the matrix.'
+
+        self._do_read_dense()
+
+        if row:
+            if item_id not in self._dic_row_links:
+                return 6, 'RTK ERROR: Attempted to drop non-existent row ' \
+                          '{0:d} from the matrix.'.format(item_id)
+
+            for _column in self._lst_columns:
+                self._do_link(item_id, _column, 0)
+            self._dic_row_links.pop(item_id)
+            self._lst_rows.remove(item_id)
+            self.dic_row_hdrs.pop(item_id, None)
+            self.n_row = len(self._lst_rows)
+            if self._dtf_dense is not None:
+                self._dtf_dense = self._dtf_dense.drop(item_id)
+        else:
+            if item_id not in self._dic_column_links:
+                return 6, 'RTK ERROR: Attempted to drop non-existent column ' \
+                          '{0:d} from the matrix.'.format(item_id)
+
+            for _row in self._lst_rows:
+                self._do_link(_row, item_id, 0)
+            self._dic_column_links.pop(item_id)
+            self._lst_columns.remove(item_id)
+            self.dic_column_hdrs.pop(item_id, None)
+            self.n_col = len(self._lst_columns)
+            if self._dtf_dense is not None:
+                self._dtf_dense.pop(item_id)
+
+        return _error_code, _msg
+
+    def update_cell(self, col, row, value):
+        """
+        Set the value of a single cell in the Sparse Matrix.
+
+        :param int col: the column item ID of the cell.
+        :param int row: the row item ID of the cell.
+        :param int value: the value to place in the cell.
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        if row not in self._dic_row_links or \
+           col not in self._dic_column_links:
+            return 6, 'RTK ERROR: Attempted to set non-existent cell ' \
+                      '({0:s}, {1:s}) in the matrix.'.format(str(col),
+                                                              str(row))
+
+        self._do_link(row, col, int(value))
+        if self._dtf_dense is not None:
+            self._dtf_dense.at[row, col] = int(value)
+
+        return 0, 'RTK SUCCESS: Updating a cell in the matrix.'
+
+    def get_unlinked_rows(self):
+        """
+        Retrieve the row items that are not linked to any column item.
+
+        :return: the list of row item IDs with no non-zero cells.
+        :rtype: list
+        """
+        self._do_read_dense()
+
+        return [
+            _row for _row in self._lst_rows
+            if self._dic_row_links.get(_row, 0) == 0
+        ]
+
+    def get_unlinked_columns(self):
+        """
+        Retrieve the column items that are not linked to any row item.
+
+        :return: the list of column item IDs with no non-zero cells.
+        :rtype: list
+        """
+        self._do_read_dense()
+
+        return [
+            _column for _column in self._lst_columns
+            if self._dic_column_links.get(_column, 0) == 0
+        ]
+
+    def _get_dirty_cells(self):
+        """
+        Find the cells that have changed since the Matrix was last saved.
+
+        :return: (_lst_changed, _lst_new); the lists of (row_item_id,
+                 column_item_id, value) tuples for the changed cells that
+                 exist and do not exist in the RTK Program database.
+        :rtype: (list, list)
+        """
+        _lst_changed = []
+        _lst_new = []
+
+        self._do_read_dense()
+
+        for _key in set(self.dic_cells) | set(self._dic_saved):
+            _value = self.dic_cells.get(_key, 0)
+            if _key in self._dic_saved:
+                if self._dic_saved[_key] != _value:
+                    _lst_changed.append(_key + (_value, ))
+            elif _value != 0:
+                _lst_new.append(_key + (_value, ))
+
+        return sorted(_lst_changed), sorted(_lst_new)
+
+    def _do_mark_saved(self):
+        """
+        Record the current non-zero cells as those saved in the database.
+
+        Cells that existed in the RTK Program database are kept (with their
+        new value) so they are updated rather than inserted the next time.
+
+        :return: None
+        :rtype: None
+        """
+        for _key in self._dic_saved:
+            self._dic_saved[_key] = self.dic_cells.get(_key, 0)
+        for _key, _value in self.dic_cells.iteritems():
+            self._dic_saved[_key] = _value
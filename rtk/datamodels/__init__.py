@@ -7,4 +7,5 @@
 # Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
 from .RTKDataModel import RTKDataModel
 from .RTKDataMatrix import RTKDataMatrix
+from .RTKDataSparseMatrix import RTKDataSparseMatrix
 from .RTKDataController import RTKDataController
@@ -72,6 +72,7 @@ class FailureDefinitionDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _definition.definition_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -148,20 +149,6 @@ class FailureDefinitionDataModel(RTKDataModel):
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.definition_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.failure_definition.Model.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.failure_definition.Model.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
@@ -11,6 +11,7 @@ from pubsub import pub  # pylint: disable=E0401
 # Import other RTK modules.
 from datamodels import RTKDataController  # pylint: disable=E0401
 from datamodels import RTKDataMatrix  # pylint: disable=E0401
+from datamodels import RTKDataSparseMatrix  # pylint: disable=E0401
 from dao import RTKFunction, RTKHardware, RTKSoftware  # pylint: disable=E0401
 from . import dtmFunction
 
@@ -33,6 +34,9 @@ class FunctionDataController(RTKDataController):
         :param configuration: the Configuration instance associated with the
                               current instance of the RTK application.
         :type configuration: :class:`rtk.Configuration.Configuration`
+        :keyword bool sparse_matrix: indicates whether to store the Function
+                                     matrices as sparse matrices.  Default is
+                                     False.
         """
         RTKDataController.__init__(
             self,
@@ -46,8 +50,12 @@ class FunctionDataController(RTKDataController):
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._dmx_fctn_hw_matrix = RTKDataMatrix(dao, RTKFunction, RTKHardware)
-        self._dmx_fctn_sw_matrix = RTKDataMatrix(dao, RTKFunction, RTKSoftware)
+        if kwargs.get('sparse_matrix', False):
+            _matrix = RTKDataSparseMatrix
+        else:
+            _matrix = RTKDataMatrix
+        self._dmx_fctn_hw_matrix = _matrix(dao, RTKFunction, RTKHardware)
+        self._dmx_fctn_sw_matrix = _matrix(dao, RTKFunction, RTKSoftware)
 
         # Initialize public dictionary attributes.
 
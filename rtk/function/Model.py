@@ -74,6 +74,7 @@ class FunctionDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _function.function_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -151,21 +152,7 @@ class FunctionDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.function_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.function.Model.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.function.Model.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
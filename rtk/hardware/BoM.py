@@ -45,6 +45,7 @@ import locale
 # Import other RTK modules.
 try:
     import Configuration
+    from analyses.prediction.Reliability import calculate_parts
     from hardware.assembly.Assembly import Model as Assembly
     from hardware.component.Component import Model as Component
     import hardware.component.capacitor.electrolytic.Aluminum as Aluminum
@@ -102,6 +103,7 @@ try:
     import hardware.component.switch.Toggle as Toggle
 except ImportError:                         # pragma: no cover
     import rtk.Configuration as Configuration
+    from rtk.analyses.prediction.Reliability import calculate_parts
     from rtk.hardware.assembly.Assembly import Model as Assembly
     from rtk.hardware.component.Component import Model as Component
     import rtk.hardware.component.capacitor.electrolytic.Aluminum as Aluminum
@@ -374,15 +376,23 @@ class BoM(object):
     :ivar _dao: the Data Access Object to use when communicating with the RTK
                 Project database.
     :ivar _last_id: the last Hardware ID used.
+    :ivar _dic_saved: Dictionary of the attributes of each Hardware item as
+                      they were last read from or saved to the RTK Project
+                      database.  Key is the Hardware ID; value is the tuple
+                      of attributes.
     :ivar dicHardware: Dictionary of the Hardware data models managed.  Key is
                        the Hardware ID; value is a pointer to the Hardware data
                        model instance.
+    :ivar dicChildren: Dictionary of the immediate children of each Hardware
+                       item.  Key is the parent Hardware ID; value is a list
+                       of pointers to the child Hardware data model instances.
     """
 
     def __init__(self):
         """ Method to initialize a BoM data controller instance. """
 
         # Initialize private dictionary attributes.
+        self._dic_saved = {}
 
         # Initialize private list attributes.
 
@@ -391,6 +401,7 @@ class BoM(object):
 
         # Define public dictionary attributes.
         self.dicHardware = {}
+        self.dicChildren = {}
 
         # Initialize public list attributes.
 
@@ -512,22 +523,32 @@ class BoM(object):
             elif _results[i][24] == 1:
                 self.load_component(_results[i])
 
-        for _key in self.dicHardware.keys():
-            _hardware = self.dicHardware[_key]
-            for _key2 in self.dicHardware.keys():
-                _hardware2 = self.dicHardware[_key2]
-                if(_hardware2.parent_id == _hardware.hardware_id and
-                   _hardware2.part == 0):
-                    try:
-                        _hardware.dicAssemblies[_hardware.hardware_id].append(_hardware2)
-                    except KeyError:
-                        _hardware.dicAssemblies[_hardware.hardware_id] = [_hardware2]
-                elif(_hardware2.parent_id == _hardware.hardware_id and
-                     _hardware2.part == 1):
-                    try:
-                        _hardware.dicComponents[_hardware.hardware_id].append(_hardware2)
-                    except KeyError:
-                        _hardware.dicComponents[_hardware.hardware_id] = [_hardware2]
+        # Remember what was read so save_bom() only writes the hardware items
+        # that have changed since.
+        self._dic_saved = {}
+        for _hardware in self.dicHardware.values():
+            self._dic_saved[_hardware.hardware_id] = \
+                _hardware.get_attributes()
+
+        # Build the parent to children index in a single pass over the
+        # hardware items, then give each parent its assemblies and components.
+        self.dicChildren = {}
+        for _hardware in self.dicHardware.values():
+            self.dicChildren.setdefault(_hardware.parent_id,
+                                        []).append(_hardware)
+
+        for _parent_id, _children in self.dicChildren.items():
+            try:
+                _parent = self.dicHardware[_parent_id]
+            except KeyError:
+                continue
+
+            _assemblies = [_child for _child in _children if _child.part == 0]
+            _components = [_child for _child in _children if _child.part == 1]
+            if _assemblies:
+                _parent.dicAssemblies[_parent_id] = _assemblies
+            if _components:
+                _parent.dicComponents[_parent_id] = _components
 
         return(_results, _error_code)
 
@@ -647,6 +668,7 @@ class BoM(object):
                                       0.0, 0.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0, 0,
                                       1, 0, 0.0))
             self.dicHardware[_hardware.hardware_id] = _hardware
+            self.dicChildren.setdefault(parent_id, []).append(_hardware)
 
         return(_hardware, _error_code)
 
@@ -669,10 +691,35 @@ class BoM(object):
                   WHERE fld_hardware_id={0:d}".format(hardware_id)
         (_results, _error_code, __) = self.dao.execute(_query, commit=True)
 
-        self.dicHardware.pop(hardware_id)
+        _hardware = self.dicHardware.pop(hardware_id)
+        self._dic_saved.pop(hardware_id, None)
+        try:
+            self.dicChildren[_hardware.parent_id].remove(_hardware)
+        except (KeyError, ValueError):
+            pass
+        self.dicChildren.pop(hardware_id, None)
 
         return(_results, _error_code)
 
+    def get_children(self, hardware_id, part=None):
+        """
+        Method to retrieve the immediate children of a Hardware item.
+
+        :param int hardware_id: the Hardware ID of the parent hardware item.
+        :keyword int part: the type of children to return.
+                           * None = all children (default)
+                           * 0 = Assemblies only
+                           * 1 = Components only
+        :return: the list of child Hardware data model instances.
+        :rtype: list
+        """
+
+        _children = self.dicChildren.get(hardware_id, [])
+        if part is not None:
+            _children = [_child for _child in _children if _child.part == part]
+
+        return _children
+
     def copy_hardware(self, revision_id, failure_info=True, matrix=True):
         """
         Method to copy a Hardware item from the currently selected Revision to
@@ -1115,8 +1162,26 @@ class BoM(object):
                       _int[9], _str[0], _str[1], _str[2], _str[3], _str[4])
         (_results, _error_code, __) = self.dao.execute(_query, commit=True)
 
+        if _results:
+            self._dic_saved[hardware_id] = _hardware.get_attributes()
+
         return (_results, _error_code)
 
+    def get_dirty(self):
+        """
+        Method to retrieve the Hardware items whose attributes have changed
+        since they were last read from or saved to the RTK Project database.
+        Hardware items added since the BoM was loaded are always included.
+
+        :return: list of the Hardware IDs that need to be saved.
+        :rtype: list
+        """
+
+        return [_hardware_id for _hardware_id, _hardware
+                in self.dicHardware.items()
+                if self._dic_saved.get(_hardware_id) !=
+                _hardware.get_attributes()]
+
     def save_bom(self):
         """
         Method to save all Assembly and Component data models managed by the
@@ -1126,20 +1191,36 @@ class BoM(object):
         :rtype: bool
         """
 
-        for _hardware in self.dicHardware.values():
+        for _hardware_id in self.get_dirty():
             (_results,
-             _error_code) = self.save_hardware_item(_hardware.hardware_id)
+             _error_code) = self.save_hardware_item(_hardware_id)
 
         return False
 
     def request_calculate(self, hardware_id=0):
         """
-        Method to request the Hardware BoM calculations be performed.
+        Method to request the Hardware BoM calculations be performed.  The
+        hazard rates of all the components below the hardware item are
+        predicted first, all at once, so each class of component is
+        calculated together.
 
+        :keyword int hardware_id: the Hardware ID of the hardware item to
+                                  calculate.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
+        _components = []
+        _parents = [hardware_id]
+        while _parents:
+            _parent_id = _parents.pop()
+            for _child in self.get_children(_parent_id):
+                if _child.part == 1:
+                    _components.append(_child)
+                else:
+                    _parents.append(_child.hardware_id)
+        calculate_parts(_components)
+
         self.dicHardware[hardware_id].calculate(self.dicHardware[hardware_id])
 
         return False
@@ -10,6 +10,9 @@ Hardware Package Hardware Module
 """
 
 from pubsub import pub                          # pylint: disable=E0401
+from sqlalchemy import inspect                  # pylint: disable=E0401
+from sqlalchemy.orm import joinedload           # pylint: disable=E0401
+from treelib import tree                        # pylint: disable=E0401
 
 # Import other RTK modules.
 from datamodels import RTKDataModel             # pylint: disable=E0401
@@ -89,10 +92,34 @@ class Model(RTKDataModel):
     The Hardware data model contains the attributes and methods of a hardware.
     A :py:class:`rtk.hardware.Hardware` will consist of one or more Hardwares.
     The attributes of a Hardware data model are:
+
+    :ivar dict _dic_rollup: dictionary of the summed values for each Hardware
+                            item.  Key is the Hardware ID; value is a
+                            dictionary of {attribute name: summed value}.
+    :ivar dict _dic_dirty: dictionary of the Hardware IDs whose summed values
+                           need to be recalculated.
     """
 
     _tag = 'Hardwares'
 
+    # The attributes summed from the parts up to the top-level assembly.  The
+    # hazard rates are attributes of the RTKReliability record belonging to
+    # each Hardware item; the cost and part count are RTKHardware attributes.
+    _lst_hazard_keys = [
+        'hazard_rate_active', 'hazard_rate_dormant', 'hazard_rate_logistics',
+        'hazard_rate_mission'
+    ]
+    _lst_hardware_keys = ['cost', 'total_part_count']
+    _lst_rollup_keys = _lst_hazard_keys + _lst_hardware_keys
+
+    # The one-to-one child records that are saved along with each Hardware
+    # item, such as the RTKReliability record rollup() writes the summed
+    # hazard rates to.
+    _lst_record_keys = [
+        'reliability', 'milhdbkf', 'nswc', 'design_electric',
+        'design_mechanic'
+    ]
+
     def __init__(self, dao):
         """
         Method to initialize a Hardware data model instance.
@@ -101,6 +128,8 @@ class Model(RTKDataModel):
         RTKDataModel.__init__(self, dao)
 
         # Initialize private dictionary attributes.
+        self._dic_rollup = {}
+        self._dic_dirty = {}
 
         # Initialize private list attributes.
 
@@ -137,8 +166,11 @@ class Model(RTKDataModel):
 
         _session = RTKDataModel.select_all(self)
 
-        for _hardware in _session.query(RTKHardware).filter(
-                RTKHardware.revision_id == revision_id).all():
+        # The reliability records are loaded with the Hardware because the
+        # session is closed before rollup() reads the hazard rates.
+        for _hardware in _session.query(RTKHardware).options(
+                joinedload(RTKHardware.reliability)).filter(
+                    RTKHardware.revision_id == revision_id).all():
             # We get and then set the attributes to replace any None values
             # (NULL fields in the database) with their default value.
             _attributes = _hardware.get_attributes()
@@ -151,6 +183,11 @@ class Model(RTKDataModel):
             self.last_id = max(self.last_id, _hardware.hardware_id)
 
         _session.close()
+        self._do_mark_clean()
+
+        # Everything needs to be summed the first time.
+        self._dic_rollup = {}
+        self._dic_dirty = dict.fromkeys(self.tree.nodes.keys(), True)
 
         return self.tree
 
@@ -165,11 +202,15 @@ class Model(RTKDataModel):
         _hardware = RTKHardware()
         _hardware.revision_id = kwargs['revision_id']
         _hardware.parent_id = kwargs['parent_id']
-        _error_code, _msg = RTKDataModel.insert(self, [_hardware, ])
+        _error_code, _msg = RTKDataModel.insert(
+            self, entities=[
+                _hardware,
+            ])
 
         if _error_code == 0:
             self.tree.create_node(_hardware.name, _hardware.hardware_id,
                                   parent=_hardware.parent_id, data=_hardware)
+            self.mark_dirty(_hardware.hardware_id)
 
             # pylint: disable=attribute-defined-outside-init
             # It is defined in RTKDataModel.__init__
@@ -187,13 +228,17 @@ class Model(RTKDataModel):
         """
 
         try:
-            _hardware = self.tree.get_node(hardware_id).data
-            _error_code, _msg = RTKDataModel.delete(self, _hardware)
+            _parent_id = self.tree.parent(hardware_id).identifier
+            _lst_subtree = list(self.tree.expand_tree(hardware_id))
+            _error_code, _msg = RTKDataModel.delete(self, hardware_id)
 
             if _error_code == 0:
-                self.tree.remove_node(hardware_id)
+                for _node_id in _lst_subtree:
+                    self._dic_rollup.pop(_node_id, None)
+                    self._dic_dirty.pop(_node_id, None)
+                self.mark_dirty(_parent_id)
 
-        except AttributeError:
+        except (AttributeError, tree.NodeIDAbsentError):
             _error_code = 2005
             _msg = 'RTK ERROR: Attempted to delete non-existent Hardware ' \
                    'ID {0:d}.'.format(hardware_id)
@@ -223,28 +268,161 @@ class Model(RTKDataModel):
         """
         Method to save all Hardwares to the RTK Program database.
 
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+        _error_code, _msg = RTKDataModel.update_all(self)
+
+        return _error_code, _msg
+
+    def move(self, hardware_id, parent_id):
+        """
+        Method to move the Hardware associated with Hardware ID to a new
+        parent Hardware.
+
+        :param int hardware_id: the ID of the Hardware to move.
+        :param int parent_id: the ID of the new parent Hardware.
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
 
         _error_code = 0
-        _msg = 'RTK SUCCESS: Saving all Hardwares.'
+        _msg = 'RTK SUCCESS: Moving Hardware ID {0:d} to parent Hardware ' \
+               'ID {1:d}.'.format(hardware_id, parent_id)
+
+        try:
+            _old_parent_id = self.tree.parent(hardware_id).identifier
+            self.tree.move_node(hardware_id, parent_id)
+            self.tree.get_node(hardware_id).data.parent_id = parent_id
+
+            self.mark_dirty(_old_parent_id)
+            self.mark_dirty(parent_id)
+        except (AttributeError, tree.NodeIDAbsentError):
+            _error_code = 2007
+            _msg = 'RTK ERROR: Attempted to move non-existent Hardware ID ' \
+                   '{0:d} or to non-existent parent Hardware ID ' \
+                   '{1:d}.'.format(hardware_id, parent_id)
+
+        return _error_code, _msg
+
+    def mark_dirty(self, hardware_id):
+        """
+        Method to flag the Hardware associated with Hardware ID, and each of
+        its parents up to the root, as needing their summed values
+        recalculated by rollup().  Call this whenever a value that is summed
+        changes.
+
+        :param int hardware_id: the ID of the Hardware that changed.
+        :return: None
+        :rtype: None
+        """
 
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.hardware_id)
+        _node = self.tree.get_node(hardware_id)
+        while _node is not None:
+            # Anything already flagged had its parents flagged at the same
+            # time, so there's no need to keep climbing.
+            if _node.identifier in self._dic_dirty:
+                break
+            self._dic_dirty[_node.identifier] = True
+            _node = self.tree.parent(_node.identifier)
 
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.hardware.Hardware.Model.update_all().'
+    def rollup(self):
+        """
+        Method to recalculate the summed hazard rates, cost, and part count of
+        every Hardware flagged by mark_dirty().  Only the flagged Hardware are
+        recalculated, deepest first, so changing a single part re-sums only
+        the assemblies between that part and the root.  A Hardware item
+        without children keeps its own hazard rates, so an assembly with
+        specified hazard rates isn't zeroed.
 
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.hardware.Hardware.Model.update_all().'
+        :return: (_error_code, _msg); the error code and associated message.
+        :rtype: (int, str)
+        """
+
+        _error_code = 0
+        _msg = 'RTK SUCCESS: Summing {0:d} Hardware items.'.format(
+            len(self._dic_dirty))
+
+        _lst_dirty = sorted(
+            [_node_id for _node_id in self._dic_dirty
+             if self.tree.contains(_node_id)],
+            key=self.tree.depth,
+            reverse=True)
+
+        for _node_id in _lst_dirty:
+            _hardware = self.tree.get_node(_node_id).data
+            _lst_children = self.tree.children(_node_id)
+
+            if _lst_children or _hardware is None:
+                _values = dict.fromkeys(self._lst_rollup_keys, 0.0)
+                _values['total_part_count'] = 0
+                for _child in _lst_children:
+                    _child_values = self._dic_rollup[_child.identifier]
+                    for _key in self._lst_rollup_keys:
+                        _values[_key] += _child_values[_key]
+
+                # The root of the tree has no data package.
+                if _hardware is not None:
+                    for _key in self._lst_rollup_keys:
+                        _values[_key] = _values[_key] * _hardware.quantity
+                    for _key in self._lst_hardware_keys:
+                        setattr(_hardware, _key, _values[_key])
+                    if _hardware.reliability is not None:
+                        for _key in self._lst_hazard_keys:
+                            setattr(_hardware.reliability, _key,
+                                    _values[_key])
+            else:
+                # A part, or an assembly without children, contributes its own
+                # hazard rates; without a reliability record it contributes
+                # none.  Only parts are counted.
+                _values = dict.fromkeys(self._lst_hazard_keys, 0.0)
+                if _hardware.reliability is not None:
+                    for _key in self._lst_hazard_keys:
+                        _values[_key] = getattr(_hardware.reliability, _key)
+                _values['cost'] = _hardware.cost * _hardware.quantity
+                _values['total_part_count'] = 0
+                if _hardware.part == 1:
+                    _values['total_part_count'] = _hardware.quantity
+
+            self._dic_rollup[_node_id] = _values
+
+        self._dic_dirty = {}
 
         return _error_code, _msg
 
+    def _do_get_records(self, entity):
+        """
+        Method to retrieve the RTKHardware instance and each of its child
+        records that has been loaded.
+
+        :param entity: the RTKHardware instance to get the records for.
+        :return: list of the RTKHardware instance and its child records.
+        :rtype: list
+        """
+
+        # Only the records already loaded are returned; the instances in the
+        # tree are detached so anything else can't be lazy loaded.
+        _loaded = inspect(entity).dict
+
+        return [entity] + [
+            _loaded[_key] for _key in self._lst_record_keys
+            if _loaded.get(_key) is not None
+        ]
+
+    def get_rollup(self, hardware_id):
+        """
+        Method to retrieve the summed values of the Hardware associated with
+        Hardware ID as of the last call to rollup().
+
+        :param int hardware_id: the ID of the Hardware to retrieve the summed
+                                values for.
+        :return: dictionary of {attribute name: summed value} or None if the
+                 Hardware has not been summed.
+        :rtype: dict
+        """
+
+        return self._dic_rollup.get(hardware_id, None)
+
     def calculate_reliability(self, hardware_id):
         """
         Method to calculate the logistics MTBF and mission MTBF.
@@ -64,6 +64,64 @@ except locale.Error:                        # pragma: no cover
 
 _ = gettext.gettext
 
+# The registry of compiled hazard rate model equations.  Key is the equation
+# string; value is the (function, symbols) tuple returned by
+# compile_equation().
+_EQUATIONS = {}
+
+
+def compile_equation(equation):
+    """
+    Function to compile a hazard rate model equation.
+
+    Each distinct equation string is only compiled the first time it is seen.
+    The equation is compiled into a function whose arguments are the symbols
+    used in the equation, sorted by name.
+
+    :param str equation: the hazard rate model equation to compile.
+    :return: (_function, _symbols); the compiled function and the tuple of
+             symbol names it must be called with.
+    :rtype: (function, tuple)
+    """
+
+    try:
+        return _EQUATIONS[equation]
+    except KeyError:
+        pass
+
+    _symbols = tuple(sorted(set(compile(equation, '<hazard rate model>',
+                                        'eval').co_names)))
+    _function = eval('lambda {0:s}: {1:s}'.format(', '.join(_symbols),
+                                                 equation),
+                     {'__builtins__': {}})
+
+    _EQUATIONS[equation] = (_function, _symbols)
+
+    return _function, _symbols
+
+
+def evaluate_equation(equation, factors):
+    """
+    Function to evaluate a hazard rate model equation.
+
+    :param str equation: the hazard rate model equation to evaluate.
+    :param dict factors: the values of the symbols in the equation.  Key is
+                         the symbol name; value is the value of the symbol.
+    :return: the value of the equation.
+    :rtype: float
+    :raise: NameError if the equation uses a symbol that is not in factors.
+    """
+
+    _function, _symbols = compile_equation(equation)
+
+    try:
+        _values = [factors[_symbol] for _symbol in _symbols]
+    except KeyError as _err:
+        raise NameError("Unknown symbol '{0:s}' in hazard rate model "
+                        "equation '{1:s}'.".format(_err.args[0], equation))
+
+    return _function(*_values)
+
 
 class Model(Hardware):                        # pylint: disable=R0902
     """
@@ -163,6 +221,20 @@ class Model(Hardware):                        # pylint: disable=R0902
 
         return _values
 
+    def calculate_model_hazard_rate(self):
+        """
+        Method to calculate the hazard rate from the component's hazard rate
+        model.
+
+        :return: the hazard rate given by the hazard rate model equation.
+        :rtype: float
+        :raise: NameError if the equation uses a symbol that is not in the
+                hazard rate model.
+        """
+
+        return evaluate_equation(self.hazard_rate_model['equation'],
+                                 self.hazard_rate_model)
+
 
 class Component(object):
     """
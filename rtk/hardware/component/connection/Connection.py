@@ -187,13 +187,7 @@ class Model(Component):
             self.hazard_rate_model['piE'] = self.piE
 
         # Calculate component active hazard rate.
-        _keys = self.hazard_rate_model.keys()
-        _values = self.hazard_rate_model.values()
-
-        for i in range(len(_keys)):
-            vars()[_keys[i]] = _values[i]
-
-        self.hazard_rate_active = eval(self.hazard_rate_model['equation'])
+        self.hazard_rate_active = self.calculate_model_hazard_rate()
         self.hazard_rate_active = (self.hazard_rate_active +
                                    self.add_adj_factor) * \
                                   (self.duty_cycle / 100.0) * \
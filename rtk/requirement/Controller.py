@@ -11,6 +11,7 @@ from pubsub import pub  # pylint: disable=E0401
 # Import other RTK modules.
 from datamodels import RTKDataController  # pylint: disable=E0401
 from datamodels import RTKDataMatrix  # pylint: disable=E0401
+from datamodels import RTKDataSparseMatrix  # pylint: disable=E0401
 # pylint: disable=E0401
 from dao import RTKRequirement, RTKHardware, RTKSoftware, RTKValidation
 from . import dtmRequirement
@@ -34,6 +35,9 @@ class RequirementDataController(RTKDataController):
         :param configuration: the Configuration instance associated with the
                               current instance of the RTK application.
         :type configuration: :class:`rtk.Configuration.Configuration`
+        :keyword bool sparse_matrix: indicates whether to store the
+                                     Requirement matrices as sparse matrices.
+                                     Default is False.
         """
         RTKDataController.__init__(
             self,
@@ -47,12 +51,14 @@ class RequirementDataController(RTKDataController):
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._dmx_rqmt_hw_matrix = RTKDataMatrix(dao, RTKRequirement,
-                                                 RTKHardware)
-        self._dmx_rqmt_sw_matrix = RTKDataMatrix(dao, RTKRequirement,
-                                                 RTKSoftware)
-        self._dmx_rqmt_val_matrix = RTKDataMatrix(dao, RTKRequirement,
-                                                  RTKValidation)
+        if kwargs.get('sparse_matrix', False):
+            _matrix = RTKDataSparseMatrix
+        else:
+            _matrix = RTKDataMatrix
+        self._dmx_rqmt_hw_matrix = _matrix(dao, RTKRequirement, RTKHardware)
+        self._dmx_rqmt_sw_matrix = _matrix(dao, RTKRequirement, RTKSoftware)
+        self._dmx_rqmt_val_matrix = _matrix(dao, RTKRequirement,
+                                            RTKValidation)
 
         # Initialize public dictionary attributes.
 
@@ -85,6 +85,10 @@ class BoM(object):
     :ivar _dao: the Data Access Object to use when communicating with the RTK
                 Project database.
     :ivar _last_id: the last Software ID used in the RTK Project database.
+    :ivar _dic_saved: Dictionary of the values of each Software item as they
+                      were last read from or saved to the RTK Project
+                      database.  Key is the Software ID; value is the tuple
+                      of values.
     :ivar dicSoftware: Dictionary of the Software data models managed.  Key is
                        the Software ID; value is a pointer to the Software data
                        model instance.
@@ -95,6 +99,9 @@ class BoM(object):
         Initializes a Software BoM data controller instance.
         """
 
+        # Initialize private dictionary attributes.
+        self._dic_saved = {}
+
         # Initialize private scalar attributes.
         self._dao = None
         self._last_id = None
@@ -195,6 +202,13 @@ class BoM(object):
             self._load_trr_questions(_software)
             self._load_test_matrix(_software)
 
+        # Remember what was read so save_bom() only writes the software items
+        # that have changed since.
+        self._dic_saved = {}
+        for _software_id in self.dicSoftware.keys():
+            self._dic_saved[_software_id] = \
+                self._get_saved_values(_software_id)
+
         return(_results, _error_code)
 
     def _load_development_questions(self, software):
@@ -573,6 +587,7 @@ class BoM(object):
         (_results, _error_code, __) = self._dao.execute(_query, commit=True)
 
         self.dicSoftware.pop(software_id)
+        self._dic_saved.pop(software_id, None)
 
         return(_results, _error_code)
 
@@ -687,7 +702,7 @@ class BoM(object):
         :rtype: tuple
         """
 
-        _software = self.dicSoftware[software_id]
+        _values = self._get_saved_values(software_id)
 
         # Save the Software model.
         _query = "UPDATE rtk_software \
@@ -719,46 +734,69 @@ class BoM(object):
                       fld_ew={64:f}, fld_e={65:f}, fld_f={66:f}, \
                       fld_cb={67:d}, fld_ncb={68:d}, fld_dr_test={69:d}, \
                       fld_test_time={70:f}, fld_dr_eot={71:d}, \
-                      fld_test_time_eot={72:f}".format(
-                          _software.description, _software.application_id,
-                          _software.development_id, _software.a_risk,
-                          _software.do, _software.dd, _software.dc,
-                          _software.d_risk, _software.am, _software.sa,
-                          _software.st, _software.dr, _software.sq,
-                          _software.s1, _software.hloc, _software.aloc,
-                          _software.sloc, _software.sl, _software.ax,
-                          _software.bx, _software.cx, _software.nm,
-                          _software.sx, _software.um, _software.wm,
-                          _software.xm, _software.sm, _software.df,
-                          _software.sr, _software.s2, _software.rpfom,
-                          _software.parent_id, _software.dev_assess_type,
-                          _software.phase_id, _software.tcl,
-                          _software.test_path, _software.category,
-                          _software.test_effort, _software.test_approach,
-                          _software.labor_hours_test,
-                          _software.labor_hours_dev, _software.budget_test,
-                          _software.budget_dev, _software.schedule_test,
-                          _software.schedule_dev, _software.branches,
-                          _software.branches_test, _software.inputs,
-                          _software.inputs_test, _software.nm_test,
-                          _software.interfaces, _software.interfaces_test,
-                          _software.te, _software.tm, _software.tc,
-                          _software.t_risk, _software.ft1, _software.ft2,
-                          _software.ren_avg, _software.ren_eot, _software.ec,
-                          _software.ev, _software.et, _software.os,
-                          _software.ew, _software.e_risk,
-                          _software.failure_rate, _software.cb, _software.ncb,
-                          _software.dr_test, _software.test_time,
-                          _software.dr_eot, _software.test_time_eot)
-
-        _query = _query + " WHERE fld_revision_id={0:d} \
-                            AND fld_software_id={1:d}".format(
-                                _software.revision_id, software_id)
+                      fld_test_time_eot={72:f} \
+                  WHERE fld_revision_id={73:d} \
+                  AND fld_software_id={74:d}".format(*_values)
 
         (_results, _error_code, __) = self._dao.execute(_query, commit=True)
 # TODO: Handle errors.
+        if _results:
+            self._dic_saved[software_id] = _values
+
         return (_results, _error_code)
 
+    def _get_saved_values(self, software_id):
+        """
+        Gathers the Software CSCI or Software Unit values that are saved to
+        the RTK Project database.
+
+        :param int software_id: the ID of the software to gather values for.
+        :return: _values
+        :rtype: tuple
+        """
+
+        _software = self.dicSoftware[software_id]
+
+        return (_software.description, _software.application_id,
+                _software.development_id, _software.a_risk, _software.do,
+                _software.dd, _software.dc, _software.d_risk, _software.am,
+                _software.sa, _software.st, _software.dr, _software.sq,
+                _software.s1, _software.hloc, _software.aloc, _software.sloc,
+                _software.sl, _software.ax, _software.bx, _software.cx,
+                _software.nm, _software.sx, _software.um, _software.wm,
+                _software.xm, _software.sm, _software.df, _software.sr,
+                _software.s2, _software.rpfom, _software.parent_id,
+                _software.dev_assess_type, _software.phase_id, _software.tcl,
+                _software.test_path, _software.category,
+                _software.test_effort, _software.test_approach,
+                _software.labor_hours_test, _software.labor_hours_dev,
+                _software.budget_test, _software.budget_dev,
+                _software.schedule_test, _software.schedule_dev,
+                _software.branches, _software.branches_test,
+                _software.inputs, _software.inputs_test, _software.nm_test,
+                _software.interfaces, _software.interfaces_test, _software.te,
+                _software.tm, _software.tc, _software.t_risk, _software.ft1,
+                _software.ft2, _software.ren_avg, _software.ren_eot,
+                _software.ec, _software.ev, _software.et, _software.os,
+                _software.ew, _software.e_risk, _software.failure_rate,
+                _software.cb, _software.ncb, _software.dr_test,
+                _software.test_time, _software.dr_eot,
+                _software.test_time_eot, _software.revision_id, software_id)
+
+    def get_dirty(self):
+        """
+        Retrieves the Software items whose attributes have changed since they
+        were last read from or saved to the RTK Project database.  Software
+        items added since the BoM was loaded are always included.
+
+        :return: list of the Software IDs that need to be saved.
+        :rtype: list
+        """
+
+        return [_software_id for _software_id in self.dicSoftware.keys()
+                if self._dic_saved.get(_software_id) !=
+                self._get_saved_values(_software_id)]
+
     def save_bom(self):
         """
         Saves all Assembly and Component data models managed by the controller.
@@ -767,9 +805,9 @@ class BoM(object):
         :rtype: bool
         """
 
-        for _software in self.dicSoftware.values():
+        for _software_id in self.get_dirty():
             (_results,
-             _error_code) = self.save_software_item(_software.software_id)
+             _error_code) = self.save_software_item(_software_id)
 
         return False
 
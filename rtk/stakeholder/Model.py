@@ -72,6 +72,7 @@ class StakeholderDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _stakeholder.stakeholder_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -152,21 +153,7 @@ class StakeholderDataModel(RTKDataModel):
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
-        _error_code = 0
-        _msg = 'RTK SUCCESS: Updating the RTK Program database.'
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.stakeholder_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.stakeholder.Model.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.stakeholder.Model.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
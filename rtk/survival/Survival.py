@@ -38,6 +38,8 @@ Survival Package Data Module
 #    NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS 
 #    SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
+import multiprocessing
 from collections import OrderedDict
 
 import numpy as np
@@ -56,6 +58,7 @@ try:
                                                      cramer_vonmises_critical_value
     from analyses.statistics.Distributions import Exponential, Gaussian, \
                                                   LogNormal, Weibull, \
+                                                  PreparedData, \
                                                   time_between_failures
     from analyses.statistics.Duane import calculate_duane_mean
     from analyses.statistics.Regression import regression
@@ -72,6 +75,7 @@ except ImportError:
                                                          cramer_vonmises_critical_value
     from rtk.analyses.statistics.Distributions import Exponential, Gaussian, \
                                                       LogNormal, Weibull, \
+                                                      PreparedData, \
                                                       time_between_failures
     from rtk.analyses.statistics.Duane import calculate_duane_mean
     from rtk.analyses.statistics.Regression import regression
@@ -81,6 +85,53 @@ __email__ = 'andrew.rowland@reliaqual.com'
 __organization__ = 'ReliaQual Associates, LLC'
 __copyright__ = 'Copyright 2007 - 2015 Andrew "Weibullguy" Rowland'
 
+# The Survival data model attributes needed to fit a data set and the
+# attributes that hold the results of the fit.
+_FIT_INPUTS = ['start_time', 'end_time', 'rel_time', 'n_rel_points',
+               'confidence', 'confidence_type', 'confidence_method',
+               'fit_method', 'grouped']
+_FIT_RESULTS = ['scale', 'shape', 'location', 'variance', 'covariance',
+                'chi2_critical_value', 'hazard', 'km', 'mcf', 'nhpp',
+                'dicMTBF', 'dicHazard', 'dicReliability', 'n_suspensions',
+                'n_failures', 'mhb', 'lp', 'lr', 'rho', 'aic', 'bic', 'mle',
+                'chi_square', 'cramer_vonmises', 'cvm_critical_value']
+
+# The (distribution ID, fit method) of each candidate fit tried by
+# Model.auto_fit() and the ranking criteria.  Each criterion is the index of
+# the statistic in the goodness of fit list and whether larger is better.
+_AUTO_FIT_CANDIDATES = [(5, 1), (6, 1), (7, 1), (8, 1),
+                        (5, 2), (6, 2), (7, 2), (8, 2)]
+_AUTO_FIT_CRITERIA = {'mle': (0, True), 'aic': (1, False), 'bic': (2, False)}
+
+
+def _fit_dataset(task):
+    """
+    Function to fit a single data set.  This is run by the worker processes
+    started by Survival.fit_many() so it must be a module-level function and
+    the task may only contain values that can be pickled.
+
+    :param tuple task: the (distribution ID, fit inputs, data set) to fit.  The
+                       fit inputs are a dictionary of {attribute: value} for
+                       the attributes in _FIT_INPUTS.  The data set is the one
+                       returned by Model.create_fit_dataset().
+    :return: _results; dictionary of {attribute: value} for the attributes in
+             _FIT_RESULTS.
+    :rtype: dict
+    """
+
+    (_distribution_id, _inputs, _data) = task
+
+    _model = Model()
+    for _key, _value in _inputs.items():
+        setattr(_model, _key, _value)
+    _model.distribution_id = _distribution_id
+
+    _model.estimate_parameters(_data)
+
+    _results = dict((_key, getattr(_model, _key)) for _key in _FIT_RESULTS)
+
+    return _results
+
 
 class Model(object):                       # pylint: disable=R0902, R0904
     """
@@ -150,10 +201,12 @@ class Model(object):                       # pylint: disable=R0902, R0904
         """
 
         # Initialize private dict attributes.
+        self._dic_fits = {}
 
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
+        self._fit_key = None
 
         # Initialize public dict attributes.
         self.dicRecords = {}
@@ -231,36 +284,144 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def estimate_parameters(self):
+    def estimate_parameters(self, data=None, results=None):
         """
         Method to fit data a parametric distribution and estimate the
         parameters of the fitted distribution.
 
+        :keyword data: the data set to fit in the form returned by
+                       create_fit_dataset().  If None, the data set is created
+                       from the records in dicRecords.
+        :keyword list results: the results of a parametric fit that has
+                               already been done.  If None, the data set is
+                               fit.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
-        _data = self._create_dataset()
+        if data is None:
+            data = self.create_fit_dataset(self.distribution_id)
 
         if self.distribution_id == 1:       # MCF
-            self.estimate_mcf()
+            self.estimate_mcf(data)
         elif self.distribution_id == 2:     # Kaplan-Meier
-            self.estimate_kaplan_meier()
+            self.estimate_kaplan_meier(data)
         elif self.distribution_id == 3:     # NHPP - Power Law
-            self.estimate_nhpp_power_law()
+            self.estimate_nhpp_power_law(data)
         elif self.distribution_id == 4:     # NHPP - Log Linear
             print "NHPP - Log Linear"
         elif self.distribution_id == 5:     # Exponential
-            self.estimate_exponential(_data)
+            self.estimate_exponential(data, results)
         elif self.distribution_id == 6:     # LogNormal
-            self.estimate_lognormal(_data)
+            self.estimate_lognormal(data, results)
         elif self.distribution_id == 7:     # Gaussian
-            self.estimate_gaussian(_data)
+            self.estimate_gaussian(data, results)
         elif self.distribution_id == 8:     # Weibull
-            self.estimate_weibull(_data)
+            self.estimate_weibull(data, results)
 
         return False
 
+    def auto_fit(self, criterion='aic', fit_method=1):
+        """
+        Method to fit the data set to every candidate distribution and fit
+        method and then estimate the parameters of the best one for
+        fit_method.  The data set is sorted and trimmed once and shared by all
+        the candidate fits.
+
+        The candidate fits are cached by a hash of the data set and the
+        start_time to rel_time window, so calling auto_fit() again with a
+        different criterion, or calling rank_fits(), doesn't refit the data.
+
+        :keyword str criterion: the statistic used to pick the best fit; one
+                                of 'aic', 'bic', or 'mle'.
+        :keyword int fit_method: the fit method to pick the best fit from;
+                                 1=MLE, 2=Regression.
+        :return: False if successful or True if an error is encountered.
+        :rtype: bool
+        """
+
+        _data = self._create_dataset()
+        self._fit_key = (hashlib.sha1(_data.tostring()).hexdigest(),
+                         _data.shape, self.start_time, self.rel_time)
+
+        if self._fit_key not in self._dic_fits:
+            _prepared = PreparedData(_data, self.start_time, self.rel_time)
+            _fits = OrderedDict()
+            for _distribution_id, _fit_method in _AUTO_FIT_CANDIDATES:
+                _fits[(_distribution_id, _fit_method)] = self._do_fit(
+                    _prepared, _distribution_id, _fit_method)
+            self._dic_fits[self._fit_key] = _fits
+
+        _ranking = self.rank_fits(criterion, fit_method)
+        if not _ranking:
+            return True
+
+        (self.distribution_id, self.fit_method) = _ranking[0][0]
+
+        return self.estimate_parameters(_data, _ranking[0][1])
+
+    def rank_fits(self, criterion='aic', fit_method=1):
+        """
+        Method to rank the candidate fits found by the last call to auto_fit()
+        from best to worst.  Candidates that could not be fit are left out.
+
+        The regression goodness of fit statistics are calculated from the
+        residuals of the linearized data, so they can't be compared with the
+        MLE statistics.  Only the candidates for one fit method are ranked.
+
+        :keyword str criterion: the statistic to rank the fits by; one of
+                                'aic', 'bic', or 'mle'.
+        :keyword int fit_method: the fit method to rank; 1=MLE,
+                                 2=Regression.
+        :return: _ranking; list of ((distribution ID, fit method), results)
+                 tuples.
+        :rtype: list
+        """
+
+        (_index, _reverse) = _AUTO_FIT_CRITERIA[criterion]
+
+        _fits = self._dic_fits.get(self._fit_key, {})
+        _ranking = [(_key, _results) for _key, _results in _fits.items()
+                    if _results is not None and
+                    np.isfinite(_results[2][_index]) and
+                    _key[1] == fit_method]
+        _ranking.sort(key=lambda _fit: _fit[1][2][_index], reverse=_reverse)
+
+        return _ranking
+
+    def _do_fit(self, data, distribution_id, fit_method):
+        """
+        Method to fit a data set to a single distribution with a single fit
+        method.
+
+        :param data: the data set to fit; a numpy array or a
+                     :py:class:`rtk.analyses.statistics.Distributions.PreparedData`.
+        :param int distribution_id: the ID of the distribution to fit.
+        :param int fit_method: the fit method to use; 1=MLE, 2=Regression.
+        :return: _results; the results returned by the fit or None if the data
+                 set can't be fit to the distribution.
+        :rtype: list
+        """
+
+        _distributions = {5: (Exponential, 'exponential'),
+                          6: (LogNormal, 'lognormal'),
+                          7: (Gaussian, 'normal'),
+                          8: (Weibull, 'weibull')}
+        (_distribution, _name) = _distributions[distribution_id]
+
+        try:
+            if fit_method == 1:
+                _results = _distribution().maximum_likelihood_estimate(
+                    data, self.start_time, self.rel_time)
+            else:
+                _results = regression(data, self.start_time, self.rel_time,
+                                      dist=_name)
+        except(ArithmeticError, IndexError, TypeError, ValueError,
+               np.linalg.LinAlgError):
+            _results = None
+
+        return _results
+
     def calculate_parameter_bounds(self, data):
         """
         Method to calculate confidence bounds on estimated parameters.
@@ -476,16 +637,21 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def estimate_mcf(self):
+    def estimate_mcf(self, data=None):
         """
         Method to estimate the Mean Cumulative Function.
 
+        :keyword dict data: the data set returned by
+                            analyses.survival.MCF.format_data().  If None, the
+                            data set is created from the records in
+                            dicRecords.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
-        _data = _mcf.format_data(self.dicRecords)
-        self.mcf = _mcf.mean_cumulative_function(_data)
+        if data is None:
+            data = _mcf.format_data(self.dicRecords)
+        self.mcf = _mcf.mean_cumulative_function(data)
 
         _times = self.mcf[:, 0]
         self.n_failures = np.float(sum(self.mcf[:, 1]))
@@ -497,17 +663,24 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def estimate_kaplan_meier(self):
+    def estimate_kaplan_meier(self, data=None):
         """
         Method to estimate the Kaplan-Meier (product limit) parameters.
 
+        :keyword tuple data: the (data set, number of failures, number of
+                             suspensions) returned by
+                             analyses.survival.KaplanMeier.format_data().  If
+                             None, the data set is created from the records in
+                             dicRecords.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
+        if data is None:
+            data = _km.format_data(self.dicRecords)
         (_data,
          self.n_failures,
-         self.n_suspensions) = _km.format_data(self.dicRecords)
+         self.n_suspensions) = data
 
         self.km, _rank = _km.kaplan_meier(_data, self.start_time,
                                           self.rel_time, self.confidence,
@@ -522,24 +695,31 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def estimate_nhpp_power_law(self):
+    def estimate_nhpp_power_law(self, data=None):
         """
         Method to estimate the NHPP-Power Law parameters.
 
+        :keyword tuple data: the (list of number of failures, list of failure
+                             times, list of failure dates) to fit.  If None,
+                             the lists are created from the records in
+                             dicRecords.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
         # TODO: Consider refactoring estimate_nhpp_power_law; current McCabe Complexity metric=11.
         self.nhpp = []
 
+        if data is None:
+            data = ([_record.n_failures
+                     for _record in self.dicRecords.values()],
+                    [_record.right_interval
+                     for _record in self.dicRecords.values()],
+                    [_record.failure_date
+                     for _record in self.dicRecords.values()])
+
         _meanc = [0.0, 0.0, 0.0]
         _meani = [0.0, 0.0, 0.0]
-        _failures = [_record.n_failures
-                     for _record in self.dicRecords.values()]
-        _times = [_record.right_interval
-                  for _record in self.dicRecords.values()]
-        _dates = [_record.failure_date
-                  for _record in self.dicRecords.values()]
+        (_failures, _times, _dates) = data
         for _index, _time in enumerate(_times):
             _NHPP = _nhpp.power_law(_failures[:_index + 1],
                                     _times[:_index + 1],
@@ -623,7 +803,7 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def estimate_exponential(self, data):
+    def estimate_exponential(self, data, results=None):
         """
         Method to estimate the Exponential distribution parameters, mean,
         parameter and mean bounds, hazard function and reliability function.
@@ -635,20 +815,26 @@ class Model(object):                       # pylint: disable=R0902, R0904
                             * 2 = Quantity of observations
                             * 3 = Status of observation
                             * 4 = Time between failures or interarrival time
+        :keyword list results: the results of a fit that has already been
+                               done, such as one found by auto_fit().  If
+                               None, the data set is fit using fit_method.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
-        if self.fit_method == 1:
+        if results is not None:
+            _results = results
+        elif self.fit_method == 1:
             _results = Exponential().maximum_likelihood_estimate(data,
                                                                  self.start_time,
                                                                  self.rel_time)
+        elif self.fit_method == 2:
+            _results = regression(data, self.start_time, self.rel_time)
 
+        if self.fit_method == 1:
             self.n_suspensions = _results[3]
             self.n_failures = _results[4]
         elif self.fit_method == 2:
-            _results = regression(data, self.start_time, self.rel_time)
-
             self.rho = _results[3]
             self.n_suspensions = _results[4]
             self.n_failures = _results[5]
@@ -672,7 +858,7 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def estimate_lognormal(self, data):
+    def estimate_lognormal(self, data, results=None):
         """
         Method to estimate the LogNormal distribution parameters, mean,
         parameter and mean bounds, hazard function and reliability function.
@@ -685,21 +871,27 @@ class Model(object):                       # pylint: disable=R0902, R0904
                                 * 3 = Status of observation
                                 * 4 = Time between failures or interarrival
                                       time
+        :keyword list results: the results of a fit that has already been
+                               done, such as one found by auto_fit().  If
+                               None, the data set is fit using fit_method.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
-        if self.fit_method == 1:
+        if results is not None:
+            _results = results
+        elif self.fit_method == 1:
             _results = LogNormal().maximum_likelihood_estimate(data,
                                                                self.start_time,
                                                                self.rel_time)
-
-            self.n_suspensions = _results[3]
-            self.n_failures = _results[4]
         elif self.fit_method == 2:
             _results = regression(data, self.start_time, self.rel_time,
                                   dist='lognormal')
 
+        if self.fit_method == 1:
+            self.n_suspensions = _results[3]
+            self.n_failures = _results[4]
+        elif self.fit_method == 2:
             self.rho = _results[3]
             self.n_suspensions = _results[4]
             self.n_failures = _results[5]
@@ -720,7 +912,7 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def estimate_gaussian(self, data):
+    def estimate_gaussian(self, data, results=None):
         """
         Method to estimate the Gaussian (Normal) distribution parameters, mean,
         parameter and mean bounds, hazard function and reliability function.
@@ -732,21 +924,27 @@ class Model(object):                       # pylint: disable=R0902, R0904
                             * 2 = Quantity of observations
                             * 3 = Status of observation
                             * 4 = Time between failures or interarrival time
+        :keyword list results: the results of a fit that has already been
+                               done, such as one found by auto_fit().  If
+                               None, the data set is fit using fit_method.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
-        if self.fit_method == 1:
+        if results is not None:
+            _results = results
+        elif self.fit_method == 1:
             _results = Gaussian().maximum_likelihood_estimate(data,
                                                               self.start_time,
                                                               self.rel_time)
-
-            self.n_suspensions = _results[3]
-            self.n_failures = _results[4]
         elif self.fit_method == 2:
             _results = regression(data, self.start_time, self.rel_time,
                                   dist='normal')
 
+        if self.fit_method == 1:
+            self.n_suspensions = _results[3]
+            self.n_failures = _results[4]
+        elif self.fit_method == 2:
             self.rho = _results[3]
             self.n_suspensions = _results[4]
             self.n_failures = _results[5]
@@ -767,7 +965,7 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def estimate_weibull(self, data):
+    def estimate_weibull(self, data, results=None):
         """
         Method to estimate the Weibull distribution parameters, mean,
         parameter and mean bounds, hazard function and reliability function.
@@ -779,21 +977,27 @@ class Model(object):                       # pylint: disable=R0902, R0904
                             * 2 = Quantity of observations
                             * 3 = Status of observation
                             * 4 = Time between failures or interarrival time
+        :keyword list results: the results of a fit that has already been
+                               done, such as one found by auto_fit().  If
+                               None, the data set is fit using fit_method.
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
-        if self.fit_method == 1:
+        if results is not None:
+            _results = results
+        elif self.fit_method == 1:
             _results = Weibull().maximum_likelihood_estimate(data,
                                                              self.start_time,
                                                              self.rel_time)
-
-            self.n_suspensions = _results[3]
-            self.n_failures = _results[4]
         elif self.fit_method == 2:
             _results = regression(data, self.start_time, self.rel_time,
                                   dist='normal')
 
+        if self.fit_method == 1:
+            self.n_suspensions = _results[3]
+            self.n_failures = _results[4]
+        elif self.fit_method == 2:
             self.rho = _results[3]
             self.n_suspensions = _results[4]
             self.n_failures = _results[5]
@@ -814,6 +1018,36 @@ class Model(object):                       # pylint: disable=R0902, R0904
 
         return False
 
+    def create_fit_dataset(self, distribution_id):
+        """
+        Method to create the data set needed to fit the records in dicRecords
+        to a distribution.  The data set only contains numpy arrays, lists,
+        and dictionaries so it can be sent to another process.
+
+        :param int distribution_id: the ID of the distribution to create the
+                                    data set for.
+        :return: _data; the data set in the form expected by the
+                 estimate_<distribution> method.
+        """
+
+        # Always create the numpy data set because it converts the status of
+        # each record to an integer.
+        _data = self._create_dataset()
+
+        if distribution_id == 1:            # MCF
+            _data = _mcf.format_data(self.dicRecords)
+        elif distribution_id == 2:          # Kaplan-Meier
+            _data = _km.format_data(self.dicRecords)
+        elif distribution_id == 3:          # NHPP - Power Law
+            _data = ([_record.n_failures
+                      for _record in self.dicRecords.values()],
+                     [_record.right_interval
+                      for _record in self.dicRecords.values()],
+                     [_record.failure_date
+                      for _record in self.dicRecords.values()])
+
+        return _data
+
     def _create_dataset(self):
         """
         Method to create a dataset for analysis from the records in dicRecords.
@@ -867,6 +1101,11 @@ class Survival(object):
     :ivar _dao: the :class:`rtk.dao.DAO` to use when communicating with the RTK
                 Project database.
     :ivar int _last_id: the last Survival ID used.
+    :ivar dict _dic_saved: Dictionary of the values of each Survival and
+                           Record as they were last read from or saved to the
+                           RTK Project database.  Key is the Survival ID or
+                           the (Survival ID, Record ID) tuple; value is the
+                           tuple of values.
     :ivar dict dicSurvivals: Dictionary of the Survival data models managed.
                              Key is the Survival ID; value is a pointer to the
                              Survival data model instance.
@@ -877,6 +1116,9 @@ class Survival(object):
         Method to initialize a Survival data controller instance.
         """
 
+        # Initialize private dictionary attributes.
+        self._dic_saved = {}
+
         # Initialize private scalar attributes.
         self._dao = None
         self._last_id = None
@@ -920,6 +1162,8 @@ class Survival(object):
             _survival = Model()
             _survival.set_attributes(_results[i])
             self.dicSurvival[_survival.survival_id] = _survival
+            self._dic_saved[_survival.survival_id] = \
+                self._get_survival_values(_survival)
 
         return(_results, _error_code)
 
@@ -976,7 +1220,10 @@ class Survival(object):
 
         # Remove the Survival analysis from the survival dictionary.
         if _results:
-            self.dicSurvival.pop(survival_id)
+            _survival = self.dicSurvival.pop(survival_id)
+            self._dic_saved.pop(survival_id, None)
+            for _record_id in _survival.dicRecords.keys():
+                self._dic_saved.pop((survival_id, _record_id), None)
 
         return(_results, _error_code)
 
@@ -985,12 +1232,22 @@ class Survival(object):
         Method to save all the Survival objects associated with the selected
         revision to the open RTK Program database.
 
+        Only the Survival analyses and Records that have changed since they
+        were last read or saved are written.
+
         :return: False if successful or True if an error is encountered.
         :rtype: bool
         """
 
-        for _survival in self.dicSurvival.values():
-            self.save_survival(_survival.survival_id)
+        for _survival_id, _survival in self.dicSurvival.items():
+            if(self._dic_saved.get(_survival_id) !=
+               self._get_survival_values(_survival)):
+                self._do_save_survival(_survival)
+
+            for _record_id, _record in _survival.dicRecords.items():
+                if(self._dic_saved.get((_survival_id, _record_id)) !=
+                   self._get_record_values(_record)):
+                    self.save_record(_survival_id, _record_id, _record)
 
         return False
 
@@ -1006,6 +1263,28 @@ class Survival(object):
 
         _survival = self.dicSurvival[survival_id]
 
+        (_results, _error_code) = self._do_save_survival(_survival)
+
+        # Save all the records.
+        for _record_id in _survival.dicRecords.keys():
+            (_results,
+             _error_code) = self.save_record(survival_id, _record_id,
+                                             _survival.dicRecords[_record_id])
+
+        return(_results, _error_code)
+
+    def _do_save_survival(self, survival):
+        """
+        Method to save the Survival model attributes, but not the Records, to
+        the open RTK Program database.
+
+        :param survival: the :py:class:`rtk.survival.Survival.Model` to save.
+        :return: (_results, _error_code)
+        :rtype: tuple
+        """
+
+        _values = self._get_survival_values(survival)
+
         _query = "UPDATE rtk_survival \
                   SET fld_assembly_id={2:d}, fld_description='{3:s}', \
                       fld_source={4:d}, fld_distribution_id={5:d}, \
@@ -1025,35 +1304,42 @@ class Survival(object):
                       fld_mle={34:f}, fld_start_time={35:f}, \
                       fld_start_date={36:d}, fld_end_date={37:d} \
                   WHERE fld_revision_id={0:d} \
-                  AND fld_survival_id={1:d}".format(
-                      _survival.revision_id, _survival.survival_id,
-                      _survival.assembly_id, _survival.description,
-                      _survival.source, _survival.distribution_id,
-                      _survival.confidence, _survival.confidence_type,
-                      _survival.confidence_method, _survival.fit_method,
-                      _survival.rel_time, _survival.n_rel_points,
-                      _survival.n_suspensions, int(_survival.n_failures),
-                      _survival.scale[0], _survival.scale[1],
-                      _survival.scale[2], _survival.shape[0],
-                      _survival.shape[1], _survival.shape[2],
-                      _survival.location[0], _survival.location[1],
-                      _survival.location[2], _survival.variance[0],
-                      _survival.variance[1], _survival.variance[2],
-                      _survival.covariance[0], _survival.covariance[1],
-                      _survival.covariance[2], _survival.mhb, _survival.lp,
-                      _survival.lr, _survival.aic, _survival.bic,
-                      _survival.mle, _survival.start_time,
-                      _survival.start_date, _survival.end_date)
+                  AND fld_survival_id={1:d}".format(*_values)
         (_results, _error_code, __) = self._dao.execute(_query, commit=True)
 
-        # Save all the records.
-        for _record_id in _survival.dicRecords.keys():
-            (_results,
-             _error_code) = self.save_record(survival_id, _record_id,
-                                             _survival.dicRecords[_record_id])
+        if _results:
+            self._dic_saved[survival.survival_id] = _values
 
         return(_results, _error_code)
 
+    @staticmethod
+    def _get_survival_values(survival):
+        """
+        Method to gather the Survival model values that are saved to the open
+        RTK Program database.
+
+        :param survival: the :py:class:`rtk.survival.Survival.Model` to gather
+                         the values for.
+        :return: _values
+        :rtype: tuple
+        """
+
+        return (survival.revision_id, survival.survival_id,
+                survival.assembly_id, survival.description, survival.source,
+                survival.distribution_id, survival.confidence,
+                survival.confidence_type, survival.confidence_method,
+                survival.fit_method, survival.rel_time, survival.n_rel_points,
+                survival.n_suspensions, int(survival.n_failures),
+                survival.scale[0], survival.scale[1], survival.scale[2],
+                survival.shape[0], survival.shape[1], survival.shape[2],
+                survival.location[0], survival.location[1],
+                survival.location[2], survival.variance[0],
+                survival.variance[1], survival.variance[2],
+                survival.covariance[0], survival.covariance[1],
+                survival.covariance[2], survival.mhb, survival.lp, survival.lr,
+                survival.aic, survival.bic, survival.mle, survival.start_time,
+                survival.start_date, survival.end_date)
+
     def request_records(self, survival_id):
         """
         Method to read the RTK Project database and load all the records
@@ -1088,6 +1374,8 @@ class Survival(object):
             _record = Record()
             _record.set_attributes([survival_id] + list(_results[i][1:]))
             _survival.dicRecords[_results[i][0]] = _record
+            self._dic_saved[(survival_id, _results[i][0])] = \
+                self._get_record_values(_record)
 
         _survival.dicRecords = OrderedDict(sorted(_survival.dicRecords.items(),
                                                   key=lambda r: r[1].right_interval))
@@ -1147,6 +1435,7 @@ class Survival(object):
 
         if _results:
             self.dicSurvival[survival_id].dicRecords.pop(record_id)
+            self._dic_saved.pop((survival_id, record_id), None)
 
         return(_results, _error_code)
 
@@ -1162,6 +1451,8 @@ class Survival(object):
         :rype: tuple
         """
 
+        _values = self._get_record_values(record)
+
         _query = "UPDATE rtk_survival_data \
                   SET fld_name='{2:s}', fld_failure_date={3:d}, \
                       fld_left_interval={4:f}, fld_right_interval={5:f}, \
@@ -1175,33 +1466,37 @@ class Survival(object):
                       fld_user_string_3='{21:s}' \
                   WHERE fld_survival_id={0:d} \
                   AND fld_record_id={1:d}".format(survival_id, record_id,
-                                                  record.assembly_name,
-                                                  record.failure_date,
-                                                  record.left_interval,
-                                                  record.right_interval,
-                                                  record.status,
-                                                  record.n_failures,
-                                                  record.interarrival_time,
-                                                  record.mode_type,
-                                                  record.nevada_chart,
-                                                  record.ship_date,
-                                                  record.return_date,
-                                                  record.user_float_1,
-                                                  record.user_float_2,
-                                                  record.user_float_3,
-                                                  record.user_integer_1,
-                                                  record.user_integer_2,
-                                                  record.user_integer_3,
-                                                  record.user_string_1,
-                                                  record.user_string_2,
-                                                  record.user_string_3)
+                                                  *_values)
         (_results, _error_code, __) = self._dao.execute(_query, commit=True)
 
         if not _results:
             print survival_id, record_id
+        else:
+            self._dic_saved[(survival_id, record_id)] = _values
 
         return(_results, _error_code)
 
+    @staticmethod
+    def _get_record_values(record):
+        """
+        Method to gather the Record values that are saved to the open RTK
+        Program database.
+
+        :param record: the :py:class:`rtk.survival.Record.Model` to gather
+                       the values for.
+        :return: _values
+        :rtype: tuple
+        """
+
+        return (record.assembly_name, record.failure_date,
+                record.left_interval, record.right_interval, record.status,
+                record.n_failures, record.interarrival_time, record.mode_type,
+                record.nevada_chart, record.ship_date, record.return_date,
+                record.user_float_1, record.user_float_2, record.user_float_3,
+                record.user_integer_1, record.user_integer_2,
+                record.user_integer_3, record.user_string_1,
+                record.user_string_2, record.user_string_3)
+
     def consolidate_dataset(self, survival_id):
         """
         Method to consolidate the dataset so there are only unique failure
@@ -1279,6 +1574,68 @@ class Survival(object):
 
         return _survival.estimate_parameters()
 
+    def fit_many(self, survival_ids, distributions=None, workers=None):
+        """
+        Method to fit the data sets of several Survivals in parallel.  The data
+        set for each Survival is created in this process and only the data set
+        and fit settings are sent to the worker processes.
+
+        The results of the fit to a Survival's own distribution are set in the
+        Survival data model.  The results of every fit are returned in the
+        order of survival_ids and then distributions, regardless of which
+        worker finished first.
+
+        :param list survival_ids: the Survival IDs to fit.
+        :keyword list distributions: the distribution IDs to fit each data set
+                                     to.  If None, each data set is fit to
+                                     the distribution of its Survival.
+        :keyword int workers: the number of worker processes to use.  If None,
+                              one worker per CPU is used.  If 1, the data
+                              sets are fit in this process.
+        :return: _results; ordered dictionary of the fit results.  Key is the
+                 (Survival ID, distribution ID) tuple; value is a dictionary
+                 of {attribute: value}.
+        :rtype: :py:class:`collections.OrderedDict`
+        """
+
+        _keys = []
+        _tasks = []
+        for _survival_id in survival_ids:
+            _survival = self.dicSurvival[_survival_id]
+            _inputs = dict((_key, getattr(_survival, _key))
+                           for _key in _FIT_INPUTS)
+
+            if distributions is None:
+                _distributions = [_survival.distribution_id]
+            else:
+                _distributions = distributions
+
+            for _distribution_id in _distributions:
+                _keys.append((_survival_id, _distribution_id))
+                _tasks.append((_distribution_id, _inputs,
+                               _survival.create_fit_dataset(
+                                   _distribution_id)))
+
+        if workers == 1:
+            _fits = [_fit_dataset(_task) for _task in _tasks]
+        else:
+            _pool = multiprocessing.Pool(processes=workers)
+            try:
+                _fits = _pool.map(_fit_dataset, _tasks, chunksize=1)
+            finally:
+                _pool.close()
+                _pool.join()
+
+        _results = OrderedDict(zip(_keys, _fits))
+
+        for (_survival_id, _distribution_id), _fit in _results.items():
+            _survival = self.dicSurvival[_survival_id]
+            if _distribution_id == _survival.distribution_id:
+                for _key, _value in _fit.items():
+                    setattr(_survival, _key, _value)
+
+        return _results
+
     def request_calculate_tbf(self, survival_id):
         """
         Method to request the interarrival times of a dataset be calculated.
@@ -48,7 +48,6 @@ import locale
 from math import ceil, sqrt
 import numpy as np
 from scipy.stats import probplot
-from statsmodels.distributions.empirical_distribution import ECDF
 
 # Modules required for the GUI.
 try:
@@ -691,6 +690,9 @@ class Plots(gtk.HBox):                      # pylint: disable=R0902, R0904
         :rtype: bool
         """
 
+        # statsmodels is slow to import so wait until the plot is requested.
+        from statsmodels.distributions.empirical_distribution import ECDF
+
         self.axAxis2.cla()
 
         _ecdf = ECDF(times)
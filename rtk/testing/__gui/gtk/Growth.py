@@ -752,12 +752,12 @@ class Planning(gtk.HPaned):                 # pylint: disable=R0902, R0904
 
         # If the ideal curve hasn't been calculated, then calculate it's
         # values.
-        if ideal is None or ideal == []:
+        if ideal is None or len(ideal) == 0:
             ideal = self._testing_model.calculate_idealized_growth_curve()
 
         # If the planned curves haven't been calculated, then calculate their
         # values.
-        if plan is None or plan == []:
+        if plan is None or len(plan) == 0:
             plan = self._testing_model.create_planned_values()
 
         _xlabel = _(u"Cumulative Test Time")
@@ -2030,12 +2030,12 @@ class Assessment(gtk.HPaned):               # pylint: disable=R0902, R0904
 
         # If the ideal curve hasn't been calculated, then calculate it's
         # values.
-        if ideal is None or ideal == []:
+        if ideal is None or len(ideal) == 0:
             ideal = self._testing_model.calculate_idealized_growth_curve()
 
         # If the planned curves haven't been calculated, then calculate their
         # values.
-        if plan is None or plan == []:
+        if plan is None or len(plan) == 0:
             plan = self._testing_model.create_planned_values()
 
         _xlabel = _(u"Cumulative Test Time")
@@ -181,6 +181,10 @@ class Model(Testing):                       # pylint: disable=R0902, R0904
         super(Model, self).__init__()
 
         # Initialize private dict attributes.
+        # The last calculated idealized and planned curves and the inputs used
+        # to calculate them.  Key is the curve name, value is a tuple of
+        # (inputs, curve values).
+        self._dic_curves = {}
 
         # Initialize private list attributes.
 
@@ -261,17 +265,61 @@ class Model(Testing):                       # pylint: disable=R0902, R0904
         self.chi_square = 0.0
         self.cvm_critical_value = 0.0
 
-    def calculate_idealized_growth_curve(self, mtbf=True):
+    def get_time_grid(self, n_points=None, log=False, phases=False):
         """
-        Method to calculate the values for the idealized growth curve.
+        Method to create the test times at which the idealized and planned
+        growth curves are calculated.  The time to first fix and the last and
+        first time of each test phase are always on the grid so the curves
+        break in the same places they do when calculated for each test hour.
+
+        :keyword int n_points: the number of evenly spaced times between zero
+                               and the total time on test.
+        :keyword bool log: indicates whether the times are evenly spaced on a
+                           logarithmic scale.
+        :keyword bool phases: indicates whether to use only the test phase
+                              breakpoints.
+        :return: _times
+        :rtype: ndarray of floats
+        """
+
+        _cum_time = np.cumsum(self.lst_p_test_time[:self.n_phases])
+        _t_max = max(self.ttt, _cum_time[-1])
+
+        _times = np.concatenate(([0.0, int(self.lst_p_test_time[0])],
+                                 _cum_time - 1.0, _cum_time))
+        if not phases and n_points is not None:
+            if log:
+                _times = np.concatenate((_times,
+                                         np.logspace(0.0, np.log10(_t_max),
+                                                     n_points)))
+            else:
+                _times = np.concatenate((_times,
+                                         np.linspace(0.0, _t_max, n_points)))
+
+        _times = np.unique(_times)
+
+        return _times[(_times >= 0.0) & (_times < _t_max)]
+
+    def calculate_idealized_growth_curve(self, mtbf=True, n_points=None,
+                                         log=False, phases=False):
+        """
+        Method to calculate the values for the idealized growth curve.  By
+        default there is one value for each test hour.  When any of the time
+        grid keywords is passed, the values are calculated at the times
+        returned by get_time_grid().
 
         :keyword bool mtbf: indicates whether to calculate MTBF (default) or
                             failure intensity values.
+        :keyword int n_points: the number of evenly spaced times.
+        :keyword bool log: indicates whether the times are evenly spaced on a
+                           logarithmic scale.
+        :keyword bool phases: indicates whether to use only the test phase
+                              breakpoints.
         :return: _ideal
-        :rtype: list of floats
+        :rtype: ndarray of floats
         """
 # WARNING: Refactor calculate_idealized_growth_curve; current McCabe Complexity metric=17.
-        _ideal = []
+        _ideal = np.array([])
 
         # Verify the first phase average MTBF is greater than zero.  If not,
         # attempt to calculate the average MTBF.
@@ -322,20 +370,35 @@ class Model(Testing):                       # pylint: disable=R0902, R0904
         # calculated from the inputs read above.
         if(self.lst_i_mtbfa[0] > 0.0 and self.lst_p_test_time[0] > 0.0 and
            self.mtbfg > 0.0 and self.ttt > 0.0 and self.avg_growth > 0.0):
-            for _time in range(int(self.ttt)):
-                if _time < int(self.lst_p_test_time[0]):
-                    _ideal.append(self.lst_i_mtbfa[0])
-                elif _time == int(self.lst_p_test_time[0]):
-                    _ideal.append(np.nan)
+            # The curve is only recalculated when one of its inputs changes.
+            _inputs = (mtbf, n_points, log, phases, self.avg_growth,
+                       self.lst_i_mtbfa[0], self.mtbfg, self.ttt,
+                       tuple(self.lst_p_test_time[:self.n_phases]))
+            try:
+                (_cached_inputs, _ideal) = self._dic_curves['ideal']
+            except KeyError:
+                _cached_inputs = None
+
+            if _inputs != _cached_inputs:
+                if n_points is None and not log and not phases:
+                    _times = np.arange(int(self.ttt), dtype=float)
                 else:
-                    _ideal.append((self.lst_i_mtbfa[0] *
-                                   (float(_time) /
-                                    self.lst_p_test_time[0])**self.avg_growth) /
-                                  (1.0 - self.avg_growth))
+                    _times = self.get_time_grid(n_points, log, phases)
+
+                _t1 = int(self.lst_p_test_time[0])
+                _ideal = np.where(_times < _t1, self.lst_i_mtbfa[0],
+                                  (self.lst_i_mtbfa[0] *
+                                   (_times / self.lst_p_test_time[0])**
+                                   self.avg_growth) / (1.0 - self.avg_growth))
+                _ideal[_times == _t1] = np.nan
+
+                # Convert to failure intensity if that has been called for.
+                if not mtbf:
+                    _ideal = 1.0 / _ideal
 
-            # Convert to failure intensity if that has been called for.
-            if not mtbf:
-                _ideal = [1.0 / _mtbf for _mtbf in _ideal]
+                self._dic_curves['ideal'] = (_inputs, _ideal)
+
+            _ideal = _ideal.copy()
 
             # Calculate the initial MTBF, final MTBF, average MTBF, and
             # expected number of failures for each phase.
@@ -411,7 +474,8 @@ class Model(Testing):                       # pylint: disable=R0902, R0904
 
         return False
 
-    def create_planned_values(self, mtbf=True):
+    def create_planned_values(self, mtbf=True, n_points=None, log=False,
+                              phases=False):
         """
         Method to create the planned growth curve values.  These are used for
         plotting the planned growth curve.  The first curve created represents
@@ -419,28 +483,56 @@ class Model(Testing):                       # pylint: disable=R0902, R0904
         horizontal lines.  The second curve created represents the
         straight-line linear change in MTBF over the phase.
 
+        By default there is one value for each test hour.  When any of the
+        time grid keywords is passed, the values are calculated at the times
+        returned by get_time_grid().
+
         :keyword boolean mtbf: indicates whether to calculate MTBF or failure
                                rates.
+        :keyword int n_points: the number of evenly spaced times.
+        :keyword bool log: indicates whether the times are evenly spaced on a
+                           logarithmic scale.
+        :keyword bool phases: indicates whether to use only the test phase
+                              breakpoints.
         :return: _plan
-        :rtype: list
+        :rtype: ndarray of floats
         """
 
-        _plan = []
-
-        for _phase in range(self.n_phases):
-            _time = 0.0
-
-            while _time < (self.lst_p_test_time[_phase] - 1.0):
-                if mtbf:
-                    _plan.append(self.lst_p_mtbfa[_phase])
-                else:
-                    _plan.append(1.0 / self.lst_p_mtbfa[_phase])
-
-                _time += 1.0
-
-            _plan.append(np.nan)            # pylint: disable=E1101
-
-        return _plan
+        # The values are only recalculated when one of their inputs changes.
+        _inputs = (mtbf, n_points, log, phases, self.ttt,
+                   tuple(self.lst_p_mtbfa[:self.n_phases]),
+                   tuple(self.lst_p_test_time[:self.n_phases]))
+        try:
+            (_cached_inputs, _plan) = self._dic_curves['plan']
+        except KeyError:
+            _cached_inputs = None
+
+        if _inputs != _cached_inputs:
+            # Each phase's values end with numpy's not a number at the phase's
+            # last test hour to break the plot between phases.
+            _test_time = np.array(self.lst_p_test_time[:self.n_phases],
+                                  dtype=float)
+            _n_values = np.maximum(np.ceil(_test_time - 1.0), 0.0) + 1.0
+            _phase_end = np.cumsum(_n_values) - 1.0
+
+            if n_points is None and not log and not phases:
+                _times = np.arange(_phase_end[-1] + 1.0)
+            else:
+                _phase_end = np.cumsum(_test_time) - 1.0
+                _times = self.get_time_grid(n_points, log, phases)
+
+            _mtbfa = np.array(self.lst_p_mtbfa[:self.n_phases], dtype=float)
+            _phase = np.minimum(np.searchsorted(_phase_end, _times),
+                                self.n_phases - 1)
+            if mtbf:
+                _plan = _mtbfa[_phase]
+            else:
+                _plan = 1.0 / _mtbfa[_phase]
+            _plan[np.in1d(_times, _phase_end)] = np.nan  # pylint: disable=E1101
+
+            self._dic_curves['plan'] = (_inputs, _plan)
+
+        return _plan.copy()
 
     def assess_plan_feasibility(self):
         """
@@ -521,6 +613,36 @@ class Model(Testing):                       # pylint: disable=R0902, R0904
 
         return _results
 
+    def simulate_plan_feasibility(self, n_histories=10000,
+                                  percentiles=(5.0, 50.0, 95.0), seed=None,
+                                  workers=None):
+        """
+        Method to assess the feasibility of a test plan by simulating failure
+        histories from the idealized growth curve.  The planned Crow-AMSAA
+        shape parameter is one minus the average growth rate and the scale
+        parameter gives the idealized average MTBF over the first phase.
+
+        :keyword int n_histories: the number of failure histories to simulate.
+        :keyword tuple percentiles: the percentiles of the estimates to
+                                    return.
+        :keyword int seed: the seed for the random number generator.
+        :keyword int workers: the number of worker processes to use.  If None,
+                              one worker per CPU is used.
+        :return: (_probability, _mtbf_bands, _beta_bands); the probability of
+                 demonstrating the goal MTBF at the end of each phase and the
+                 percentiles of the instantaneous MTBF and shape parameter
+                 estimates at the end of each phase.
+        :rtype: tuple of ndarrays
+        """
+
+        _t1 = self.lst_p_test_time[0]
+        _beta = 1.0 - self.avg_growth
+        _alpha = _t1**(1.0 - _beta) / self.lst_i_mtbfa[0]
+
+        return CrowAMSAA.simulate_crow_amsaa(
+            _alpha, _beta, self.lst_p_test_time[:self.n_phases], self.mtbfg,
+            n_histories, percentiles, seed, workers)
+
     def estimate_crow_amsaa(self):
         """
         Method to estimate the parameters of the Crow-AMSAA reliability growth
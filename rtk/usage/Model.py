@@ -236,16 +236,7 @@ class UsageProfileDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _key in self.tree.nodes:
-            if _key != 0:
-                _error_code, _msg = self.update(_key)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print _error_code
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
@@ -311,6 +302,7 @@ class MissionDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _mission.mission_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -389,21 +381,7 @@ class MissionDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.mission_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.Usage.Model.MissionDataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.Usage.Model.MissionDataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
@@ -463,6 +441,7 @@ class MissionPhaseDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _phase.phase_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -539,21 +518,7 @@ class MissionPhaseDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.phase_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.Usage.Model.MissionPhaseDataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.Usage.Model.MissionPhaseDataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
 
@@ -616,6 +581,7 @@ class EnvironmentDataModel(RTKDataModel):
             self.last_id = max(self.last_id, _environment.environment_id)
 
         _session.close()
+        self._do_mark_clean()
 
         return self.tree
 
@@ -695,20 +661,6 @@ class EnvironmentDataModel(RTKDataModel):
         :return: (_error_code, _msg); the error code and associated message.
         :rtype: (int, str)
         """
-        _error_code = 0
-        _msg = ''
-
-        for _node in self.tree.all_nodes():
-            try:
-                _error_code, _msg = self.update(_node.data.environment_id)
-
-                # Break if something goes wrong and return.
-                if _error_code != 0:
-                    print 'FIXME: Handle non-zero error codes in ' \
-                          'rtk.Usage.Model.EnvironmentDataModel.update_all().'
-
-            except AttributeError:
-                print 'FIXME: Handle AttributeError in ' \
-                      'rtk.Usage.Model.EnvironmentDataModel.update_all().'
+        _error_code, _msg = RTKDataModel.update_all(self)
 
         return _error_code, _msg
@@ -151,6 +151,13 @@ class TestConfiguration(unittest.TestCase):
         self.assertEqual(self.DUT.RTK_BACKEND, '')
         self.assertEqual(self.DUT.RTK_COM_INFO, {})
         self.assertEqual(self.DUT.RTK_PROG_INFO, {})
+        self.assertEqual(self.DUT.RTK_DB_PROFILE,
+                         {'pool_size': 5, 'max_overflow': 10,
+                          'pool_timeout': 30, 'journal_mode': 'WAL',
+                          'synchronous': 'NORMAL', 'cache_size': -65536,
+                          'mmap_size': 268435456, 'temp_store': 'MEMORY'})
+        self.assertFalse(self.DUT.RTK_DB_PROFILE is
+                         Configuration.RTK_DB_PROFILE)
         self.assertEqual(self.DUT.RTK_MODULES, {})
         self.assertEqual(self.DUT.RTK_PAGE_NUMBER, {})
         self.assertEqual(self.DUT.RTK_HR_MULTIPLIER, 1000000.0)
@@ -45,6 +45,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
 
 import logging
 
+from sqlalchemy.exc import UnboundExecutionError
 from treelib import Tree
 
 import unittest
@@ -300,6 +301,49 @@ class TestRTKModel(unittest.TestCase):
                          (u'Last Name', u'First Name', u'EMail', u'867.5309',
                           u'0'))
 
+    @attr(all=True, unit=True)
+    def test07b_load_globals_cached(self):
+        """
+        (TestRTKModel) load_globals() should use the cached global lookups until the RTK Common database changes
+        """
+
+        _cache = self.Configuration.RTK_CONF_DIR + '/RTK_globals.cache'
+        if isfile(_cache):
+            os.remove(_cache)
+
+        self.assertFalse(self.DUT.load_globals(self.Configuration))
+        self.assertTrue(isfile(_cache))
+
+        # The lookup dictionaries are shared by every Configuration so they
+        # are emptied before loading from the cache.
+        _severity = dict(self.Configuration.RTK_SEVERITY)
+        _users = dict(self.Configuration.RTK_USERS)
+        self.assertNotEqual(_severity, {})
+        self.assertNotEqual(_users, {})
+        self.Configuration.RTK_SEVERITY.clear()
+        self.Configuration.RTK_USERS.clear()
+
+        # The cached lookups are loaded without connecting to the RTK Common
+        # database.
+        _configuration = Configuration()
+        _configuration.RTK_CONF_DIR = self.Configuration.RTK_CONF_DIR
+        _configuration.RTK_COM_BACKEND = self.Configuration.RTK_COM_BACKEND
+        _configuration.RTK_COM_INFO = self.Configuration.RTK_COM_INFO
+        _model = Model(DAO(), self.program_dao)
+        self.assertFalse(_model.load_globals(_configuration))
+        self.assertEqual(_configuration.RTK_SEVERITY, _severity)
+        self.assertEqual(_configuration.RTK_USERS, _users)
+        self.assertEqual(len(_model.tree.nodes), len(self.DUT.tree.nodes))
+
+        # The cache is not used once the RTK Common database changes.
+        _model = Model(DAO(), self.program_dao)
+        os.utime(self.Configuration.RTK_COM_INFO['database'], None)
+        _stat = os.stat(self.Configuration.RTK_COM_INFO['database'])
+        os.utime(self.Configuration.RTK_COM_INFO['database'],
+                 (_stat.st_atime, _stat.st_mtime + 1.0))
+        self.assertRaises(UnboundExecutionError, _model.load_globals,
+                          _configuration)
+
     @attr(all=True, unit=True)
     def test08a_validate_license(self):
         """
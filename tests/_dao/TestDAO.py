@@ -47,14 +47,20 @@ sys.path.insert(0, dirname(dirname(dirname(__file__))) + "/rtk", )
 import unittest
 from nose.plugins.attrib import attr
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from Configuration import Configuration
-from dao.DAO import DAO
+import dao
+from dao import RTKCommonDB
+from dao.DAO import DAO, get_table
 from dao.RTKRevision import RTKRevision
 from dao.RTKMission import RTKMission
 from dao.RTKMissionPhase import RTKMissionPhase
 from dao.RTKEnvironment import RTKEnvironment
+from dao.RTKHardware import RTKHardware
+from dao.RTKMatrix import RTKMatrix
 
 __author__ = 'Andrew Rowland'
 __email__ = 'andrew.rowland@reliaqual.com'
@@ -133,6 +139,18 @@ class TestDAO(unittest.TestCase):
         self.assertTrue(isinstance(self.DUT, DAO))
         self.assertTrue(isinstance(self.DUT.RTK_SESSION, sessionmaker))
 
+    @attr(all=True, unit=True)
+    def test00a_dao_get_table(self):
+        """
+        (TestDAO) get_table should return the table class with the passed name.
+        """
+
+        self.assertTrue(get_table('RTKRevision') is RTKRevision)
+        self.assertTrue(dao.RTKRevision is RTKRevision)
+        self.assertTrue(get_table('RTKUser') is dao.RTKUser)
+        self.assertRaises(KeyError, get_table, 'RTKNotATable')
+        self.assertRaises(AttributeError, getattr, dao, 'RTKNotATable')
+
     @attr(all=True, unit=True)
     def test01_dao_db_connect(self):
         """
@@ -145,6 +163,57 @@ class TestDAO(unittest.TestCase):
 
         self.assertFalse(_dao.db_connect(_database))
 
+    @attr(all=True, unit=True)
+    def test01a_dao_db_connect_profile(self):
+        """
+        (TestDAO) db_connect should pool connections and set the SQLite PRAGMAs when passed an engine profile.
+        """
+
+        _database = 'sqlite:////tmp/_rtk_profile_db.rtk'
+        _dao = DAO()
+
+        self.assertFalse(_dao.db_connect(_database,
+                                         self.Configuration.RTK_DB_PROFILE))
+        self.assertTrue(isinstance(_dao.engine.pool, QueuePool))
+        self.assertEqual(
+            _dao.engine.execute('PRAGMA journal_mode').scalar(), 'wal')
+        self.assertEqual(
+            _dao.engine.execute('PRAGMA synchronous').scalar(), 1)
+        self.assertEqual(
+            _dao.engine.execute('PRAGMA temp_store').scalar(), 2)
+
+        _dao.db_close()
+
+        for _file in ['/tmp/_rtk_profile_db.rtk', '/tmp/_rtk_profile_db.rtk-wal',
+                      '/tmp/_rtk_profile_db.rtk-shm']:
+            if os.path.exists(_file):
+                os.remove(_file)
+
+    @attr(all=True, unit=True)
+    def test01b_dao_db_session(self):
+        """
+        (TestDAO) db_session should return the same session until db_close is called.
+        """
+
+        _database = 'sqlite:////tmp/_rtk_profile_db.rtk'
+        _dao = DAO()
+        _dao.db_connect(_database, self.Configuration.RTK_DB_PROFILE)
+
+        _engine = _dao.engine
+        _session = _dao.db_session()
+        self.assertTrue(_dao.db_session() is _session)
+        _session.execute('SELECT 1')
+        self.assertEqual(_engine.pool.checkedout(), 1)
+
+        self.assertFalse(_dao.db_close())
+        self.assertEqual(_engine.pool.checkedout(), 0)
+        self.assertEqual(_dao.engine, None)
+
+        for _file in ['/tmp/_rtk_profile_db.rtk', '/tmp/_rtk_profile_db.rtk-wal',
+                      '/tmp/_rtk_profile_db.rtk-shm']:
+            if os.path.exists(_file):
+                os.remove(_file)
+
     @attr(all=True, unit=True)
     def test02a_dao_db_create_common(self):
         """
@@ -158,9 +227,17 @@ class TestDAO(unittest.TestCase):
                                            'password': ''}
         _database = self.Configuration.RTK_COM_BACKEND + ':///' + \
                     self.Configuration.RTK_COM_INFO['database']
-        self.assertFalse(self.DUT.db_create_common(_database,
-                                                   self.site_session))
+        _dao = DAO()
+        _dao.db_connect(_database)
+        self.assertFalse(_dao.db_create_common(_database, _dao.db_session()))
 
+        _session = _dao.db_session()
+        self.assertEqual(_session.query(dao.RTKGroup).count(),
+                         len(RTKCommonDB.RTK_GROUPS))
+        self.assertEqual(_session.query(dao.RTKLoadHistory).count(),
+                         len(RTKCommonDB.RTK_HISTORIES))
+
+        _dao.db_close()
         os.remove('/tmp/_rtk_common_db.rtk')
 
     @attr(all=True, unit=True)
@@ -193,9 +270,15 @@ class TestDAO(unittest.TestCase):
                                             'password' : ''}
         _database = self.Configuration.RTK_BACKEND + ':///' + \
                     self.Configuration.RTK_PROG_INFO['database']
-        self.assertFalse(self.DUT.db_create_program(_database,
-                                                    self.program_session))
+        _dao = DAO()
+        _dao.db_connect(_database)
+        self.assertFalse(_dao.db_create_program(_database, _dao.db_session()))
 
+        _session = _dao.db_session()
+        self.assertEqual(_session.query(RTKRevision).count(), 1)
+        self.assertEqual(_session.query(dao.RTKSoftwareReview).count(), 50)
+
+        _dao.db_close()
         os.remove('/tmp/_rtk_program_db.rtk')
 
     @attr(all=True, unit=True)
@@ -215,6 +298,29 @@ class TestDAO(unittest.TestCase):
         self.assertTrue(self.DUT.db_create_program(_database,
                                                    self.program_session))
 
+    @attr(all=True, unit=True)
+    def test02e_dao_db_create_program_tables_error(self):
+        """
+        (TestDAO) db_create_program should return True when the tables can't be created.
+        """
+
+        _database = 'sqlite:////tmp/_rtk_program_db.rtk'
+        _dao = DAO()
+        _dao.db_connect(_database)
+
+        # A table with the same name as one of the hardware indexes stops the
+        # hardware table from being created.
+        _dao.engine.execute(
+            'CREATE TABLE ix_rtk_hardware_fld_revision_id (fld_id INTEGER)')
+
+        self.assertTrue(_dao.db_create_program(_database, _dao.db_session()))
+        self.assertEqual(
+            _dao.engine.execute('SELECT COUNT(*) FROM rtk_revision').scalar(),
+            0)
+
+        _dao.db_close()
+        os.remove('/tmp/_rtk_program_db.rtk')
+
     @attr(all=True, unit=True)
     def test03a_dao_db_add(self):
         """
@@ -304,3 +410,134 @@ class TestDAO(unittest.TestCase):
         self.assertEqual(_error_code, 1005)
         self.assertEqual(_msg, "RTK ERROR: Deleting an item from the RTK " \
                                "Program database.")
+
+    @attr(all=True, unit=True)
+    def test04b_dao_db_add_many(self):
+        """
+        (TestDAO) db_add_many should return a zero error code and an empty failure list on success.
+        """
+
+        (_error_code, _msg,
+         _failed) = self.DUT.db_add_many([RTKRevision(), RTKRevision()],
+                                         self.program_session)
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(_msg, "RTK SUCCESS: Adding one or more items to " \
+                               "the RTK Program database.")
+        self.assertEqual(_failed, [])
+
+    @attr(all=True, unit=True)
+    def test04c_dao_db_add_many_partial_failure(self):
+        """
+        (TestDAO) db_add_many should return a 1003 error code and the index of each item that failed while still adding the good items.
+        """
+
+        _revision = RTKRevision()
+
+        (_error_code, _msg,
+         _failed) = self.DUT.db_add_many([_revision, None],
+                                         self.program_session)
+
+        self.assertEqual(_error_code, 1003)
+        self.assertEqual(_msg, "RTK ERROR: Adding 1 of 2 items to the RTK " \
+                               "Program database.")
+        self.assertEqual(_failed, [1])
+        self.assertTrue(_revision.revision_id is not None)
+
+    @attr(all=True, unit=True)
+    def test07a_dao_db_create_indexes(self):
+        """
+        (TestDAO) db_create_indexes should add the missing indexes to an existing RTK Program database.
+        """
+
+        _database = 'sqlite:////tmp/_rtk_index_db.rtk'
+        _dao = DAO()
+        _dao.db_connect(_database)
+
+        # Create the tables the way older versions of RTK did, without any
+        # indexes other than the primary key.
+        _tables = [RTKHardware.__table__, RTKMatrix.__table__]
+        for _table in _tables:
+            _table.create(bind=_dao.engine, checkfirst=True)
+            for _index in _table.indexes:
+                _index.drop(bind=_dao.engine)
+
+        (_error_code, _msg) = _dao.db_create_indexes()
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(_msg, "RTK SUCCESS: Creating indexes in the RTK "
+                               "Program database.")
+        _inspector = inspect(_dao.engine)
+        for _table in _tables:
+            self.assertEqual(
+                sorted([_index['name']
+                        for _index in _inspector.get_indexes(_table.name)]),
+                sorted([_index.name for _index in _table.indexes]))
+
+        # Running it again on an indexed database should change nothing.
+        self.assertEqual(_dao.db_create_indexes()[0], 0)
+
+        _dao.db_close()
+        os.remove('/tmp/_rtk_index_db.rtk')
+
+    @attr(all=True, unit=True)
+    def test07b_dao_db_create_indexes_query_plan(self):
+        """
+        (TestDAO) db_create_indexes should make the hardware and matrix queries use the new indexes.
+        """
+
+        _database = 'sqlite:////tmp/_rtk_index_db.rtk'
+        _dao = DAO()
+        _dao.db_connect(_database)
+
+        for _table in [RTKHardware.__table__, RTKMatrix.__table__]:
+            _table.create(bind=_dao.engine, checkfirst=True)
+            for _index in _table.indexes:
+                _index.drop(bind=_dao.engine)
+
+        # Ten revisions of 100 hardware items and 1,000 matrix cells spread
+        # over ten revisions and five matrix types.
+        _dao.engine.execute(
+            RTKHardware.__table__.insert(),
+            [{'fld_revision_id': _id // 100, 'fld_hardware_id': _id + 1}
+             for _id in range(1000)])
+        _dao.engine.execute(
+            RTKMatrix.__table__.insert(),
+            [{'fld_revision_id': _id // 100, 'fld_matrix_id': _id % 5,
+              'fld_matrix_type': 'type{0:d}'.format(_id % 5),
+              'fld_row_item_id': (_id % 100) // 10,
+              'fld_column_item_id': _id % 10, 'fld_value': 1}
+             for _id in range(1000)])
+
+        _queries = [
+            "SELECT * FROM rtk_hardware WHERE fld_revision_id=4",
+            "SELECT fld_matrix_id, fld_row_item_id, fld_column_item_id, "
+            "fld_value FROM rtk_matrix WHERE fld_revision_id=4 AND "
+            "fld_matrix_type='type3'"
+        ]
+
+        def _plan(query):
+            return ' '.join([
+                str(_row[-1]) for _row in _dao.engine.execute(
+                    'EXPLAIN QUERY PLAN ' + query)
+            ])
+
+        def _count(query):
+            return len(_dao.engine.execute(query).fetchall())
+
+        _before = [(_plan(_query), _count(_query)) for _query in _queries]
+        _dao.db_create_indexes()
+        _after = [(_plan(_query), _count(_query)) for _query in _queries]
+
+        for (_plan_before, _count_before), (_plan_after, _count_after) \
+                in zip(_before, _after):
+            self.assertFalse('ix_rtk_' in _plan_before)
+            self.assertTrue('ix_rtk_' in _plan_after)
+            self.assertEqual(_count_after, _count_before)
+        self.assertTrue(_before[0][0].startswith('SCAN'))
+        self.assertTrue('ix_rtk_hardware_fld_revision_id' in _after[0][0])
+        self.assertTrue('COVERING INDEX ix_rtk_matrix_lookup' in _after[1][0])
+        self.assertEqual([_count for __, _count in _after], [100, 20])
+
+        _dao.db_close()
+        os.remove('/tmp/_rtk_index_db.rtk')
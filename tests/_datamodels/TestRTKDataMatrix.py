@@ -28,6 +28,7 @@ from Configuration import Configuration  # pylint: disable=import-error
 from datamodels import RTKDataMatrix  # pylint: disable=import-error
 from dao import DAO  # pylint: disable=import-error
 from dao import RTKFunction, RTKHardware  # pylint: disable=import-error
+from dao import RTKMatrix  # pylint: disable=import-error
 
 __author__ = 'Andrew Rowland'
 __email__ = 'andrew.rowland@reliaqual.com'
@@ -209,3 +210,48 @@ class Test00MatrixModel(unittest.TestCase):
         (_error_code, _msg) = self.DUT.update(1, 'fnctn_sftwr')
 
         self.assertEqual(_error_code, 0)
+
+    @attr(all=True, unit=True)
+    def test05c_update_changed_cell(self):
+        """(TestMatrixModel): update() should save only the changed cells and the new value should be selected the next time."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+        self.DUT.dtf_matrix[2][3] = 2
+
+        self.assertEqual(self.DUT._get_dirty_cells(), ([(3, 2, 2)], []))
+
+        (_error_code, _msg) = self.DUT.update(1, 'fnctn_hrdwr')
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(_msg, 'RTK SUCCESS: Updating Matrix fnctn_hrdwr.')
+        self.assertEqual(self.DUT._get_dirty_cells(), ([], []))
+
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+        self.assertEqual(self.DUT.select(2, 3), 2)
+
+        self.DUT.dtf_matrix[2][3] = 0
+        self.DUT.update(1, 'fnctn_hrdwr')
+
+    @attr(all=True, unit=True)
+    def test05d_update_inserted_row(self):
+        """(TestMatrixModel): update() should insert the cells of a row that does not exist in the RTK Program database."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+        self.DUT.insert(4, 'TEMP-002', row=True)
+
+        self.assertEqual(self.DUT._get_dirty_cells(),
+                         ([], [(4, 1, 0), (4, 2, 0), (4, 3, 0)]))
+
+        (_error_code, _msg) = self.DUT.update(1, 'fnctn_hrdwr')
+
+        self.assertEqual(_error_code, 0)
+
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+        self.assertEqual(self.DUT.select(1, 4), 0)
+
+        self.session.query(RTKMatrix).filter(
+            RTKMatrix.matrix_type == 'fnctn_hrdwr',
+            RTKMatrix.row_item_id == 4).delete()
+        self.session.commit()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python -O
+# -*- coding: utf-8 -*-
+#
+#       tests.unit.TestSparseMatrix.py is part of The RTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
+"""The test class for testing the Sparse Matrix class."""
+
+import sys
+
+import unittest
+
+from os.path import dirname
+
+import pandas as pd
+
+from nose.plugins.attrib import attr
+
+from sqlalchemy.orm import scoped_session
+
+sys.path.insert(
+    0,
+    dirname(dirname(dirname(__file__))) + "/rtk", )
+
+import Utilities as Utilities  # pylint: disable=import-error
+from Configuration import Configuration  # pylint: disable=import-error
+from datamodels import RTKDataSparseMatrix  # pylint: disable=import-error
+from dao import DAO  # pylint: disable=import-error
+from dao import RTKFunction, RTKHardware  # pylint: disable=import-error
+
+__author__ = 'Andrew Rowland'
+__email__ = 'andrew.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2017 Andrew "weibullguy" Rowland'
+
+
+class Test00SparseMatrixModel(unittest.TestCase):
+    """Class for testing the Sparse Matrix model class."""
+
+    def setUp(self):
+        """Prepare the test fixture for the Sparse Matrix class."""
+        self.Configuration = Configuration()
+
+        self.Configuration.RTK_BACKEND = 'sqlite'
+        self.Configuration.RTK_PROG_INFO = {
+            'host': 'localhost',
+            'socket': 3306,
+            'database': '/tmp/TestDB.rtk',
+            'user': '',
+            'password': ''
+        }
+
+        self.Configuration.DEBUG_LOG = \
+            Utilities.create_logger("RTK.debug", 'DEBUG', '/tmp/RTK_debug.log')
+        self.Configuration.USER_LOG = \
+            Utilities.create_logger("RTK.user", 'INFO', '/tmp/RTK_user.log')
+
+        # Create a data access object and connect to a test database.
+        self.dao = DAO()
+        _database = self.Configuration.RTK_BACKEND + ':///' + \
+            self.Configuration.RTK_PROG_INFO['database']
+        self.dao.db_connect(_database)
+
+        self.dao.RTK_SESSION.configure(
+            bind=self.dao.engine, autoflush=False, expire_on_commit=False)
+        self.session = scoped_session(self.dao.RTK_SESSION)
+
+        self.DUT = RTKDataSparseMatrix(self.dao, RTKFunction, RTKHardware)
+
+    @attr(all=True, unit=True)
+    def test00_create(self):
+        """(TestSparseMatrixModel) __init__ should return an RTKDataSparseMatrix model."""
+        self.assertTrue(isinstance(self.DUT, RTKDataSparseMatrix))
+        self.assertTrue(isinstance(self.DUT.dao, DAO))
+        self.assertEqual(self.DUT.dic_cells, {})
+        self.assertEqual(self.DUT.dtf_matrix, None)
+
+    @attr(all=True, unit=True)
+    def test01_select_all(self):
+        """(TestSparseMatrixModel): select_all() should return False on success and store only the non-zero cells."""
+        self.assertFalse(
+            self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                                'function_code', 6))
+
+        self.assertEqual(self.DUT.dic_cells, {})
+        self.assertEqual(self.DUT.n_row, 3)
+        self.assertEqual(self.DUT.n_col, 3)
+
+    @attr(all=True, unit=True)
+    def test02a_select(self):
+        """(TestSparseMatrixModel): select() should return the value of the cell."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+
+        self.assertEqual(self.DUT.select(2, 2), 0)
+
+    @attr(all=True, unit=True)
+    def test02b_select_non_existent_cell(self):
+        """(TestSparseMatrixModel): select() should raise a KeyError when the cell does not exist."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+
+        self.assertRaises(KeyError, self.DUT.select, 2, 22)
+
+    @attr(all=True, unit=True)
+    def test03_insert_row(self):
+        """(TestSparseMatrixModel): insert() should return False on successfully inserting a row."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+
+        _error_code, _msg = self.DUT.insert(6, 'TEMP-001A', row=True)
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(self.DUT.n_row, 4)
+        self.assertEqual(self.DUT.select(1, 6), 0)
+
+    @attr(all=True, unit=True)
+    def test04_delete_column(self):
+        """(TestSparseMatrixModel): delete() should return False on successfully deleting a column."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+
+        _error_code, _msg = self.DUT.delete(2, row=False)
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(self.DUT.n_col, 2)
+        self.assertRaises(KeyError, self.DUT.select, 2, 1)
+
+    @attr(all=True, unit=True)
+    def test05_get_unlinked(self):
+        """(TestSparseMatrixModel): get_unlinked_rows() and get_unlinked_columns() should return the items without a non-zero cell."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+        self.DUT.update_cell(2, 1, 1)
+
+        self.assertEqual(self.DUT.get_unlinked_rows(), [2, 3])
+        self.assertEqual(self.DUT.get_unlinked_columns(), [1, 3])
+
+    @attr(all=True, unit=True)
+    def test06_dense_matrix(self):
+        """(TestSparseMatrixModel): dtf_matrix should be a dense DataFrame and changes to it should be seen by the Sparse Matrix."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+        self.DUT.update_cell(2, 1, 1)
+
+        _matrix = self.DUT.dtf_matrix
+        self.assertTrue(isinstance(_matrix, pd.DataFrame))
+        self.assertEqual(_matrix[2][1], 1)
+        self.assertEqual(_matrix[3][3], 0)
+
+        _matrix[3][3] = 2
+
+        self.assertEqual(self.DUT.get_unlinked_rows(), [2])
+        self.assertEqual(self.DUT.dic_cells, {(1, 2): 1, (3, 3): 2})
+
+    @attr(all=True, unit=True)
+    def test07_update(self):
+        """(TestSparseMatrixModel): update() should save the changed cells."""
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+        self.DUT.update_cell(2, 1, 1)
+
+        self.assertEqual(self.DUT._get_dirty_cells(), ([(1, 2, 1)], []))
+
+        (_error_code, _msg) = self.DUT.update(1, 'fnctn_hrdwr')
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(self.DUT._get_dirty_cells(), ([], []))
+
+        self.DUT.select_all(1, 'fnctn_hrdwr', 'function_id', 1,
+                            'function_code', 6)
+        self.assertEqual(self.DUT.select(2, 1), 1)
+
+        self.DUT.update_cell(2, 1, 0)
+        self.DUT.update(1, 'fnctn_hrdwr')
@@ -106,6 +106,45 @@ class TestFMEADataModel(unittest.TestCase):
 
         self.assertTrue(isinstance(_tree, Tree))
 
+    @attr(all=True, unit=True)
+    def test01b1_select_all_hardware_node_ids(self):
+        """
+        (TestFMEAModel) select_all() should build the same Node IDs as selecting each level of a Hardware FMEA separately
+        """
+        _tree = self.DUT.select_all(1, functional=False)
+
+        _lst_node_ids = [0]
+        for _mode_id in dtmMode(self.dao).select_all(
+                1, functional=False).nodes:
+            if _mode_id == 0:
+                continue
+            _mode_node = '0.' + str(_mode_id)
+            _lst_node_ids.append(_mode_node)
+            for _mechanism_id in dtmMechanism(self.dao).select_all(
+                    _mode_id).nodes:
+                if _mechanism_id == 0:
+                    continue
+                _mechanism_node = _mode_node + '.' + str(_mechanism_id)
+                _lst_node_ids.append(_mechanism_node)
+                for _cause_id in dtmCause(self.dao).select_all(
+                        _mechanism_id).nodes:
+                    if _cause_id == 0:
+                        continue
+                    _cause_node = _mechanism_node + '.' + str(_cause_id)
+                    _lst_node_ids.append(_cause_node)
+                    for _control_id in dtmControl(self.dao).select_all(
+                            _cause_id, functional=False).nodes:
+                        if _control_id != 0:
+                            _lst_node_ids.append(_cause_node + '.0' +
+                                                 str(_control_id))
+                    for _action_id in dtmAction(self.dao).select_all(
+                            _cause_id, functional=False).nodes:
+                        if _action_id != 0:
+                            _lst_node_ids.append(_cause_node + '.' +
+                                                 str(_action_id))
+
+        self.assertEqual(sorted(_tree.nodes.keys()), sorted(_lst_node_ids))
+
     @attr(all=True, unit=True)
     def test01c_select_all_non_existent_hardware_id(self):
         """
@@ -537,6 +576,28 @@ class TestFMEADataModel(unittest.TestCase):
         self.assertEqual(_msg,
                          'RTK SUCCESS: Updating the RTK Program database.')
 
+    @attr(all=True, unit=True)
+    def test06b_update_all_after_select_all(self):
+        """
+        (TestFMEAModel) update_all() should write nothing when called right after select_all()
+        """
+        for _parent_id, _functional in [(3, True), (1, False)]:
+            self.DUT.select_all(_parent_id, functional=_functional)
+
+            self.assertEqual(self.DUT.get_dirty(), [])
+            for _datamodel in [
+                    self.DUT.dtm_mode, self.DUT.dtm_mechanism,
+                    self.DUT.dtm_cause, self.DUT.dtm_control,
+                    self.DUT.dtm_action
+            ]:
+                self.assertEqual(_datamodel.get_dirty(), [])
+
+            _error_code, _msg = self.DUT.update_all()
+
+            self.assertEqual(_error_code, 0)
+            self.assertEqual(_msg,
+                             'RTK SUCCESS: Updating the RTK Program database.')
+
     @attr(all=True, unit=True)
     def test07a_calculate_criticality(self):
         """
@@ -190,6 +190,54 @@ class TestFunctionDataModel(unittest.TestCase):
         self.assertEqual(_msg,
                          'RTK SUCCESS: Updating the RTK Program database.')
 
+    @attr(all=True, unit=True)
+    def test_06b_update_many(self):
+        """(TestFunctionModel): update_many() should return a zero error code and an empty list of failed Node IDs on success."""
+        self.DUT.select_all(1)
+
+        _function = self.DUT.tree.get_node(1).data
+        _function.availability_logistics = 0.9945
+
+        _error_code, _msg, _failed = self.DUT.update_many([1, 2])
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(_msg,
+                         'RTK SUCCESS: Updating the RTK Program database.')
+        self.assertEqual(_failed, [])
+
+        self.DUT.select_all(1)
+        self.assertAlmostEqual(
+            self.DUT.tree.get_node(1).data.availability_logistics, 0.9945)
+
+    @attr(all=True, unit=True)
+    def test_06c_update_many_non_existent_id(self):
+        """(TestFunctionModel): update_many() should return a non-zero error code and the list of failed Node IDs when passed a Function ID that doesn't exist."""
+        self.DUT.select_all(1)
+
+        _error_code, _msg, _failed = self.DUT.update_many([1, 100])
+
+        self.assertEqual(_error_code, 6)
+        self.assertEqual(_msg, 'RTK ERROR: Attempted to save 1 of 2 entities '
+                         'with Node IDs [100].')
+        self.assertEqual(_failed, [100])
+
+    @attr(all=True, unit=True)
+    def test_06d_get_dirty(self):
+        """(TestFunctionModel): get_dirty() should return only the Node IDs of the modified Functions and update_all() should clear them."""
+        self.DUT.select_all(1)
+
+        self.assertEqual(self.DUT.get_dirty(), [])
+
+        _function = self.DUT.tree.get_node(2).data
+        _function.remarks = 'Modified Function'
+
+        self.assertEqual(self.DUT.get_dirty(), [2])
+
+        _error_code, _msg = self.DUT.update_all()
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(self.DUT.get_dirty(), [])
+
     @attr(all=True, unit=True)
     def test07a_calculate_mtbf(self):
         """(TestFunctionModel) calculate_mtbf should return a zero error code on success."""
@@ -0,0 +1,266 @@
+#!/usr/bin/env python -O
+# -*- coding: utf-8 -*-
+#
+#       tests._hardware.TestHardware.py is part of The RTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
+"""
+This is the test class for testing the Hardware Data Model hazard rate, cost,
+and part count roll-up.
+"""
+
+import sys
+from os.path import dirname
+
+sys.path.insert(
+    0,
+    dirname(dirname(dirname(__file__))) + "/rtk", )
+
+import unittest
+from nose.plugins.attrib import attr
+
+from sqlalchemy.orm import joinedload
+
+from hardware.Hardware import Model
+from dao import DAO, RTKHardware, RTKReliability
+
+__author__ = 'Andrew Rowland'
+__email__ = 'andrew.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2017 Andrew "weibullguy" Rowland'
+
+
+def _make_hardware(hardware_id, parent_id, part, hazard_rate=0.0, cost=0.0,
+                   quantity=1):
+    """
+    Function to create a Hardware item, and its reliability record, for the
+    roll-up tests.
+    """
+
+    _hardware = RTKHardware()
+    _hardware.hardware_id = hardware_id
+    _hardware.parent_id = parent_id
+    _hardware.part = part
+    _hardware.quantity = quantity
+    _hardware.cost = cost
+    _hardware.reliability = RTKReliability()
+    _hardware.reliability.hazard_rate_active = hazard_rate
+    _hardware.reliability.hazard_rate_dormant = hazard_rate / 10.0
+    _hardware.reliability.hazard_rate_logistics = hazard_rate
+    _hardware.reliability.hazard_rate_mission = hazard_rate
+
+    return _hardware
+
+
+class TestHardwareRollup(unittest.TestCase):
+    """
+    Class for testing the Hardware data model roll-up methods.
+    """
+
+    def setUp(self):
+        """
+        Method to setup the test fixture for the Hardware roll-up.
+        """
+
+        self.DUT = Model(None)
+
+        # 1 -+- 2 -+- 4 (part)
+        #    |     +- 5 (part)
+        #    +- 3 --- 6 (part)
+        for _hardware in [
+                _make_hardware(1, 0, 0),
+                _make_hardware(2, 1, 0),
+                _make_hardware(3, 1, 0, quantity=2),
+                _make_hardware(4, 2, 1, 0.001, 1.5),
+                _make_hardware(5, 2, 1, 0.002, 2.0, 3),
+                _make_hardware(6, 3, 1, 0.004, 0.5)
+        ]:
+            self.DUT.tree.create_node(_hardware.name, _hardware.hardware_id,
+                                      parent=_hardware.parent_id,
+                                      data=_hardware)
+            self.DUT.mark_dirty(_hardware.hardware_id)
+
+    @attr(all=True, unit=True)
+    def test00_rollup(self):
+        """
+        (TestHardwareModel) rollup() should return a zero error code on success and sum every dirty Hardware item
+        """
+
+        _error_code, _msg = self.DUT.rollup()
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(_msg, 'RTK SUCCESS: Summing 7 Hardware items.')
+
+        self.assertAlmostEqual(self.DUT.get_rollup(2)['hazard_rate_active'],
+                               0.003)
+        self.assertAlmostEqual(self.DUT.get_rollup(2)['cost'], 7.5)
+        self.assertEqual(self.DUT.get_rollup(2)['total_part_count'], 4)
+        self.assertAlmostEqual(self.DUT.get_rollup(3)['hazard_rate_active'],
+                               0.008)
+        self.assertAlmostEqual(self.DUT.get_rollup(1)['hazard_rate_active'],
+                               0.011)
+        self.assertAlmostEqual(self.DUT.get_rollup(1)['hazard_rate_dormant'],
+                               0.0011)
+        self.assertAlmostEqual(self.DUT.get_rollup(1)['cost'], 8.5)
+        self.assertEqual(self.DUT.get_rollup(1)['total_part_count'], 6)
+        self.assertAlmostEqual(
+            self.DUT.select(1).reliability.hazard_rate_mission, 0.011)
+
+    @attr(all=True, unit=True)
+    def test01_mark_dirty(self):
+        """
+        (TestHardwareModel) mark_dirty() should only flag the path from the Hardware item to the root
+        """
+
+        self.DUT.rollup()
+        self.DUT.select(4).reliability.hazard_rate_active = 0.01
+        self.DUT.mark_dirty(4)
+
+        _error_code, _msg = self.DUT.rollup()
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(_msg, 'RTK SUCCESS: Summing 4 Hardware items.')
+        self.assertAlmostEqual(self.DUT.get_rollup(2)['hazard_rate_active'],
+                               0.012)
+        self.assertAlmostEqual(self.DUT.get_rollup(1)['hazard_rate_active'],
+                               0.020)
+
+    @attr(all=True, unit=True)
+    def test02_move(self):
+        """
+        (TestHardwareModel) move() should return a zero error code on success and keep the summed values consistent
+        """
+
+        self.DUT.rollup()
+
+        _error_code, _msg = self.DUT.move(5, 3)
+        self.DUT.rollup()
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(_msg, 'RTK SUCCESS: Moving Hardware ID 5 to parent '
+                         'Hardware ID 3.')
+        self.assertEqual(self.DUT.select(5).parent_id, 3)
+        self.assertAlmostEqual(self.DUT.get_rollup(2)['hazard_rate_active'],
+                               0.001)
+        self.assertAlmostEqual(self.DUT.get_rollup(3)['hazard_rate_active'],
+                               0.012)
+        self.assertAlmostEqual(self.DUT.get_rollup(1)['hazard_rate_active'],
+                               0.013)
+
+    @attr(all=True, unit=True)
+    def test02a_move_non_existent_id(self):
+        """
+        (TestHardwareModel) move() should return a 2007 error code when passed a non-existent Hardware ID
+        """
+
+        _error_code, _msg = self.DUT.move(100, 3)
+
+        self.assertEqual(_error_code, 2007)
+        self.assertEqual(_msg, 'RTK ERROR: Attempted to move non-existent '
+                         'Hardware ID 100 or to non-existent parent Hardware '
+                         'ID 3.')
+
+    @attr(all=True, unit=True)
+    def test03_rollup_program_database(self):
+        """
+        (TestHardwareModel) rollup() should keep the specified hazard rates of a Hardware item read from the RTK Program database without children
+        """
+
+        _dao = DAO()
+        _dao.db_connect('sqlite:////tmp/TestDB.rtk')
+        _session = _dao.db_session()
+
+        self.DUT = Model(_dao)
+        for _hardware in _session.query(RTKHardware).options(
+                joinedload(RTKHardware.reliability)).all():
+            self.DUT.tree.create_node(_hardware.name, _hardware.hardware_id,
+                                      parent=_hardware.parent_id,
+                                      data=_hardware)
+            self.DUT.mark_dirty(_hardware.hardware_id)
+        _session.close()
+
+        _reliability = self.DUT.select(3).reliability
+        _reliability.hazard_rate_active = 0.005
+
+        _error_code, _msg = self.DUT.rollup()
+
+        self.assertEqual(_error_code, 0)
+        self.assertTrue(isinstance(_reliability, RTKReliability))
+        self.assertTrue(self.DUT.select(1).reliability is None)
+        self.assertEqual(self.DUT.select(3).total_part_count, 0)
+        self.assertEqual(_reliability.hazard_rate_active, 0.005)
+        self.assertEqual(self.DUT.get_rollup(3)['hazard_rate_active'], 0.005)
+        self.assertEqual(self.DUT.get_rollup(3)['total_part_count'], 0)
+
+        _dao.db_close()
+
+    @attr(all=True, unit=True)
+    def test03a_rollup_save_program_database(self):
+        """
+        (TestHardwareModel) update_many() should save the summed hazard rates rollup() writes to the reliability records
+        """
+
+        _dao = DAO()
+        _dao.db_connect('sqlite:////tmp/TestDB.rtk')
+        _session = _dao.db_session()
+
+        self.DUT = Model(_dao)
+        for _hardware in _session.query(RTKHardware).options(
+                joinedload(RTKHardware.reliability)).all():
+            self.DUT.tree.create_node(_hardware.name, _hardware.hardware_id,
+                                      parent=_hardware.parent_id,
+                                      data=_hardware)
+            self.DUT.mark_dirty(_hardware.hardware_id)
+        _session.close()
+
+        _total_part_count = self.DUT.select(3).total_part_count
+
+        # Give Hardware ID 3 a part so rollup() sums into its reliability
+        # record.
+        _part = _make_hardware(100, 3, 1, 0.002)
+        self.DUT.tree.create_node(_part.name, 100, parent=3, data=_part)
+        self.DUT.mark_dirty(100)
+
+        self.DUT.rollup()
+
+        self.assertTrue(3 in self.DUT.get_dirty())
+
+        _error_code, _msg, _failed = self.DUT.update_many([3])
+
+        self.assertEqual(_error_code, 0)
+        self.assertEqual(_failed, [])
+        self.assertFalse(3 in self.DUT.get_dirty())
+
+        _session = _dao.db_session()
+        _reliability = _session.query(RTKReliability).filter(
+            RTKReliability.hardware_id == 3).first()
+        self.assertAlmostEqual(_reliability.hazard_rate_active, 0.002)
+        self.assertAlmostEqual(_reliability.hazard_rate_dormant, 0.0002)
+        self.assertAlmostEqual(_reliability.hazard_rate_mission, 0.002)
+        _session.close()
+
+        # Changing only the reliability record should still be saved.  This
+        # also puts the test database back the way it was.
+        _reliability = self.DUT.select(3).reliability
+        for _key in ['hazard_rate_active', 'hazard_rate_dormant',
+                     'hazard_rate_logistics', 'hazard_rate_mission']:
+            setattr(_reliability, _key, 0.0)
+
+        self.assertTrue(3 in self.DUT.get_dirty())
+
+        _error_code, _msg, _failed = self.DUT.update_many([3])
+
+        self.assertEqual(_error_code, 0)
+
+        _session = _dao.db_session()
+        _reliability = _session.query(RTKReliability).filter(
+            RTKReliability.hardware_id == 3).first()
+        self.assertEqual(_reliability.hazard_rate_active, 0.0)
+        self.assertEqual(_reliability.hazard_rate_mission, 0.0)
+        _session.close()
+
+        self.DUT.select(3).total_part_count = _total_part_count
+        self.DUT.update_many([3])
+
+        _dao.db_close()
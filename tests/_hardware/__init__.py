@@ -0,0 +1 @@
+from TestHardware import TestHardwareRollup
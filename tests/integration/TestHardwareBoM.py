@@ -99,6 +99,29 @@ class TestBoMController(unittest.TestCase):
 
         self.assertEqual(self.DUT.request_bom(0)[1], 0)
 
+    @attr(all=True, integration=True)
+    def test1a_request_bom_children(self):
+        """
+        (TestBoM) request_bom should index the children of each hardware item
+        """
+
+        self.DUT.request_bom(0)
+
+        for _hardware in self.DUT.dicHardware.values():
+            self.assertTrue(_hardware in
+                            self.DUT.get_children(_hardware.parent_id))
+
+        for _parent_id in self.DUT.dicChildren.keys():
+            _assemblies = self.DUT.get_children(_parent_id, part=0)
+            _components = self.DUT.get_children(_parent_id, part=1)
+            self.assertEqual(len(_assemblies) + len(_components),
+                             len(self.DUT.get_children(_parent_id)))
+
+            if _parent_id in self.DUT.dicHardware and _assemblies:
+                _parent = self.DUT.dicHardware[_parent_id]
+                self.assertEqual(_parent.dicAssemblies[_parent_id],
+                                 _assemblies)
+
     @attr(all=True, integration=True)
     def test2_add_hardware_assembly(self):
         """
@@ -0,0 +1,214 @@
+#!/usr/bin/env python -O
+"""
+This is the test class for testing the bootstrap bounds algorithms.
+"""
+
+# -*- coding: utf-8 -*-
+#
+#       tests.statistics.TestBootstrap.py is part of The RTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+#    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#    "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#    LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+#    PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER
+#    OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#    EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#    PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#    PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#    LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#    NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#    SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+from os.path import dirname
+
+sys.path.insert(0, dirname(dirname(dirname(__file__))) + "/rtk", )
+
+import unittest
+from nose.plugins.attrib import attr
+import numpy as np
+
+from analyses.statistics.Bootstrap import bootstrap_crow_amsaa, \
+                                          bootstrap_kaplan_meier_mean, \
+                                          bootstrap_lognormal, \
+                                          bootstrap_mcf, \
+                                          bootstrap_weibull
+
+__author__ = 'Andrew Rowland'
+__email__ = 'andrew.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2015 Andrew "Weibullguy" Rowland'
+
+
+class TestBootstrap(unittest.TestCase):
+    """
+    Class for testing the bootstrap bounds functions.
+    """
+
+    def setUp(self):
+        """
+        Method to setup the test fixture for the bootstrap bounds functions.
+        """
+
+        # Data set of 200 Weibull(eta=100.0, beta=1.5) times with 20% of the
+        # records marked as right censored.
+        _random = np.random.RandomState(0)
+        _times = _random.weibull(1.5, 200) * 100.0
+        _status = np.where(_random.rand(200) < 0.2, 2.0, 1.0)
+        self.WEIBULL = np.column_stack((np.zeros(200), _times, np.ones(200),
+                                        _status, _times))
+
+        # Data set of 100 LogNormal(mu=3.5, sigma=0.8) times with 20% of the
+        # records marked as right censored.
+        _times = _random.lognormal(3.5, 0.8, 100)
+        _status = np.where(_random.rand(100) < 0.2, 2.0, 1.0)
+        self.LOGNORMAL = np.column_stack((np.zeros(100), _times,
+                                          np.ones(100), _status, _times))
+
+        # Data set of exact failure times from MIL-HDBK-189C.
+        self.FAIL_TIMES = [4.3, 4.4, 10.2, 23.5, 23.8, 23.8, 51.4, 61.9, 76.2,
+                           91.5, 95.8, 113.4, 157.0, 166.0, 215.0, 256.6,
+                           299.9]
+
+    @attr(all=True, unit=True)
+    def test01_bootstrap_weibull(self):
+        """
+        (TestBootstrap) bootstrap_weibull should return bounds that bracket the Weibull MLE
+        """
+
+        (_lower,
+         _point,
+         _upper) = bootstrap_weibull(self.WEIBULL, 0.0, 1000000.0,
+                                     n_resamples=200, conf=0.90, seed=1,
+                                     workers=1)
+
+        self.assertEqual(_point.shape, (2, ))
+        self.assertTrue(np.all(_lower < _point))
+        self.assertTrue(np.all(_point < _upper))
+        self.assertAlmostEqual(_point[0], 115.8879960, places=4)
+        self.assertAlmostEqual(_point[1], 1.5045632, places=6)
+
+        # The same seed gives the same bounds with any number of workers.
+        (_lower2,
+         _point2,
+         _upper2) = bootstrap_weibull(self.WEIBULL, 0.0, 1000000.0,
+                                      n_resamples=200, conf=0.90, seed=1,
+                                      workers=2)
+        np.testing.assert_allclose(_lower, _lower2)
+        np.testing.assert_allclose(_upper, _upper2)
+
+    @attr(all=True, unit=True)
+    def test01a_bootstrap_weibull_bca(self):
+        """
+        (TestBootstrap) bootstrap_weibull should return BCa bounds that bracket the Weibull MLE
+        """
+
+        (_lower,
+         _point,
+         _upper) = bootstrap_weibull(self.WEIBULL, 0.0, 1000000.0,
+                                     n_resamples=200, conf=0.90,
+                                     method='bca', seed=1, workers=1)
+
+        self.assertTrue(np.all(_lower < _point))
+        self.assertTrue(np.all(_point < _upper))
+
+    @attr(all=True, unit=True)
+    def test02_bootstrap_mcf(self):
+        """
+        (TestBootstrap) bootstrap_mcf should return bounds on the MCF at each failure time
+        """
+
+        _data = {1: [5.0, 8.0, 12.0, '15+'], 2: [4.0, 10.0, '12+'],
+                 3: [2.0, 6.0, 7.0, 13.0, '20+'], 4: [9.0, '14+']}
+
+        (_times,
+         _lower,
+         _point,
+         _upper) = bootstrap_mcf(_data, n_resamples=500, seed=1, workers=1)
+
+        np.testing.assert_array_equal(_times, [2.0, 4.0, 5.0, 6.0, 7.0, 8.0,
+                                               9.0, 10.0, 12.0, 13.0])
+        np.testing.assert_allclose(_point, [0.25, 0.5, 0.75, 1.0, 1.25, 1.5,
+                                            1.75, 2.0, 2.25, 2.5833333],
+                                   rtol=1.0E-6)
+        self.assertTrue(np.all(_lower <= _point))
+        self.assertTrue(np.all(_point <= _upper))
+
+    @attr(all=True, unit=True)
+    def test03_bootstrap_crow_amsaa(self):
+        """
+        (TestBootstrap) bootstrap_crow_amsaa should return bounds that bracket the Crow-AMSAA estimates
+        """
+
+        (_lower,
+         _point,
+         _upper) = bootstrap_crow_amsaa([1] * 17, self.FAIL_TIMES, 300.0,
+                                        n_resamples=500, seed=1, workers=1)
+
+        self.assertAlmostEqual(_point[0], 0.6146908)
+        self.assertAlmostEqual(_point[1], 0.5820435)
+        self.assertTrue(np.all(_lower < _point))
+        self.assertTrue(np.all(_point < _upper))
+
+    @attr(all=True, unit=True)
+    def test04_bootstrap_lognormal(self):
+        """
+        (TestBootstrap) bootstrap_lognormal should return bounds that bracket the LogNormal MLE
+        """
+
+        (_lower,
+         _point,
+         _upper) = bootstrap_lognormal(self.LOGNORMAL, 0.0, 1000000.0,
+                                       n_resamples=200, conf=0.90, seed=1,
+                                       workers=1)
+
+        self.assertEqual(_point.shape, (2, ))
+        self.assertAlmostEqual(_point[0], 3.7534201)
+        self.assertAlmostEqual(_point[1], 0.8540226)
+        self.assertTrue(np.all(_lower < _point))
+        self.assertTrue(np.all(_point < _upper))
+
+    @attr(all=True, unit=True)
+    def test05_bootstrap_kaplan_meier_mean(self):
+        """
+        (TestBootstrap) bootstrap_kaplan_meier_mean should return bounds that bracket the Kaplan-Meier MTBF
+        """
+
+        # Data is from Lee and Wang, page 69, example 4.2.
+        _data = [('', 3.0, 3.0, 0.0, u'Event', 1),
+                 ('', 4.0, 4.0, 0.0, u'Right Censored', 1),
+                 ('', 5.7, 5.7, 0.0, u'Right Censored', 1),
+                 ('', 6.5, 6.5, 0.0, u'Event', 1),
+                 ('', 6.5, 6.5, 0.0, u'Event', 1),
+                 ('', 8.4, 8.4, 0.0, u'Right Censored', 1),
+                 ('', 10.0, 10.0, 0.0, u'Event', 1),
+                 ('', 10.0, 10.0, 0.0, u'Right Censored', 1),
+                 ('', 12.0, 12.0, 0.0, u'Event', 1),
+                 ('', 15.0, 15.0, 0.0, u'Event', 1)]
+
+        (_lower,
+         _point,
+         _upper) = bootstrap_kaplan_meier_mean(_data, 0.0, 100000.0,
+                                               n_resamples=500, conf=0.90,
+                                               seed=1, workers=1)
+
+        self.assertAlmostEqual(_point[0], 10.0875)
+        self.assertTrue(_lower[0] < _point[0])
+        self.assertTrue(_point[0] < _upper[0])
@@ -43,6 +43,7 @@ sys.path.insert(0, dirname(dirname(dirname(__file__))) + "/rtk", )
 
 import unittest
 from nose.plugins.attrib import attr
+import numpy as np
 
 from analyses.statistics.growth.CrowAMSAA import calculate_average_mtbf, \
                                                  calculate_cramer_vonmises, \
@@ -55,7 +56,8 @@ from analyses.statistics.growth.CrowAMSAA import calculate_average_mtbf, \
                                                  calculate_n_failures, \
                                                  calculate_t1, \
                                                  calculate_total_time, \
-                                                 cramer_vonmises_critical_value
+                                                 cramer_vonmises_critical_value, \
+                                                 simulate_crow_amsaa
 
 __author__ = 'Andrew Rowland'
 __email__ = 'andrew.rowland@reliaqual.com'
@@ -539,3 +541,38 @@ class TestCrowAMSAA(unittest.TestCase):
         _chi_square = calculate_crow_amsaa_chi_square(n_failures, fail_times,
                                                       beta, ttt)
         self.assertAlmostEqual(_chi_square, 15.3965744)
+
+    @attr(all=True, unit=True)
+    def test15_simulate_crow_amsaa(self):
+        """
+        (TestCrowAMSAA) simulate_crow_amsaa should return the probability of demonstrating the goal MTBF and percentile bands for each phase
+        """
+
+        # The planned growth curve has a growth rate of 0.23 and an average
+        # MTBF of 50.0 over the first 1000 hours.
+        _beta = 0.77
+        _alpha = 1000.0**(1.0 - _beta) / 50.0
+        _times = [1000.0, 1500.0, 2500.0, 2000.0, 3000.0]
+
+        (_probability,
+         _mtbf_bands,
+         _beta_bands) = simulate_crow_amsaa(_alpha, _beta, _times, 110.0,
+                                            n_histories=5000, seed=1,
+                                            workers=1)
+        self.assertEqual(_probability.shape, (5, ))
+        self.assertEqual(_mtbf_bands.shape, (5, 3))
+        self.assertTrue(np.all(np.diff(_probability) > 0.0))
+
+        # The median estimates follow the planned curve, which reaches the
+        # goal MTBF at the end of the test.
+        self.assertAlmostEqual(_probability[-1], 0.5, delta=0.05)
+        self.assertAlmostEqual(_mtbf_bands[-1][1], 110.3, delta=2.0)
+        self.assertAlmostEqual(_beta_bands[-1][1], 0.77, delta=0.01)
+
+        # The same seed gives the same results.
+        (_probability2,
+         _mtbf_bands2,
+         __) = simulate_crow_amsaa(_alpha, _beta, _times, 110.0,
+                                   n_histories=5000, seed=1, workers=1)
+        np.testing.assert_array_equal(_probability, _probability2)
+        np.testing.assert_array_equal(_mtbf_bands, _mtbf_bands2)
@@ -48,6 +48,8 @@ import numpy as np
 
 from analyses.statistics.Distributions import Exponential, Gaussian, \
                                               LogNormal, Weibull, \
+                                              format_data_set, \
+                                              split_data_set, \
                                               time_between_failures
 from survival.Record import Model as Record
 
@@ -222,6 +224,37 @@ class TestExponentialDistribution(unittest.TestCase):
         _part_deriv = self.DUT.partial_derivatives(0.0034, _data)
         self.assertAlmostEqual(_part_deriv, -115.5080488)
 
+        # The pre-split data set should give the same answer.
+        _part_deriv = self.DUT.partial_derivatives(0.0034,
+                                                   split_data_set(_data))
+        self.assertAlmostEqual(_part_deriv, -115.5080488)
+
+    @attr(all=True, unit=True)
+    def test02c_observed_information(self):
+        """
+        (TestExponentialDistribution) observed_information should return the negative of the derivative of the partial derivative on success.
+        """
+
+        _data = np.array([[0.0, 24.0, 24, 3], [24.0, 39.0, 1, 3],
+                          [24.0, 113.0, 4, 3], [28.0, 88.0, 1, 3],
+                          [39.0, 113.0, 2, 3], [57.0, 113.0, 1, 3],
+                          [0.0, 39.0, 2, 3], [24.0, 57.0, 10, 3],
+                          [24.0, 28.0, 4, 3], [24.0, 88.0, 3, 3],
+                          [28.0, 39.0, 4, 3], [39.0, 57.0, 3, 3],
+                          [57.0, 88.0, 5, 3], [88.0, 113.0, 1, 3],
+                          [0.0, 88.0, 34, 2], [0.0, 24.0, 61, 2],
+                          [0.0, 28.0, 8, 2], [0.0, 39.0, 15, 2],
+                          [0.0, 57.0, 22, 2], [0.0, 113.0, 92, 2]])
+
+        _info = self.DUT.observed_information(0.0034, _data)
+        self.assertAlmostEqual(_info, 5614808.0009207)
+
+        _step = 1.0E-7
+        _numeric = (self.DUT.partial_derivatives(0.0034 - _step, _data) -
+                    self.DUT.partial_derivatives(0.0034 + _step, _data)) / \
+                   (2.0 * _step)
+        self.assertAlmostEqual(_info / _numeric, 1.0)
+
     @attr(all=True, unit=True)
     def test03_maximum_likelihood_estimate_exact_times(self):
         """
@@ -551,6 +584,32 @@ class TestGaussianDistribution(unittest.TestCase):
         _part_deriv = self.DUT.partial_derivatives([100.0, 30.0], self.AIDS)
         self.assertAlmostEqual(_part_deriv, -0.7378606)
 
+    @attr(all=True, unit=True)
+    def test02c_observed_information(self):
+        """
+        (TestGaussianDistribution) observed_information should return the negative of the derivatives of the score on success.
+        """
+
+        _pars = [100.0, 30.0]
+
+        _info = self.DUT.observed_information(_pars, self.AIDS)
+        np.testing.assert_allclose(_info, [[0.1705191765, -0.1226087870],
+                                           [-0.1226087870, 0.9853159694]],
+                                   rtol=1.0E-7, atol=1.0E-9)
+
+        _numeric = np.zeros((2, 2))
+        for _index in range(2):
+            _step = 1.0E-6 * _pars[_index]
+            _lower = list(_pars)
+            _upper = list(_pars)
+            _lower[_index] -= _step
+            _upper[_index] += _step
+            _numeric[:, _index] = \
+                (np.array(self.DUT.score(_lower, self.AIDS)) -
+                 np.array(self.DUT.score(_upper, self.AIDS))) / \
+                (2.0 * _step)
+        np.testing.assert_allclose(_info, _numeric, rtol=1.0E-6, atol=1.0E-6)
+
     @attr(all=True, unit=True)
     def test03_maximum_likelihood_estimate_exact_times(self):
         """
@@ -851,6 +910,32 @@ class TestLogNormalDistribution(unittest.TestCase):
                                                    self.ALPHA)
         self.assertAlmostEqual(_part_deriv, -33687.1470588)
 
+    @attr(all=True, unit=True)
+    def test02c_observed_information(self):
+        """
+        (TestLogNormalDistribution) observed_information should return the negative of the derivatives of the score on success.
+        """
+
+        _pars = [3.5158554, 0.8491908]
+
+        _info = self.DUT.observed_information(_pars, self.LOGN_TEST)
+        np.testing.assert_allclose(_info, [[19.4141095, -3.170947959E-07],
+                                           [22.8618934, -19.4141101]],
+                                   rtol=1.0E-7, atol=1.0E-9)
+
+        _numeric = np.zeros((2, 2))
+        for _index in range(2):
+            _step = 1.0E-6 * _pars[_index]
+            _lower = list(_pars)
+            _upper = list(_pars)
+            _lower[_index] -= _step
+            _upper[_index] += _step
+            _numeric[:, _index] = \
+                (np.array(self.DUT.score(_lower, self.LOGN_TEST)) -
+                 np.array(self.DUT.score(_upper, self.LOGN_TEST))) / \
+                (2.0 * _step)
+        np.testing.assert_allclose(_info, _numeric, rtol=1.0E-6, atol=1.0E-6)
+
     @attr(all=True, unit=True)
     def test03_maximum_likelihood_estimate_exact_times(self):
         """
@@ -1222,6 +1307,32 @@ class TestWeibullDistribution(unittest.TestCase):
         _part_deriv = self.DUT.partial_derivatives([1.0, 1.0], self.AIDS)
         self.assertAlmostEqual(_part_deriv, -1452769512.6979916)
 
+    @attr(all=True, unit=True)
+    def test02c_observed_information(self):
+        """
+        (TestWeibullDistribution) observed_information should return the negative of the derivatives of the score on success.
+        """
+
+        _pars = [150.0, 1.5]
+
+        _info = self.DUT.observed_information(_pars, self.AIDS)
+        np.testing.assert_allclose(_info, [[0.0117310776, 0.2839301378],
+                                           [0.5108603750, 127.3248479]],
+                                   rtol=1.0E-7, atol=1.0E-9)
+
+        _numeric = np.zeros((2, 2))
+        for _index in range(2):
+            _step = 1.0E-6 * _pars[_index]
+            _lower = list(_pars)
+            _upper = list(_pars)
+            _lower[_index] -= _step
+            _upper[_index] += _step
+            _numeric[:, _index] = \
+                (np.array(self.DUT.score(_lower, self.AIDS)) -
+                 np.array(self.DUT.score(_upper, self.AIDS))) / \
+                (2.0 * _step)
+        np.testing.assert_allclose(_info, _numeric, rtol=1.0E-6, atol=1.0E-6)
+
     @attr(all=True, unit=True)
     def test03_maximum_likelihood_estimate_exact_times(self):
         """
@@ -1234,7 +1345,7 @@ class TestWeibullDistribution(unittest.TestCase):
         # Check the mean for exact failure time data.
         self.assertAlmostEqual(_fit[0][0], 73.5260622)
         self.assertAlmostEqual(_fit[0][1], 1.9326764)
-        self.assertAlmostEqual(_fit[1][0], 241.3390782)
+        self.assertAlmostEqual(_fit[1][0], 241.3390945)
         self.assertAlmostEqual(_fit[1][1], 1.166965e-02)
         self.assertAlmostEqual(_fit[1][2], 1.6781965)
         self.assertAlmostEqual(_fit[2][0], -29.5849216)
@@ -1513,3 +1624,36 @@ class TestTBF(unittest.TestCase):
         # Test interval censored records.
         self.assertEqual(time_between_failures(self.record3, self.record4),
                          22.0)
+
+
+class TestFormatDataSet(unittest.TestCase):
+    """
+    Class for testing the function to format survival data sets.
+    """
+
+    @attr(all=True, unit=True)
+    def test01_format_data_set(self):
+        """
+        (TestFormatDataSet) format_data_set should return one record for each failure or suspension in the quantity of each record
+        """
+
+        _data = [('', 10.0, 10.0, 10.0, u'Event', 3),
+                 ('', 5.0, 5.0, 5.0, u'Event', 1),
+                 ('', 20.0, 20.0, 10.0, u'Right Censored', 2),
+                 ('', 12.0, 15.0, 5.0, u'Interval Censored', 1),
+                 ('', 40.0, 40.0, 20.0, u'Event', 1)]
+
+        (_data, _n_records, _n_suspensions,
+         _n_failures) = format_data_set(_data, 0.0, 30.0)
+
+        self.assertTrue(np.array_equal(_data,
+                                       [[5.0, 5.0, 1.0, 1.0, 5.0],
+                                        [10.0, 10.0, 1.0, 1.0, 10.0],
+                                        [10.0, 10.0, 1.0, 1.0, 10.0],
+                                        [10.0, 10.0, 1.0, 1.0, 10.0],
+                                        [12.0, 15.0, 1.0, 3.0, 5.0],
+                                        [20.0, np.inf, 1.0, 2.0, 10.0],
+                                        [20.0, np.inf, 1.0, 2.0, 10.0]]))
+        self.assertEqual(_n_records, 7)
+        self.assertEqual(_n_suspensions, 2)
+        self.assertEqual(_n_failures, 5)
@@ -479,6 +479,44 @@ class TestGrowthModel(unittest.TestCase):
         self.assertAlmostEqual(_ideal[7000], 0.009843469)
         self.assertAlmostEqual(_ideal[9999], 0.009068401)
 
+    @attr(all=True, unit=True)
+    def test13g_calculate_idealized_values_phase_grid(self):
+        """
+        (TestGrowth) calculate_idealized_values should return idealized values at the test phase breakpoints and reuse them when the inputs are unchanged
+        """
+
+        self.DUT.lst_i_mtbfa = [50.0, 73.0, 87.0, 98.0, 106.0]
+        self.DUT.lst_i_mtbfi = [45.0, 64.9350649, 80.1688181, 94.0247917,
+                                101.5902031]
+        self.DUT.lst_i_mtbff = [55.0, 80.1688181, 94.0247917, 101.5902031,
+                                110.0]
+        self.DUT.lst_i_n_failures = [20.0, 20.5, 28.6, 20.4, 28.3]
+
+        self.DUT.lst_p_test_time = [1000.0, 1500.0, 2500.0, 2000.0, 3000.0]
+        self.DUT.lst_p_growth_rate = [0.23, 0.23, 0.23, 0.23, 0.23]
+
+        self.DUT.avg_growth = 0.23
+        self.DUT.ttt = 10000.0
+        self.DUT.mtbfg = 110.0
+
+        self.DUT.n_phases = 5
+
+        np.testing.assert_array_equal(self.DUT.get_time_grid(phases=True),
+                                      [0.0, 999.0, 1000.0, 2499.0, 2500.0,
+                                       4999.0, 5000.0, 6999.0, 7000.0,
+                                       9999.0])
+
+        _ideal = self.DUT.calculate_idealized_growth_curve(phases=True)
+        self.assertEqual(_ideal[0], 50.0)
+        np.testing.assert_equal(_ideal[2], np.nan)
+        self.assertAlmostEqual(_ideal[4], 80.1688181)
+        self.assertAlmostEqual(_ideal[9], 110.2730254)
+
+        _cached = self.DUT._dic_curves['ideal'][1]
+        self.DUT.tr = 100.0
+        self.DUT.calculate_idealized_growth_curve(phases=True)
+        self.assertTrue(self.DUT._dic_curves['ideal'][1] is _cached)
+
     @attr(all=True, unit=True)
     def test14_calculate_planned_growth_curve_no_mtbfa(self):
         """
@@ -625,6 +663,25 @@ class TestGrowthModel(unittest.TestCase):
         self.assertAlmostEqual(_plan[7000], 0.009302326)
         np.testing.assert_equal(_plan[9999], np.nan)
 
+    @attr(all=True, unit=True)
+    def test15b_create_planned_values_log_grid(self):
+        """
+        (TestGrowth) create_planned_values should return a list of MTBF values at logarithmically spaced times
+        """
+
+        self.DUT.lst_p_test_time = [1000.0, 1500.0, 2500.0, 2000.0, 3000.0]
+        self.DUT.lst_p_mtbfa = [50.0, 66.0, 81.5, 95.0, 107.5]
+
+        self.DUT.ttt = 10000.0
+        self.DUT.n_phases = 5
+
+        _times = self.DUT.get_time_grid(50, log=True)
+        _plan = self.DUT.create_planned_values(n_points=50, log=True)
+        self.assertEqual(len(_plan), len(_times))
+        np.testing.assert_equal(_plan[_times == 999.0], np.nan)
+        self.assertEqual(_plan[_times == 1000.0], 66.0)
+        self.assertEqual(_plan[_times == 1.0], 50.0)
+
     @attr(all=True, unit=True)
     def test16_assess_plan_feasibility(self):
         """
@@ -800,6 +857,28 @@ class TestGrowthModel(unittest.TestCase):
                          [19.17808219178082, 35.0, 56.81818181818182,
                           57.37704918032787, 0.0])
 
+    @attr(all=True, unit=True)
+    def test16e_simulate_plan_feasibility(self):
+        """
+        (TestGrowth) simulate_plan_feasibility should return the probability of demonstrating the goal MTBF for each test phase
+        """
+
+        self.DUT.lst_i_mtbfa = [50.0, 73.0, 87.0, 98.0, 106.0]
+        self.DUT.lst_p_test_time = [1000.0, 1500.0, 2500.0, 2000.0, 3000.0]
+
+        self.DUT.avg_growth = 0.23
+        self.DUT.mtbfg = 110.0
+
+        self.DUT.n_phases = 5
+
+        (_probability,
+         _mtbf_bands,
+         _beta_bands) = self.DUT.simulate_plan_feasibility(n_histories=2000,
+                                                           seed=1, workers=1)
+        self.assertEqual(len(_probability), 5)
+        self.assertAlmostEqual(_probability[-1], 0.5, delta=0.05)
+        self.assertTrue(np.all(_mtbf_bands[:, 0] < _mtbf_bands[:, 2]))
+
     @attr(all=True, unit=True)
     def test18_estimate_crow_amsaa_exact(self):
         """
@@ -74,4 +74,6 @@ class TestBoMController(unittest.TestCase):
         self.assertTrue(isinstance(self.DUT, BoM))
         self.assertEqual(self.DUT._last_id, None)
         self.assertEqual(self.DUT.dicHardware, {})
+        self.assertEqual(self.DUT.dicChildren, {})
+        self.assertEqual(self.DUT.get_children(0), [])
         self.assertEqual(self.DUT.dao, None)
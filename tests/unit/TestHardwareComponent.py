@@ -45,7 +45,8 @@ import unittest
 from nose.plugins.attrib import attr
 
 import dao.DAO as _dao
-from hardware.component.Component import Model, Component
+from hardware.component.Component import Model, Component, \
+    compile_equation, evaluate_equation
 
 __author__ = 'Andrew Rowland'
 __email__ = 'andrew.rowland@reliaqual.com'
@@ -103,6 +104,39 @@ class TestComponentModel(unittest.TestCase):
         self.assertEqual(self.DUT.thermal_resistance, 0.0)
         self.assertEqual(self.DUT.reference_temperature, 30.0)
 
+    @attr(all=True, unit=True)
+    def test_compile_equation(self):
+        """
+        (TestComponent) compile_equation should compile each equation only once
+        """
+
+        (_function, _symbols) = compile_equation('(C1 * piT + C2 * piE) * piQ')
+
+        self.assertEqual(_symbols, ('C1', 'C2', 'piE', 'piQ', 'piT'))
+        self.assertEqual(_function(1.0, 2.0, 3.0, 4.0, 5.0), 44.0)
+        self.assertTrue(compile_equation('(C1 * piT + C2 * piE) * piQ')[0] is
+                        _function)
+
+    @attr(all=True, unit=True)
+    def test_evaluate_equation(self):
+        """
+        (TestComponent) evaluate_equation should return the value of the equation
+        """
+
+        self.assertAlmostEqual(evaluate_equation('lambdab * piQ',
+                                                 {'equation': 'lambdab * piQ',
+                                                  'lambdab': 0.0037,
+                                                  'piQ': 3.0}), 0.0111)
+
+    @attr(all=True, unit=True)
+    def test_evaluate_equation_unknown_symbol(self):
+        """
+        (TestComponent) evaluate_equation should raise a NameError when a symbol is missing
+        """
+
+        self.assertRaises(NameError, evaluate_equation, 'lambdab * piQ * piE',
+                          {'lambdab': 0.0037, 'piQ': 3.0})
+
     @attr(all=True, unit=True)
     def test_set_attributes(self):
         """
@@ -120,6 +120,35 @@ class TestKaplanMeier(unittest.TestCase):
 
         self.assertTrue(np.allclose(_km[1], [1, 4, 5, 7, 9, 10]))
 
+    @attr(all=True, unit=True)
+    def test_kaplan_meier_quantity(self):
+        """
+        (TestKaplanMeier) kaplan_meier should return the same results for a record with a quantity as for the same number of single records
+        """
+
+        _data = [('', 3.0, 3.0, 0.0, u'Event', 1),
+                 ('', 4.0, 4.0, 0.0, u'Right Censored', 1),
+                 ('', 5.7, 5.7, 0.0, u'Right Censored', 1),
+                 ('', 6.5, 6.5, 0.0, u'Event', 2),
+                 ('', 8.4, 8.4, 0.0, u'Right Censored', 1),
+                 ('', 10.0, 10.0, 0.0, u'Event', 1),
+                 ('', 10.0, 10.0, 0.0, u'Right Censored', 1),
+                 ('', 12.0, 12.0, 0.0, u'Event', 1),
+                 ('', 15.0, 15.0, 0.0, u'Event', 1)]
+
+        _km = kaplan_meier(_data, 0.0, 100000.0)
+        self.assertTrue(np.allclose(_km[0],
+                                    [[3.0, 0.71671928, 0.9, 0.96722054],
+                                     [4.0, 0.71671928, 0.9, 0.96722054],
+                                     [5.7, 0.71671928, 0.9, 0.96722054],
+                                     [6.5, 0.41797166, 0.64285714, 0.79948773],
+                                     [8.4, 0.41797166, 0.64285714, 0.79948773],
+                                     [10.0, 0.25976276, 0.48214286, 0.67381139],
+                                     [12.0, 0.06504527, 0.24107143, 0.47680147],
+                                     [15.0, 0.0, 0.0, 0.0]]))
+
+        self.assertTrue(np.allclose(_km[1], [1, 4, 5, 7, 9, 10]))
+
     @attr(all=True, unit=True)
     def test_kaplan_meier_mean(self):
         """
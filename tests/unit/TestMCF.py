@@ -191,6 +191,37 @@ class TestMeanCumulativeFunction(unittest.TestCase):
                              [8., 2., 1.05429046, 1.33333333, 1.6862315],
                              [16., 1., 1.46857718, 1.83333333, 2.28868537]]))
 
+    @attr(all=True, unit=True)
+    def test_mean_cumulative_function_matches_matrices(self):
+        """
+        (TestMCF) mean_cumulative_function should match the estimates calculated from the d and delta matrices
+        """
+
+        _random = np.random.RandomState(19)
+        _data = {}
+        for _system in range(50):
+            _times = sorted(_random.randint(1, 40, _random.randint(0, 6)))
+            _data[_system] = [float(_t) for _t in _times] + \
+                [str(40.0 + _random.randint(0, 10)) + '+']
+
+        _mcf = mean_cumulative_function(_data)
+
+        _times = sorted(set([_t for _value in _data.values()
+                             for _t in _value if isinstance(_t, float)]))
+        _d_matrix = d_matrix(_data, _times)
+        _delta_matrix = delta_matrix(_data, _times)
+        _delta_dot = _delta_matrix.sum(axis=1)
+        _d_dot = _d_matrix.sum(axis=1)
+        _d_bar = _d_dot / _delta_dot
+        _variance = mcf_variance(_delta_matrix, _d_matrix, _delta_dot, _d_bar)
+
+        self.assertTrue(np.allclose(_mcf[:, 0], np.matrix(_times).T))
+        self.assertTrue(np.allclose(_mcf[:, 1], _d_dot))
+        self.assertTrue(np.allclose(_mcf[:, 3], _d_bar.cumsum(axis=0)))
+        self.assertTrue(np.allclose(
+            np.log(_mcf[:, 4] / _mcf[:, 3]),
+            np.sqrt(_variance) * 1.15034938 / _mcf[:, 3]))
+
     @attr(all=True, unit=True)
     def test_mil_handbook(self):
         """
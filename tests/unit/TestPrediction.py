@@ -0,0 +1,133 @@
+#!/usr/bin/env python -O
+# -*- coding: utf-8 -*-
+#
+#       tests.unit.TestPrediction.py is part of The RTK Project
+#
+# All rights reserved.
+
+"""
+This is the test class for testing the vectorized MIL-HDBK-217F hazard rate
+prediction functions.
+"""
+
+import sys
+from os.path import dirname
+
+sys.path.insert(0, dirname(dirname(dirname(__file__))) + "/rtk", )
+
+import unittest
+from nose.plugins.attrib import attr
+
+from copy import deepcopy
+
+import Configuration
+from analyses.prediction.Reliability import calculate_parts
+from hardware.component.integrated_circuit.Logic import Logic
+from hardware.component.resistor.fixed.Film import Film
+
+__author__ = 'Andrew Rowland'
+__email__ = 'andrew.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2017 Andrew "Weibullguy" Rowland'
+
+
+def _make_part(part, **kwargs):
+    """
+    Function to set the operating and rated values common to all components.
+    """
+
+    part.add_adj_factor = 0.0
+    part.duty_cycle = 100.0
+    part.mult_adj_factor = 1.0
+    part.quantity = 1
+    part.operating_current = 0.1
+    part.operating_voltage = 5.0
+    part.operating_power = 0.05
+    part.rated_current = 0.5
+    part.rated_voltage = 5.0
+    part.rated_power = 0.25
+    part.temperature_active = 30.0
+    for _key, _value in kwargs.items():
+        setattr(part, _key, _value)
+
+    return part
+
+
+class TestPrediction(unittest.TestCase):
+    """
+    Class for testing the vectorized hazard rate prediction functions.
+    """
+
+    def setUp(self):
+        """
+        Setup the test fixture for the hazard rate prediction functions.
+        """
+
+        Configuration.FRMULT = 1000000.0
+
+        self._lst_parts = []
+        for _type in [1, 2]:
+            for _environment in [1, 2, 5, 14]:
+                for _n_gates in [50, 206, 2500, 8000, 25000, 45000]:
+                    self._lst_parts.append(
+                        _make_part(Logic(), hazard_rate_type=_type,
+                                   environment_active=_environment,
+                                   quality=2, technology=1 + _n_gates % 2,
+                                   family=3, package=_environment % 7,
+                                   n_gates=_n_gates, n_pins=18,
+                                   years_production=1.5,
+                                   case_temperature=35.0,
+                                   thermal_resistance=60.0))
+                for _specification in [1, 2, 3, 4]:
+                    for _resistance in [1.0E3, 1.0E5, 5.0E6, 1.0E7]:
+                        self._lst_parts.append(
+                            _make_part(Film(), hazard_rate_type=_type,
+                                       environment_active=_environment,
+                                       quality=_specification + 1,
+                                       specification=_specification,
+                                       resistance=_resistance,
+                                       quantity=_specification))
+
+        # A Logic IC outside the gate count ranges has to be calculated by
+        # the part itself.
+        self._lst_parts.append(
+            _make_part(Logic(), hazard_rate_type=2, environment_active=2,
+                       quality=1, technology=1, family=2, package=3,
+                       n_gates=0, n_pins=18, years_production=1.5,
+                       case_temperature=35.0, thermal_resistance=60.0))
+
+    @attr(all=True, unit=True)
+    def test00_calculate_parts(self):
+        """
+        (TestPrediction) calculate_parts should return False on success and match calculate_part() for every component
+        """
+
+        _lst_expected = deepcopy(self._lst_parts)
+        for _part in _lst_expected:
+            _part.calculate_part()
+
+        self.assertFalse(calculate_parts(self._lst_parts))
+
+        for _part, _expected in zip(self._lst_parts, _lst_expected):
+            self.assertAlmostEqual(
+                _part.hazard_rate_active, _expected.hazard_rate_active,
+                delta=1.0E-9 * abs(_expected.hazard_rate_active))
+            self.assertEqual(sorted(_part.hazard_rate_model.keys()),
+                             sorted(_expected.hazard_rate_model.keys()))
+            for _key, _value in _expected.hazard_rate_model.items():
+                if _key == 'equation':
+                    self.assertEqual(_part.hazard_rate_model[_key], _value)
+                else:
+                    self.assertAlmostEqual(_part.hazard_rate_model[_key],
+                                           _value, delta=1.0E-9 * abs(_value))
+            self.assertEqual(_part.overstress, _expected.overstress)
+            self.assertAlmostEqual(_part.power_ratio, _expected.power_ratio,
+                                   delta=1.0E-9 * abs(_expected.power_ratio))
+
+    @attr(all=True, unit=True)
+    def test01_calculate_parts_empty(self):
+        """
+        (TestPrediction) calculate_parts should return False when passed an empty list
+        """
+
+        self.assertFalse(calculate_parts([]))
@@ -214,6 +214,29 @@ class TestRegression(unittest.TestCase):
         self.assertTrue(np.array_equal(_adj_rank, [-1, 1.125, -1, 2.4375, 3.75,
                                                    5.0625, 6.375, -1]))
 
+    @attr(all=True, unit=True)
+    def test01b_adjusted_rank_large_data_set(self):
+        """
+        (TestRegression) adjusted_rank should return the same ranks as the record-by-record calculation for a large suspended data set
+        """
+
+        _status = np.where(np.arange(5000) % 7 < 2, 2, 1)
+        _data = np.column_stack((np.zeros(5000), np.arange(1.0, 5001.0),
+                                 np.ones(5000), _status))
+
+        _rank = []
+        _prev_rank = 0.0
+        for _index, _record in enumerate(_data):
+            if _record[3] != 1:
+                _rank.append(-1)
+            else:
+                _prev_rank = ((5000 - _index) * _prev_rank + 5001.0) / \
+                             (5001 - _index)
+                _rank.append(_prev_rank)
+
+        _adj_rank = adjusted_rank(_data)
+        np.testing.assert_allclose(_adj_rank, _rank, rtol=1.0e-12)
+
     @attr(all=True, unit=True)
     def test02_bernards_rank_exact_data(self):
         """
@@ -247,10 +270,14 @@ class TestRegression(unittest.TestCase):
                           [0.0, 96.0, 1, 1], [0.0, 100.0, 1, 2]])
 
         _bernards = bernard_ranks(_data)
-        np.testing.assert_array_almost_equal(_bernards, [np.nan, 0.202381,
-                                                         np.nan, 0.440476,
-                                                         0.559524, 0.678571,
-                                                         0.797619, np.nan])
+        np.testing.assert_array_almost_equal(_bernards, [np.nan, 0.098214,
+                                                         np.nan, 0.254464,
+                                                         0.410714, 0.566964,
+                                                         0.723214, np.nan])
+
+        # The ranks don't depend on how many columns the data set has.
+        np.testing.assert_array_equal(
+            bernard_ranks(np.column_stack((_data, _data[:, 1]))), _bernards)
 
     @attr(all=True, unit=True)
     def test02b_bernards_rank_interval_censored(self):
@@ -289,6 +316,24 @@ class TestRegression(unittest.TestCase):
 
         return False
 
+    @attr(all=True, unit=True)
+    def test03a_exponential_regression_fit_suspended(self):
+        """
+        (TestRegression) regression should return a numpy array of rank regression on y (RRY) fit of the exponential parameters with suspended data
+        """
+
+        _data = np.array([[0.0, 10.0, 1, 2], [0.0, 30.0, 1, 1],
+                          [0.0, 45.0, 1, 3], [0.0, 49.0, 1, 1],
+                          [0.0, 82.0, 1, 1], [0.0, 90.0, 1, 1],
+                          [0.0, 96.0, 1, 1], [0.0, 100.0, 1, 2]])
+
+        _fit = regression(_data, 0.0, 10000000.0, dist='exponential')
+
+        self.assertAlmostEqual(_fit[0][0], 0.0147302)
+        self.assertAlmostEqual(_fit[3], -0.9016890)
+        self.assertEqual(_fit[4], 2)
+        self.assertEqual(_fit[5], 6)
+
     @attr(all=True, unit=True)
     def test04_lognormal_regression_fit(self):
         """
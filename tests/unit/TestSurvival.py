@@ -508,6 +508,58 @@ class TestSurvivalModel(unittest.TestCase):
         self.assertAlmostEqual(self.DUT.shape[1], 33.6440913)
         self.assertAlmostEqual(self.DUT.shape[2], 33.7092415)
 
+    @attr(all=True, unit=True)
+    def test07_auto_fit(self):
+        """
+        (TestSurvival) auto_fit should return False on success and use the best fit
+        """
+
+        self.DUT.start_time = 0.0
+        self.DUT.rel_time = 1000.0
+        self.DUT.n_rel_points = 10
+        self.DUT.confidence = 0.75
+        self.DUT.confidence_type = 3
+        self.DUT.confidence_method = 3
+
+        for _index, _time in enumerate([5.0, 10.0, 15.0, 20.0, 25.0, 30.0,
+                                        35.0, 40.0, 50.0, 60.0, 70.0, 80.0,
+                                        90.0, 100.0]):
+            _record = Record()
+            _record.right_interval = _time
+            _record.interarrival_time = _time
+            _record.status = 1
+            _record.n_failures = 1
+            self.DUT.dicRecords[_index] = _record
+
+        self.assertFalse(self.DUT.auto_fit(criterion='aic', fit_method=1))
+
+        _ranking = self.DUT.rank_fits(criterion='aic', fit_method=1)
+        _aic = [_results[2][1] for __, _results in _ranking]
+        self.assertEqual(len(_ranking), 4)
+        self.assertEqual(_aic, sorted(_aic))
+        self.assertEqual((self.DUT.distribution_id, self.DUT.fit_method),
+                         _ranking[0][0])
+        self.assertEqual(self.DUT.aic, _aic[0])
+
+        # Ranking by another criterion should use the cached fits.
+        self.assertFalse(self.DUT.auto_fit(criterion='bic'))
+        self.assertEqual(len(self.DUT._dic_fits), 1)
+        _bic = [_results[2][2] for __, _results in self.DUT.rank_fits('bic')]
+        self.assertEqual(_bic, sorted(_bic))
+
+        # The MLE and regression candidates should never be ranked together.
+        self.assertEqual(self.DUT.fit_method, 1)
+        self.assertEqual(set([_key[1] for _key, __ in
+                              self.DUT.rank_fits('bic')]), set([1]))
+        self.assertEqual(set([_key[1] for _key, __ in
+                              self.DUT.rank_fits('bic', fit_method=2)]),
+                         set([2]))
+
+        # Changing the window should fit the data set again.
+        self.DUT.rel_time = 50.0
+        self.assertFalse(self.DUT.auto_fit())
+        self.assertEqual(len(self.DUT._dic_fits), 2)
+
 
 class TestSurvivalController(unittest.TestCase):
     """
@@ -531,3 +583,50 @@ class TestSurvivalController(unittest.TestCase):
         self.assertEqual(self.DUT._dao, None)
         self.assertEqual(self.DUT._last_id, None)
         self.assertEqual(self.DUT.dicSurvival, {})
+
+    @attr(all=True, unit=True)
+    def test01_fit_many(self):
+        """
+        (TestSurvival) fit_many should return the fits in the order requested and update the Survival models
+        """
+
+        for _survival_id, _distribution_id in enumerate([5, 6, 2]):
+            _survival = Model()
+            _survival.survival_id = _survival_id
+            _survival.distribution_id = _distribution_id
+            _survival.fit_method = 1
+            _survival.confidence = 0.75
+            _survival.confidence_type = 3
+            _survival.confidence_method = 3
+            _survival.rel_time = 1000.0
+            _survival.n_rel_points = 10
+            for _index, _time in enumerate([5.0, 10.0, 15.0, 20.0, 25.0,
+                                            30.0, 35.0, 40.0, 50.0, 60.0]):
+                _record = Record()
+                _record.right_interval = _time
+                _record.interarrival_time = _time
+                _record.status = 1
+                _record.n_failures = 1
+                _survival.dicRecords[_index] = _record
+            self.DUT.dicSurvival[_survival_id] = _survival
+
+        _results = self.DUT.fit_many([2, 0, 1], distributions=[6, 5],
+                                     workers=2)
+        self.assertEqual(_results.keys(),
+                         [(2, 6), (2, 5), (0, 6), (0, 5), (1, 6), (1, 5)])
+
+        # The Survival models should only be updated with the results for
+        # their own distribution.
+        self.assertEqual(self.DUT.dicSurvival[0].scale[1],
+                         _results[(0, 5)]['scale'][1])
+        self.assertEqual(self.DUT.dicSurvival[1].scale[1],
+                         _results[(1, 6)]['scale'][1])
+        self.assertEqual(self.DUT.dicSurvival[2].scale, [0.0, 0.0, 0.0])
+
+        # Fitting in the worker processes and in this process should give the
+        # same answers.
+        _serial = self.DUT.fit_many([2, 0, 1], distributions=[6, 5],
+                                    workers=1)
+        for _key in _results:
+            self.assertEqual(_results[_key]['scale'], _serial[_key]['scale'])
+            self.assertEqual(_results[_key]['aic'], _serial[_key]['aic'])
@@ -0,0 +1,132 @@
+#!/usr/bin/env python -O
+"""
+This is the test class for testing Turnbull module algorithms
+and models.
+"""
+
+# -*- coding: utf-8 -*-
+#
+#       tests.survival.TestTurnbull.py is part of The RTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2017 Andrew Rowland andrew.rowland <AT> reliaqual <DOT> com
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+#    THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+#    "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+#    LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A
+#    PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER
+#    OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+#    EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+#    PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+#    PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+#    LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+#    NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+#    SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+from os.path import dirname
+
+sys.path.insert(0, dirname(dirname(dirname(__file__))) + "/rtk", )
+
+import unittest
+from nose.plugins.attrib import attr
+import numpy as np
+
+from analyses.survival.Turnbull import *
+
+__author__ = 'Andrew Rowland'
+__email__ = 'andrew.rowland@reliaqual.com'
+__organization__ = 'ReliaQual Associates, LLC'
+__copyright__ = 'Copyright 2015 Andrew "Weibullguy" Rowland'
+
+
+class TestTurnbull(unittest.TestCase):
+    """
+    Class for testing the Turnbull data model class.
+    """
+
+    @attr(all=True, unit=True)
+    def test_turnbull_A(self):
+        """
+        (TestTurnbull) turnbull_A should return a sparse boolean matrix with one column per innermost interval on success
+        """
+
+        _data = format_data([('', 0.0, 1.0, 0.0, u'Interval Censored', 1),
+                             ('', 1.0, 2.0, 0.0, u'Interval Censored', 1),
+                             ('', 0.0, 2.0, 0.0, u'Interval Censored', 1),
+                             ('', 0.5, 3.0, 0.0, u'Interval Censored', 2),
+                             ('', 2.5, 2.5, 0.0, u'Right Censored', 1)],
+                            0.0, 10.0)
+        _tau = np.unique(np.concatenate((_data[:, 0], _data[:, 1])))
+
+        (_A, _last) = turnbull_A(_data, _tau)
+        self.assertEqual(_A.dtype, bool)
+        self.assertTrue(np.array_equal(_A.toarray(),
+                                       [[1, 0, 0], [1, 1, 0], [0, 1, 0],
+                                        [0, 0, 1], [1, 1, 1]]))
+        self.assertTrue(np.array_equal(_last, [2, 3, 5]))
+
+    @attr(all=True, unit=True)
+    def test_turnbull_interval_censored(self):
+        """
+        (TestTurnbull) turnbull should return a numpy matrix of floats on success with interval censored data
+        """
+
+        _data = [('', 0.0, 1.0, 0.0, u'Interval Censored', 1),
+                 ('', 1.0, 2.0, 0.0, u'Interval Censored', 1),
+                 ('', 0.0, 2.0, 0.0, u'Interval Censored', 1),
+                 ('', 0.5, 3.0, 0.0, u'Interval Censored', 2),
+                 ('', 2.5, 2.5, 0.0, u'Right Censored', 1)]
+
+        _turnbull = turnbull(_data, 0.0, 10.0)
+        self.assertTrue(np.allclose(_turnbull[0][:, 0],
+                                    [0.0, 0.5, 1.0, 2.0, 2.5, 3.0]))
+        self.assertTrue(np.allclose(_turnbull[0][:, 2],
+                                    [1.0, 1.0, 0.625, 0.25, 0.25, 0.0]))
+        self.assertTrue(np.all(_turnbull[0][:, 1] <= _turnbull[0][:, 2]))
+        self.assertTrue(np.all(_turnbull[0][:, 3] >= _turnbull[0][:, 2]))
+        self.assertTrue(np.allclose(_turnbull[1], [1, 2, 3, 5, 6]))
+
+    @attr(all=True, unit=True)
+    def test_turnbull_kaplan_meier(self):
+        """
+        (TestTurnbull) turnbull should return the Kaplan-Meier estimates on success with exact and right censored data
+        """
+
+        # Data is from Lee and Wang, page 69, example 4.2.
+        _data = [('', 3.0, 3.0, 0.0, u'Event', 1),
+                 ('', 4.0, 4.0, 0.0, u'Right Censored', 1),
+                 ('', 5.7, 5.7, 0.0, u'Right Censored', 1),
+                 ('', 6.5, 6.5, 0.0, u'Event', 2),
+                 ('', 8.4, 8.4, 0.0, u'Right Censored', 1),
+                 ('', 10.0, 10.0, 0.0, u'Event', 1),
+                 ('', 10.0, 10.0, 0.0, u'Right Censored', 1),
+                 ('', 12.0, 12.0, 0.0, u'Event', 1),
+                 ('', 15.0, 15.0, 0.0, u'Event', 1)]
+
+        _turnbull = turnbull(_data, 0.0, 100000.0)
+        self.assertTrue(np.allclose(_turnbull[0],
+                                    [[3.0, 0.71673988, 0.9, 0.96721776],
+                                     [4.0, 0.71673988, 0.9, 0.96721776],
+                                     [5.7, 0.71673988, 0.9, 0.96721776],
+                                     [6.5, 0.41799026, 0.64285714, 0.79947861],
+                                     [8.4, 0.41799026, 0.64285714, 0.79947861],
+                                     [10.0, 0.25977887, 0.48214286, 0.67379915],
+                                     [12.0, 0.06505397, 0.24107143, 0.47678419],
+                                     [15.0, 0.0, 0.0, 0.0]]))
+
+        self.assertTrue(np.allclose(_turnbull[1], [1, 4, 5, 7, 9, 10]))
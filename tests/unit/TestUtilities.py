@@ -50,7 +50,7 @@ import logging
 from Utilities import create_logger, split_string, none_to_string, \
                       string_to_boolean, date_to_ordinal, ordinal_to_date, \
                       dir_exists, file_exists, missing_to_default, \
-                      error_handler
+                      error_handler, ImportProfiler
 
 __author__ = 'Andrew Rowland'
 __email__ = 'andrew.rowland@reliaqual.com'
@@ -319,3 +319,26 @@ class TestUtilities(unittest.TestCase):
         _error_code = error_handler(
                           ['Some kinda error message'])
         self.assertEqual(_error_code, 1000)
+
+    @attr(all=True, unit=True)
+    def test10_import_profiler(self):
+        """
+        (TestUtilities) ImportProfiler should record the import time of each module imported while it is running
+        """
+
+        _profiler = ImportProfiler()
+        _profiler.start()
+        import json
+        import xml.dom.minidom
+        _profiler.stop()
+
+        self.assertTrue('xml.dom.minidom' in _profiler.dic_times)
+        (_self, _cumulative) = _profiler.dic_times['xml.dom.minidom']
+        self.assertTrue(0.0 <= _self <= _cumulative)
+
+        # Modules that were already imported are not recorded.
+        self.assertFalse('sys' in _profiler.dic_times)
+
+        _report = _profiler.report(n_modules=1).splitlines()
+        self.assertEqual(len(_report), 3)
+        self.assertTrue(_report[-1].endswith('s since start.'))